@@ -2,15 +2,13 @@ from __future__ import annotations
 
 import asyncio
 
-import json
 import logging
 import traceback
 from datetime import datetime, timezone
 from typing import Any
 
-import yaml
-
-from . import config, firestore_client, gcs_client
+from . import config, firestore_client, gcs_client, odds_store, snapshot_manifest, stats_prefetch
+from .config_cache import ConfigCache
 from .analysis_utils import (
     calculate_volatility,
     identify_outsider_reparable,
@@ -24,9 +22,43 @@ from .pipeline_run import generate_tickets
 
 logger = logging.getLogger(__name__)
 
+GPI_CONFIG_PATH = "config/gpi_v52.yml"
+PAYOUT_CALIBRATION_PATH = "config/payout_calibration.yaml"
+
+_config_cache = ConfigCache()
+
+
+def preload_gpi_config() -> None:
+    """Warm the GPI config cache so the first H-30/H-5 task skips the GCS reads."""
+    _config_cache.preload((GPI_CONFIG_PATH, PAYOUT_CALIBRATION_PATH))
+    logger.info("GPI config cache preloaded.", extra={"config_cache": _config_cache.stats()})
+
 
 def _find_and_load_h30_snapshot(race_doc_id: str, log_extra: dict) -> dict[str, Any]:
-    """Finds the latest H-30 snapshot for a given race and loads it."""
+    """Finds the latest H-30 snapshot for a given race and loads it.
+
+    The day's odds store is tried first, then the race's snapshot manifest;
+    the snapshot directory is only listed for races saved without one.
+    """
+    if log_extra.get("date"):
+        try:
+            h30_odds = odds_store.get_odds_store().phase_snapshot(log_extra["date"], race_doc_id, "H30")
+        except Exception as e:
+            logger.warning(f"Odds store lookup failed: {e}", extra=log_extra)
+            h30_odds = {}
+        if h30_odds:
+            logger.info("Loaded H-30 odds from the odds store.", extra=log_extra)
+            return h30_odds
+
+    try:
+        h30_snapshot = snapshot_manifest.load_latest(race_doc_id, "H30")
+    except Exception as e:
+        logger.warning(f"Snapshot manifest lookup failed, listing snapshots: {e}", extra=log_extra)
+        h30_snapshot = None
+    if h30_snapshot is not None:
+        logger.info("Loaded latest H-30 snapshot through the manifest.", extra=log_extra)
+        return h30_snapshot
+
     snapshot_dir = f"data/{race_doc_id}/snapshots/"
     try:
         all_snapshots = gcs_client.list_files(snapshot_dir)
@@ -49,7 +81,7 @@ def _find_and_load_h30_snapshot(race_doc_id: str, log_extra: dict) -> dict[str,
         logger.info(f"Found latest H-30 snapshot: {latest_h30_path}", extra=log_extra)
 
         h30_content = gcs_client.read_file_from_gcs(latest_h30_path)
-        return json.loads(h30_content) if h30_content else {}
+        return snapshot_manifest.decode_snapshot(h30_content)
 
     except Exception as e:
         logger.error(f"Failed to find or load H-30 snapshot: {e}", extra=log_extra)
@@ -66,13 +98,16 @@ async def _run_gpi_pipeline(
     """Loads configs and stats, then runs the GPI ticket generation pipeline."""
     logger.info("Preparing to run GPI ticket generation.", extra=log_extra)
 
-    # Load GPI config and calibration from GCS
-    gpi_config_content = gcs_client.read_file_from_gcs("config/gpi_v52.yml")
-    gpi_config = yaml.safe_load(gpi_config_content) if gpi_config_content else {}
-
-    calibration_content = gcs_client.read_file_from_gcs("config/payout_calibration.yaml")
-    calibration_data = yaml.safe_load(calibration_content) if calibration_content else {}
-    gpi_config["payout_calibration"] = calibration_data
+    # Load GPI config and calibration (cached per GCS object generation)
+    saved_before = _config_cache.stats()["time_saved_seconds"]
+    gpi_config = _config_cache.get(GPI_CONFIG_PATH)
+    gpi_config["payout_calibration"] = _config_cache.get(PAYOUT_CALIBRATION_PATH)
+    cache_stats = _config_cache.stats()
+    logger.info(
+        f"Config cache hit ratio {cache_stats['hit_ratio']:.2f}, "
+        f"{(cache_stats['time_saved_seconds'] - saved_before) * 1000:.1f} ms saved on this request.",
+        extra={**log_extra, "config_cache": cache_stats},
+    )
 
     # Enrich the snapshot with stats using SourceRegistry
     # Assuming snapshot_data can be converted to RaceSnapshotNormalized for enrichment
@@ -143,8 +178,19 @@ async def _fetch_and_save_snapshot(
     snapshot_id = f"{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}_{phase}"
     gcs_path = f"data/{race_doc_id}/snapshots/{snapshot_id}.json"
 
-    gcs_client.save_json_to_gcs(gcs_path, snapshot_data.model_dump_json()) # Save Pydantic model as JSON string
+    snapshot_doc = snapshot_data.model_dump(mode="json")
+    gcs_client.save_json_to_gcs(gcs_path, snapshot_doc)
     logger.info(f"Snapshot saved to GCS at {gcs_path}", extra=log_extra)
+    try:
+        snapshot_manifest.record_snapshot(race_doc_id, phase, gcs_path, snapshot_doc)
+    except Exception as e:
+        logger.warning(f"Failed to update the snapshot manifest: {e}", extra=log_extra)
+    try:
+        odds_store.get_odds_store().append_snapshot(
+            log_extra["date"], race_doc_id, phase, snapshot_data.model_dump()
+        )
+    except Exception as e:
+        logger.warning(f"Failed to append the snapshot odds to the odds store: {e}", extra=log_extra)
 
     return snapshot_data.model_dump(), gcs_path # Return dict version of snapshot_data
 
@@ -189,6 +235,9 @@ async def run_analysis_for_phase(
             snapshot_data_dict, gcs_path = await _fetch_and_save_snapshot(
                 course_url, race_doc_id, phase, log_extra
             )
+            if snapshot_data_dict:
+                # Warm the runners' stats for H-30/H-5 while the other races are snapshotted.
+                stats_prefetch.submit_runners(snapshot_data_dict.get("runners", []))
             analysis_content.update(
                 {
                     "status": "snapshot_only",
@@ -109,8 +109,8 @@ async def snapshot_9h_task(
     )
 
     try:
-        # Call the existing snapshot writing logic
-        await write_snapshot_for_day_async(
+        # Snapshot every race; the runners' stats prefetch continues in the background
+        prefetch_summary = await write_snapshot_for_day_async(
             date_str=target_date_str,
             phase="H9",  # Explicitly passing the phase
             race_urls=body.meeting_urls,
@@ -122,12 +122,15 @@ async def snapshot_9h_task(
             f"Snapshot-9h completed successfully for {target_date_str}.",
             extra={"correlation_id": correlation_id, "date": target_date_str},
         )
-        return {
+        response = {
             "ok": True,
             "message": f"Snapshot-9h for {target_date_str} initiated.",
             "date": target_date_str,
             "correlation_id": correlation_id,
         }
+        if isinstance(prefetch_summary, dict):
+            response["stats_prefetch"] = prefetch_summary
+        return response
     except Exception as e:
         logger.error(
             f"Exception during snapshot-9h for {target_date_str}: {e}",
@@ -12,8 +12,9 @@ from datetime import date
 from typing import Any, Optional
 import os
 
+from google.api_core import exceptions as gcs_exceptions
 from google.cloud import storage
-from hippique_orchestrator import config
+from hippique_orchestrator import config, gcs_disk_cache, storage_codec
 from hippique_orchestrator.data_contract import Programme
 from hippique_orchestrator.logging_utils import get_logger
 
@@ -89,6 +90,9 @@ class CacheManager:
         """
         Loads a Programme object from the cache for a given date.
 
+        Reads go through the local disk tier (:mod:`gcs_disk_cache`) when it is
+        enabled, so workers of one host download an unchanged programme once.
+
         Args:
             target_date: The date of the programme to load.
 
@@ -104,13 +108,27 @@ class CacheManager:
             bucket = self.client.bucket(config.BUCKET_NAME)
             blob = bucket.blob(gcs_path)
 
-            if not blob.exists():
+            disk_cache = gcs_disk_cache.get_gcs_disk_cache()
+            if disk_cache is not None:
+                try:
+                    body, content_encoding, _ = disk_cache.fetch(
+                        config.BUCKET_NAME,
+                        gcs_path,
+                        lambda generation: gcs_disk_cache.download_blob(blob, generation),
+                    )
+                except gcs_exceptions.NotFound:
+                    body = None
+                programme_data = storage_codec.decompress(body, content_encoding) if body else None
+            elif blob.exists():
+                programme_data = blob.download_as_string()
+            else:
+                programme_data = None
+
+            if programme_data is None:
                 logger.info(
                     f"Programme for {target_date} not found in cache at {gcs_path}."
                 )
                 return None
-
-            programme_data = blob.download_as_string()
             
             # Use Pydantic's parsing feature for validation
             programme = Programme.model_validate_json(programme_data)
@@ -0,0 +1,247 @@
+"""
+File-backed calibration snapshots refreshed off the hot path.
+
+A :class:`CalibrationStore` parses a YAML calibration file once into an
+immutable :class:`CalibrationSnapshot` and hands that snapshot out without
+touching the filesystem.  The file is only stat'ed again when the store is
+invalidated, when the watched path changes, or by the background refresher
+thread that every store registers with (every ``CALIBRATION_REFRESH_SECONDS``,
+``0`` disables it).  Each store keeps load and lookup counters for monitoring.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+
+import yaml
+
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_REFRESH_SECONDS = 30.0
+
+# Parser turning the raw YAML document into ``(entries, metadata)``.
+CalibrationParser = Callable[[Any], tuple[Mapping[str, Any], Mapping[str, Any]]]
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+def _refresh_interval() -> float:
+    try:
+        return max(float(os.getenv("CALIBRATION_REFRESH_SECONDS", DEFAULT_REFRESH_SECONDS)), 0.0)
+    except ValueError:
+        return DEFAULT_REFRESH_SECONDS
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable deep copy of a frozen snapshot value."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(v) for v in value]
+    return value
+
+
+@dataclass(frozen=True)
+class CalibrationSnapshot:
+    """Parsed content of a calibration file at a given modification time."""
+
+    path: Path | None
+    mtime: float = 0.0
+    entries: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+    metadata: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)
+    loaded_at: float = field(default_factory=time.time)
+    load_seconds: float = 0.0
+
+    @property
+    def exists(self) -> bool:
+        return self.mtime > 0.0
+
+
+class CalibrationStore:
+    """Caches a parsed calibration file and refreshes it on demand."""
+
+    def __init__(
+        self,
+        path: Path | Callable[[], Path],
+        parser: CalibrationParser | None = None,
+        *,
+        name: str | None = None,
+    ) -> None:
+        self._path_source = path
+        self._parser = parser
+        self.name = name or str(path)
+        self._lock = threading.Lock()
+        self._snapshot: CalibrationSnapshot | None = None
+        self._stale = True
+        self._loads = 0
+        self._checks = 0
+        self._hits = 0
+        self._misses = 0
+        _register(self)
+
+    def _resolve_path(self) -> Path:
+        source = self._path_source
+        return Path(source() if callable(source) else source)
+
+    def get(self, path: Path | None = None) -> CalibrationSnapshot:
+        """Return the current snapshot, loading it first when stale.
+
+        ``path`` overrides the watched path; a different path triggers a load.
+        No filesystem access happens while the snapshot is fresh.
+        """
+        snapshot = self._snapshot
+        if (
+            snapshot is None
+            or self._stale
+            or (path is not None and Path(path) != snapshot.path)
+        ):
+            if path is not None:
+                self._path_source = Path(path)
+            snapshot = self.refresh(raise_errors=True)
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Force the next :meth:`get` to check the file again."""
+        self._stale = True
+
+    def refresh(self, *, raise_errors: bool = False) -> CalibrationSnapshot:
+        """Stat the file and reparse it when its modification time changed.
+
+        Parse errors propagate when ``raise_errors`` is set; otherwise (the
+        background refresher) they are logged and the previous snapshot kept.
+        """
+        with self._lock:
+            self._checks += 1
+            current = self._snapshot
+            try:
+                path = self._resolve_path()
+                try:
+                    mtime = path.stat().st_mtime
+                except FileNotFoundError:
+                    mtime = 0.0
+                if current is not None and current.path == path and current.mtime == mtime:
+                    self._stale = False
+                    return current
+                snapshot = self._load(path, mtime)
+            except Exception as e:
+                if raise_errors or current is None:
+                    raise
+                logger.warning(f"Calibration refresh failed for {self.name}: {e}")
+                return current
+            self._snapshot = snapshot
+            self._stale = False
+            return snapshot
+
+    def _load(self, path: Path, mtime: float) -> CalibrationSnapshot:
+        if mtime <= 0.0:
+            return CalibrationSnapshot(path=path)
+        start = time.perf_counter()
+        entries: Mapping[str, Any] = {}
+        metadata: Mapping[str, Any] = {}
+        if self._parser is not None:
+            with path.open("r", encoding="utf-8") as fh:
+                data = yaml.safe_load(fh) or {}
+            entries, metadata = self._parser(data)
+        self._loads += 1
+        return CalibrationSnapshot(
+            path=path,
+            mtime=mtime,
+            entries=_freeze(entries),
+            metadata=_freeze(metadata),
+            load_seconds=time.perf_counter() - start,
+        )
+
+    def record_lookup(self, hit: bool) -> None:
+        """Count a lookup served (``hit``) or missed by the calibration."""
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Return load and lookup counters for monitoring."""
+        snapshot = self._snapshot
+        lookups = self._hits + self._misses
+        return {
+            "name": self.name,
+            "path": str(snapshot.path) if snapshot else None,
+            "exists": bool(snapshot and snapshot.exists),
+            "entries": len(snapshot.entries) if snapshot else 0,
+            "loaded_at": snapshot.loaded_at if snapshot and snapshot.exists else None,
+            "load_seconds": snapshot.load_seconds if snapshot else 0.0,
+            "loads": self._loads,
+            "checks": self._checks,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+        }
+
+
+# --- Background refresher ---
+
+_stores: weakref.WeakSet[CalibrationStore] = weakref.WeakSet()
+_refresher_lock = threading.Lock()
+_refresher_started = False
+
+
+def _register(store: CalibrationStore) -> None:
+    _stores.add(store)
+    _ensure_refresher()
+
+
+def _refresh_loop(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        refresh_all()
+
+
+def _ensure_refresher() -> None:
+    """Start the refresher thread once per process."""
+    global _refresher_started
+    interval = _refresh_interval()
+    if interval <= 0:
+        return
+    with _refresher_lock:
+        if _refresher_started:
+            return
+        _refresher_started = True
+        threading.Thread(
+            target=_refresh_loop, args=(interval,), name="calibration-refresher", daemon=True
+        ).start()
+
+
+def _restart_refresher_in_child() -> None:
+    # Threads do not survive fork(); pool workers need their own refresher.
+    global _refresher_lock, _refresher_started
+    _refresher_lock = threading.Lock()
+    _refresher_started = False
+    if len(_stores):
+        _ensure_refresher()
+
+
+os.register_at_fork(after_in_child=_restart_refresher_in_child)
+
+
+def refresh_all() -> None:
+    """Explicitly refresh every store that has been loaded in this process."""
+    for store in list(_stores):
+        if store._snapshot is not None:
+            store.refresh()
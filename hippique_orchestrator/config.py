@@ -1,5 +1,6 @@
 # hippique_orchestrator/config.py
 import os
+import tempfile
 from datetime import timedelta
 
 # GCP Configuration
@@ -26,6 +27,81 @@ MAX_CONCURRENT_SNAPSHOT_TASKS = int(os.getenv("MAX_CONCURRENT_SNAPSHOT_TASKS", "
 # GCS Enablement for local dev/test
 GCS_ENABLED = os.getenv("GCS_ENABLED", "False").lower() in ("true", "1", "t")
 
+# Shared HTTP client pool used by providers and scrapers
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "100"))
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "20"))
+HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", "6"))
+HTTP_KEEPALIVE_EXPIRY_S = float(os.getenv("HTTP_KEEPALIVE_EXPIRY_S", "30"))
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "True").lower() in ("true", "1", "t")
+
+# Fetch scheduler: per-host politeness budget and global concurrency cap
+REQUESTS_PER_SECOND = float(os.getenv("REQUESTS_PER_SECOND", "1.0"))
+FETCH_BURST = float(os.getenv("FETCH_BURST", "1"))
+FETCH_HOST_RATES = os.getenv("FETCH_HOST_RATES", "")  # e.g. "www.geny.com=0.5,www.zone-turf.fr=2"
+FETCH_MAX_CONCURRENCY = int(os.getenv("FETCH_MAX_CONCURRENCY", "8"))
+
+# On-disk HTTP response cache shared by the scrapers
+HTTP_CACHE_ENABLED = os.getenv("HTTP_CACHE_ENABLED", "True").lower() in ("true", "1", "t")
+HTTP_CACHE_DIR = os.getenv(
+    "HTTP_CACHE_DIR", os.path.join(tempfile.gettempdir(), "hippique-http-cache")
+)
+HTTP_CACHE_MAX_MB = float(os.getenv("HTTP_CACHE_MAX_MB", "128"))
+HTTP_CACHE_TTL_RULES = os.getenv("HTTP_CACHE_TTL_RULES", "")  # e.g. "/jockey/=86400;/course/=30"
+
+# HTML parsing engine: "lxml" (native, fastest), "bs4", "html.parser" or "html5lib"
+HTML_PARSER = os.getenv("HTML_PARSER", "lxml")
+
+# Local Zone-Turf name -> ID index (letters older than the refresh age are re-walked in the background; 0 disables)
+ZONETURF_INDEX_PATH = os.getenv(
+    "ZONETURF_INDEX_PATH", os.path.join(tempfile.gettempdir(), "zoneturf-index.json.gz")
+)
+ZONETURF_INDEX_REFRESH_HOURS = float(os.getenv("ZONETURF_INDEX_REFRESH_HOURS", "24"))
+# In-process memo of zoneturf_id_cache reads, so entities seen earlier in the day skip Firestore
+ZONETURF_ID_MEMO_TTL_SECONDS = float(os.getenv("ZONETURF_ID_MEMO_TTL_SECONDS", "86400"))
+# Firestore collection sharing the day's parsed jockey/trainer stats between instances
+JE_STATS_CACHE_COLLECTION = os.getenv("JE_STATS_CACHE_COLLECTION", "je_stats_daily")
+# Concurrent profile fetches of the H9 stats prefetch (0 disables the prefetch)
+STATS_PREFETCH_CONCURRENCY = int(os.getenv("STATS_PREFETCH_CONCURRENCY", "4"))
+
+# Provider fallback strategy: "sequential" (one after the other), "hedged" (start the next
+# provider once the current one exceeds its latency quantile) or "parallel" (merge all)
+PROVIDER_FETCH_MODE = os.getenv("PROVIDER_FETCH_MODE", "sequential")
+# Hedge delay used until a provider has PROVIDER_HEDGE_MIN_SAMPLES recorded latencies
+PROVIDER_HEDGE_DELAY_SECONDS = float(os.getenv("PROVIDER_HEDGE_DELAY_SECONDS", "3"))
+PROVIDER_HEDGE_QUANTILE = float(os.getenv("PROVIDER_HEDGE_QUANTILE", "0.95"))
+PROVIDER_HEDGE_MIN_SAMPLES = int(os.getenv("PROVIDER_HEDGE_MIN_SAMPLES", "20"))
+# Threads per provider call pool: races fetched at once x providers, since an abandoned
+# (losing) call keeps its thread until it times out; hedge launches get a pool of their own
+PROVIDER_FETCH_WORKERS = int(os.getenv("PROVIDER_FETCH_WORKERS", str(FETCH_MAX_CONCURRENCY * 4)))
+# Providers slower than this are left out of a parallel merge
+PROVIDER_PARALLEL_TIMEOUT_SECONDS = float(os.getenv("PROVIDER_PARALLEL_TIMEOUT_SECONDS", "20"))
+
+# In-process lifetime of snapshot manifests and payloads; must cover the H-30 -> H-5 gap
+# for the drift lookup to skip GCS on the instance that saved the H-30 snapshot
+SNAPSHOT_MANIFEST_TTL_SECONDS = float(os.getenv("SNAPSHOT_MANIFEST_TTL_SECONDS", "3600"))
+
+# Columnar odds store (one Arrow IPC dataset per day): buffered rows per flush, parts per compaction
+ODDS_STORE_DIR = os.getenv("ODDS_STORE_DIR", os.path.join(tempfile.gettempdir(), "hippique-odds"))
+ODDS_STORE_FLUSH_ROWS = int(os.getenv("ODDS_STORE_FLUSH_ROWS", "2000"))
+ODDS_STORE_MAX_PARTS = int(os.getenv("ODDS_STORE_MAX_PARTS", "16"))
+
+# Compression of the JSON documents written to GCS: "zstd" (needs zstandard), "gzip" or "identity"
+STORAGE_CODEC = os.getenv("STORAGE_CODEC", "zstd")
+
+# Local-disk (tmpfs) read-through tier in front of GCS reads, validated by object generation (0 disables)
+GCS_DISK_CACHE_DIR = os.getenv(
+    "GCS_DISK_CACHE_DIR",
+    os.path.join("/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(), "hippique-gcs"),
+)
+GCS_DISK_CACHE_MAX_MB = float(os.getenv("GCS_DISK_CACHE_MAX_MB", "128"))
+
+# Seconds a cached GCS config is served before its generation is revalidated
+CONFIG_CACHE_REVALIDATE_SECONDS = float(os.getenv("CONFIG_CACHE_REVALIDATE_SECONDS", "60"))
+
+# Lifetime of the memoized /api/pronostics day payload (bounds programme staleness
+# and writes made by other instances; local race writes invalidate it immediately)
+PRONOSTICS_CACHE_TTL_SECONDS = float(os.getenv("PRONOSTICS_CACHE_TTL_SECONDS", "15"))
+
 # Secret key for internal API authentication
 _secret_path = "/run/secrets/hippique-internal-api-secret-v1"
 if os.path.exists(_secret_path):
@@ -39,6 +115,8 @@ else:
 REQUIRE_AUTH = os.getenv("ENV_NAME") == "production"
 BUDGET_CAP_EUR = float(os.getenv("BUDGET_CAP_EUR", "5.0"))
 FIRESTORE_COLLECTION = os.getenv("FIRESTORE_COLLECTION", "races")
+# Per-day aggregate of race outcomes (counts, latest write, last error) read by /ops/status
+FIRESTORE_DAILY_STATUS_COLLECTION = os.getenv("FIRESTORE_DAILY_STATUS_COLLECTION", "daily_status")
 
 # Task Scheduling Offsets
 h30_offset = timedelta(minutes=30)
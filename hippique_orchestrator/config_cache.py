@@ -0,0 +1,127 @@
+"""
+Per-process cache of YAML configuration objects stored in GCS.
+
+Each path is parsed once and remembered with its GCS object generation.
+Within ``revalidate_seconds`` of the last check the parsed copy is served
+without any network access; after that a conditional read (generation
+mismatch) either confirms the copy with a 304 or downloads and parses the new
+object.  Hits, revalidations, refetches and the fetch+parse time they avoided
+are counted so callers can log the hit ratio and time saved.
+"""
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import yaml
+
+from hippique_orchestrator import config, gcs_client
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# Reader returning ``(modified, content, generation)`` for a path and known generation.
+ConditionalReader = Callable[[str, Any], tuple[bool, Any, Any]]
+
+
+@dataclass
+class _CachedConfig:
+    generation: Any
+    data: Any
+    checked_at: float
+    fetch_seconds: float
+
+
+class ConfigCache:
+    """Generation-aware cache of parsed YAML files."""
+
+    def __init__(
+        self,
+        revalidate_seconds: float | None = None,
+        *,
+        reader: ConditionalReader | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.revalidate_seconds = (
+            config.CONFIG_CACHE_REVALIDATE_SECONDS
+            if revalidate_seconds is None
+            else revalidate_seconds
+        )
+        self._reader = reader
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, _CachedConfig] = {}
+        self._hits = 0
+        self._revalidations = 0
+        self._fetches = 0
+        self._time_saved = 0.0
+
+    def _read(self, path: str, generation: Any) -> tuple[bool, Any, Any]:
+        reader = self._reader or gcs_client.read_file_if_modified
+        return reader(path, generation)
+
+    def get(self, path: str) -> Any:
+        """Return a private copy of the parsed YAML at ``path`` (``{}`` if unavailable)."""
+        with self._lock:
+            start = time.perf_counter()
+            now = self._clock()
+            entry = self._entries.get(path)
+            if entry is not None and now - entry.checked_at < self.revalidate_seconds:
+                self._hits += 1
+                self._time_saved += entry.fetch_seconds
+                return copy.deepcopy(entry.data)
+
+            modified, content, generation = self._read(
+                path, entry.generation if entry is not None else None
+            )
+            if entry is not None and not modified:
+                entry.checked_at = now
+                self._revalidations += 1
+                self._time_saved += max(entry.fetch_seconds - (time.perf_counter() - start), 0.0)
+                return copy.deepcopy(entry.data)
+
+            if content is None:
+                if entry is not None:
+                    logger.warning(f"Could not refresh {path}; serving the cached copy.")
+                    entry.checked_at = now
+                    return copy.deepcopy(entry.data)
+                return {}
+
+            data = yaml.safe_load(content) or {}
+            self._fetches += 1
+            self._entries[path] = _CachedConfig(
+                generation=generation,
+                data=data,
+                checked_at=now,
+                fetch_seconds=time.perf_counter() - start,
+            )
+            return copy.deepcopy(data)
+
+    def preload(self, paths: Iterable[str]) -> None:
+        """Warm the cache, logging rather than raising on failures."""
+        for path in paths:
+            try:
+                self.get(path)
+            except Exception as e:
+                logger.warning(f"Config preload failed for {path}: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Return lookup counters, hit ratio and cumulative time saved."""
+        with self._lock:
+            lookups = self._hits + self._revalidations + self._fetches
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "revalidations": self._revalidations,
+                "fetches": self._fetches,
+                "hit_ratio": (self._hits + self._revalidations) / lookups if lookups else 0.0,
+                "time_saved_seconds": self._time_saved,
+            }
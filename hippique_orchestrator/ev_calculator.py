@@ -51,6 +51,7 @@ DEFAULT_ROUND_TO = 0.10
 DEFAULT_ROR_THRESHOLD = None
 DEFAULT_OPTIMIZE = False
 DEFAULT_VARIANCE_CAP = None
+DEFAULT_ENGINE = "scalar"
 
 
 def _make_hashable(value: Any) -> Any:
@@ -239,6 +240,44 @@ def _simulate_joint_probability(
     return value
 
 
+def _copula_method() -> str | None:
+    """Return the ``correlations`` method configured for ticket pairs."""
+
+    try:
+        from hippique_orchestrator import simulate_wrapper as sw
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    try:
+        return sw._resolve_correlation_settings("tickets").get("method")
+    except Exception:  # pragma: no cover - defensive
+        return None
+
+
+def _copula_joint_probability(p_i: float, p_j: float, rho: float) -> float | None:
+    """Return the Gaussian-copula joint probability of two tickets if available.
+
+    ``method: quadrature`` in the payout calibration ``correlations`` section
+    selects the deterministic Gauss-Hermite estimate; otherwise the optional
+    Monte Carlo hook is used.
+    """
+
+    if _copula_method() == "quadrature":
+        from hippique_orchestrator.simulate_wrapper import _quadrature_joint_probability
+
+        value = _quadrature_joint_probability([p_i, p_j], rho)
+        if value is not None:
+            return value
+
+    if callable(_COPULA_MONTE_CARLO):  # pragma: no cover - optional
+        try:
+            mc = _COPULA_MONTE_CARLO([p_i, p_j], rho)
+        except Exception:  # pragma: no cover - defensive
+            mc = None
+        if mc is not None:
+            return float(mc)
+    return None
+
+
 def _estimate_joint_probability(
     info_i: dict[str, Any],
     info_j: dict[str, Any],
@@ -254,13 +293,8 @@ def _estimate_joint_probability(
     merged = _merge_legs(legs_i, legs_j)
     joint = _simulate_joint_probability(merged, simulate_fn, cache)
 
-    if joint is None and callable(_COPULA_MONTE_CARLO):  # pragma: no cover - optional
-        try:
-            mc = _COPULA_MONTE_CARLO([info_i["p"], info_j["p"]], rho)
-        except Exception:  # pragma: no cover - defensive
-            mc = None
-        if mc is not None:
-            joint = float(mc)
+    if joint is None:
+        joint = _copula_joint_probability(info_i["p"], info_j["p"], rho)
 
     if joint is None:
         joint = _approx_joint_probability(info_i["p"], info_j["p"], rho)
@@ -801,6 +835,9 @@ def compute_ev_roi(
         - round_to: float, default 0.10
         - optimize: bool, default False
         - variance_cap: float or None, default None
+        - engine: ``"scalar"`` (default, reference implementation) or
+          ``"numpy"`` to use the array-backed engine from
+          :mod:`hippique_orchestrator.ev_vectorized`
 
     Returns
     -------
@@ -823,6 +860,7 @@ def compute_ev_roi(
         "round_to": DEFAULT_ROUND_TO,
         "optimize": DEFAULT_OPTIMIZE,
         "variance_cap": DEFAULT_VARIANCE_CAP,
+        "engine": DEFAULT_ENGINE,
     }
     if config:
         cfg.update(config)
@@ -832,6 +870,20 @@ def compute_ev_roi(
     if cfg["variance_cap"] is not None and cfg["variance_cap"] <= 0:
         raise ValueError("variance_cap must be > 0")
 
+    if cfg["engine"] == "numpy":
+        try:
+            from hippique_orchestrator.ev_vectorized import compute_ev_roi_vectorized
+        except ImportError:  # pragma: no cover - numpy is optional
+            _LOGGER.debug("NumPy engine unavailable, falling back to scalar path")
+        else:
+            return compute_ev_roi_vectorized(
+                tickets,
+                budget,
+                simulate_fn,
+                cache_simulations=cache_simulations,
+                config=cfg,
+            )
+
     # First adjust stakes for dutching groups
     _apply_dutching(tickets)
 
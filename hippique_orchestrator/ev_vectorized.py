@@ -0,0 +1,761 @@
+"""Array-backed (NumPy) engine mirroring :func:`ev_calculator.compute_ev_roi`.
+
+The scalar implementation in :mod:`hippique_orchestrator.ev_calculator` walks
+tickets one at a time and remains the reference.  This module evaluates the
+same quantities on a struct-of-arrays (:class:`TicketArrays`): Kelly stakes,
+caps, rounding, EV, variance, CLV and Sharpe ratios are computed in batch and
+assembled into the exact result dictionary produced by the scalar path.
+
+Two entry points are provided:
+
+* :func:`compute_ev_roi_vectorized` is a drop-in replacement for
+  :func:`compute_ev_roi` operating on ticket mappings (probabilities of
+  combined bets are still resolved through ``simulate_fn``).
+* :func:`evaluate_arrays` works directly on :class:`TicketArrays` when the
+  caller already holds columnar data (backtests, exotic combo sweeps).
+
+Covariance between tickets sharing an exposure (same runner id or leg) is
+estimated by :func:`compute_joint_moments_sparse`, which replaces the pairwise
+``itertools.combinations`` walk with an inverted index turned into a sparse
+ticket/exposure incidence matrix.
+
+Results match the scalar path up to floating point summation order.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+try:  # pragma: no cover - SciPy is optional
+    from scipy import sparse
+except ImportError:  # pragma: no cover - handled gracefully
+    sparse = None  # type: ignore
+
+from hippique_orchestrator import ev_calculator
+from hippique_orchestrator.ev_calculator import (
+    COVARIANCE_THRESHOLD,
+    DEFAULT_EV_THRESHOLD,
+    DEFAULT_KELLY_CAP,
+    DEFAULT_OPTIMIZE,
+    DEFAULT_ROI_THRESHOLD,
+    DEFAULT_ROR_THRESHOLD,
+    DEFAULT_ROUND_TO,
+    DEFAULT_VARIANCE_CAP,
+    MIN_TICKETS_FOR_JOINT_MOMENTS,
+    FinalMetricsConfig,
+    _apply_dutching,
+    _calculate_final_metrics,
+    _make_hashable,
+    _merge_legs,
+    _prepare_ticket_dependencies,
+    _simulate_joint_probability,
+    _ticket_label,
+    compute_joint_moments,
+    optimize_stake_allocation,
+)
+from hippique_orchestrator.kelly import _to_float
+
+
+@dataclass
+class TicketArrays:
+    """Struct-of-arrays view of a ticket list.
+
+    ``stake`` and ``closing_odds`` use ``NaN`` for tickets that did not
+    provide a value.  ``combined`` flags tickets carrying ``legs`` (used for
+    the combined expected payout) and ``has_combined`` records whether any
+    ticket carried ``legs`` or ``legs_details``.
+    """
+
+    p: np.ndarray
+    odds: np.ndarray
+    stake: np.ndarray
+    closing_odds: np.ndarray
+    combined: np.ndarray
+    has_combined: bool = False
+    labels: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return int(self.p.shape[0])
+
+    @classmethod
+    def from_columns(
+        cls,
+        p: Sequence[float],
+        odds: Sequence[float],
+        stake: Sequence[float] | None = None,
+        closing_odds: Sequence[float] | None = None,
+        combined: Sequence[bool] | None = None,
+    ) -> TicketArrays:
+        """Build arrays from plain columns, filling optional ones with ``NaN``."""
+
+        p_arr = np.asarray(p, dtype=float)
+        n = p_arr.shape[0]
+        odds_arr = np.asarray(odds, dtype=float)
+        stake_arr = (
+            np.full(n, np.nan) if stake is None else np.asarray(stake, dtype=float)
+        )
+        closing_arr = (
+            np.full(n, np.nan)
+            if closing_odds is None
+            else np.asarray(closing_odds, dtype=float)
+        )
+        combined_arr = (
+            np.zeros(n, dtype=bool) if combined is None else np.asarray(combined, dtype=bool)
+        )
+        return cls(
+            p=p_arr,
+            odds=odds_arr,
+            stake=stake_arr,
+            closing_odds=closing_arr,
+            combined=combined_arr,
+            has_combined=bool(combined_arr.any()),
+            labels=[f"ticket_{i + 1}" for i in range(n)],
+        )
+
+
+def kelly_fractions(
+    p: np.ndarray, odds: np.ndarray, lam: float = 1.0, cap: float = 1.0
+) -> np.ndarray:
+    """Vectorised :func:`hippique_orchestrator.kelly.calculate_kelly_fraction`."""
+
+    lam = _to_float(lam, 1.0) or 1.0
+    if lam <= 0.0:
+        lam = 1.0
+    cap = _to_float(cap, 1.0) or 1.0
+    if not 0.0 < cap <= 1.0:
+        cap = 1.0
+
+    p = np.asarray(p, dtype=float)
+    odds = np.asarray(odds, dtype=float)
+    valid = np.isfinite(p) & np.isfinite(odds) & (p > 0.0) & (p < 1.0) & (odds > 1.0)
+    denom = np.where(valid, odds - 1.0, 1.0)
+    raw = np.where(valid, (p * odds - 1.0) / denom, 0.0)
+    raw = np.where(raw > 0.0, raw, 0.0)
+    return np.clip(np.minimum(raw * lam, cap), 0.0, 1.0)
+
+
+def ticket_moments(
+    p: np.ndarray, odds: np.ndarray, stake: np.ndarray
+) -> dict[str, np.ndarray]:
+    """Return per-ticket EV, ROI, variance, expected payout and Sharpe arrays."""
+
+    ev = stake * (p * (odds - 1) - (1 - p))
+    variance = p * (stake * (odds - 1)) ** 2 + (1 - p) * (-stake) ** 2 - ev**2
+    variance = np.maximum(variance, 0.0)
+    std = np.sqrt(variance)
+    roi = np.divide(ev, stake, out=np.zeros_like(ev), where=stake != 0)
+    sharpe = np.divide(ev, std, out=np.zeros_like(ev), where=std != 0)
+    return {
+        "ev": ev,
+        "roi": roi,
+        "variance": variance,
+        "expected_payout": p * stake * odds,
+        "sharpe": sharpe,
+    }
+
+
+def _approx_joint_probabilities(
+    p_i: np.ndarray, p_j: np.ndarray, rho: np.ndarray
+) -> np.ndarray:
+    """Vectorised :func:`ev_calculator._approx_joint_probability`."""
+
+    rho = np.clip(rho, -0.99, 0.99)
+    independence = p_i * p_j
+    term = rho * np.sqrt(
+        np.maximum(p_i * (1 - p_i), 0.0) * np.maximum(p_j * (1 - p_j), 0.0)
+    )
+    lower = np.maximum(0.0, p_i + p_j - 1.0)
+    upper = np.minimum(p_i, p_j)
+    estimate = np.maximum(lower, np.minimum(upper, independence + term))
+    return np.where(rho == 0.0, independence, np.maximum(independence, estimate))
+
+
+def _covariances_from_joint(
+    p_i: np.ndarray,
+    p_j: np.ndarray,
+    joint: np.ndarray,
+    win_i: np.ndarray,
+    loss_i: np.ndarray,
+    win_j: np.ndarray,
+    loss_j: np.ndarray,
+    ev_i: np.ndarray,
+    ev_j: np.ndarray,
+) -> np.ndarray:
+    """Vectorised :func:`ev_calculator._covariance_from_joint`."""
+
+    joint = np.maximum(0.0, np.minimum(joint, np.minimum(p_i, p_j)))
+    p_i_only = np.maximum(0.0, p_i - joint)
+    p_j_only = np.maximum(0.0, p_j - joint)
+    p_none = np.maximum(0.0, 1.0 - p_i - p_j + joint)
+
+    total = joint + p_i_only + p_j_only + p_none
+    valid = total > 0
+    safe_total = np.where(valid, total, 1.0)
+    expected_product = (
+        joint / safe_total * win_i * win_j
+        + p_i_only / safe_total * win_i * loss_j
+        + p_j_only / safe_total * loss_i * win_j
+        + p_none / safe_total * loss_i * loss_j
+    )
+    return np.where(valid, expected_product - ev_i * ev_j, 0.0)
+
+
+def _shared_exposure_pairs(
+    ticket_infos: Sequence[dict[str, Any]],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ``(i, j, rho)`` for every ticket pair sharing an exposure.
+
+    Exposures are indexed once (inverted index) into a sparse incidence
+    matrix ``A`` (tickets x exposures); the non-zero upper triangle of
+    ``A @ A.T`` enumerates the correlated pairs, already sorted by ``(i, j)``.
+    Separate products restricted to ``id:`` and ``leg:`` exposures give the
+    correlation class used by ``ev_calculator._rho_for_shared_exposures``.
+    """
+
+    index: dict[str, int] = {}
+    rows: list[int] = []
+    cols: list[int] = []
+    for idx, info in enumerate(ticket_infos):
+        for key in info.get("exposures", frozenset()):
+            rows.append(idx)
+            cols.append(index.setdefault(key, len(index)))
+
+    empty = np.empty(0, dtype=np.int64)
+    if not index:
+        return empty, empty, np.empty(0)
+
+    kinds = np.zeros(len(index), dtype=np.int8)
+    for key, col in index.items():
+        if key.startswith("id:"):
+            kinds[col] = 1
+        elif key.startswith("leg:"):
+            kinds[col] = 2
+
+    shape = (len(ticket_infos), len(index))
+    incidence = sparse.csr_matrix(
+        (np.ones(len(rows)), (np.asarray(rows), np.asarray(cols))), shape=shape
+    )
+    overlap = sparse.triu(incidence @ incidence.T, k=1).tocoo()
+    if overlap.nnz == 0:
+        return empty, empty, np.empty(0)
+
+    order = np.lexsort((overlap.col, overlap.row))
+    pair_i = overlap.row[order].astype(np.int64)
+    pair_j = overlap.col[order].astype(np.int64)
+
+    def _shares(kind: int) -> np.ndarray:
+        mask = sparse.diags((kinds == kind).astype(float))
+        restricted = incidence @ mask @ incidence.T
+        return np.asarray(restricted[pair_i, pair_j]).ravel() > 0
+
+    rho = np.where(_shares(1), 0.85, np.where(_shares(2), 0.60, 0.40))
+    return pair_i, pair_j, rho
+
+
+def compute_joint_moments_sparse(
+    ticket_infos: Sequence[dict[str, Any]],
+    *,
+    simulate_fn: Callable[[Iterable[Any]], float] | None = None,
+    cache: dict[tuple[Any, ...], float] | None = None,
+) -> tuple[float, list[dict[str, Any]]]:
+    """Sparse, vectorised equivalent of :func:`ev_calculator.compute_joint_moments`.
+
+    Joint probabilities still go through ``simulate_fn`` pair by pair, since
+    it is an arbitrary callable; the pair discovery, copula quadrature,
+    analytical approximation, clamping and covariance terms are evaluated in
+    batch.  Falls back to the scalar implementation when
+    SciPy is unavailable.
+    """
+
+    if len(ticket_infos) < MIN_TICKETS_FOR_JOINT_MOMENTS:
+        return 0.0, []
+    if sparse is None:  # pragma: no cover - SciPy is optional
+        return compute_joint_moments(ticket_infos, simulate_fn=simulate_fn, cache=cache)
+
+    pair_i, pair_j, rho = _shared_exposure_pairs(ticket_infos)
+    if pair_i.size == 0:
+        return 0.0, []
+
+    def _column(key: str) -> np.ndarray:
+        return np.asarray([info[key] for info in ticket_infos], dtype=float)
+
+    p = _column("p")
+    p_i = p[pair_i]
+    p_j = p[pair_j]
+
+    joint = np.full(pair_i.size, np.nan)
+    if simulate_fn is not None:
+        for k, (i, j) in enumerate(zip(pair_i.tolist(), pair_j.tolist(), strict=True)):
+            info_i = ticket_infos[i]
+            info_j = ticket_infos[j]
+            merged = _merge_legs(info_i.get("legs_for_sim", ()), info_j.get("legs_for_sim", ()))
+            value = _simulate_joint_probability(merged, simulate_fn, cache)
+            if value is not None:
+                joint[k] = float(value)
+
+    missing = np.isnan(joint)
+    if missing.any() and ev_calculator._copula_method() == "quadrature":
+        from hippique_orchestrator.simulate_wrapper import quadrature_joint_probabilities
+
+        joint[missing] = quadrature_joint_probabilities(
+            np.column_stack((p_i[missing], p_j[missing])), rho[missing]
+        )
+        missing = np.isnan(joint)
+    copula = ev_calculator._COPULA_MONTE_CARLO
+    if missing.any() and callable(copula):  # pragma: no cover - optional
+        for k in np.flatnonzero(missing).tolist():
+            try:
+                value = copula([float(p_i[k]), float(p_j[k])], float(rho[k]))
+            except Exception:  # pragma: no cover - defensive
+                value = None
+            if value is not None:
+                joint[k] = float(value)
+        missing = np.isnan(joint)
+    if missing.any():
+        joint[missing] = _approx_joint_probabilities(p_i[missing], p_j[missing], rho[missing])
+
+    lower = np.maximum(0.0, p_i + p_j - 1.0)
+    upper = np.minimum(p_i, p_j)
+    joint = np.maximum(p_i * p_j, np.maximum(lower, np.minimum(upper, joint)))
+
+    win = _column("win_value")
+    loss = _column("loss_value")
+    ev = _column("ev")
+    covariance = _covariances_from_joint(
+        p_i,
+        p_j,
+        joint,
+        win[pair_i],
+        loss[pair_i],
+        win[pair_j],
+        loss[pair_j],
+        ev[pair_i],
+        ev[pair_j],
+    )
+
+    keep = np.flatnonzero(np.abs(covariance) >= COVARIANCE_THRESHOLD)
+    details: list[dict[str, Any]] = []
+    for k in keep.tolist():
+        info_i = ticket_infos[int(pair_i[k])]
+        info_j = ticket_infos[int(pair_j[k])]
+        details.append(
+            {
+                "tickets": (info_i.get("label"), info_j.get("label")),
+                "shared": sorted(info_i["exposures"] & info_j["exposures"]),
+                "joint_probability": float(joint[k]),
+                "covariance": float(covariance[k]),
+            }
+        )
+    adjustment = 2.0 * sum(covariance[keep].tolist())
+    return adjustment, details
+
+
+def _validate(arrays: TicketArrays) -> None:
+    if not np.all((arrays.p > 0) & (arrays.p < 1)):
+        raise ValueError("probability must be in (0,1)")
+    if not np.all(arrays.odds > 1):
+        raise ValueError("odds must be > 1")
+
+
+def _initial_stakes(
+    arrays: TicketArrays, budget: float, kelly_cap: float, round_to: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    kelly_stake = kelly_fractions(arrays.p, arrays.odds) * budget
+    max_stake = kelly_fractions(arrays.p, arrays.odds, lam=kelly_cap) * budget
+    stake_input = np.where(np.isnan(arrays.stake), kelly_stake, arrays.stake)
+    capped = stake_input > max_stake
+    stake = np.minimum(stake_input, max_stake)
+    if round_to > 0:
+        stake = np.round(stake / round_to) * round_to
+    return stake, kelly_stake, max_stake, capped
+
+
+def _adjust_stakes(
+    stake: np.ndarray,
+    kelly_stake: np.ndarray,
+    max_stake: np.ndarray,
+    capped: np.ndarray,
+    budget: float,
+    round_to: float,
+) -> float:
+    """Array port of :func:`ev_calculator._adjust_stakes` (updates ``stake``).
+
+    The leftover budget is distributed greedily, each allocation depending on
+    what the previous ticket consumed, so only the non-capped subset is walked.
+    """
+
+    # Plain ``sum`` keeps the summation order (and thus the threshold
+    # comparisons below) identical to the scalar implementation.
+    total_stake = sum(stake.tolist())
+    if not (round_to > 0 and total_stake < budget):
+        return total_stake
+
+    remaining = budget - total_stake
+    non_capped = np.flatnonzero(~capped)
+    if non_capped.size == 0 or remaining < round_to / 2:
+        return total_stake
+
+    weight_sum = sum(kelly_stake[non_capped].tolist())
+    for i in non_capped:
+        max_extra = max_stake[i] - stake[i]
+        if max_extra <= 0:
+            continue
+        allocation = remaining * (kelly_stake[i] / weight_sum) if weight_sum else 0.0
+        allocation = min(allocation, max_extra)
+        allocation = math.floor((allocation + 1e-12) / round_to) * round_to
+        stake[i] += allocation
+        remaining -= allocation
+
+    if remaining >= round_to / 2:
+        order = sorted(non_capped, key=lambda i: kelly_stake[i], reverse=True)
+        for i in order:
+            if remaining < round_to / 2:
+                break
+            max_extra = max_stake[i] - stake[i]
+            add_units = min(
+                int((max_extra + 1e-12) / round_to),
+                int((remaining + 1e-12) / round_to),
+            )
+            if add_units <= 0:
+                continue
+            add_amount = add_units * round_to
+            stake[i] += add_amount
+            remaining -= add_amount
+            if remaining < round_to / 2:
+                break
+
+    return budget - remaining
+
+
+def _metrics_rows(
+    kelly_stake: np.ndarray,
+    stake: np.ndarray,
+    moments: dict[str, np.ndarray],
+    clv: np.ndarray,
+) -> list[dict[str, float]]:
+    columns = (
+        ("kelly_stake", kelly_stake),
+        ("stake", stake),
+        ("ev", moments["ev"]),
+        ("roi", moments["roi"]),
+        ("variance", moments["variance"]),
+        ("clv", clv),
+        ("expected_payout", moments["expected_payout"]),
+        ("sharpe", moments["sharpe"]),
+    )
+    names = [name for name, _ in columns]
+    stacked = np.column_stack([values for _, values in columns]).tolist()
+    return [dict(zip(names, row, strict=True)) for row in stacked]
+
+
+def _covariance_inputs(
+    arrays: TicketArrays,
+    stake: np.ndarray,
+    ev: np.ndarray,
+    dependencies: Sequence[dict[str, Any]],
+) -> list[dict[str, Any]]:
+    win_values = (stake * (arrays.odds - 1)).tolist()
+    loss_values = (-stake).tolist()
+    p_values = arrays.p.tolist()
+    ev_values = ev.tolist()
+    return [
+        {
+            "p": p_values[i],
+            "ev": ev_values[i],
+            "win_value": win_values[i],
+            "loss_value": loss_values[i],
+            "exposures": dep.get("exposures", frozenset()),
+            "legs_for_sim": dep.get("legs", ()),
+            "label": arrays.labels[i],
+        }
+        for i, dep in enumerate(dependencies)
+    ]
+
+
+def _resolve_config(config: dict[str, Any] | None) -> dict[str, Any]:
+    cfg = {
+        "ev_threshold": DEFAULT_EV_THRESHOLD,
+        "roi_threshold": DEFAULT_ROI_THRESHOLD,
+        "ror_threshold": DEFAULT_ROR_THRESHOLD,
+        "kelly_cap": DEFAULT_KELLY_CAP,
+        "round_to": DEFAULT_ROUND_TO,
+        "optimize": DEFAULT_OPTIMIZE,
+        "variance_cap": DEFAULT_VARIANCE_CAP,
+    }
+    if config:
+        cfg.update(config)
+    return cfg
+
+
+def evaluate_arrays(
+    arrays: TicketArrays,
+    budget: float,
+    *,
+    config: dict[str, Any] | None = None,
+    dependencies: Sequence[dict[str, Any]] | None = None,
+    simulate_fn: Callable[[Iterable[Any]], float] | None = None,
+    joint_cache: dict[tuple[Any, ...], float] | None = None,
+) -> tuple[dict[str, Any], list[dict[str, float]]]:
+    """Evaluate ``arrays`` and return ``(result, final_ticket_metrics)``.
+
+    ``result`` has the same layout as :func:`compute_ev_roi`.  Covariance
+    between tickets is only estimated when ``dependencies`` (as produced by
+    ``ev_calculator._prepare_ticket_dependencies``) are supplied.
+    """
+
+    cfg = _resolve_config(config)
+    if budget <= 0:
+        raise ValueError("budget must be > 0")
+    if cfg["variance_cap"] is not None and cfg["variance_cap"] <= 0:
+        raise ValueError("variance_cap must be > 0")
+    _validate(arrays)
+
+    round_to = cfg["round_to"]
+    clv = np.where(
+        np.isnan(arrays.closing_odds), 0.0, (arrays.closing_odds - arrays.odds) / arrays.odds
+    )
+    total_clv = float(clv.sum())
+    clv_count = len(arrays)
+
+    stake, kelly_stake, max_stake, capped = _initial_stakes(
+        arrays, budget, cfg["kelly_cap"], round_to
+    )
+    total_stake = _adjust_stakes(stake, kelly_stake, max_stake, capped, budget, round_to)
+
+    def _totals(current_stake: np.ndarray) -> tuple[dict[str, np.ndarray], float, float, float]:
+        moments = ticket_moments(arrays.p, arrays.odds, current_stake)
+        combined_payout = float(moments["expected_payout"][arrays.combined].sum())
+        return (
+            moments,
+            float(moments["ev"].sum()),
+            float(moments["expected_payout"].sum()),
+            combined_payout,
+        )
+
+    moments, total_ev, total_expected_payout, combined_expected_payout = _totals(stake)
+    total_variance = float(moments["variance"].sum())
+
+    total_variance_naive = total_variance
+    covariance_adjustment = 0.0
+    covariance_details: list[dict[str, Any]] = []
+    if dependencies:
+        covariance_adjustment, covariance_details = compute_joint_moments_sparse(
+            _covariance_inputs(arrays, stake, moments["ev"], dependencies),
+            simulate_fn=simulate_fn,
+            cache=joint_cache,
+        )
+        total_variance = max(0.0, total_variance_naive + covariance_adjustment)
+
+    total_stake_normalized = total_stake
+    # Stake rescaling (budget overflow then variance cap) is linear, so EV and
+    # payouts scale with ``scale`` while variances scale with ``scale**2``.
+    scales: list[float] = []
+    if total_stake > budget:
+        scales.append(budget / total_stake)
+        total_stake_normalized = budget
+
+    variance_exceeded = False
+    var_limit = cfg["variance_cap"] * budget**2 if cfg["variance_cap"] is not None else None
+    if scales:
+        total_variance *= scales[0] ** 2
+    if var_limit is not None and total_variance > var_limit:
+        variance_exceeded = True
+        variance_scale = math.sqrt(var_limit / total_variance)
+        total_variance *= variance_scale**2
+        total_stake_normalized *= variance_scale
+        scales.append(variance_scale)
+
+    for scale in scales:
+        stake = stake * scale
+        moments["ev"] = moments["ev"] * scale
+        moments["variance"] = moments["variance"] * scale**2
+        moments["expected_payout"] = moments["expected_payout"] * scale
+        moments["roi"] = np.divide(
+            moments["ev"], stake, out=np.zeros_like(stake), where=stake != 0
+        )
+        total_ev *= scale
+        combined_expected_payout *= scale
+        total_variance_naive *= scale**2
+        covariance_adjustment *= scale**2
+        for detail in covariance_details:
+            detail["covariance"] *= scale**2
+        total_expected_payout *= scale
+
+    ticket_metrics = _metrics_rows(kelly_stake, stake, moments, clv)
+
+    ev_individual = total_ev
+    ticket_metrics_individual = [dict(m) for m in ticket_metrics]
+    calibrated_expected_payout_individual = total_expected_payout
+
+    if cfg["optimize"]:
+        optimizer_input = [
+            {"p": p, "odds": o, "stake": s}
+            for p, o, s in zip(
+                arrays.p.tolist(), arrays.odds.tolist(), stake.tolist(), strict=True
+            )
+        ]
+        stake = np.asarray(
+            optimize_stake_allocation(optimizer_input, total_stake_normalized, cfg["kelly_cap"]),
+            dtype=float,
+        )
+        moments, total_ev, total_expected_payout, combined_expected_payout = _totals(stake)
+        total_variance_naive = float(moments["variance"].sum())
+        ticket_metrics = _metrics_rows(kelly_stake, stake, moments, clv)
+        total_stake_normalized = float(stake.sum())
+        if dependencies:
+            covariance_adjustment, covariance_details = compute_joint_moments_sparse(
+                _covariance_inputs(arrays, stake, moments["ev"], dependencies),
+                simulate_fn=simulate_fn,
+                cache=joint_cache,
+            )
+            total_variance = max(0.0, total_variance_naive + covariance_adjustment)
+        else:
+            total_variance = total_variance_naive
+
+    result = _calculate_final_metrics(
+        FinalMetricsConfig(
+            total_ev=total_ev,
+            total_variance=total_variance,
+            total_stake_normalized=total_stake_normalized,
+            budget=budget,
+            total_variance_naive=total_variance_naive,
+            has_combined=arrays.has_combined,
+            combined_expected_payout=combined_expected_payout,
+            ror_threshold=cfg["ror_threshold"],
+            ev_threshold=cfg["ev_threshold"],
+            roi_threshold=cfg["roi_threshold"],
+            variance_cap=cfg["variance_cap"],
+            variance_exceeded=variance_exceeded,
+            total_clv=total_clv,
+            clv_count=clv_count,
+            covariance_adjustment=covariance_adjustment,
+            covariance_details=covariance_details,
+            ticket_metrics=ticket_metrics,
+            total_expected_payout=total_expected_payout,
+        )
+    )
+
+    if cfg["optimize"]:
+        result["optimized_stakes"] = stake.tolist()
+        result["ev_individual"] = ev_individual
+        result["ticket_metrics_individual"] = ticket_metrics_individual
+        result["calibrated_expected_payout_individual"] = calibrated_expected_payout_individual
+
+    return result, ticket_metrics
+
+
+def _resolve_probability(
+    ticket: dict[str, Any],
+    simulate_fn: Callable[[Iterable[Any]], float] | None,
+    cache: dict[tuple[Any, ...], float] | None,
+) -> float:
+    p = ticket.get("p")
+    if p is not None:
+        return p
+    legs = ticket.get("legs_details") or ticket.get("legs")
+    if legs is None:
+        raise ValueError("Ticket must include probability 'p'")
+    if simulate_fn is None:
+        raise ValueError("simulate_fn must be provided when tickets include 'legs'")
+    if cache is None:
+        p = simulate_fn(legs)
+    else:
+        key = tuple(_make_hashable(leg) for leg in legs)
+        p = cache.get(key)
+        if p is None:
+            p = simulate_fn(legs)
+            cache[key] = p
+    ticket["p"] = p
+    return p
+
+
+def compute_ev_roi_vectorized(
+    tickets: list[dict[str, Any]],
+    budget: float,
+    simulate_fn: Callable[[Iterable[Any]], float] | None = None,
+    *,
+    cache_simulations: bool = True,
+    config: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Drop-in, array-backed equivalent of :func:`compute_ev_roi`.
+
+    Tickets are mutated exactly as the scalar path does (``p`` for simulated
+    combined bets, ``clv`` and the final per-ticket metrics).
+    """
+
+    cfg = _resolve_config(config)
+    if budget <= 0:
+        raise ValueError("budget must be > 0")
+    if cfg["variance_cap"] is not None and cfg["variance_cap"] <= 0:
+        raise ValueError("variance_cap must be > 0")
+
+    _apply_dutching(tickets)
+
+    if simulate_fn is None:
+        simulate_fn = ev_calculator.simulate_wrapper
+
+    cache: dict[tuple[Any, ...], float] = {}
+    sim_cache = cache if cache_simulations else None
+
+    n = len(tickets)
+    p = np.empty(n)
+    odds = np.empty(n)
+    stake = np.full(n, np.nan)
+    closing = np.full(n, np.nan)
+    combined = np.zeros(n, dtype=bool)
+    has_combined = False
+    dependencies: list[dict[str, Any]] = []
+    labels: list[str] = []
+    for i, t in enumerate(tickets):
+        p[i] = _resolve_probability(t, simulate_fn, sim_cache)
+        odds[i] = t["odds"]
+        if not 0 < p[i] < 1:
+            raise ValueError("probability must be in (0,1)")
+        if odds[i] <= 1:
+            raise ValueError("odds must be > 1")
+        if "stake" in t:
+            stake[i] = t["stake"]
+        closing_odds = t.get("closing_odds")
+        if closing_odds is not None:
+            closing[i] = closing_odds
+        combined[i] = "legs" in t
+        has_combined = has_combined or combined[i] or "legs_details" in t
+        legs_for_probability = t.get("legs_details") or t.get("legs")
+        dependencies.append(_prepare_ticket_dependencies(t, legs_for_probability))
+        labels.append(_ticket_label(t, i))
+
+    arrays = TicketArrays(
+        p=p,
+        odds=odds,
+        stake=stake,
+        closing_odds=closing,
+        combined=combined,
+        has_combined=bool(has_combined),
+        labels=labels,
+    )
+    result, ticket_metrics = evaluate_arrays(
+        arrays,
+        budget,
+        config=cfg,
+        dependencies=dependencies,
+        simulate_fn=simulate_fn,
+        joint_cache=sim_cache,
+    )
+    for t, metrics in zip(tickets, ticket_metrics, strict=True):
+        t.update(metrics)
+    return result
+
+
+__all__ = [
+    "TicketArrays",
+    "compute_ev_roi_vectorized",
+    "compute_joint_moments_sparse",
+    "evaluate_arrays",
+    "kelly_fractions",
+    "ticket_moments",
+]
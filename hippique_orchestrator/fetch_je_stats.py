@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import csv
 import difflib
 import json
@@ -17,11 +18,13 @@ from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote_plus, urljoin
+from urllib.parse import quote_plus, urljoin, urlsplit
 
+import httpx
 import requests
-from bs4 import BeautifulSoup
 
+from hippique_orchestrator import html_parser
+from hippique_orchestrator.fetch_scheduler import Priority, get_fetch_scheduler
 from hippique_orchestrator.gcs_client import get_gcs_manager
 
 LOGGER = logging.getLogger(__name__)
@@ -30,8 +33,9 @@ LOGGER = logging.getLogger(__name__)
 GENY_BASE_URL = "https://www.geny.com"
 DEFAULT_TIMEOUT = 15
 TIMEOUT = DEFAULT_TIMEOUT
-DELAY = 1.0
+DELAY = None  # Seconds between Geny requests; None keeps REQUESTS_PER_SECOND/FETCH_HOST_RATES
 RETRIES = 3
+CONCURRENCY = 4  # Runners processed at once by collect_stats
 TTL_DEFAULT = 3600
 DEFAULT_HEADERS = {
     "User-Agent": "Hippique-Analyse/1.0 (contact: ops@hippique.local)",
@@ -43,7 +47,7 @@ UA = DEFAULT_HEADERS["User-Agent"]
 @dataclass
 class FetchConf:
     timeout: float
-    delay_between_requests: float
+    delay_between_requests: float | None
     user_agent: str
     use_cache: bool
     cache_dir: Path
@@ -83,13 +87,13 @@ def http_get(
     timeout: int = DEFAULT_TIMEOUT,
     headers: Mapping[str, str] | None = None,
 ) -> str:
-    caller = session.get if session else requests.get
+    caller = session.get if session else get_fetch_scheduler().get
     merged_headers = {**DEFAULT_HEADERS, **(headers or {})}
     try:
         response = caller(url, headers=merged_headers, timeout=timeout)
         response.raise_for_status()
         return response.text
-    except requests.RequestException as exc:
+    except (requests.RequestException, httpx.HTTPError) as exc:
         raise RuntimeError(f"HTTP request failed for {url}") from exc
 
 
@@ -100,26 +104,12 @@ def _normalise_text(value: str) -> str:
     return cleaned.lower()
 
 
-def discover_horse_url_by_name(
-    name: str,
-    *,
-    get: Callable[[str], str] | None = None,
-) -> str | None:
-    if not name or not name.strip():
-        return None
-    fetch = get or http_get
-    query = quote_plus(name.strip())
-    search_url = f"{GENY_BASE_URL}/recherche?query={query}"
+def _horse_search_url(name: str) -> str:
+    return f"{GENY_BASE_URL}/recherche?query={quote_plus(name.strip())}"
 
-    # END DEBUGGING CODE
 
-    try:
-        html = fetch(search_url)
-    except RuntimeError:
-        LOGGER.warning("Failed to fetch Geny search results for %s", name)
-        return None
-
-    soup = BeautifulSoup(html, "html.parser")
+def _best_horse_link(html: str, name: str) -> str | None:
+    soup = html_parser.soup(html)
     target_norm = _normalise_text(name)
     best_url: str | None = None
     best_score = 0.0
@@ -140,8 +130,26 @@ def discover_horse_url_by_name(
     return best_url
 
 
+def discover_horse_url_by_name(
+    name: str,
+    *,
+    get: Callable[[str], str] | None = None,
+) -> str | None:
+    if not name or not name.strip():
+        return None
+    fetch = get or http_get
+
+    try:
+        html = fetch(_horse_search_url(name))
+    except RuntimeError:
+        LOGGER.warning("Failed to fetch Geny search results for %s", name)
+        return None
+
+    return _best_horse_link(html, name)
+
+
 def extract_links_from_horse_page(html: str) -> dict[str, str]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = html_parser.soup(html)
     links: dict[str, str] = {}
     for anchor in soup.select("a[href]"):
         href = anchor.get("href")
@@ -198,7 +206,7 @@ def _parse_percentage(text: str) -> float | None:
 
 
 def extract_rate_from_profile(html: str) -> float | None:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = html_parser.soup(html)
     for element in soup.find_all(["span", "div", "td", "th", "p", "li", "strong", "b"]):
         text = element.get_text(" ", strip=True)
         rate = _parse_percentage(text)
@@ -239,58 +247,82 @@ def parse_horse_percentages(
 
 # --- Main Functions from User Diff ---
 
+CSV_FIELDNAMES = [
+    "num",
+    "j_rate",
+    "e_rate",
+    "h_win5",
+    "h_place5",
+    "h_win_career",
+    "h_place_career",
+]
 
-def collect_stats(
-    h5: str,
-    out: str | None = None,
+
+async def async_http_get(
+    url: str,
     *,
-    timeout: float = TIMEOUT,
-    delay: float = DELAY,
-    retries: int = RETRIES,
-    cache: bool = False,
-    cache_dir: str | None = None,
-    ttl_seconds: int = TTL_DEFAULT,
-    neutral_on_fail: bool = False,
+    timeout: float = DEFAULT_TIMEOUT,
+    headers: Mapping[str, str] | None = None,
 ) -> str:
-    gcs_manager = get_gcs_manager()
-    conf = FetchConf(
-        timeout=timeout,
-        delay_between_requests=delay,
-        user_agent=UA,
-        use_cache=bool(cache),
-        cache_dir=(Path(cache_dir) if cache_dir else Path.home() / '.cache' / 'hippiques' / 'geny'),
-        ttl_seconds=int(ttl_seconds),
-        retries=int(retries),
-    )
+    """Async :func:`http_get` queued in the fetch scheduler's backfill lane."""
+    merged_headers = {**DEFAULT_HEADERS, **(headers or {})}
+    try:
+        response = await get_fetch_scheduler().fetch(
+            url, priority=Priority.BACKFILL, headers=merged_headers, timeout=timeout
+        )
+        response.raise_for_status()
+        return response.text
+    except httpx.HTTPError as exc:
+        raise RuntimeError(f"HTTP request failed for {url}") from exc
 
-    def fetcher(url):
-        return http_get(url, timeout=conf.timeout)
 
-    data = load_json(h5)
-    runners = data.get("runners", [])
-
-    rows = []
-    successful_fetches = 0
-    for r in runners:
-        num = str(r.get("num"))
-        name = (r.get("name") or "").strip()
-        j_rate = e_rate = None
-        h_win5 = h_place5 = h_win_career = h_place_career = None
-        if name:
+class _SharedFetcher:
+    """Fetches each URL once per collection; concurrent callers share the request."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.requested = 0
+        self._tasks: dict[str, asyncio.Task[str]] = {}
+
+    @property
+    def performed(self) -> int:
+        return len(self._tasks)
+
+    async def __call__(self, url: str) -> str:
+        self.requested += 1
+        task = self._tasks.get(url)
+        if task is None:
+            task = asyncio.ensure_future(async_http_get(url, timeout=self.timeout))
+            self._tasks[url] = task
+        return await task
+
+
+async def _collect_runner_stats(
+    runner: Mapping, fetch: _SharedFetcher, semaphore: asyncio.Semaphore
+) -> tuple[dict[str, str], bool, float]:
+    num = str(runner.get("num"))
+    name = (runner.get("name") or "").strip()
+    j_rate = e_rate = None
+    h_win5 = h_place5 = h_win_career = h_place_career = None
+    success = False
+    start = time.perf_counter()
+    if name:
+        async with semaphore:
             try:
-                h_url = discover_horse_url_by_name(name, get=fetcher)
-                time.sleep(conf.delay_between_requests)
+                h_url = None
+                try:
+                    h_url = _best_horse_link(await fetch(_horse_search_url(name)), name)
+                except RuntimeError:
+                    LOGGER.warning("Failed to fetch Geny search results for %s", name)
                 if h_url:
-                    h_html = fetcher(h_url)
-                    time.sleep(conf.delay_between_requests)
+                    h_html = await fetch(h_url)
                     links = extract_links_from_horse_page(h_html or "")
                     j_url = links.get("jockey")
                     e_url = links.get("trainer")
 
                     if j_url:
                         try:
-                            j_rate = extract_rate_from_profile(fetcher(j_url))
-                            time.sleep(conf.delay_between_requests)
+                            j_rate = extract_rate_from_profile(await fetch(j_url))
                         except Exception as e:
                             LOGGER.warning(
                                 f"Failed to fetch jockey stats for '{name}' from {j_url}: {e}"
@@ -298,36 +330,34 @@ def collect_stats(
 
                     if e_url:
                         try:
-                            e_rate = extract_rate_from_profile(fetcher(e_url))
-                            time.sleep(conf.delay_between_requests)
+                            e_rate = extract_rate_from_profile(await fetch(e_url))
                         except Exception as e:
                             LOGGER.warning(
                                 f"Failed to fetch trainer stats for '{name}' from {e_url}: {e}"
                             )
 
-                    if j_rate is not None or e_rate is not None:
-                        successful_fetches += 1
+                    success = j_rate is not None or e_rate is not None
             except Exception as e:
                 LOGGER.warning(f"Could not process horse '{name}': {e}")
+    elapsed = time.perf_counter() - start
 
-        def _fmt(x):
-            return f"{float(x):.2f}" if isinstance(x, (int, float)) else ""
-
-        rows.append(
-            {
-                "num": num,
-                "j_rate": _fmt(j_rate),
-                "e_rate": _fmt(e_rate),
-                "h_win5": _fmt(h_win5),
-                "h_place5": _fmt(h_place5),
-                "h_win_career": _fmt(h_win_career),
-                "h_place_career": _fmt(h_place_career),
-            }
-        )
+    def _fmt(x):
+        return f"{float(x):.2f}" if isinstance(x, (int, float)) else ""
+
+    row = {
+        "num": num,
+        "j_rate": _fmt(j_rate),
+        "e_rate": _fmt(e_rate),
+        "h_win5": _fmt(h_win5),
+        "h_place5": _fmt(h_place5),
+        "h_win_career": _fmt(h_win_career),
+        "h_place_career": _fmt(h_place_career),
+    }
+    return row, success, elapsed
 
-    coverage = (successful_fetches / len(runners) * 100) if runners else 0
-    output_payload = {"coverage": coverage, "rows": rows}
 
+def _write_outputs(h5: str, out: str | None, output_payload: dict, rows: list[dict]) -> str:
+    gcs_manager = get_gcs_manager()
     if gcs_manager:
         h5_dir = os.path.dirname(h5)
         json_out_path_str = os.path.join(h5_dir, "stats_je.json")
@@ -339,46 +369,117 @@ def collect_stats(
         csv_out_path_str = out if out else os.path.join(h5_dir, f"{Path(h5).stem}_je.csv")
         gcs_csv_path = gcs_manager.get_gcs_path(csv_out_path_str)
         with gcs_manager.fs.open(gcs_csv_path, "w", encoding="utf-8", newline="") as f:
-            fieldnames = [
-                "num",
-                "j_rate",
-                "e_rate",
-                "h_win5",
-                "h_place5",
-                "h_win_career",
-                "h_place_career",
-            ]
-            w = csv.DictWriter(f, fieldnames=fieldnames)
+            w = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
             w.writeheader()
-            w.writerows([{k: v for k, v in row.items() if k in fieldnames} for row in rows])
+            w.writerows([{k: v for k, v in row.items() if k in CSV_FIELDNAMES} for row in rows])
 
         return gcs_json_path
 
-    else:
-        h5p = Path(h5)
-        json_out_path = h5p.parent / "stats_je.json"
-        ensure_parent(json_out_path)
-        json_out_path.write_text(
-            json.dumps(output_payload, indent=2, ensure_ascii=False), encoding="utf-8"
+    h5p = Path(h5)
+    json_out_path = h5p.parent / "stats_je.json"
+    ensure_parent(json_out_path)
+    json_out_path.write_text(
+        json.dumps(output_payload, indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+
+    csv_out_path = Path(out) if out else (h5p.parent / f"{h5p.stem}_je.csv")
+    ensure_parent(csv_out_path)
+    with csv_out_path.open("w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        w.writeheader()
+        w.writerows([{k: v for k, v in row.items() if k in CSV_FIELDNAMES} for row in rows])
+
+    return str(json_out_path)
+
+
+async def collect_stats_async(
+    h5: str,
+    out: str | None = None,
+    *,
+    timeout: float = TIMEOUT,
+    delay: float | None = DELAY,
+    retries: int = RETRIES,
+    cache: bool = False,
+    cache_dir: str | None = None,
+    ttl_seconds: int = TTL_DEFAULT,
+    neutral_on_fail: bool = False,
+    concurrency: int = CONCURRENCY,
+) -> str:
+    """Collect jockey/trainer rates for every runner of ``h5`` concurrently.
+
+    Runners are processed ``concurrency`` at a time; pages shared between
+    runners (typically jockey and trainer profiles) are fetched only once.
+    Writes the same ``stats_je.json`` and CSV as before and returns the JSON path.
+    """
+    conf = FetchConf(
+        timeout=timeout,
+        delay_between_requests=delay,
+        user_agent=UA,
+        use_cache=bool(cache),
+        cache_dir=(Path(cache_dir) if cache_dir else Path.home() / '.cache' / 'hippiques' / 'geny'),
+        ttl_seconds=int(ttl_seconds),
+        retries=int(retries),
+    )
+
+    if conf.delay_between_requests:
+        # Requests are paced by the fetch scheduler's per-host token bucket.
+        get_fetch_scheduler().configure_host(
+            urlsplit(GENY_BASE_URL).netloc, rate=1.0 / conf.delay_between_requests
         )
 
-        csv_out_path = Path(out) if out else (h5p.parent / f"{h5p.stem}_je.csv")
-        ensure_parent(csv_out_path)
-        with csv_out_path.open("w", encoding="utf-8", newline="") as f:
-            fieldnames = [
-                "num",
-                "j_rate",
-                "e_rate",
-                "h_win5",
-                "h_place5",
-                "h_win_career",
-                "h_place_career",
-            ]
-            w = csv.DictWriter(f, fieldnames=fieldnames)
-            w.writeheader()
-            w.writerows([{k: v for k, v in row.items() if k in fieldnames} for row in rows])
+    data = load_json(h5)
+    runners = data.get("runners", [])
+
+    fetch = _SharedFetcher(conf.timeout)
+    semaphore = asyncio.Semaphore(max(int(concurrency), 1))
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(_collect_runner_stats(r, fetch, semaphore) for r in runners)
+    )
+    elapsed = time.perf_counter() - start
+
+    rows = [row for row, _, _ in results]
+    successful_fetches = sum(1 for _, success, _ in results if success)
+    for row, _, runner_seconds in results:
+        LOGGER.info(f"Runner {row['num']} stats collected in {runner_seconds:.2f}s")
+    LOGGER.info(
+        f"Collected stats for {len(runners)} runners in {elapsed:.2f}s: "
+        f"{fetch.performed} fetches, {fetch.requested - fetch.performed} saved by deduplication."
+    )
+
+    coverage = (successful_fetches / len(runners) * 100) if runners else 0
+    output_payload = {"coverage": coverage, "rows": rows}
+    return _write_outputs(h5, out, output_payload, rows)
+
 
-        return str(json_out_path)
+def collect_stats(
+    h5: str,
+    out: str | None = None,
+    *,
+    timeout: float = TIMEOUT,
+    delay: float | None = DELAY,
+    retries: int = RETRIES,
+    cache: bool = False,
+    cache_dir: str | None = None,
+    ttl_seconds: int = TTL_DEFAULT,
+    neutral_on_fail: bool = False,
+    concurrency: int = CONCURRENCY,
+) -> str:
+    """Blocking entry point for :func:`collect_stats_async`."""
+    return asyncio.run(
+        collect_stats_async(
+            h5,
+            out,
+            timeout=timeout,
+            delay=delay,
+            retries=retries,
+            cache=cache,
+            cache_dir=cache_dir,
+            ttl_seconds=ttl_seconds,
+            neutral_on_fail=neutral_on_fail,
+            concurrency=concurrency,
+        )
+    )
 
 
 def main():
@@ -388,12 +489,18 @@ def main():
     ap.add_argument("--h5", required=True, help="Fichier JSON H-5")
     ap.add_argument("--out", default=None, help="Fichier CSV sortie (défaut: <h5_stem>_je.csv)")
     ap.add_argument("--timeout", type=float, default=TIMEOUT)
-    ap.add_argument("--delay", type=float, default=DELAY)
+    ap.add_argument(
+        "--delay",
+        type=float,
+        default=DELAY,
+        help="Secondes minimum entre deux requêtes Geny (défaut: REQUESTS_PER_SECOND)",
+    )
     ap.add_argument("--retries", type=int, default=RETRIES)
     ap.add_argument("--cache", action="store_true")
     ap.add_argument("--cache-dir", default=None)
     ap.add_argument("--ttl-seconds", type=int, default=TTL_DEFAULT)
     ap.add_argument("--neutral-on-fail", action="store_true")
+    ap.add_argument("--concurrency", type=int, default=CONCURRENCY)
     args = ap.parse_args()
     out_csv = collect_stats(
         args.h5,
@@ -405,6 +512,7 @@ def main():
         cache_dir=args.cache_dir,
         ttl_seconds=args.ttl_seconds,
         neutral_on_fail=bool(args.neutral_on_fail),
+        concurrency=args.concurrency,
     )
     print(f"[OK] je_stats.csv écrit → {out_csv}")
 
@@ -0,0 +1,321 @@
+"""
+Polite fetch scheduling for the scrapers.
+
+:class:`FetchScheduler` sends requests through the shared
+:mod:`http_client` pool while enforcing, per host, a token bucket of
+``REQUESTS_PER_SECOND`` (overridable per host with ``FETCH_HOST_RATES``,
+e.g. ``"www.geny.com=0.5,www.zone-turf.fr=2"``) and, globally, at most
+``FETCH_MAX_CONCURRENCY`` requests in flight.  Waiting requests are served by
+:class:`Priority`, so H-5 odds fetches overtake a queued stats backfill.
+Requests to different hosts only share the global cap and run in parallel.
+
+Token buckets are process-wide and thread-safe, so synchronous callers
+(:meth:`FetchScheduler.fetch_sync`) draw from the same budget; priority
+lanes and the concurrency cap apply to the async path of each event loop.
+
+GET requests go through the :mod:`http_cache` disk cache first: fresh pages
+are served without spending a token, stale ones are revalidated with a
+conditional GET.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+import weakref
+from collections.abc import Callable, Mapping
+from enum import IntEnum
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from hippique_orchestrator import config, http_cache, http_client
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class Priority(IntEnum):
+    """Scheduling lanes; lower values are served first."""
+
+    CRITICAL = 0  # H-5/H-30 odds and snapshots feeding a decision
+    NORMAL = 1
+    BACKFILL = 2  # H9 stats/chrono warm-up
+
+
+def parse_host_rates(spec: str | None) -> dict[str, float]:
+    """Parse ``"host=rate,host=rate"`` into a mapping, skipping malformed items."""
+    rates: dict[str, float] = {}
+    for item in (spec or "").split(","):
+        host, sep, rate = item.partition("=")
+        if not sep:
+            continue
+        try:
+            value = float(rate)
+        except ValueError:
+            logger.warning(f"Ignoring invalid FETCH_HOST_RATES entry: {item!r}")
+            continue
+        if value > 0:
+            rates[host.strip().lower()] = value
+    return rates
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled at ``rate`` tokens per second."""
+
+    def __init__(
+        self, rate: float, burst: float = 1.0, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def acquire_sync(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class _PriorityGate:
+    """Asyncio semaphore handing free slots to the highest-priority waiter."""
+
+    def __init__(self, slots: int) -> None:
+        self._free = slots
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    async def acquire(self, priority: int) -> None:
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release()  # The slot was handed over just before cancellation.
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._free += 1
+
+
+class FetchScheduler:
+    """Rate-limited, priority-aware front end to the shared HTTP client pool."""
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        host_rates: Mapping[str, float] | None = None,
+        max_concurrency: int | None = None,
+        pool: http_client.HttpClientPool | None = None,
+        cache: http_cache.HttpCache | None = None,
+    ) -> None:
+        self.rate = rate or config.REQUESTS_PER_SECOND
+        self.burst = burst or config.FETCH_BURST
+        self.max_concurrency = max_concurrency or config.FETCH_MAX_CONCURRENCY
+        self._host_rates = dict(
+            parse_host_rates(config.FETCH_HOST_RATES) if host_rates is None else host_rates
+        )
+        self._pool = pool
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._host_gates: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, _PriorityGate]
+        ] = weakref.WeakKeyDictionary()
+        self._global_gates: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, _PriorityGate
+        ] = weakref.WeakKeyDictionary()
+        self._stats: dict[str, dict[str, Any]] = {}
+
+    @property
+    def pool(self) -> http_client.HttpClientPool:
+        return self._pool or http_client.get_http_pool()
+
+    @property
+    def cache(self) -> http_cache.HttpCache | None:
+        return self._cache or http_cache.get_http_cache()
+
+    def _cache_lookup(
+        self, method: str, url: str, kwargs: dict[str, Any]
+    ) -> tuple[http_cache.HttpCache | None, http_cache.CachedEntry | None, httpx.Response | None]:
+        """Return ``(cache, entry, response)``; ``response`` is set for a fresh hit.
+
+        A stale entry adds its validators to ``kwargs["headers"]``.
+        """
+        cache = self.cache
+        if cache is None or method.upper() != "GET" or "params" in kwargs:
+            return None, None, None
+        entry = cache.lookup(url)
+        if entry is None:
+            return cache, None, None
+        if entry.fresh:
+            response = cache.cached_response(entry)
+            if response is not None:
+                return cache, entry, response
+            return cache, None, None
+        kwargs["headers"] = {**(kwargs.get("headers") or {}), **entry.validators()}
+        return cache, entry, None
+
+    def configure_host(self, host: str, rate: float, burst: float | None = None) -> None:
+        """Set the request budget of ``host`` (requests per second)."""
+        host = host.lower()
+        with self._lock:
+            self._host_rates[host] = rate
+            self._buckets[host] = TokenBucket(rate, burst or self.burst)
+
+    def bucket(self, host: str) -> TokenBucket:
+        host = host.lower()
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self._host_rates.get(host, self.rate), self.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _gates(self, host: str) -> tuple[_PriorityGate, _PriorityGate]:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            host_gates = self._host_gates.setdefault(loop, {})
+            host_gate = host_gates.get(host)
+            if host_gate is None:
+                host_gate = host_gates[host] = _PriorityGate(1)
+            global_gate = self._global_gates.get(loop)
+            if global_gate is None:
+                global_gate = self._global_gates[loop] = _PriorityGate(self.max_concurrency)
+            return host_gate, global_gate
+
+    def _record(self, host: str, priority: Priority, waited: float) -> None:
+        with self._lock:
+            stats = self._stats.setdefault(
+                host, {"requests": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0, "by_priority": {}}
+            )
+            stats["requests"] += 1
+            stats["wait_seconds"] += waited
+            stats["max_wait_seconds"] = max(stats["max_wait_seconds"], waited)
+            lanes = stats["by_priority"]
+            lanes[priority.name] = lanes.get(priority.name, 0) + 1
+
+    async def fetch(
+        self,
+        url: str,
+        *,
+        priority: Priority = Priority.NORMAL,
+        method: str = "GET",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request once its host has a token and a global slot is free."""
+        cache, entry, cached = self._cache_lookup(method, url, kwargs)
+        if cached is not None:
+            return cached
+        host = urlsplit(url).netloc.lower()
+        start = time.perf_counter()
+        host_gate, global_gate = self._gates(host)
+        # One waiter per host holds the turn while its token refills, so the
+        # next token always goes to the most urgent queued request.
+        await host_gate.acquire(priority)
+        try:
+            await self.bucket(host).acquire()
+        finally:
+            host_gate.release()
+        await global_gate.acquire(priority)
+        try:
+            self._record(host, Priority(priority), time.perf_counter() - start)
+            response = await self.pool.arequest(method, url, **kwargs)
+        finally:
+            global_gate.release()
+        return cache.update(url, entry, response) if cache is not None else response
+
+    def fetch_sync(self, url: str, *, method: str = "GET", **kwargs: Any) -> httpx.Response:
+        """Blocking variant for worker threads; honours the host budget only."""
+        cache, entry, cached = self._cache_lookup(method, url, kwargs)
+        if cached is not None:
+            return cached
+        host = urlsplit(url).netloc.lower()
+        waited = self.bucket(host).acquire_sync()
+        self._record(host, Priority.NORMAL, waited)
+        response = self.pool.request(method, url, **kwargs)
+        return cache.update(url, entry, response) if cache is not None else response
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.fetch_sync(url, **kwargs)
+
+    async def aget(
+        self, url: str, *, priority: Priority = Priority.NORMAL, **kwargs: Any
+    ) -> httpx.Response:
+        return await self.fetch(url, priority=priority, **kwargs)
+
+    def bind(self, base_url: str) -> http_client.BoundHttpClient:
+        """Return a view resolving relative URLs against ``base_url``."""
+        return http_client.BoundHttpClient(self, base_url)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the configured budgets and per-host scheduling counters."""
+        with self._lock:
+            hosts = {
+                host: {**stats, "by_priority": dict(stats["by_priority"])}
+                for host, stats in self._stats.items()
+            }
+            rates = {host: bucket.rate for host, bucket in self._buckets.items()}
+        cache = self.cache
+        return {
+            "default_rate": self.rate,
+            "burst": self.burst,
+            "max_concurrency": self.max_concurrency,
+            "host_rates": rates,
+            "hosts": hosts,
+            "cache": cache.stats() if cache is not None else None,
+        }
+
+
+_scheduler: FetchScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_fetch_scheduler() -> FetchScheduler:
+    """Return the process-wide scheduler, creating it on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = FetchScheduler()
+        return _scheduler
+
+
+def reset_fetch_scheduler() -> None:
+    """Forget the process-wide scheduler (mainly for tests)."""
+    global _scheduler
+    with _scheduler_lock:
+        _scheduler = None
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import atexit
 import re
+import threading
+import time
+from collections.abc import Iterable, Mapping
 from datetime import datetime, timezone
 from typing import Any
 
@@ -16,6 +20,25 @@ logger = get_logger(__name__)
 # Firestore client instance for lazy initialization
 _db_client: firestore.Client | None = None
 
+# Document references sent per get_all() round trip
+GET_ALL_CHUNK_SIZE = 300
+
+# Write counters per race date, used by readers to invalidate memoized day views.
+# Documents whose id carries no date bump the "*" counter, which covers every day.
+_race_versions: dict[str, int] = {}
+_DOC_DATE_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})_")
+
+
+def _bump_race_version(document_id: str) -> None:
+    match = _DOC_DATE_RE.match(document_id)
+    key = match.group(1) if match else "*"
+    _race_versions[key] = _race_versions.get(key, 0) + 1
+
+
+def races_version(date_str: str) -> tuple[int, int]:
+    """Returns a token that changes whenever a race of ``date_str`` is written."""
+    return _race_versions.get(date_str, 0), _race_versions.get("*", 0)
+
 
 def _get_firestore_client() -> firestore.Client | None:
     global _db_client
@@ -71,11 +94,146 @@ def set_document(collection: str, document_id: str, data: dict[str, Any]) -> Non
         return
     try:
         db_client.collection(collection).document(document_id).set(data)
+        if collection == config.FIRESTORE_COLLECTION:
+            _bump_race_version(document_id)
         logger.debug(f"Document {document_id} set successfully in {collection}.")
     except Exception as e:
         logger.error(f"Failed to set document '{document_id}' in '{collection}': {e}", exc_info=e)
 
 
+def get_documents(collection: str, document_ids: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """
+    Retrieves several documents of a collection with batched get_all() round trips.
+    Returns the existing documents keyed by id; missing ones are left out.
+    """
+    ids = list(dict.fromkeys(document_ids))
+    if not ids:
+        return {}
+    db_client = _get_firestore_client()
+    if not db_client:
+        logger.warning("Firestore is not available, cannot get documents.")
+        return {}
+    collection_ref = db_client.collection(collection)
+    found: dict[str, dict[str, Any]] = {}
+    try:
+        for start in range(0, len(ids), GET_ALL_CHUNK_SIZE):
+            refs = [collection_ref.document(doc_id) for doc_id in ids[start : start + GET_ALL_CHUNK_SIZE]]
+            for doc in db_client.get_all(refs):
+                if doc.exists:
+                    found[doc.id] = doc.to_dict()
+    except Exception as e:
+        logger.error(f"Failed to get {len(ids)} documents from '{collection}': {e}", exc_info=e)
+    return found
+
+
+def set_documents(collection: str, documents: Mapping[str, dict[str, Any]]) -> int:
+    """
+    Sets (overwrites) several documents of a collection through a BulkWriter.
+    Returns the number of documents handed to the writer.
+    """
+    if not documents:
+        return 0
+    db_client = _get_firestore_client()
+    if not db_client:
+        logger.warning("Firestore is not available, cannot set documents.")
+        return 0
+    try:
+        collection_ref = db_client.collection(collection)
+        writer = db_client.bulk_writer()
+        for doc_id, data in documents.items():
+            writer.set(collection_ref.document(doc_id), data)
+        writer.close()  # Flushes and waits for every pending write
+    except Exception as e:
+        logger.error(f"Failed to set {len(documents)} documents in '{collection}': {e}", exc_info=e)
+        return 0
+    if collection == config.FIRESTORE_COLLECTION:
+        for doc_id in documents:
+            _bump_race_version(doc_id)
+    logger.debug(f"{len(documents)} documents set in {collection}.")
+    return len(documents)
+
+
+class WriteBehindBuffer:
+    """
+    Buffers document writes to one collection and sends them with set_documents().
+
+    Writes are flushed once ``max_pending`` documents are buffered, by a timer
+    ``max_delay`` seconds after the oldest pending one was buffered, on an explicit
+    flush() and at interpreter exit.  Later writes to the same id replace earlier ones.
+    """
+
+    def __init__(self, collection: str, *, max_pending: int = 100, max_delay: float = 30.0) -> None:
+        self.collection = collection
+        self.max_pending = max_pending
+        self.max_delay = max_delay
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._oldest: float | None = None
+        self._timer: threading.Timer | None = None
+        self.flushes = 0
+        self.written = 0
+        atexit.register(self.flush)
+
+    def put(self, document_id: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._pending[document_id] = data
+            now = time.monotonic()
+            if self._oldest is None:
+                self._oldest = now
+                self._start_timer()
+            due = len(self._pending) >= self.max_pending or now - self._oldest >= self.max_delay
+        if due:
+            self.flush()
+
+    def _start_timer(self) -> None:
+        # Caller holds the lock; flushes the batch even if no later put() arrives.
+        if self.max_delay <= 0:
+            return
+        self._timer = threading.Timer(self.max_delay, self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        # Caller holds the lock.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def get(self, document_id: str) -> dict[str, Any] | None:
+        """Returns a write still waiting in the buffer (read-your-writes)."""
+        with self._lock:
+            return self._pending.get(document_id)
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._oldest = None
+            self._cancel_timer()
+        if not pending:
+            return 0
+        written = set_documents(self.collection, pending)
+        with self._lock:
+            self.flushes += 1
+            self.written += written
+        return written
+
+    def clear(self) -> None:
+        """Drops pending writes without sending them."""
+        with self._lock:
+            self._pending.clear()
+            self._oldest = None
+            self._cancel_timer()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "collection": self.collection,
+                "pending": len(self._pending),
+                "flushes": self.flushes,
+                "written": self.written,
+            }
+
+
 def update_race_document(document_id: str, data: dict[str, Any]) -> None:
     """Updates a document in the main races collection, merging data."""
     db_client = _get_firestore_client()
@@ -96,9 +254,121 @@ def update_race_document(document_id: str, data: dict[str, Any]) -> None:
             },
         )
         doc_ref.set(data, merge=True)  # Use merge=True to be non-destructive
+        _bump_race_version(document_id)
         logger.debug(f"Document {document_id} updated successfully.")
     except Exception as e:
         logger.error(f"Failed to update document {document_id}: {e}", exc_info=e)
+        return
+
+    try:
+        _record_daily_status(db_client, document_id, data)
+    except Exception as e:
+        logger.error(f"Failed to mark the daily status of {document_id} dirty: {e}", exc_info=e)
+
+
+# --- Daily status aggregate ---
+# One document per race date in FIRESTORE_DAILY_STATUS_COLLECTION, kept up to date by
+# update_race_document so /ops/status reads it instead of scanning the day's races:
+#   {"date", "races": {"R1C1": "play", ...}, "counts", "latest_doc_id",
+#    "latest_processed_timestamp", "last_error"}
+# The most recent race write of any day is the newest "latest_processed_timestamp" among
+# these documents.  A day whose update failed carries "dirty": True and is rebuilt from
+# its races on the next read.
+
+
+def _count_decisions(races: Mapping[str, str]) -> dict[str, int]:
+    counts = {"total_processed": len(races), "total_playable": 0, "total_abstain": 0, "total_error": 0}
+    for decision in races.values():
+        if "play" in decision:
+            counts["total_playable"] += 1
+        elif "abstain" in decision:
+            counts["total_abstain"] += 1
+        elif "error" in decision:
+            counts["total_error"] += 1
+    return counts
+
+
+def _merge_daily_status(
+    status: Mapping[str, Any], date_str: str, document_id: str, data: Mapping[str, Any]
+) -> dict[str, Any]:
+    """The day's aggregate after the race write ``data`` to ``document_id``."""
+    races = dict(status.get("races") or {})
+    race_label = document_id[len(date_str) + 1 :]
+    analysis = data.get("tickets_analysis")
+    if isinstance(analysis, Mapping) and analysis.get("gpi_decision"):
+        races[race_label] = str(analysis["gpi_decision"]).lower()
+    else:
+        # Merged writes keep the race's previous tickets_analysis
+        races.setdefault(race_label, "pending")
+
+    modified_at = data.get("last_modified_at")
+    latest_doc_id = status.get("latest_doc_id")
+    latest_at = status.get("latest_processed_timestamp")
+    if modified_at and (latest_at is None or modified_at >= latest_at):
+        latest_doc_id, latest_at = document_id, modified_at
+
+    last_error = status.get("last_error")
+    if data.get("ok") is False or data.get("error_message"):
+        last_error = {
+            "doc_id": document_id,
+            "at": modified_at,
+            "message": data.get("error_message") or data.get("gpi_decision"),
+        }
+
+    return {
+        "date": date_str,
+        "races": races,
+        "counts": _count_decisions(races),
+        "latest_doc_id": latest_doc_id,
+        "latest_processed_timestamp": latest_at,
+        "last_error": last_error,
+    }
+
+
+@firestore.transactional
+def _apply_daily_status(transaction, status_ref, date_str: str, document_id: str, data: Mapping[str, Any]):
+    snapshot = status_ref.get(transaction=transaction)
+    status = (snapshot.to_dict() or {}) if snapshot.exists else {}
+    merged = _merge_daily_status(status, date_str, document_id, data)
+    if status.get("dirty"):
+        merged["dirty"] = True  # still missing an earlier write; only a rebuild clears it
+    transaction.set(status_ref, merged)
+
+
+def _record_daily_status(db_client: firestore.Client, document_id: str, data: Mapping[str, Any]) -> None:
+    match = _DOC_DATE_RE.match(document_id)
+    if not match:
+        return
+    status_ref = db_client.collection(config.FIRESTORE_DAILY_STATUS_COLLECTION).document(match.group(1))
+    try:
+        _apply_daily_status(db_client.transaction(), status_ref, match.group(1), document_id, data)
+    except Exception as e:
+        # The race is written but the aggregate missed it: the next status read rebuilds the day.
+        logger.warning(f"Failed to update the daily status for {document_id}, marking the day dirty: {e}")
+        status_ref.set({"dirty": True}, merge=True)
+
+
+def rebuild_daily_status(db_client: firestore.Client, date_str: str) -> dict[str, Any]:
+    """The aggregate of ``date_str`` replayed from its race documents, in write order."""
+    query = (
+        db_client.collection(config.FIRESTORE_COLLECTION)
+        .order_by("__name__")
+        .start_at([date_str])
+        .end_at([date_str + "\uf8ff"])
+    )
+    races = sorted(
+        ((doc.id, doc.to_dict() or {}) for doc in query.stream()),
+        key=lambda item: item[1].get("last_modified_at") or "",
+    )
+    status: dict[str, Any] = {}
+    for doc_id, data in races:
+        status = _merge_daily_status(status, date_str, doc_id, data)
+    return status
+
+
+def get_daily_status(date_str: str) -> dict[str, Any] | None:
+    """The aggregate document of ``date_str`` (None when no race of that day was written)."""
+    return get_document(config.FIRESTORE_DAILY_STATUS_COLLECTION, date_str)
 
 
 async def get_races_for_date(date_str: str) -> list[firestore.DocumentSnapshot]:
@@ -158,6 +428,9 @@ def get_doc_id_from_url(url: str, date: str) -> str | None:
 async def get_processing_status_for_date(date_str: str, daily_plan: list[dict]) -> dict[str, Any]:
     """
     Aggregates processing status from Firestore and system config for the /ops/status endpoint.
+
+    Reads the day's aggregate document maintained by :func:`update_race_document`
+    (plus the newest other day's when nothing was written that day) instead of the races.
     """
     db_client = _get_firestore_client()
     if not db_client:
@@ -166,46 +439,24 @@ async def get_processing_status_for_date(date_str: str, daily_plan: list[dict])
             "reason_if_empty": "FIRESTORE_CONNECTION_FAILED",
         }
 
-    races_from_db = await get_races_for_date(date_str)
+    daily_status = get_daily_status(date_str) or {}
+    if daily_status.get("dirty"):
+        # A race write whose aggregate update failed: replay the day's races once.
+        try:
+            daily_status = rebuild_daily_status(db_client, date_str)
+            set_document(config.FIRESTORE_DAILY_STATUS_COLLECTION, date_str, daily_status)
+        except Exception as e:
+            logger.warning(f"Could not rebuild the daily status of {date_str}: {e}")
+    races = daily_status.get("races") or {}
 
-    # Initialize counts
+    plan_rc_labels = {f"{race['r_label']}{race['c_label']}" for race in daily_plan if 'r_label' in race and 'c_label' in race}
     counts = {
         "total_in_plan": len(daily_plan),
-        "total_processed": len(races_from_db),
-        "total_playable": 0,
-        "total_abstain": 0,
-        "total_error": 0,
-        "total_pending": 0, # Will be calculated later
-        "total_analyzed": 0,
+        **_count_decisions(races),
+        "total_pending": len(plan_rc_labels - set(races)),
+        "total_analyzed": len(races),
     }
-
-    # Process races from DB to update counts
-    processed_race_ids = set()
-    latest_processed_timestamp = None
-    for doc in races_from_db:
-        race_data = doc.to_dict()
-        processed_race_ids.add(doc.id.split('_')[-1]) # Extract RC label
-        counts["total_analyzed"] += 1
-
-        analysis = race_data.get("tickets_analysis", {})
-        decision = analysis.get("gpi_decision", "Pending").lower()
-
-        if "play" in decision:
-            counts["total_playable"] += 1
-        elif "abstain" in decision:
-            counts["total_abstain"] += 1
-        elif "error" in decision:
-            counts["total_error"] += 1
-
-        # Track latest modification timestamp for processed races
-        if last_mod_at := race_data.get("last_modified_at"):
-            last_mod_dt = datetime.fromisoformat(last_mod_at)
-            if latest_processed_timestamp is None or last_mod_dt > latest_processed_timestamp:
-                latest_processed_timestamp = last_mod_dt
-
-    # Calculate pending races
-    plan_rc_labels = {f"{race['r_label']}{race['c_label']}" for race in daily_plan if 'r_label' in race and 'c_label' in race}
-    counts["total_pending"] = len(plan_rc_labels - processed_race_ids)
+    latest_processed_timestamp = daily_status.get("latest_processed_timestamp")
 
     # --- Config Info ---
     config_info = {
@@ -217,31 +468,42 @@ async def get_processing_status_for_date(date_str: str, daily_plan: list[dict])
 
     # --- Firestore Metadata ---
     firestore_meta = {
-        "num_docs_today": len(races_from_db),
-        "latest_processed_timestamp": latest_processed_timestamp.isoformat() if latest_processed_timestamp else None,
+        "num_docs_today": len(races),
+        "latest_processed_timestamp": latest_processed_timestamp,
         "latest_global_doc_id": None, # Populate from global latest query
         "latest_global_timestamp": None, # Populate from global latest query
     }
 
     # Get latest global doc for metadata if no docs today
-    if not races_from_db:
-        latest_global_doc_query = (
-            db_client.collection(config.FIRESTORE_COLLECTION)
-            .order_by("last_modified_at", direction=firestore.Query.DESCENDING)
+    if not races:
+        newest_day_query = (
+            db_client.collection(config.FIRESTORE_DAILY_STATUS_COLLECTION)
+            .order_by("latest_processed_timestamp", direction=firestore.Query.DESCENDING)
             .limit(1)
         )
-        latest_global_docs = [doc for doc in latest_global_doc_query.stream()]
-        if latest_global_docs and latest_global_docs[0].to_dict():
-            latest_doc_data = latest_global_docs[0].to_dict()
-            firestore_meta["latest_global_doc_id"] = latest_doc_data.get("race_doc_id")
-            firestore_meta["latest_global_timestamp"] = latest_doc_data.get("last_modified_at")
+        newest_days = [doc.to_dict() or {} for doc in newest_day_query.stream()]
+        if newest_days:
+            firestore_meta["latest_global_doc_id"] = newest_days[0].get("latest_doc_id")
+            firestore_meta["latest_global_timestamp"] = newest_days[0].get("latest_processed_timestamp")
+        else:
+            # No day aggregate yet: older deployments only have the races.
+            latest_global_doc_query = (
+                db_client.collection(config.FIRESTORE_COLLECTION)
+                .order_by("last_modified_at", direction=firestore.Query.DESCENDING)
+                .limit(1)
+            )
+            latest_global_docs = [doc for doc in latest_global_doc_query.stream()]
+            if latest_global_docs and latest_global_docs[0].to_dict():
+                latest_doc_data = latest_global_docs[0].to_dict()
+                firestore_meta["latest_global_doc_id"] = latest_doc_data.get("race_doc_id")
+                firestore_meta["latest_global_timestamp"] = latest_doc_data.get("last_modified_at")
 
     reason_if_empty = None
-    if not daily_plan and not races_from_db:
+    if not daily_plan and not races:
         reason_if_empty = "NO_PLAN_AND_NO_FIRESTORE_DATA"
     elif not daily_plan:
         reason_if_empty = "NO_PLAN_FOR_DATE"
-    elif not races_from_db:
+    elif not races:
         reason_if_empty = "NO_TASKS_PROCESSED_OR_FIRESTORE_EMPTY"
 
     return {
@@ -253,5 +515,5 @@ async def get_processing_status_for_date(date_str: str, daily_plan: list[dict])
         "firestore_metadata": firestore_meta,
         "reason_if_empty": reason_if_empty,
         "last_task_attempt": firestore_meta["latest_processed_timestamp"],  # Use latest processed timestamp
-        "last_error": None,  # Placeholder for actual error tracking
+        "last_error": daily_status.get("last_error"),
     }
@@ -1,13 +1,13 @@
 import glob
-import json
 import logging
 import os
 from typing import Any
 
 import gcsfs
+from google.api_core import exceptions as gcs_exceptions
 from google.cloud import storage
 
-from hippique_orchestrator import config
+from hippique_orchestrator import config, gcs_disk_cache, storage_codec
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -137,7 +137,7 @@ class GCSManager:
 
     def read_file_from_gcs(self, gcs_path: str) -> str | None:
         """
-        Reads the content of a file from GCS.
+        Reads the content of a file from GCS, undoing its Content-Encoding.
 
         Args:
             gcs_path (str): The GCS path (e.g., 'gs://bucket/path/to/file.json' or 'path/to/file.json').
@@ -149,18 +149,123 @@ class GCSManager:
             raise RuntimeError("GCS is disabled. Cannot read file.")
 
         gcs_uri = self.get_gcs_path(gcs_path)
+        blob_name = gcs_uri[len(f"gs://{self.bucket_name}/"):]
         logger.debug(f"Reading file from GCS: {gcs_uri}")
         try:
-            with self.fs.open(gcs_uri, 'r') as f:
-                content = f.read()
-            return content
+            # Raw download: compressed objects cross the network compressed and are decoded here.
+            body, content_encoding, _ = self._download(blob_name)
+            return storage_codec.decode_text(body, content_encoding)
         except Exception as e:
             logger.error(f"Failed to read file from GCS at {gcs_uri}: {e}", exc_info=True)
             return None
 
+    def _download(self, blob_name: str) -> tuple[bytes, str | None, int | None]:
+        """Raw ``(body, content_encoding, generation)``, through the local disk tier when enabled."""
+        blob = self.client.bucket(self.bucket_name).blob(blob_name)
+        disk_cache = gcs_disk_cache.get_gcs_disk_cache()
+        if disk_cache is None:
+            body = blob.download_as_bytes(raw_download=True)
+            return body, blob.content_encoding, blob.generation
+        return disk_cache.fetch(
+            self.bucket_name, blob_name, lambda generation: gcs_disk_cache.download_blob(blob, generation)
+        )
+
+    def read_file_if_modified(
+        self, gcs_path: str, generation: int | None = None
+    ) -> tuple[bool, str | None, int | None]:
+        """
+        Reads a file from GCS unless its object generation is still ``generation``.
+
+        The download is conditional (``ifGenerationNotMatch``), so an unchanged
+        object costs a single 304 round trip and no transfer.
+
+        Args:
+            gcs_path (str): The GCS path (e.g., 'gs://bucket/path/to/file.yml' or 'path/to/file.yml').
+            generation (int, optional): The generation already held by the caller.
+
+        Returns:
+            tuple: ``(modified, content, generation)``. ``(False, None, generation)``
+            when unchanged, ``(True, None, None)`` if an error occurs.
+        """
+        if not self._gcs_enabled:
+            raise RuntimeError("GCS is disabled. Cannot read file.")
+
+        gcs_uri = self.get_gcs_path(gcs_path)
+        blob_name = gcs_uri[len(f"gs://{self.bucket_name}/"):]
+        logger.debug(f"Conditionally reading file from GCS: {gcs_uri} (generation={generation})")
+        try:
+            if generation is None and gcs_disk_cache.get_gcs_disk_cache() is not None:
+                # First read in this process: another worker may have the object on disk.
+                body, content_encoding, new_generation = self._download(blob_name)
+                return True, storage_codec.decode_text(body, content_encoding), new_generation
+            blob = self.client.bucket(self.bucket_name).blob(blob_name)
+            if generation is None:
+                content = blob.download_as_text()
+            else:
+                content = blob.download_as_text(if_generation_not_match=generation)
+            return True, content, blob.generation
+        except gcs_exceptions.NotModified:
+            return False, None, generation
+        except Exception as e:
+            logger.error(f"Failed to read file from GCS at {gcs_uri}: {e}", exc_info=True)
+            return True, None, None
+
+    def read_text_with_generation(self, gcs_path: str) -> tuple[str | None, int | None]:
+        """
+        Reads a file from GCS along with its object generation.
+
+        Args:
+            gcs_path (str): The GCS path (e.g., 'gs://bucket/path/to/file.json' or 'path/to/file.json').
+
+        Returns:
+            tuple: ``(content, generation)``; ``(None, 0)`` when the object does not
+            exist (0 is the precondition for "create only"), ``(None, None)`` on error.
+        """
+        if not self._gcs_enabled:
+            raise RuntimeError("GCS is disabled. Cannot read file.")
+
+        gcs_uri = self.get_gcs_path(gcs_path)
+        blob_name = gcs_uri[len(f"gs://{self.bucket_name}/"):]
+        try:
+            blob = self.client.bucket(self.bucket_name).blob(blob_name)
+            content = blob.download_as_text()
+            return content, blob.generation
+        except gcs_exceptions.NotFound:
+            return None, 0
+        except Exception as e:
+            logger.error(f"Failed to read file from GCS at {gcs_uri}: {e}", exc_info=True)
+            return None, None
+
+    def write_text_if_generation_match(
+        self, gcs_path: str, content: str, generation: int
+    ) -> int | None:
+        """
+        Uploads ``content`` only if the object is still at ``generation`` (0: does not exist).
+
+        Returns:
+            int: The new object generation, or None when another writer got
+            there first (precondition failed).
+        """
+        if not self._gcs_enabled:
+            raise RuntimeError("GCS is disabled. Cannot write file.")
+
+        gcs_uri = self.get_gcs_path(gcs_path)
+        blob_name = gcs_uri[len(f"gs://{self.bucket_name}/"):]
+        try:
+            blob = self.client.bucket(self.bucket_name).blob(blob_name)
+            blob.upload_from_string(
+                content, content_type="application/json", if_generation_match=generation
+            )
+            return blob.generation
+        except gcs_exceptions.PreconditionFailed:
+            return None
+
     def save_json_to_gcs(self, gcs_path: str, data: dict[str, Any]):
         """
-        Saves a dictionary as a JSON file to GCS.
+        Saves a dictionary as a compact, compressed JSON file to GCS.
+
+        The codec (``config.STORAGE_CODEC``) is recorded as the object's
+        Content-Encoding; see :mod:`hippique_orchestrator.storage_codec`.
 
         Args:
             gcs_path (str): The GCS path (e.g., 'gs://bucket/path/to/file.json' or 'path/to/file.json').
@@ -171,11 +276,17 @@ class GCSManager:
             return
 
         gcs_uri = self.get_gcs_path(gcs_path) # Ensure it's a full URI
+        blob_name = gcs_uri[len(f"gs://{self.bucket_name}/"):]
         logger.info(f"Saving JSON to GCS: {gcs_uri}")
         try:
-            with self.fs.open(gcs_uri, 'w') as f:
-                json.dump(data, f)
-            logger.info(f"Successfully saved JSON to {gcs_uri}")
+            encoded = storage_codec.encode(data)
+            blob = self.client.bucket(self.bucket_name).blob(blob_name)
+            blob.content_encoding = encoded.content_encoding
+            blob.upload_from_string(encoded.body, content_type="application/json")
+            logger.info(
+                f"Successfully saved JSON to {gcs_uri} "
+                f"({len(encoded.body)} bytes stored, {encoded.raw_size} raw)"
+            )
         except Exception as e:
             logger.error(f"Failed to save JSON to GCS at {gcs_uri}: {e}", exc_info=True)
             raise
@@ -282,14 +393,42 @@ def read_file_from_gcs(gcs_path: str) -> str | None:
             if not os.path.exists(local_path):
                 logger.warning(f"Local file not found: {local_path}")
                 return None
-            with open(local_path) as f:
-                content = f.read()
-            return content
+            with open(local_path, "rb") as f:
+                content = storage_codec.decompress(f.read())
+            return content.decode("utf-8")
         except Exception as e:
             logger.error(f"Failed to read local file {local_path}: {e}", exc_info=True)
             return None
 
 
+def read_file_if_modified(
+    gcs_path: str, generation: int | None = None
+) -> tuple[bool, str | None, int | None]:
+    """
+    Conditional variant of :func:`read_file_from_gcs` keyed by object generation.
+
+    With GCS disabled the local file's ``st_mtime_ns`` stands in for the generation.
+
+    Returns:
+        tuple: ``(modified, content, generation)`` as described in
+        :meth:`GCSManager.read_file_if_modified`.
+    """
+    manager = get_gcs_manager()
+    if manager and manager._gcs_enabled:
+        return manager.read_file_if_modified(gcs_path, generation)
+
+    local_path = gcs_path.replace("gs://", "").replace(f"{config.BUCKET_NAME}/", "")
+    try:
+        local_generation = os.stat(local_path).st_mtime_ns
+    except FileNotFoundError:
+        logger.warning(f"Local file not found: {local_path}")
+        return True, None, None
+    if generation is not None and local_generation == generation:
+        return False, None, generation
+    content = read_file_from_gcs(gcs_path)
+    return True, content, local_generation if content is not None else None
+
+
 def save_json_to_gcs(gcs_path: str, data: dict[str, Any]):
     """
     Saves a dictionary as a JSON file to GCS using the GCSManager.
@@ -300,3 +439,24 @@ def save_json_to_gcs(gcs_path: str, data: dict[str, Any]):
         raise RuntimeError("GCSManager not initialized or GCS disabled.")
     manager.save_json_to_gcs(build_gcs_path(gcs_path), data) # Use build_gcs_path here
 
+
+def read_text_with_generation(gcs_path: str) -> tuple[str | None, int | None]:
+    """
+    Reads a GCS object with its generation (see :meth:`GCSManager.read_text_with_generation`).
+
+    Returns ``(None, None)`` when GCS is disabled.
+    """
+    manager = get_gcs_manager()
+    if not manager:
+        return None, None
+    return manager.read_text_with_generation(gcs_path)
+
+
+def write_text_if_generation_match(gcs_path: str, content: str, generation: int) -> int | None:
+    """
+    Compare-and-swap upload (see :meth:`GCSManager.write_text_if_generation_match`).
+    """
+    manager = get_gcs_manager()
+    if not manager:
+        raise RuntimeError("GCSManager not initialized or GCS disabled.")
+    return manager.write_text_if_generation_match(gcs_path, content, generation)
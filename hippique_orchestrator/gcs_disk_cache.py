@@ -0,0 +1,275 @@
+"""
+Local-disk read-through tier in front of GCS object reads.
+
+Workers keep downloading the same objects: configs, the H-30 snapshot the
+H-5 run of the same race needs, the day's programme.  :class:`GcsDiskCache`
+keeps the raw object bytes (still Content-Encoded) on local disk, by default
+on tmpfs (``/dev/shm``)::
+
+    {GCS_DISK_CACHE_DIR}/{sha256(bucket/name)[:2]}/{sha256}.{generation}.{encoding}
+
+A cached object is only served after a conditional download
+(``ifGenerationNotMatch``) answered "not modified", so a replaced object is
+never served stale and an unchanged one costs a round trip without transfer.
+Concurrent reads of the same object share one download (single flight), the
+total size is bounded by ``GCS_DISK_CACHE_MAX_MB`` with least-recently-used
+eviction, and hits and misses are counted per prefix: the object's directory
+with digit-bearing segments (race ids, dates) replaced by ``*``, e.g.
+``data/*/snapshots``.
+
+The index is rebuilt from the file names at start-up, so worker processes
+sharing the directory reuse each other's downloads.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from google.api_core import exceptions as gcs_exceptions
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+# ``download(generation)`` returns ``(body, content_encoding, generation)`` and raises
+# NotModified when the object is still at ``generation`` (None: unconditional).
+Downloader = Callable[[Any], tuple[bytes, Any, Any]]
+
+_DIGITS = re.compile(r"\d")
+
+
+def prefix_of(name: str) -> str:
+    """Counter key of an object: its directory, digit-bearing segments as ``*``."""
+    segments = name.split("/")[:-1]
+    return "/".join("*" if _DIGITS.search(s) else s for s in segments) or "/"
+
+
+def download_blob(blob: Any, generation: Any = None) -> tuple[bytes, str | None, int]:
+    """Raw (still encoded) download of ``blob``, conditional when ``generation`` is set."""
+    if generation is None:
+        body = blob.download_as_bytes(raw_download=True)
+    else:
+        body = blob.download_as_bytes(raw_download=True, if_generation_not_match=generation)
+    return body, blob.content_encoding, int(blob.generation)
+
+
+@dataclass
+class _Entry:
+    generation: int
+    content_encoding: str | None
+    path: Path
+    size: int
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: tuple[bytes, str | None, int] | None = None
+        self.error: BaseException | None = None
+
+
+class GcsDiskCache:
+    """Size-bounded, generation-validated disk cache of GCS objects."""
+
+    def __init__(self, directory: str | os.PathLike[str], *, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max(int(max_bytes), 0)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._flights: dict[str, _Flight] = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._coalesced = 0
+        self._prefixes: dict[str, dict[str, int]] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load_index()
+
+    def _load_index(self) -> None:
+        files = []
+        for path in self.directory.glob("*/*.*.*"):
+            digest, generation, encoding = path.name.split(".", 2)
+            if encoding.endswith(".tmp") or not generation.isdigit():
+                continue
+            stat = path.stat()
+            files.append((stat.st_atime, digest, int(generation), encoding, path, stat.st_size))
+        for _, digest, generation, encoding, path, size in sorted(files):
+            previous = self._entries.pop(digest, None)
+            if previous is not None:  # an older generation left by another process
+                self._bytes -= previous.size
+                previous.path.unlink(missing_ok=True)
+            content_encoding = None if encoding == "identity" else encoding
+            self._entries[digest] = _Entry(generation, content_encoding, path, size)
+            self._bytes += size
+        self._evict()
+
+    @staticmethod
+    def _key(bucket: str, name: str) -> str:
+        return hashlib.sha256(f"{bucket}/{name}".encode()).hexdigest()
+
+    def _count(self, name: str, counter: str) -> None:
+        with self._lock:
+            counters = self._prefixes.setdefault(prefix_of(name), {"hits": 0, "misses": 0})
+            counters[counter] += 1
+
+    # --- reads ----------------------------------------------------------------
+
+    def fetch(self, bucket: str, name: str, download: Downloader) -> tuple[bytes, str | None, int]:
+        """``(body, content_encoding, generation)`` of ``bucket/name``, from disk when unchanged.
+
+        Errors of ``download`` (NotFound, ...) propagate to every waiting caller.
+        """
+        key = self._key(bucket, name)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self._coalesced += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = self._fetch(key, name, download)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _fetch(self, key: str, name: str, download: Downloader) -> tuple[bytes, str | None, int]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            try:
+                result = download(entry.generation)
+            except gcs_exceptions.NotModified:
+                body = self._read(key, entry)
+                if body is not None:
+                    self._count(name, "hits")
+                    return body, entry.content_encoding, entry.generation
+                result = download(None)
+        else:
+            result = download(None)
+        self._count(name, "misses")
+        self._store(key, *result)
+        return result
+
+    def _read(self, key: str, entry: _Entry) -> bytes | None:
+        try:
+            body = entry.path.read_bytes()
+        except OSError:  # evicted by another process
+            body = None
+        with self._lock:
+            if body is None or len(body) != entry.size:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self._bytes -= entry.size
+                return None
+            if key in self._entries:
+                self._entries.move_to_end(key)
+        return body
+
+    # --- writes ---------------------------------------------------------------
+
+    def _store(self, key: str, body: bytes, content_encoding: str | None, generation: int) -> None:
+        if len(body) > self.max_bytes:
+            return
+        path = self.directory / key[:2] / f"{key}.{generation}.{content_encoding or 'identity'}"
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not cache GCS object {key[:12]} on disk: {e}")
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+                if previous.path != path:
+                    previous.path.unlink(missing_ok=True)
+            self._entries[key] = _Entry(generation, content_encoding, path, len(body))
+            self._bytes += len(body)
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock (or is the constructor).
+        while self._bytes > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            entry.path.unlink(missing_ok=True)
+            self._bytes -= entry.size
+            self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            for entry in self._entries.values():
+                entry.path.unlink(missing_ok=True)
+            self._entries.clear()
+            self._bytes = 0
+
+    # --- monitoring -----------------------------------------------------------
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            prefixes = {prefix: dict(counters) for prefix, counters in self._prefixes.items()}
+            stats = {
+                "directory": str(self.directory),
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evictions": self._evictions,
+                "coalesced": self._coalesced,
+            }
+        for counters in prefixes.values():
+            total = counters["hits"] + counters["misses"]
+            counters["hit_rate"] = counters["hits"] / total if total else 0.0
+        return {**stats, "prefixes": dict(sorted(prefixes.items()))}
+
+
+_cache: GcsDiskCache | None = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def get_gcs_disk_cache() -> GcsDiskCache | None:
+    """Return the process-wide tier, or None when ``GCS_DISK_CACHE_MAX_MB`` is 0."""
+    global _cache, _cache_failed
+    if config.GCS_DISK_CACHE_MAX_MB <= 0:
+        return None
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            try:
+                _cache = GcsDiskCache(
+                    config.GCS_DISK_CACHE_DIR,
+                    max_bytes=int(config.GCS_DISK_CACHE_MAX_MB * 1024 * 1024),
+                )
+            except OSError as e:
+                logger.warning(f"GCS disk cache disabled, cannot use {config.GCS_DISK_CACHE_DIR}: {e}")
+                _cache_failed = True
+                return None
+            logger.info(f"GCS disk cache initialized in {config.GCS_DISK_CACHE_DIR}.")
+        return _cache
+
+
+def reset_gcs_disk_cache() -> None:
+    """Forget the process-wide tier (files stay on disk); used by tests."""
+    global _cache, _cache_failed
+    with _cache_lock:
+        _cache = None
+        _cache_failed = False
@@ -0,0 +1,153 @@
+"""
+Pluggable HTML parsing for the scrapers.
+
+Building a BeautifulSoup tree costs far more than the few selectors the
+extractors need: on a saved ZEturf race page, ``html5lib`` takes ~220 ms,
+``html.parser`` ~120 ms, BeautifulSoup over lxml ~85 ms and a native
+``lxml.html`` tree ~11 ms.  The engine is chosen by ``HTML_PARSER``:
+
+* ``lxml`` (default) - native libxml2 tree for the extractors that have a
+  native implementation, BeautifulSoup over the lxml tree builder elsewhere;
+* ``bs4`` - BeautifulSoup over the lxml tree builder everywhere;
+* ``html.parser`` / ``html5lib`` - BeautifulSoup with that tree builder.
+
+Without lxml installed, the engine falls back to BeautifulSoup and the
+standard library ``html.parser``.  :func:`use_engine` overrides the engine for
+a block of code (benchmarks and output-equivalence tests).
+"""
+from __future__ import annotations
+
+import contextlib
+import contextvars
+from collections.abc import Iterator
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+
+try:
+    import lxml.html as lxml_html
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - lxml is a pinned dependency
+    lxml_html = None
+    lxml_etree = None
+
+logger = get_logger(__name__)
+
+ENGINES = ("lxml", "bs4", "html.parser", "html5lib")
+# BeautifulSoup tree builder used by each engine
+_SOUP_FEATURES = {"lxml": "lxml", "bs4": "lxml", "html.parser": "html.parser", "html5lib": "html5lib"}
+_FALLBACK_ENGINE = "html.parser"
+
+_override: contextvars.ContextVar[str | None] = contextvars.ContextVar("html_engine", default=None)
+
+
+def available_engines() -> tuple[str, ...]:
+    """Engines usable in this environment."""
+    engines = []
+    for name in ENGINES:
+        if _SOUP_FEATURES[name] == "lxml" and lxml_html is None:
+            continue
+        if name == "html5lib":
+            try:
+                import html5lib  # noqa: F401
+            except ImportError:
+                continue
+        engines.append(name)
+    return tuple(engines)
+
+
+def engine(name: str | None = None) -> str:
+    """Resolve the engine to use: ``name``, the :func:`use_engine` override, then ``HTML_PARSER``."""
+    name = name or _override.get() or config.HTML_PARSER
+    if name not in ENGINES:
+        logger.warning(f"Unknown HTML parser '{name}', using '{_FALLBACK_ENGINE}'.")
+        return _FALLBACK_ENGINE
+    if _SOUP_FEATURES[name] == "lxml" and lxml_html is None:
+        return _FALLBACK_ENGINE
+    return name
+
+
+@contextlib.contextmanager
+def use_engine(name: str) -> Iterator[str]:
+    """Parse with ``name`` inside the block."""
+    token = _override.set(name)
+    try:
+        yield engine(name)
+    finally:
+        _override.reset(token)
+
+
+def soup(html: str, engine_name: str | None = None) -> BeautifulSoup:
+    """BeautifulSoup tree, for extractors without a native implementation."""
+    return BeautifulSoup(html, _SOUP_FEATURES[engine(engine_name)])
+
+
+def parse_html(html: str, engine_name: str | None = None) -> Any:
+    """Parse ``html`` with the selected engine.
+
+    Returns an ``lxml.html`` element for the ``lxml`` engine and a BeautifulSoup
+    otherwise; extractors branch on :func:`is_soup`.
+    """
+    name = engine(engine_name)
+    if name == "lxml":
+        return _lxml_document(html)
+    return BeautifulSoup(html, _SOUP_FEATURES[name])
+
+
+def _lxml_document(html: str) -> Any:
+    # BeautifulSoup accepts any input; mirror that for the pages lxml refuses.
+    try:
+        return lxml_html.document_fromstring(html or "<html></html>")
+    except ValueError:
+        # Text carrying an XML encoding declaration: parse it as the UTF-8 bytes it now is.
+        parser = lxml_html.HTMLParser(encoding="utf-8")
+        return lxml_html.document_fromstring(html.encode("utf-8"), parser=parser)
+    except lxml_etree.ParserError:
+        # Whitespace- or comment-only body
+        return lxml_html.document_fromstring("<html></html>")
+
+
+def is_soup(document: Any) -> bool:
+    return isinstance(document, BeautifulSoup)
+
+
+# --- Native (lxml) helpers mirroring the BeautifulSoup calls used by the extractors ---
+
+
+def has_class(class_name: str) -> str:
+    """XPath predicate matching elements whose ``class`` attribute contains ``class_name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+def first(node: Any, xpath: str) -> Any:
+    """First node matched by ``xpath`` in document order, or None (like ``select_one``)."""
+    matches = node.xpath(xpath)
+    return matches[0] if matches else None
+
+
+def text(node: Any, strip: bool = False) -> str:
+    """Text of ``node`` as BeautifulSoup's ``get_text(strip=strip)`` returns it.
+
+    Script and style contents are skipped; with ``strip`` every string is
+    stripped and empty ones dropped before joining.
+    """
+    parts = node.xpath(".//text()[not(ancestor::script or ancestor::style)]")
+    if strip:
+        return "".join(part.strip() for part in parts)
+    return "".join(parts)
+
+
+def script_containing(document: Any, marker: str) -> str | None:
+    """Source of the first ``<script>`` whose text contains ``marker``."""
+    if is_soup(document):
+        for script in document.find_all("script"):
+            if script.string and marker in script.string:
+                return str(script.string)
+        return None
+    for script in document.iter("script"):
+        if script.text and marker in script.text:
+            return script.text
+    return None
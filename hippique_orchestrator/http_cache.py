@@ -0,0 +1,414 @@
+"""
+Persistent HTTP response cache shared by the scrapers.
+
+:class:`HttpCache` keeps successful GET responses on local disk so programme,
+race and profile pages are not downloaded again on every run:
+
+* bodies are stored zlib-compressed under the SHA-256 of their content, so
+  identical pages fetched through different URLs are stored once;
+* each URL gets a time-to-live from the first matching rule of
+  :data:`DEFAULT_TTL_RULES` (profiles: days, odds: seconds), overridable with
+  ``HTTP_CACHE_TTL_RULES`` (``"regex=seconds;regex=seconds"``);
+* once stale, an entry is revalidated with ``If-None-Match`` /
+  ``If-Modified-Since`` and a ``304`` is answered from disk;
+* the total compressed size is bounded by ``HTTP_CACHE_MAX_MB`` with
+  least-recently-used eviction.
+
+The index is a SQLite database next to the blobs, so the cache can be shared
+by the worker threads of a process and by several processes on one host.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+_DAY = 86400.0
+
+# First match wins; URLs matching no rule are always revalidated.
+DEFAULT_TTL_RULES: tuple[tuple[str, float], ...] = (
+    (r"/(course|cotes|partants|rapports)/", 15.0),  # live odds and race pages
+    (r"/(cheval|jockey|entraineur)/lettre-", 1 * _DAY),  # zone-turf letter indexes
+    (r"/(cheval|chevaux|jockey|jockeys|entraineur|entraineurs)/", 3 * _DAY),  # profiles
+    (r"/recherche\?", 1 * _DAY),  # geny horse search
+    (r"/(programme|reunions)", 300.0),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT PRIMARY KEY,
+    body_hash TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    stored_size INTEGER NOT NULL
+);
+"""
+
+
+def parse_ttl_rules(spec: str | None) -> list[tuple[str, float]]:
+    """Parse ``"regex=seconds;regex=seconds"``, skipping malformed items."""
+    rules: list[tuple[str, float]] = []
+    for item in (spec or "").split(";"):
+        pattern, sep, seconds = item.rpartition("=")
+        if not sep or not pattern.strip():
+            continue
+        try:
+            re.compile(pattern.strip())
+            rules.append((pattern.strip(), float(seconds)))
+        except (re.error, ValueError):
+            logger.warning(f"Ignoring invalid HTTP_CACHE_TTL_RULES entry: {item!r}")
+    return rules
+
+
+@dataclass(frozen=True)
+class CachedEntry:
+    url: str
+    body_hash: str
+    size: int
+    content_type: str | None
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+    fresh: bool
+
+    def validators(self) -> dict[str, str]:
+        """Headers turning the next request for this URL into a conditional GET."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """Size-bounded, content-addressed disk cache of GET responses."""
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        *,
+        max_bytes: int,
+        ttl_rules: Iterable[tuple[str, float]] | None = None,
+        default_ttl: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max(int(max_bytes), 0)
+        self.default_ttl = default_ttl
+        rules = DEFAULT_TTL_RULES if ttl_rules is None else ttl_rules
+        self._rules = [(re.compile(pattern), float(ttl)) for pattern, ttl in rules]
+        self._clock = clock
+        self._lock = threading.Lock()
+        (self.directory / "blobs").mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            self.directory / "index.sqlite", timeout=30, check_same_thread=False
+        )
+        self._db.executescript(_SCHEMA)
+        self._counters = {
+            "lookups": 0,
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "bytes_saved": 0,
+        }
+
+    # --- Policy ---
+
+    def ttl_for(self, url: str) -> float:
+        for pattern, ttl in self._rules:
+            if pattern.search(url):
+                return ttl
+        return self.default_ttl
+
+    def _blob_path(self, body_hash: str) -> Path:
+        return self.directory / "blobs" / body_hash[:2] / f"{body_hash}.z"
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    # --- Lookups ---
+
+    def lookup(self, url: str) -> CachedEntry | None:
+        """Return the entry stored for ``url`` (fresh or stale), or None."""
+        self._count("lookups")
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body_hash, size, content_type, etag, last_modified, stored_at "
+                "FROM entries WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+        body_hash, size, content_type, etag, last_modified, stored_at = row
+        fresh = self._clock() - stored_at < self.ttl_for(url)
+        return CachedEntry(
+            url, body_hash, size, content_type, etag, last_modified, stored_at, fresh
+        )
+
+    def _read_body(self, entry: CachedEntry) -> bytes | None:
+        try:
+            return zlib.decompress(self._blob_path(entry.body_hash).read_bytes())
+        except (OSError, zlib.error) as e:
+            logger.warning(f"Dropping unreadable HTTP cache entry for {entry.url}: {e}")
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM entries WHERE url = ?", (entry.url,))
+                self._release_blob(entry.body_hash)
+            return None
+
+    def _response(self, entry: CachedEntry, body: bytes, state: str) -> httpx.Response:
+        headers = {"X-Cache": state}
+        for name, value in (
+            ("Content-Type", entry.content_type),
+            ("ETag", entry.etag),
+            ("Last-Modified", entry.last_modified),
+        ):
+            if value:
+                headers[name] = value
+        return httpx.Response(
+            200, headers=headers, content=body, request=httpx.Request("GET", entry.url)
+        )
+
+    def cached_response(self, entry: CachedEntry) -> httpx.Response | None:
+        """Serve a fresh entry without touching the network."""
+        body = self._read_body(entry)
+        if body is None:
+            self._count("misses")
+            return None
+        self._touch(entry.url)
+        self._count("hits")
+        self._count("bytes_saved", len(body))
+        return self._response(entry, body, "HIT")
+
+    # --- Updates ---
+
+    def _touch(self, url: str, *, stored_at: float | None = None) -> None:
+        now = self._clock()
+        with self._lock, self._db:
+            if stored_at is None:
+                self._db.execute("UPDATE entries SET accessed_at = ? WHERE url = ?", (now, url))
+            else:
+                self._db.execute(
+                    "UPDATE entries SET accessed_at = ?, stored_at = ? WHERE url = ?",
+                    (now, stored_at, url),
+                )
+
+    def update(self, url: str, entry: CachedEntry | None, response: httpx.Response) -> httpx.Response:
+        """Record a network response for ``url`` and return what the caller should see.
+
+        A ``304`` to a conditional GET is answered with the cached body; a ``200``
+        is stored when it can be reused (positive TTL or validators).
+        """
+        if response.status_code == 304 and entry is not None:
+            body = self._read_body(entry)
+            if body is not None:
+                self._touch(url, stored_at=self._clock())
+                self._count("revalidated")
+                self._count("bytes_saved", len(body))
+                return self._response(entry, body, "REVALIDATED")
+            return response
+        if entry is not None:
+            self._count("misses")
+        if response.status_code == 200:
+            self.store(url, response)
+        return response
+
+    def store(self, url: str, response: httpx.Response) -> bool:
+        """Store a 200 response body; returns False when it is not cacheable."""
+        if "no-store" in response.headers.get("Cache-Control", "").lower():
+            return False
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.ttl_for(url) <= 0 and not (etag or last_modified):
+            return False
+        body = response.content
+        body_hash = hashlib.sha256(body).hexdigest()
+        blob = self._blob_path(body_hash)
+        now = self._clock()
+        try:
+            if not blob.exists():
+                blob.parent.mkdir(parents=True, exist_ok=True)
+                tmp = blob.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(zlib.compress(body, 6))
+                os.replace(tmp, blob)
+            with self._lock, self._db:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO blobs (hash, stored_size) VALUES (?, ?)",
+                    (body_hash, blob.stat().st_size),
+                )
+                previous = self._db.execute(
+                    "SELECT body_hash FROM entries WHERE url = ?", (url,)
+                ).fetchone()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (url, body_hash, size, content_type, etag, "
+                    "last_modified, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        url,
+                        body_hash,
+                        len(body),
+                        response.headers.get("Content-Type"),
+                        etag,
+                        last_modified,
+                        now,
+                        now,
+                    ),
+                )
+                if previous is not None and previous[0] != body_hash:
+                    self._release_blob(previous[0])
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not cache response for {url}: {e}")
+            return False
+        self._count("stores")
+        self._evict()
+        return True
+
+    def _release_blob(self, body_hash: str) -> int:
+        """Delete ``body_hash`` once no entry references it; returns the bytes freed.
+
+        Must be called with the lock held, inside a transaction.
+        """
+        shared = self._db.execute(
+            "SELECT 1 FROM entries WHERE body_hash = ? LIMIT 1", (body_hash,)
+        ).fetchone()
+        if shared is not None:
+            return 0
+        size = self._db.execute(
+            "SELECT stored_size FROM blobs WHERE hash = ?", (body_hash,)
+        ).fetchone()
+        self._db.execute("DELETE FROM blobs WHERE hash = ?", (body_hash,))
+        self._blob_path(body_hash).unlink(missing_ok=True)
+        return size[0] if size else 0
+
+    def _evict(self) -> None:
+        with self._lock, self._db:
+            # Blobs left behind by a replaced or dropped entry (e.g. by another process).
+            orphans = self._db.execute(
+                "SELECT hash FROM blobs WHERE hash NOT IN (SELECT body_hash FROM entries)"
+            ).fetchall()
+            for (body_hash,) in orphans:
+                self._release_blob(body_hash)
+            total = self._db.execute("SELECT COALESCE(SUM(stored_size), 0) FROM blobs").fetchone()[0]
+            evicted = 0
+            while total > self.max_bytes:
+                row = self._db.execute(
+                    "SELECT url, body_hash FROM entries ORDER BY accessed_at LIMIT 1"
+                ).fetchone()
+                if row is None:
+                    break
+                url, body_hash = row
+                self._db.execute("DELETE FROM entries WHERE url = ?", (url,))
+                evicted += 1
+                total -= self._release_blob(body_hash)
+            self._counters["evictions"] += evicted
+
+    def clear(self) -> None:
+        """Drop every entry and blob."""
+        with self._lock, self._db:
+            hashes = [row[0] for row in self._db.execute("SELECT hash FROM blobs")]
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM blobs")
+        for body_hash in hashes:
+            self._blob_path(body_hash).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # --- Monitoring ---
+
+    def stats(self) -> dict[str, Any]:
+        """Return usage counters, hit rate and on-disk footprint."""
+        with self._lock:
+            counters = dict(self._counters)
+            entries, body_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            disk_bytes = self._db.execute(
+                "SELECT COALESCE(SUM(stored_size), 0) FROM blobs"
+            ).fetchone()[0]
+        served = counters["hits"] + counters["revalidated"]
+        return {
+            **counters,
+            "hit_rate": served / counters["lookups"] if counters["lookups"] else 0.0,
+            "entries": entries,
+            "body_bytes": body_bytes,
+            "disk_bytes": disk_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+_cache: HttpCache | None = None
+_cache_failed = False
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache | None:
+    """Return the process-wide cache, or None when ``HTTP_CACHE_ENABLED`` is off."""
+    global _cache, _cache_failed
+    if not config.HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None and not _cache_failed:
+            try:
+                _cache = HttpCache(
+                    config.HTTP_CACHE_DIR,
+                    max_bytes=int(config.HTTP_CACHE_MAX_MB * 1024 * 1024),
+                    ttl_rules=[
+                        *parse_ttl_rules(config.HTTP_CACHE_TTL_RULES),
+                        *DEFAULT_TTL_RULES,
+                    ],
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"HTTP cache disabled, cannot open {config.HTTP_CACHE_DIR}: {e}")
+                _cache_failed = True
+                return None
+            logger.info(f"HTTP cache initialized in {config.HTTP_CACHE_DIR}.")
+        return _cache
+
+
+def reset_http_cache() -> None:
+    """Close and forget the process-wide cache (mainly for tests)."""
+    global _cache, _cache_failed
+    with _cache_lock:
+        cache, _cache = _cache, None
+        _cache_failed = False
+    if cache is not None:
+        cache.close()
+
+
+def _forget_cache_in_child() -> None:
+    # SQLite connections must not be shared across fork().
+    global _cache, _cache_failed, _cache_lock
+    _cache = None
+    _cache_failed = False
+    _cache_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_cache_in_child)
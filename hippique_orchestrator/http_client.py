@@ -0,0 +1,373 @@
+"""
+Process-wide pooled HTTP clients shared by every provider and scraper.
+
+:class:`HttpClientPool` owns one keep-alive ``httpx.Client`` for the
+synchronous providers (run in worker threads) and one ``httpx.AsyncClient``
+per event loop, both with HTTP/2 when the ``h2`` package is installed.  Every
+request goes through the standard retry policy of :mod:`utils.retry`
+(transport errors, 429 and 5xx responses), is limited to
+``HTTP_MAX_CONNECTIONS_PER_HOST`` concurrent requests per host, and is
+recorded in per-host counters (latency, retries, new vs. reused connections).
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import weakref
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urljoin, urlsplit
+
+import httpx
+from tenacity import AsyncRetrying, Retrying, retry_if_exception_type
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+from hippique_orchestrator.utils.retry import (
+    BACKOFF_BASE_S,
+    TIMEOUT_S,
+    TOTAL_ATTEMPTS,
+    retry_policy,
+)
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # pragma: no cover - HTTP/2 is optional
+    h2 = None
+
+logger = get_logger(__name__)
+
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0 (compatible; GPI/5.1; +https://example.local)"}
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+_NEW_CONNECTION_EVENT = "connection.connect_tcp.started"
+
+
+class _RetryableStatus(Exception):
+    def __init__(self, response: httpx.Response) -> None:
+        super().__init__(f"HTTP {response.status_code} for {response.request.url}")
+        self.response = response
+
+
+@dataclass
+class _HostStats:
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    new_connections: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        completed = self.requests - self.errors
+        reused = max(completed - self.new_connections, 0)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "new_connections": self.new_connections,
+            "reused_connections": reused,
+            "connection_reuse_rate": reused / completed if completed else 0.0,
+            "latency_avg_ms": self.latency_total / self.requests * 1000 if self.requests else 0.0,
+            "latency_max_ms": self.latency_max * 1000,
+        }
+
+
+class HttpClientPool:
+    """Shared sync/async httpx clients with retries, per-host limits and metrics."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float | None = None,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+        per_host_limit: int | None = None,
+        http2: bool | None = None,
+        attempts: int = TOTAL_ATTEMPTS,
+        backoff: float = BACKOFF_BASE_S,
+        headers: Mapping[str, str] | None = None,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.timeout = TIMEOUT_S if timeout is None else timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections or config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=(
+                max_keepalive_connections or config.HTTP_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=(
+                config.HTTP_KEEPALIVE_EXPIRY_S if keepalive_expiry is None else keepalive_expiry
+            ),
+        )
+        self.per_host_limit = per_host_limit or config.HTTP_MAX_CONNECTIONS_PER_HOST
+        wanted_http2 = config.HTTP2_ENABLED if http2 is None else http2
+        self.http2 = bool(wanted_http2 and h2 is not None)
+        self.attempts = max(attempts, 1)
+        self.backoff = backoff
+        self.headers = dict(DEFAULT_HEADERS if headers is None else headers)
+        self._transport = transport
+        self._async_transport = async_transport
+        self._lock = threading.Lock()
+        self._sync_client: httpx.Client | None = None
+        self._host_semaphores: dict[str, threading.BoundedSemaphore] = {}
+        # AsyncClient and asyncio primitives are bound to the loop that created them.
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._async_semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._stats: dict[str, _HostStats] = {}
+
+    # --- Clients ---
+
+    def _client_kwargs(self) -> dict[str, Any]:
+        return {
+            "timeout": self.timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+            "headers": self.headers,
+            "follow_redirects": True,
+        }
+
+    def sync_client(self) -> httpx.Client:
+        """Return the shared synchronous client, creating it on first use."""
+        with self._lock:
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    transport=self._transport, **self._client_kwargs()
+                )
+            return self._sync_client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Return the shared async client of the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    transport=self._async_transport, **self._client_kwargs()
+                )
+                self._async_clients[loop] = client
+            return client
+
+    def bind(self, base_url: str) -> BoundHttpClient:
+        """Return a view of the pool resolving relative URLs against ``base_url``."""
+        return BoundHttpClient(self, base_url)
+
+    # --- Bookkeeping ---
+
+    def _host_stats(self, host: str) -> _HostStats:
+        stats = self._stats.get(host)
+        if stats is None:
+            stats = self._stats[host] = _HostStats()
+        return stats
+
+    def _record(self, host: str, elapsed: float, *, retry: bool, error: bool) -> None:
+        with self._lock:
+            stats = self._host_stats(host)
+            stats.requests += 1
+            stats.retries += int(retry)
+            stats.errors += int(error)
+            stats.latency_total += elapsed
+            stats.latency_max = max(stats.latency_max, elapsed)
+
+    def _record_new_connection(self, host: str) -> None:
+        with self._lock:
+            self._host_stats(host).new_connections += 1
+
+    def _sync_semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+
+    def _async_semaphore(self, host: str) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._async_semaphores.setdefault(loop, {})
+            semaphore = semaphores.get(host)
+            if semaphore is None:
+                semaphore = semaphores[host] = asyncio.Semaphore(self.per_host_limit)
+            return semaphore
+
+    def _retrying_kwargs(self) -> dict[str, Any]:
+        return {
+            **retry_policy(self.attempts, self.backoff),
+            "retry": retry_if_exception_type((httpx.TransportError, _RetryableStatus)),
+        }
+
+    # --- Requests ---
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared sync client with the standard retry policy.
+
+        Retryable statuses are returned as the final response once attempts run
+        out, so callers keep using ``raise_for_status()``.
+        """
+        client = self.sync_client()
+        host = urlsplit(url).netloc
+
+        def trace(event_name: str, info: Mapping[str, Any]) -> None:
+            if event_name == _NEW_CONNECTION_EVENT:
+                self._record_new_connection(host)
+
+        extensions = {**kwargs.pop("extensions", {}), "trace": trace}
+        try:
+            for attempt in Retrying(**self._retrying_kwargs()):
+                with attempt:
+                    retry = attempt.retry_state.attempt_number > 1
+                    start = time.perf_counter()
+                    try:
+                        with self._sync_semaphore(host):
+                            response = client.request(
+                                method, url, extensions=extensions, **kwargs
+                            )
+                    except httpx.TransportError:
+                        self._record(host, time.perf_counter() - start, retry=retry, error=True)
+                        raise
+                    self._record(host, time.perf_counter() - start, retry=retry, error=False)
+                    if response.status_code in RETRYABLE_STATUS:
+                        raise _RetryableStatus(response)
+                    return response
+        except _RetryableStatus as e:
+            return e.response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    async def arequest(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Async counterpart of :meth:`request` using the loop's shared AsyncClient."""
+        client = self.async_client()
+        host = urlsplit(url).netloc
+
+        async def trace(event_name: str, info: Mapping[str, Any]) -> None:
+            if event_name == _NEW_CONNECTION_EVENT:
+                self._record_new_connection(host)
+
+        extensions = {**kwargs.pop("extensions", {}), "trace": trace}
+        try:
+            async for attempt in AsyncRetrying(**self._retrying_kwargs()):
+                with attempt:
+                    retry = attempt.retry_state.attempt_number > 1
+                    start = time.perf_counter()
+                    try:
+                        async with self._async_semaphore(host):
+                            response = await client.request(
+                                method, url, extensions=extensions, **kwargs
+                            )
+                    except httpx.TransportError:
+                        self._record(host, time.perf_counter() - start, retry=retry, error=True)
+                        raise
+                    self._record(host, time.perf_counter() - start, retry=retry, error=False)
+                    if response.status_code in RETRYABLE_STATUS:
+                        raise _RetryableStatus(response)
+                    return response
+        except _RetryableStatus as e:
+            return e.response
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    async def aget(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.arequest("GET", url, **kwargs)
+
+    # --- Lifecycle and monitoring ---
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool configuration and per-host request counters."""
+        with self._lock:
+            hosts = {host: stats.as_dict() for host, stats in self._stats.items()}
+        return {
+            "http2": self.http2,
+            "per_host_limit": self.per_host_limit,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """Close the sync client; async clients are closed by :meth:`aclose`."""
+        with self._lock:
+            client, self._sync_client = self._sync_client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and the sync client."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+        self.close()
+
+
+class BoundHttpClient:
+    """View of a :class:`HttpClientPool` (or anything with ``get``/``aget``) for a single site."""
+
+    def __init__(self, pool: Any, base_url: str) -> None:
+        self.pool = pool
+        self.base_url = base_url.rstrip("/") + "/"
+
+    def _url(self, url: str) -> str:
+        return urljoin(self.base_url, url.lstrip("/")) if "://" not in url else url
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.pool.get(self._url(url), **kwargs)
+
+    async def aget(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.pool.aget(self._url(url), **kwargs)
+
+
+# --- Process-wide pool ---
+
+_pool: HttpClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HttpClientPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = HttpClientPool()
+            logger.info(
+                f"HTTP client pool initialized (http2={_pool.http2}, "
+                f"per_host_limit={_pool.per_host_limit})."
+            )
+        return _pool
+
+
+def reset_http_pool() -> None:
+    """Close and forget the process-wide pool (mainly for tests)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+def _forget_pool_in_child() -> None:
+    # Sockets inherited through fork() must not be shared with the parent.
+    global _pool, _pool_lock
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_pool_in_child)
+
+
+def http_get(url: str, **kwargs: Any) -> httpx.Response:
+    """GET ``url`` through the process-wide pool."""
+    return get_http_pool().get(url, **kwargs)
+
+
+async def async_http_get(url: str, **kwargs: Any) -> httpx.Response:
+    """GET ``url`` through the process-wide pool's async client."""
+    return await get_http_pool().aget(url, **kwargs)
@@ -0,0 +1,146 @@
+"""
+Day-scoped cache of jockey, driver and trainer statistics.
+
+The same people ride and train in many races of a day, so their profile pages
+only need to be fetched and parsed once per day.  :class:`DayStatsCache` keys
+parsed stats by ``(day, entity type, entity id)`` and keeps them at two levels:
+an in-process :class:`MemoCache` and a Firestore collection
+(``JE_STATS_CACHE_COLLECTION``) shared by every Cloud Run instance, read with
+batched ``get_all`` calls and written behind.  Counters report, per day, how
+many profile fetches were avoided.
+"""
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from hippique_orchestrator import config, firestore_client
+from hippique_orchestrator.logging_utils import get_logger
+from hippique_orchestrator.memo_cache import MemoCache
+
+logger = get_logger(__name__)
+
+
+def today() -> str:
+    """Racing day (in ``TIMEZONE``) used as the default cache scope."""
+    return datetime.now(ZoneInfo(config.TIMEZONE)).date().isoformat()
+
+
+class DayStatsCache:
+    """Two-level (process, Firestore) cache of per-day entity stats."""
+
+    def __init__(self, collection: str | None = None, *, maxsize: int = 5000) -> None:
+        self.collection = collection or config.JE_STATS_CACHE_COLLECTION
+        # Entries never outlive their day: the day is part of every key.
+        self._memo = MemoCache(maxsize=maxsize, ttl=86400 * 2)
+        self._writer = firestore_client.WriteBehindBuffer(self.collection, max_pending=50)
+        self._lock = threading.Lock()
+        self._days: dict[str, dict[str, int]] = {}
+
+    @staticmethod
+    def doc_id(day: str, entity_type: str, entity_id: str) -> str:
+        return f"{day}_{entity_type}_{entity_id}"
+
+    def _count(self, day: str, name: str, amount: int = 1) -> None:
+        with self._lock:
+            counters = self._days.setdefault(
+                day, {"local_hits": 0, "shared_hits": 0, "misses": 0, "stored": 0}
+            )
+            counters[name] += amount
+
+    @staticmethod
+    def _stats_of(doc: Any) -> dict[str, Any] | None:
+        if isinstance(doc, dict) and isinstance(doc.get("stats"), dict):
+            return doc["stats"]
+        return None
+
+    def get(self, entity_type: str, entity_id: str, day: str | None = None) -> dict[str, Any] | None:
+        """Return the stats cached for the entity on ``day`` (default: today), or None."""
+        day = day or today()
+        doc_id = self.doc_id(day, entity_type, entity_id)
+        stats = self._memo.get(doc_id)
+        if stats is not None:
+            self._count(day, "local_hits")
+            return stats
+        stats = self._stats_of(self._writer.get(doc_id))
+        if stats is None:
+            stats = self._stats_of(firestore_client.get_document(self.collection, doc_id))
+            if stats is None:
+                self._count(day, "misses")
+                return None
+        self._memo.put(doc_id, stats)
+        self._count(day, "shared_hits")
+        return stats
+
+    def prefetch(self, entities: Iterable[tuple[str, str]], day: str | None = None) -> int:
+        """Load the shared entries of many ``(entity_type, entity_id)`` pairs in one read.
+
+        Returns how many were found; later :meth:`get` calls are served locally.
+        """
+        day = day or today()
+        wanted = [
+            doc_id
+            for entity_type, entity_id in entities
+            if entity_id
+            and (doc_id := self.doc_id(day, entity_type, entity_id)) not in self._memo
+        ]
+        if not wanted:
+            return 0
+        found = 0
+        for doc_id, doc in firestore_client.get_documents(self.collection, wanted).items():
+            stats = self._stats_of(doc)
+            if stats is not None:
+                self._memo.put(doc_id, stats)
+                found += 1
+        return found
+
+    def put(
+        self, entity_type: str, entity_id: str, stats: dict[str, Any], day: str | None = None
+    ) -> None:
+        """Store freshly parsed stats locally and, write-behind, in the shared store."""
+        day = day or today()
+        doc_id = self.doc_id(day, entity_type, entity_id)
+        self._memo.put(doc_id, stats)
+        self._writer.put(
+            doc_id,
+            {
+                "day": day,
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "stats": stats,
+                "cached_at": datetime.now(timezone.utc),
+            },
+        )
+        self._count(day, "stored")
+
+    def flush(self) -> int:
+        return self._writer.flush()
+
+    def clear(self) -> None:
+        """Forget local entries, pending writes and counters (the shared store is untouched)."""
+        self._memo.clear()
+        self._writer.clear()
+        with self._lock:
+            self._days.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            days = {
+                day: {**counters, "fetches_avoided": counters["local_hits"] + counters["shared_hits"]}
+                for day, counters in sorted(self._days.items())
+            }
+        return {"memo": self._memo.stats(), "write_behind": self._writer.stats(), "days": days}
+
+
+_cache: DayStatsCache | None = None
+
+
+def get_day_stats_cache() -> DayStatsCache:
+    """Return the process-wide cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = DayStatsCache()
+    return _cache
@@ -0,0 +1,110 @@
+"""
+Bounded, thread-safe memoisation cache.
+
+:class:`MemoCache` is a least-recently-used mapping with an optional
+time-to-live, guarded by a lock so it can be shared by the threadpool workers
+that serve FastAPI requests.  It keeps hit, miss, eviction and expiration
+counters for the debug endpoints.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+_MISSING = object()
+
+
+class MemoCache:
+    """LRU cache with optional TTL (seconds) and usage counters."""
+
+    def __init__(
+        self,
+        maxsize: int = 500,
+        ttl: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self.maxsize = maxsize
+        self.ttl = ttl if ttl and ttl > 0 else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def _live_value(self, key: Hashable) -> Any:
+        # Caller holds the lock.
+        item = self._data.get(key, _MISSING)
+        if item is _MISSING:
+            return _MISSING
+        expires_at, value = item
+        if expires_at is not None and expires_at <= self._clock():
+            del self._data[key]
+            self._expirations += 1
+            return _MISSING
+        return value
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` and mark it as recently used."""
+        with self._lock:
+            value = self._live_value(key)
+            if value is _MISSING:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value for ``key`` without touching counters or recency."""
+        with self._lock:
+            value = self._live_value(key)
+            return default if value is _MISSING else value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store ``value``, evicting the least recently used entries if full."""
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept."""
+        with self._lock:
+            self._data.clear()
+
+    def keys(self) -> list[Hashable]:
+        """Return the keys from least to most recently used."""
+        with self._lock:
+            return list(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING  # type: ignore[arg-type]
+
+    def stats(self) -> dict[str, Any]:
+        """Return size, configuration and usage counters."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
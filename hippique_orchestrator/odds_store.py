@@ -0,0 +1,352 @@
+"""
+Columnar odds time series, one Arrow IPC dataset per race day.
+
+Snapshots are saved as one JSON blob per race and phase; drift, CLV analysis
+and replays only need their odds, and reading them back means opening and
+parsing one file per race.  This store keeps every snapshot's odds as rows of
+``(race, runner, phase, ts, odds_win, odds_place, source)``::
+
+    {ODDS_STORE_DIR}/{day}/part-{ns}-{pid}.arrow   appended batches
+    {ODDS_STORE_DIR}/{day}/compact.arrow           earlier parts, merged and sorted
+
+Rows are buffered in memory and written as a new part every
+``ODDS_STORE_FLUSH_ROWS`` rows (and on :meth:`OddsStore.flush`); once a day
+has ``ODDS_STORE_MAX_PARTS`` parts they are merged into ``compact.arrow``,
+sorted by race, runner and time.  Files are uncompressed Arrow IPC written
+under a temporary name and renamed, and are scanned through memory maps with
+the race/runner/phase/time filter pushed down into the dataset scan.
+
+pyarrow is optional: without it the store keeps nothing and reads are empty.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+except ImportError:  # pragma: no cover - depends on the environment
+    pa = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+from hippique_orchestrator import config
+from hippique_orchestrator.analysis_utils import normalize_phase
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+COMPACT_NAME = "compact.arrow"
+COLUMNS = ("race", "runner", "phase", "ts", "odds_win", "odds_place", "source")
+SORT_KEYS = [("race", "ascending"), ("runner", "ascending"), ("ts", "ascending")]
+
+if pa is not None:
+    SCHEMA = pa.schema(
+        [
+            ("race", pa.string()),
+            ("runner", pa.int32()),
+            ("phase", pa.string()),
+            ("ts", pa.timestamp("us", tz="UTC")),
+            ("odds_win", pa.float64()),
+            ("odds_place", pa.float64()),
+            ("source", pa.string()),
+        ]
+    )
+else:  # pragma: no cover - depends on the environment
+    SCHEMA = None
+
+
+def available() -> bool:
+    return pa is not None
+
+
+def _odds(value: Any) -> float | None:
+    try:
+        odds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return odds if odds > 0 else None
+
+
+def _timestamp(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        ts = value
+    elif isinstance(value, str):
+        try:
+            ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            ts = datetime.now(timezone.utc)
+    else:
+        ts = datetime.now(timezone.utc)
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def rows_from_snapshot(
+    race: str, phase: str, snapshot: dict[str, Any], ts: datetime | None = None
+) -> list[dict[str, Any]]:
+    """One row per runner of a normalized snapshot dict (``runners[].num/odds_*``)."""
+    ts = _timestamp(ts or snapshot.get("fetched_at") or snapshot.get("scraped_at"))
+    source = snapshot.get("source_snapshot") or snapshot.get("source")
+    phase = normalize_phase(phase)
+    rows = []
+    for runner in snapshot.get("runners") or []:
+        try:
+            num = int(runner.get("num"))
+        except (TypeError, ValueError):
+            continue
+        odds_win, odds_place = _odds(runner.get("odds_win")), _odds(runner.get("odds_place"))
+        if odds_win is None and odds_place is None:
+            continue
+        rows.append(
+            {
+                "race": race, "runner": num, "phase": phase, "ts": ts,
+                "odds_win": odds_win, "odds_place": odds_place, "source": source,
+            }
+        )
+    return rows
+
+
+class OddsStore:
+    """Buffered, compacting writer and filtered reader of the per-day datasets."""
+
+    def __init__(
+        self,
+        root: str | os.PathLike[str] | None = None,
+        *,
+        flush_rows: int | None = None,
+        max_parts: int | None = None,
+    ) -> None:
+        self.root = Path(root or config.ODDS_STORE_DIR)
+        self.flush_rows = flush_rows or config.ODDS_STORE_FLUSH_ROWS
+        self.max_parts = max_parts or config.ODDS_STORE_MAX_PARTS
+        self._lock = threading.RLock()
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._filesystem = pafs.LocalFileSystem(use_mmap=True) if pa is not None else None
+        self._rows_written = 0
+        self._parts_written = 0
+        self._compactions = 0
+        self._warned = False
+
+    def _disabled(self) -> bool:
+        if pa is None and not self._warned:
+            logger.warning("pyarrow is not installed; the odds store is disabled.")
+            self._warned = True
+        return pa is None
+
+    # --- writes -------------------------------------------------------------
+
+    def append(self, day: str, rows: Iterable[dict[str, Any]]) -> int:
+        """Buffer ``rows`` for ``day``; returns how many were added."""
+        rows = list(rows)
+        if not rows or self._disabled():
+            return 0
+        with self._lock:
+            buffer = self._buffers.setdefault(day, [])
+            buffer.extend(rows)
+            if len(buffer) >= self.flush_rows:
+                self._flush_day(day)
+        return len(rows)
+
+    def append_snapshot(
+        self, day: str, race: str, phase: str, snapshot: dict[str, Any], ts: datetime | None = None
+    ) -> int:
+        return self.append(day, rows_from_snapshot(race, phase, snapshot, ts))
+
+    def flush(self, day: str | None = None) -> None:
+        """Write the buffered rows of ``day`` (every day by default) as new parts."""
+        if pa is None:
+            return
+        with self._lock:
+            for buffered_day in [day] if day else list(self._buffers):
+                self._flush_day(buffered_day)
+
+    def _day_dir(self, day: str) -> Path:
+        return self.root / day
+
+    def _parts(self, day: str) -> list[Path]:
+        return sorted(self._day_dir(day).glob("part-*.arrow"))
+
+    def _write(self, table: pa.Table, path: Path) -> None:
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        os.replace(tmp, path)
+
+    def _flush_day(self, day: str) -> None:
+        # Caller holds the lock.
+        rows = self._buffers.pop(day, None)
+        if not rows:
+            return
+        directory = self._day_dir(day)
+        directory.mkdir(parents=True, exist_ok=True)
+        table = pa.Table.from_pylist(rows, schema=SCHEMA)
+        self._write(table, directory / f"part-{time.time_ns():020d}-{os.getpid()}.arrow")
+        self._rows_written += len(rows)
+        self._parts_written += 1
+        if len(self._parts(day)) >= self.max_parts:
+            self._compact_day(day)
+
+    @contextmanager
+    def _day_file_lock(self, day: str):
+        # Serializes compactions of one day between worker processes.
+        if fcntl is None:
+            yield
+            return
+        with open(self._day_dir(day) / ".lock", "w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def compact(self, day: str) -> Path | None:
+        """Flush ``day`` and merge all of its files into ``compact.arrow``."""
+        if self._disabled():
+            return None
+        with self._lock:
+            self._flush_day(day)
+            return self._compact_day(day)
+
+    def _compact_day(self, day: str) -> Path | None:
+        # Caller holds the lock.
+        directory = self._day_dir(day)
+        if not directory.is_dir():
+            return None
+        with self._day_file_lock(day):
+            parts = self._parts(day)
+            if not parts:
+                return None
+            compact = directory / COMPACT_NAME
+            sources = ([compact] if compact.exists() else []) + parts
+            table = self._dataset(sources).to_table().sort_by(SORT_KEYS)
+            self._write(table, compact)
+            for part in parts:
+                part.unlink(missing_ok=True)
+        self._compactions += 1
+        logger.info(f"Compacted {len(parts)} odds parts of {day} ({table.num_rows} rows).")
+        return compact
+
+    # --- reads --------------------------------------------------------------
+
+    def _dataset(self, paths: Sequence[Path]) -> ds.Dataset:
+        return ds.dataset(
+            [str(p) for p in paths], schema=SCHEMA, format="ipc", filesystem=self._filesystem
+        )
+
+    def _day_files(self, day: str) -> list[Path]:
+        compact = self._day_dir(day) / COMPACT_NAME
+        return ([compact] if compact.exists() else []) + self._parts(day)
+
+    def scan(
+        self,
+        days: str | Sequence[str],
+        *,
+        races: Sequence[str] | None = None,
+        runners: Sequence[int] | None = None,
+        phases: Sequence[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> pa.Table | None:
+        """Rows of ``days`` matching every given filter (None without pyarrow).
+
+        Rows still buffered in memory are included without being flushed.
+        """
+        if self._disabled():
+            return None
+        days = [days] if isinstance(days, str) else list(days)
+        columns = list(columns or COLUMNS)
+        with self._lock:
+            buffered = [row for day in days for row in self._buffers.get(day, ())]
+        files = [path for day in days for path in self._day_files(day)]
+
+        predicates = []
+        if races is not None:
+            predicates.append(ds.field("race").isin(list(races)))
+        if runners is not None:
+            predicates.append(ds.field("runner").isin([int(r) for r in runners]))
+        if phases is not None:
+            predicates.append(ds.field("phase").isin([normalize_phase(p) for p in phases]))
+        if start is not None:
+            predicates.append(ds.field("ts") >= pa.scalar(_timestamp(start), SCHEMA.field("ts").type))
+        if end is not None:
+            predicates.append(ds.field("ts") < pa.scalar(_timestamp(end), SCHEMA.field("ts").type))
+        expression = None
+        for predicate in predicates:
+            expression = predicate if expression is None else expression & predicate
+
+        tables = []
+        if files:
+            tables.append(self._dataset(files).to_table(columns=columns, filter=expression))
+        if buffered:
+            table = pa.Table.from_pylist(buffered, schema=SCHEMA)
+            if expression is not None:
+                table = table.filter(expression)
+            tables.append(table.select(columns))
+        if not tables:
+            return SCHEMA.empty_table().select(columns)
+        return pa.concat_tables(tables) if len(tables) > 1 else tables[0]
+
+    def latest_odds(self, day: str, race: str, phase: str) -> dict[int, dict[str, Any]]:
+        """``{runner: row}`` with each runner's most recent odds of ``phase``."""
+        table = self.scan(day, races=[race], phases=[phase])
+        latest: dict[int, dict[str, Any]] = {}
+        for row in table.to_pylist() if table is not None else []:
+            current = latest.get(row["runner"])
+            if current is None or row["ts"] >= current["ts"]:
+                latest[row["runner"]] = row
+        return latest
+
+    def phase_snapshot(self, day: str, race: str, phase: str) -> dict[str, Any]:
+        """The odds of the latest ``phase`` snapshot as a snapshot-shaped dict ({} if none)."""
+        latest = self.latest_odds(day, race, phase)
+        if not latest:
+            return {}
+        return {
+            "runners": [
+                {"num": num, "odds_win": row["odds_win"], "odds_place": row["odds_place"]}
+                for num, row in sorted(latest.items())
+            ],
+            "source": "odds_store",
+        }
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "available": pa is not None,
+                "root": str(self.root),
+                "rows_buffered": sum(len(rows) for rows in self._buffers.values()),
+                "rows_written": self._rows_written,
+                "parts_written": self._parts_written,
+                "compactions": self._compactions,
+            }
+
+
+_store: OddsStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_odds_store() -> OddsStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = OddsStore()
+        return _store
+
+
+def reset_odds_store() -> None:
+    """Drop the process-wide store (buffered rows are discarded); used by tests."""
+    global _store
+    with _store_lock:
+        _store = None
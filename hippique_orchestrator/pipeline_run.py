@@ -1,7 +1,11 @@
 import logging
 import math
 import pathlib
+import pickle
 import statistics
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from itertools import combinations
 from typing import Any, Optional
 import json
@@ -12,7 +16,10 @@ from hippique_orchestrator.analysis_utils import (
     score_musique_form,
 )
 from hippique_orchestrator.kelly import calculate_kelly_fraction
-from hippique_orchestrator.simulate_wrapper import evaluate_combo
+from hippique_orchestrator.simulate_wrapper import (
+    combo_probability_upper_bounds,
+    evaluate_combo,
+)
 
 # --- Constants ---
 REAL_FAVORITE_PLACE_THRESHOLD = 0.25
@@ -22,6 +29,8 @@ MIN_SP_DUTCHING_CANDIDATES = 2
 MID_RANGE_ODDS_LOWER_BOUND = 4.0
 MID_RANGE_ODDS_UPPER_BOUND = 7.0
 MAX_SP_DUTCHING_CANDIDATES = 3
+# Slack on the combo ROI/payout bounds so float noise never prunes a tie.
+COMBO_BOUND_TOLERANCE = 1e-9
 
 
 # --- Logging ---
@@ -549,6 +558,16 @@ def _get_legs_for_exotic_type(exotic_type: str) -> int:
     return 3
 
 
+def _combo_roi_bounds(prob_bound: float, odds: float, bankroll: float) -> tuple[float, float]:
+    """Returns optimistic ``(roi, payout_expected)`` for a combo evaluated by ``evaluate_combo``.
+
+    A single Kelly-staked ticket has ROI ``p * odds - 1`` (zero when unstaked)
+    and its stake never exceeds ``bankroll``, so both values grow with ``p``.
+    """
+    gross = prob_bound * odds
+    return max(gross - 1.0, 0.0), gross * bankroll
+
+
 def _generate_exotic_tickets(
     sp_candidates: list[dict[str, Any]],
     snapshot_data: dict[str, Any],
@@ -576,45 +595,84 @@ def _generate_exotic_tickets(
 
     combo_budget = budget * (1 - sp_config["budget_ratio"])
     best_combo_overall = None
+    search_stats = {"combos": 0, "pruned_threshold": 0, "pruned_bound": 0, "evaluated": 0}
 
+    # Bound every combination cheaply, drop those that cannot clear the
+    # thresholds, then evaluate the survivors from the most promising down.
+    survivors = []
     for exotic_type in allowed_exotic_types:
         num_legs = _get_legs_for_exotic_type(exotic_type)
         if len(sp_candidates) < num_legs:
             continue
 
-        exotic_combinations = list(combinations(sp_candidates, num_legs))
-
-        for combo in exotic_combinations:
+        priced_combos = []
+        for combo in combinations(sp_candidates, num_legs):
             combo_legs = list(combo)
             try:
                 combo_odds_heuristic = math.prod(leg["odds"] for leg in combo_legs)
             except (TypeError, KeyError):
                 continue
+            priced_combos.append((combo_legs, combo_odds_heuristic))
+        search_stats["combos"] += len(priced_combos)
 
-            combo_eval_result = evaluate_combo(
-                tickets=[{"type": exotic_type, "odds": combo_odds_heuristic, "legs": combo_legs}],
-                bankroll=combo_budget,
-                calibration=CALIB_PATH,
-            )
+        prob_bounds = combo_probability_upper_bounds(legs for legs, _ in priced_combos)
+        for (combo_legs, combo_odds), prob_bound in zip(priced_combos, prob_bounds, strict=True):
+            roi_bound, payout_bound = _combo_roi_bounds(prob_bound, combo_odds, combo_budget)
+            if (
+                roi_bound + COMBO_BOUND_TOLERANCE < ev_min_combo
+                or payout_bound * (1 + COMBO_BOUND_TOLERANCE) < payout_min_combo
+            ):
+                search_stats["pruned_threshold"] += 1
+                continue
+            survivors.append((roi_bound, len(survivors), exotic_type, combo_legs, combo_odds))
 
-            if combo_eval_result.get("status") == "ok":
-                is_profitable = (
-                    combo_eval_result.get("roi", 0) >= ev_min_combo
-                    and combo_eval_result.get("payout_expected", 0) >= payout_min_combo
-                )
-                if is_profitable:
-                    current_combo_details = {
-                        "type": exotic_type,
-                        "legs": [c["num"] for c in combo_legs],
-                        "roi": combo_eval_result.get("roi"),
-                        "payout": combo_eval_result.get("payout_expected"),
-                    }
+    # Ties keep the enumeration order so the pick matches an exhaustive scan.
+    survivors.sort(key=lambda survivor: (-survivor[0], survivor[1]))
+    for position, (roi_bound, order, exotic_type, combo_legs, combo_odds) in enumerate(survivors):
+        if (
+            best_combo_overall is not None
+            and roi_bound + COMBO_BOUND_TOLERANCE < best_combo_overall["roi"]
+        ):
+            search_stats["pruned_bound"] += len(survivors) - position
+            break
 
-                    if (
-                        best_combo_overall is None
-                        or current_combo_details["roi"] > best_combo_overall["roi"]
-                    ):
-                        best_combo_overall = current_combo_details
+        search_stats["evaluated"] += 1
+        combo_eval_result = evaluate_combo(
+            tickets=[{"type": exotic_type, "odds": combo_odds, "legs": combo_legs}],
+            bankroll=combo_budget,
+            calibration=CALIB_PATH,
+        )
+
+        if combo_eval_result.get("status") == "ok":
+            is_profitable = (
+                combo_eval_result.get("roi", 0) >= ev_min_combo
+                and combo_eval_result.get("payout_expected", 0) >= payout_min_combo
+            )
+            if is_profitable:
+                current_combo_details = {
+                    "type": exotic_type,
+                    "legs": [c["num"] for c in combo_legs],
+                    "roi": combo_eval_result.get("roi"),
+                    "payout": combo_eval_result.get("payout_expected"),
+                    "order": order,
+                }
+
+                if (
+                    best_combo_overall is None
+                    or current_combo_details["roi"] > best_combo_overall["roi"]
+                    or (
+                        current_combo_details["roi"] == best_combo_overall["roi"]
+                        and order < best_combo_overall["order"]
+                    )
+                ):
+                    best_combo_overall = current_combo_details
+
+    logger.info(
+        f"EXOTIC_COMBO_SEARCH combos={search_stats['combos']} "
+        f"evaluated={search_stats['evaluated']} "
+        f"pruned_threshold={search_stats['pruned_threshold']} "
+        f"pruned_bound={search_stats['pruned_bound']}"
+    )
 
     if best_combo_overall:
         final_tickets.append(
@@ -816,3 +874,91 @@ def generate_tickets(snapshot_data: dict[str, Any], gpi_config: dict[str, Any])
     # --- End Implied Odds + Steam/Drift Table ---
 
     return analysis_result
+
+
+# ==============================================================================
+# Batch Mode
+# ==============================================================================
+
+# GPI config unpickled once per worker process by ``_init_batch_worker``.
+_BATCH_CONFIG: dict[str, Any] | None = None
+
+
+def _init_batch_worker(config_blob: bytes, initializer: Callable[[], None] | None) -> None:
+    """Loads the shared GPI config in a pool worker and runs the caller's hook."""
+    global _BATCH_CONFIG
+    _BATCH_CONFIG = pickle.loads(config_blob)
+    if initializer is not None:
+        initializer()
+
+
+def _run_batch_race(
+    race_key: str,
+    snapshot_data: dict[str, Any],
+    overrides: dict[str, Any] | None,
+    base_config: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Runs ``generate_tickets`` for one race of a batch and times it."""
+    gpi_config = base_config if base_config is not None else _BATCH_CONFIG
+    if overrides:
+        gpi_config = {**gpi_config, **overrides}
+
+    start = time.perf_counter()
+    try:
+        result, error = generate_tickets(snapshot_data, gpi_config), None
+    except Exception as e:  # One broken race must not abort the whole day.
+        logger.error(f"Batch generate_tickets failed for race {race_key}: {e}", exc_info=True)
+        result, error = None, f"{type(e).__name__}: {e}"
+    return {
+        "race": race_key,
+        "result": result,
+        "error": error,
+        "wall_time_s": time.perf_counter() - start,
+    }
+
+
+def generate_tickets_batch(
+    snapshots: Mapping[str, dict[str, Any]] | Iterable[tuple[str, dict[str, Any]]],
+    gpi_config: dict[str, Any],
+    workers: int | None = None,
+    *,
+    config_overrides: Mapping[str, dict[str, Any]] | None = None,
+    initializer: Callable[[], None] | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Runs ``generate_tickets`` over a whole day of races in a process pool.
+
+    ``snapshots`` maps a race key to its snapshot (or yields ``(key, snapshot)``
+    pairs).  ``gpi_config`` is pickled once and loaded once per worker; per-race
+    keys such as ``h30_snapshot_data`` go in ``config_overrides``, keyed like
+    ``snapshots``.  ``initializer`` runs in every worker after the config is
+    loaded and must be picklable.
+
+    Results are yielded as races complete, not in input order, as mappings
+    with ``race``, ``result``, ``error`` and ``wall_time_s``.  ``workers=1``
+    runs in the calling process.
+    """
+    items = snapshots.items() if isinstance(snapshots, Mapping) else snapshots
+    overrides = config_overrides or {}
+
+    if workers == 1:
+        if initializer is not None:
+            initializer()
+        for race_key, snapshot_data in items:
+            yield _run_batch_race(race_key, snapshot_data, overrides.get(race_key), gpi_config)
+        return
+
+    config_blob = pickle.dumps(gpi_config, protocol=pickle.HIGHEST_PROTOCOL)
+    pool = ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_batch_worker, initargs=(config_blob, initializer)
+    )
+    try:
+        futures = [
+            pool.submit(_run_batch_race, race_key, snapshot_data, overrides.get(race_key))
+            for race_key, snapshot_data in items
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # Also reached when the caller stops consuming early.
+        pool.shutdown(wait=True, cancel_futures=True)
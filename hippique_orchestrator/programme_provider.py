@@ -8,8 +8,10 @@ complexities of data source selection and fallbacks.
 from datetime import date
 from typing import Optional
 
+from . import config
 from .data_contract import Programme
 from .logging_utils import get_logger
+from .providers import hedging
 from .providers.base_provider import BaseProgrammeProvider
 from .source_registry import source_registry
 
@@ -40,13 +42,17 @@ def get_programme_for_date(target_date: date) -> Optional[Programme]:
 
     date_str = target_date.strftime("%Y-%m-%d")
 
+    mode = hedging.resolve_mode(config.PROVIDER_FETCH_MODE)
+    if mode != "sequential" and len(providers) > 1:
+        return _get_programme_concurrently(providers, date_str, mode)
+
     for provider in providers:
         provider_name = provider.__class__.__name__
         logger.info(f"Attempting to fetch programme from provider: {provider_name}")
         try:
             # Each provider is responsible for returning data that can be
             # parsed into a Programme object.
-            programme_data = provider.get_programme(date_str)
+            programme_data = hedging.timed_call(provider_name, provider.get_programme, date_str)
 
             if not programme_data or not programme_data.get("races"):
                 logger.warning(
@@ -76,4 +82,43 @@ def get_programme_for_date(target_date: date) -> Optional[Programme]:
     logger.critical(
         f"All configured providers failed to deliver a programme for {date_str}."
     )
-    return None
\ No newline at end of file
+    return None
+
+
+def _fetch_validated(provider, date_str: str) -> Programme | None:
+    programme_data = provider.get_programme(date_str)
+    if not programme_data or not programme_data.get("races"):
+        return None
+    return Programme.model_validate(programme_data)
+
+
+def _get_programme_concurrently(providers, date_str: str, mode: str) -> Programme | None:
+    """Hedged (first valid programme) or parallel (races merged by R/C) fetch."""
+    candidates = [
+        (provider.__class__.__name__, lambda p=provider: _fetch_validated(p, date_str))
+        for provider in providers
+    ]
+    if mode == "hedged":
+        winner = hedging.hedged_first(candidates)
+        results = [winner] if winner else []
+    else:
+        results = hedging.gather_valid(candidates)
+
+    if not results:
+        logger.critical(
+            f"All configured providers failed to deliver a programme for {date_str}."
+        )
+        return None
+
+    programme = results[0][1]
+    if len(results) > 1:
+        races = hedging.merge_records(
+            ([race.model_dump() for race in prog.races] for _, prog in results),
+            key=lambda race: (race["reunion_id"], race["course_id"]),
+        )
+        programme = Programme.model_validate({**programme.model_dump(), "races": races})
+    logger.info(
+        f"Successfully fetched and validated programme from provider(s) "
+        f"{', '.join(name for name, _ in results)} ({mode}) with {len(programme.races)} races."
+    )
+    return programme
@@ -7,6 +7,7 @@ from datetime import date
 from typing import List, Tuple, Dict
 
 from hippique_orchestrator.contracts.models import Race, Runner, OddsSnapshot
+from hippique_orchestrator.providers import hedging
 from hippique_orchestrator.providers.base import Provider
 
 logger = logging.getLogger(__name__)
@@ -15,11 +16,17 @@ class AggregateProvider(Provider):
     """
     A provider that wraps multiple providers and tries them in order until one
     succeeds.
+
+    ``mode`` (default ``config.PROVIDER_FETCH_MODE``) selects how: "sequential"
+    waits for each provider in turn, "hedged" starts the next provider once the
+    current one is slower than usual and keeps the first valid answer, and
+    "parallel" queries every provider and merges their data field by field.
     """
-    def __init__(self, providers: List[Provider]):
+    def __init__(self, providers: List[Provider], mode: str | None = None):
         if not providers:
             raise ValueError("AggregateProvider requires at least one sub-provider.")
         self.providers = providers
+        self.mode = hedging.resolve_mode(mode)
         self._name = "Aggregate"
 
     @property
@@ -27,10 +34,12 @@ class AggregateProvider(Provider):
         return self._name
 
     def fetch_programme(self, for_date: date) -> List[Race]:
+        if self.mode != "sequential":
+            return self._fetch_programme_concurrently(for_date)
         for provider in self.providers:
             try:
                 logger.info(f"Attempting to fetch program for {for_date} with {provider.name}")
-                programme = provider.fetch_programme(for_date)
+                programme = hedging.timed_call(provider.name, provider.fetch_programme, for_date)
                 if programme:
                     logger.info(f"Successfully fetched program with {provider.name}")
                     return programme
@@ -41,10 +50,18 @@ class AggregateProvider(Provider):
         return []
 
     def fetch_race_details(self, race: Race, phase: str) -> Tuple[List[Runner], OddsSnapshot]:
+        if self.mode != "sequential":
+            details = self._fetch_race_details_concurrently(race, phase)
+            if details:
+                return details
+            logger.warning(f"All providers failed to fetch details for race {race.race_uid} (phase {phase}).")
+            return [], OddsSnapshot(race_uid=race.race_uid, phase=phase, source="N/A")
         for provider in self.providers:
             try:
                 logger.info(f"Attempting to fetch details for race {race.race_uid} (phase {phase}) with {provider.name}")
-                runners, snapshot = provider.fetch_race_details(race, phase)
+                runners, snapshot = hedging.timed_call(
+                    provider.name, provider.fetch_race_details, race, phase
+                )
                 if runners and snapshot:
                     logger.info(f"Successfully fetched details with {provider.name}")
                     # The snapshot from the successful provider already contains the source name
@@ -56,3 +73,53 @@ class AggregateProvider(Provider):
         logger.warning(f"All providers failed to fetch details for race {race.race_uid} (phase {phase}).")
         # Return empty data structures if all providers fail
         return [], OddsSnapshot(race_uid=race.race_uid, phase=phase, source="N/A")
+
+    def _fetch_programme_concurrently(self, for_date: date) -> list[Race]:
+        candidates = [
+            (provider.name, lambda p=provider: p.fetch_programme(for_date))
+            for provider in self.providers
+        ]
+        if self.mode == "hedged":
+            winner = hedging.hedged_first(candidates)
+            results = [winner] if winner else []
+        else:
+            results = hedging.gather_valid(candidates)
+        if not results:
+            logger.warning(f"All providers failed to fetch program for {for_date}.")
+            return []
+        logger.info(f"Fetched program with {', '.join(name for name, _ in results)} ({self.mode})")
+        if len(results) == 1:
+            return results[0][1]
+        merged = hedging.merge_records(
+            ([race.model_dump() for race in programme] for _, programme in results),
+            key=lambda race: race["race_uid"],
+        )
+        return [Race.model_validate(race) for race in merged]
+
+    def _fetch_race_details_concurrently(
+        self, race: Race, phase: str
+    ) -> tuple[list[Runner], OddsSnapshot] | None:
+        candidates = [
+            (provider.name, lambda p=provider: p.fetch_race_details(race, phase))
+            for provider in self.providers
+        ]
+
+        def is_valid(details) -> bool:
+            runners, snapshot = details
+            return bool(runners and snapshot)
+
+        if self.mode == "hedged":
+            winner = hedging.hedged_first(candidates, is_valid)
+            return winner[1] if winner else None
+        results = hedging.gather_valid(candidates, is_valid)
+        if not results:
+            return None
+        if len(results) == 1:
+            return results[0][1]
+        runners = hedging.merge_records(
+            ([runner.model_dump() for runner in details[0]] for _, details in results),
+            key=lambda runner: runner["program_number"],
+        )
+        snapshot = hedging.merge_fields(*(details[1].model_dump() for _, details in results))
+        snapshot["source"] = "+".join(details[1].source for _, details in results)
+        return [Runner.model_validate(r) for r in runners], OddsSnapshot.model_validate(snapshot)
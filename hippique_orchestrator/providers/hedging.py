@@ -0,0 +1,264 @@
+"""
+Hedged and parallel calls over an ordered list of providers.
+
+Trying providers strictly in order makes a slow primary that eventually fails
+add its whole latency before the fallback starts.  Two other modes are
+available (``PROVIDER_FETCH_MODE``):
+
+* ``hedged`` - start the primary; if it has not produced a valid result after
+  its hedge delay (the ``PROVIDER_HEDGE_QUANTILE`` of its recorded latencies,
+  ``PROVIDER_HEDGE_DELAY_SECONDS`` until enough samples exist), also start the
+  next provider, and so on.  The first valid result wins, ties going to the
+  preferred provider; losers not started yet are cancelled and running ones
+  are abandoned (provider calls are synchronous and cannot be interrupted).
+* ``parallel`` - call every provider at once and return all the valid results,
+  for callers that merge them field by field (see :func:`merge_records`).
+
+Every provider call, in any mode, is recorded in a per-provider latency
+histogram reported by :func:`latency_stats`.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+MODES = ("sequential", "hedged", "parallel")
+# Upper bounds (seconds) of the latency histogram buckets; slower calls land in "+Inf"
+LATENCY_BUCKETS_S = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0)
+
+Candidate = tuple[str, Callable[[], Any]]
+
+
+class LatencyHistogram:
+    """Thread-safe bucketed histogram of call latencies."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS_S) -> None:
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.failures = 0
+        self.max_seconds = 0.0
+
+    def record(self, seconds: float, ok: bool = True) -> None:
+        with self._lock:
+            self._counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            self.count += 1
+            self.failures += int(not ok)
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the ``q`` quantile (the maximum seen for "+Inf")."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            seen = 0
+            for i, n in enumerate(self._counts):
+                seen += n
+                if seen >= rank and n:
+                    return self.buckets[i] if i < len(self.buckets) else self.max_seconds
+            return self.max_seconds
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            labels = [f"<={b:g}s" for b in self.buckets] + ["+Inf"]
+            counts = dict(zip(labels, self._counts, strict=True))
+            count, failures, max_seconds = self.count, self.failures, self.max_seconds
+        return {
+            "count": count,
+            "failures": failures,
+            "p50_seconds": self.quantile(0.5),
+            "p95_seconds": self.quantile(0.95),
+            "max_seconds": round(max_seconds, 3),
+            "buckets": counts,
+        }
+
+
+_histograms: dict[str, LatencyHistogram] = {}
+_histograms_lock = threading.Lock()
+_executor = ThreadPoolExecutor(
+    max_workers=config.PROVIDER_FETCH_WORKERS, thread_name_prefix="provider-fetch"
+)
+# Backup calls started by hedged_first; abandoned calls filling _executor never delay them.
+_hedge_executor = ThreadPoolExecutor(
+    max_workers=config.PROVIDER_FETCH_WORKERS, thread_name_prefix="provider-hedge"
+)
+
+
+def histogram(name: str) -> LatencyHistogram:
+    with _histograms_lock:
+        if name not in _histograms:
+            _histograms[name] = LatencyHistogram()
+        return _histograms[name]
+
+
+def latency_stats() -> dict[str, dict[str, Any]]:
+    with _histograms_lock:
+        names = sorted(_histograms)
+    return {name: histogram(name).stats() for name in names}
+
+
+def reset_latency_histograms() -> None:
+    with _histograms_lock:
+        _histograms.clear()
+
+
+def timed_call(name: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call ``func`` and record its latency (and whether it raised) under ``name``."""
+    start = time.perf_counter()
+    ok = False
+    try:
+        result = func(*args, **kwargs)
+        ok = True
+        return result
+    finally:
+        histogram(name).record(time.perf_counter() - start, ok)
+
+
+def hedge_delay(name: str) -> float:
+    """Seconds to wait for ``name`` before starting the next provider."""
+    hist = histogram(name)
+    if hist.count >= config.PROVIDER_HEDGE_MIN_SAMPLES:
+        delay = hist.quantile(config.PROVIDER_HEDGE_QUANTILE)
+        if delay is not None:
+            return delay
+    return config.PROVIDER_HEDGE_DELAY_SECONDS
+
+
+def resolve_mode(mode: str | None) -> str:
+    mode = (mode or config.PROVIDER_FETCH_MODE).lower()
+    if mode not in MODES:
+        logger.warning(f"Unknown provider fetch mode '{mode}', using 'sequential'.")
+        return "sequential"
+    return mode
+
+
+def _outcome(future: Future, name: str, is_valid: Callable[[Any], bool]) -> tuple[bool, Any]:
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.error(f"Provider {name} failed: {e}")
+        return False, None
+    if result is None or not is_valid(result):
+        logger.warning(f"Provider {name} returned no usable data.")
+        return False, None
+    return True, result
+
+
+def hedged_first(
+    candidates: Sequence[Candidate],
+    is_valid: Callable[[Any], bool] = bool,
+    *,
+    delay_for: Callable[[str], float] = hedge_delay,
+) -> tuple[str, Any] | None:
+    """Return ``(name, result)`` of the first valid result, hedging slow providers."""
+    pending: dict[Future, int] = {}
+    next_index = 0
+    deadline = 0.0
+
+    def launch() -> None:
+        nonlocal next_index, deadline
+        name, func = candidates[next_index]
+        executor = _executor if next_index == 0 else _hedge_executor
+        pending[executor.submit(timed_call, name, func)] = next_index
+        next_index += 1
+        deadline = time.monotonic() + delay_for(name)
+
+    if candidates:
+        launch()
+    while pending:
+        timeout = None if next_index >= len(candidates) else max(deadline - time.monotonic(), 0)
+        done, _ = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        if not done:
+            running = ", ".join(candidates[i][0] for i in sorted(pending.values()))
+            logger.info(f"Hedging: {running} still running, starting {candidates[next_index][0]}.")
+            launch()
+            continue
+        for future in sorted(done, key=pending.get):
+            index = pending.pop(future)
+            name = candidates[index][0]
+            ok, result = _outcome(future, name, is_valid)
+            if ok:
+                for loser, loser_index in pending.items():
+                    started = not loser.cancel()
+                    logger.info(
+                        f"Hedging: {name} won; {'abandoning' if started else 'cancelled'} "
+                        f"{candidates[loser_index][0]}."
+                    )
+                return name, result
+        if not pending and next_index < len(candidates):
+            launch()  # everything started so far failed: no reason to wait for the delay
+    return None
+
+
+def gather_valid(
+    candidates: Sequence[Candidate],
+    is_valid: Callable[[Any], bool] = bool,
+    *,
+    timeout: float | None = None,
+) -> list[tuple[str, Any]]:
+    """Call every candidate at once; return the valid ``(name, result)`` pairs in candidate order."""
+    timeout = config.PROVIDER_PARALLEL_TIMEOUT_SECONDS if timeout is None else timeout
+    futures = [(name, _executor.submit(timed_call, name, func)) for name, func in candidates]
+    wait([future for _, future in futures], timeout=timeout)
+    results = []
+    for name, future in futures:
+        if not future.done():
+            future.cancel()
+            logger.warning(f"Provider {name} did not answer within {timeout}s; ignored.")
+            continue
+        ok, result = _outcome(future, name, is_valid)
+        if ok:
+            results.append((name, result))
+    return results
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value in ("", [], {})
+
+
+def merge_fields(primary: dict[str, Any], *others: dict[str, Any]) -> dict[str, Any]:
+    """Copy of ``primary`` whose missing or empty fields are filled from ``others``, in order.
+
+    Dictionary fields (e.g. odds per runner) are merged key by key.
+    """
+    merged = dict(primary)
+    for other in others:
+        for key, value in other.items():
+            if _is_empty(value):
+                continue
+            current = merged.get(key)
+            if _is_empty(current):
+                merged[key] = value
+            elif isinstance(current, dict) and isinstance(value, dict):
+                merged[key] = {**value, **current}
+    return merged
+
+
+def merge_records(
+    record_lists: Iterable[Iterable[dict[str, Any]]], key: Callable[[dict[str, Any]], Hashable]
+) -> list[dict[str, Any]]:
+    """Merge lists of records (most preferred list first) matched by ``key``, field by field.
+
+    Records only some providers know are kept, after those of the preferred list.
+    """
+    merged: dict[Hashable, dict[str, Any]] = {}
+    for records in record_lists:
+        for record in records:
+            record_key = key(record)
+            merged[record_key] = (
+                merge_fields(merged[record_key], record) if record_key in merged else dict(record)
+            )
+    return list(merged.values())
@@ -9,9 +9,7 @@ import unicodedata
 from datetime import datetime
 from typing import Any
 
-import httpx
-from bs4 import BeautifulSoup
-
+from hippique_orchestrator import fetch_scheduler, html_parser
 from hippique_orchestrator.logging_utils import get_logger
 
 from hippique_orchestrator.utils.retry import http_retry
@@ -55,14 +53,14 @@ def fetch_geny_programme() -> dict[str, Any]:
     empty_response = {"date": datetime.today().strftime("%Y-%m-%d"), "meetings": []}
 
     try:
-        response = httpx.get(url, follow_redirects=True)
+        response = fetch_scheduler.get_fetch_scheduler().fetch_sync(url)
         response.raise_for_status()
         html_content = response.text
     except Exception as e:
         logger.error(f"Failed to fetch Geny programme after retries: {e}")
         return empty_response
 
-    soup = BeautifulSoup(html_content, "html.parser")
+    soup = html_parser.soup(html_content)
 
     meetings_map: dict[str, dict[str, Any]] = {}
     r_counter = 1
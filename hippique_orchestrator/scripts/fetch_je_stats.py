@@ -10,24 +10,26 @@ import logging
 import re
 import shlex
 import subprocess
-import time
 import unicodedata
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote_plus, urljoin
+from urllib.parse import quote_plus, urljoin, urlsplit
 
+import httpx
 import requests
 from bs4 import BeautifulSoup
 
+from hippique_orchestrator.fetch_scheduler import get_fetch_scheduler
+
 LOGGER = logging.getLogger(__name__)
 
 # --- Constants and Dummy Implementations ---
 GENY_BASE_URL = "https://www.geny.com"
 DEFAULT_TIMEOUT = 15
 TIMEOUT = DEFAULT_TIMEOUT
-DELAY = 1.0
+DELAY = None  # Seconds between Geny requests; None keeps REQUESTS_PER_SECOND/FETCH_HOST_RATES
 RETRIES = 3
 TTL_DEFAULT = 3600
 DEFAULT_HEADERS = {
@@ -40,7 +42,7 @@ UA = DEFAULT_HEADERS["User-Agent"]
 @dataclass
 class FetchConf:
     timeout: float
-    delay_between_requests: float
+    delay_between_requests: float | None
     user_agent: str
     use_cache: bool
     cache_dir: Path
@@ -66,13 +68,13 @@ def http_get(
     timeout: int = DEFAULT_TIMEOUT,
     headers: Mapping[str, str] | None = None,
 ) -> str:
-    caller = session.get if session else requests.get
+    caller = session.get if session else get_fetch_scheduler().get
     merged_headers = {**DEFAULT_HEADERS, **(headers or {})}
     try:
         response = caller(url, headers=merged_headers, timeout=timeout)
         response.raise_for_status()
         return response.text
-    except requests.RequestException as exc:
+    except (requests.RequestException, httpx.HTTPError) as exc:
         raise RuntimeError(f"HTTP request failed for {url}") from exc
 
 
@@ -234,7 +236,7 @@ class CollectStatsConfig:
     h5: str
     out: str | None = None
     timeout: float = TIMEOUT
-    delay: float = DELAY
+    delay: float | None = DELAY
     retries: int = RETRIES
     cache: bool = False
     cache_dir: str | None = None
@@ -261,6 +263,12 @@ def collect_stats(config: CollectStatsConfig) -> str:
         retries=config.retries,
     )
 
+    if conf.delay_between_requests:
+        # Requests are paced by the fetch scheduler's per-host token bucket.
+        get_fetch_scheduler().configure_host(
+            urlsplit(GENY_BASE_URL).netloc, rate=1.0 / conf.delay_between_requests
+        )
+
     # Define a local fetcher to pass to helpers
     def fetcher(url):
         return http_get(url, timeout=conf.timeout)
@@ -285,21 +293,17 @@ def collect_stats(config: CollectStatsConfig) -> str:
         if name:
             try:
                 h_url = discover_horse_url_by_name(name, get=fetcher)
-                time.sleep(conf.delay_between_requests)
                 if h_url:
                     h_html = fetcher(h_url)
-                    time.sleep(conf.delay_between_requests)
                     links = extract_links_from_horse_page(h_html or "")
                     j_url = links.get("jockey")
                     e_url = links.get("trainer")
 
                     if j_url:
                         j_rate = extract_rate_from_profile(fetcher(j_url))
-                        time.sleep(conf.delay_between_requests)
 
                     if e_url:
                         e_rate = extract_rate_from_profile(fetcher(e_url))
-                        time.sleep(conf.delay_between_requests)
 
                     if j_rate is not None or e_rate is not None:
                         successful_fetches += 1
@@ -369,7 +373,12 @@ def main():
     ap.add_argument("--h5", required=True, help="Fichier JSON H-5")
     ap.add_argument("--out", default=None, help="Fichier CSV sortie (défaut: <h5_stem>_je.csv)")
     ap.add_argument("--timeout", type=float, default=TIMEOUT)
-    ap.add_argument("--delay", type=float, default=DELAY)
+    ap.add_argument(
+        "--delay",
+        type=float,
+        default=DELAY,
+        help="Secondes minimum entre deux requêtes Geny (défaut: REQUESTS_PER_SECOND)",
+    )
     ap.add_argument("--retries", type=int, default=RETRIES)
     ap.add_argument("--cache", action="store_true")
     ap.add_argument("--cache-dir", default=None)
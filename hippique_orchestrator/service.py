@@ -4,10 +4,12 @@ src/service.py - Main FastAPI application for the Hippique Orchestrator.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import os
 import logging
+from contextlib import asynccontextmanager
 from datetime import date, datetime, time, timezone
 from zoneinfo import ZoneInfo
 from typing import Any, Optional
@@ -22,6 +24,21 @@ from starlette.concurrency import run_in_threadpool
 from hippique_orchestrator import plan as plan  # noqa
 from hippique_orchestrator import firestore_client as firestore_client  # noqa
 from hippique_orchestrator import analysis_pipeline as analysis_pipeline # noqa
+from hippique_orchestrator import (
+    fetch_scheduler,
+    gcs_disk_cache,
+    http_client,
+    je_stats_cache,
+    odds_store,
+    simulate_wrapper,
+    snapshot_manifest,
+    stats_prefetch,
+    stats_provider,
+    storage_codec,
+    zoneturf_index,
+)
+from hippique_orchestrator.providers import hedging
+from hippique_orchestrator.memo_cache import MemoCache
 from hippique_orchestrator.auth import _require_api_key
 from hippique_orchestrator.logging_utils import get_logger
 from hippique_orchestrator.schemas import BootstrapDayRequest
@@ -38,6 +55,7 @@ from hippique_orchestrator.firestore_client import (
 from hippique_orchestrator.programme_provider import get_programme_for_date
 from hippique_orchestrator.orchestrator_runner import run_course_analysis_pipeline
 from hippique_orchestrator.config import (
+    PRONOSTICS_CACHE_TTL_SECONDS,
     REQUIRE_AUTH,
     INTERNAL_API_SECRET,
     PROJECT_ID,
@@ -47,7 +65,30 @@ from hippique_orchestrator.config import (
     TASK_OIDC_SA_EMAIL,
 )
 
+logger = get_logger(__name__)
+
+# Merged day payloads keyed by (date, phase); values carry the races version they were built from.
+_pronostics_cache = MemoCache(maxsize=64, ttl=PRONOSTICS_CACHE_TTL_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm the GPI config cache before the first H-30/H-5 task arrives.
+    try:
+        await run_in_threadpool(analysis_pipeline.preload_gpi_config)
+    except Exception as e:
+        logger.warning(f"GPI config preload failed: {e}")
+    stats_provider.start_index_refresh()
+    yield
+    await stats_prefetch.cancel_detached()
+    await run_in_threadpool(stats_provider._id_cache_writer.flush)
+    await run_in_threadpool(je_stats_cache.get_day_stats_cache().flush)
+    await run_in_threadpool(odds_store.get_odds_store().flush)
+    await http_client.get_http_pool().aclose()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="hippique-orchestrator",
     description="API for managing horse racing data and pronostics.",
     version="1.0.0",
@@ -103,6 +144,32 @@ async def double_underscore_health():
     return await health_check()
 
 # --- API Endpoints ---
+async def _build_pronostics_payload(date: date, phase: str | None) -> dict[str, Any]:
+    """Fetches the programme and Firestore races concurrently and merges them by race id."""
+    programme, firestore_races = await asyncio.gather(
+        run_in_threadpool(get_programme_for_date, date),
+        get_races_for_date(date),
+    )
+    races_by_id = {r.id: r for r in firestore_races if hasattr(r, "id")}
+
+    merged_races = []
+    if programme and programme.races:
+        for race_in_plan in programme.races:
+            fs_race = races_by_id.get(f"{race_in_plan.date.isoformat()}_{race_in_plan.rc}")
+            fs_race_data = fs_race.to_dict() if fs_race is not None else {}
+            merged_race = {**race_in_plan.model_dump(mode='json'), **fs_race_data}
+            if phase:
+                if (
+                    "gpi_decision" in merged_race
+                    and merged_race["gpi_decision"].lower() == "play"
+                ):
+                    merged_races.append(merged_race)
+            else:
+                merged_races.append(merged_race)
+
+    return {"ok": True, "date": date.isoformat(), "races": merged_races}
+
+
 @app.get("/api/pronostics", tags=["Pronostics"])
 async def get_pronostics_data(
     request: Request,
@@ -118,31 +185,15 @@ async def get_pronostics_data(
     if "if-none-match" in request.headers and request.headers["if-none-match"] == etag:
         return Response(status_code=status.HTTP_304_NOT_MODIFIED)
 
-    programme = await run_in_threadpool(get_programme_for_date, date)
-    firestore_races = await get_races_for_date(date)
+    cache_key = (date.isoformat(), phase or "")
+    version = firestore_client.races_version(date.isoformat())
+    cached = _pronostics_cache.get(cache_key)
+    if cached is not None and cached[0] == version:
+        response_content = cached[1]
+    else:
+        response_content = await _build_pronostics_payload(date, phase)
+        _pronostics_cache.put(cache_key, (version, response_content))
 
-    merged_races = []
-    if programme and programme.races:
-        for race_in_plan in programme.races:
-            fs_race_data = next(
-                (
-                    r.to_dict()
-                    for r in firestore_races
-                    if hasattr(r, "id") and r.id == f"{race_in_plan.date.isoformat()}_{race_in_plan.rc}"
-                ),
-                {},
-            )
-            merged_race = {**race_in_plan.model_dump(mode='json'), **fs_race_data}
-            if phase:
-                if (
-                    "gpi_decision" in merged_race
-                    and merged_race["gpi_decision"].lower() == "play"
-                ):
-                    merged_races.append(merged_race)
-            else:
-                merged_races.append(merged_race)
-
-    response_content = {"ok": True, "date": date.isoformat(), "races": merged_races}
     response = JSONResponse(content=response_content)
     response.headers["ETag"] = etag
     return response
@@ -193,6 +244,38 @@ async def debug_config(request: Request):
         "version": "1.0.0",
     }
 
+@app.get("/debug/caches", tags=["Debug"])
+async def debug_caches(request: Request):
+    _require_api_key(request)
+    disk_cache = gcs_disk_cache.get_gcs_disk_cache()
+    return {
+        "ok": True,
+        "simulate_wrapper_memo": simulate_wrapper.memo_stats(),
+        "calibration": simulate_wrapper.calibration_stats(),
+        "gpi_config": analysis_pipeline._config_cache.stats(),
+        "pronostics": _pronostics_cache.stats(),
+        "zoneturf_index": zoneturf_index.get_zoneturf_index().stats(),
+        "zoneturf_id_cache": {
+            "memo": stats_provider._id_memo.stats(),
+            "write_behind": stats_provider._id_cache_writer.stats(),
+        },
+        "je_stats_day": je_stats_cache.get_day_stats_cache().stats(),
+        "snapshot_manifest": snapshot_manifest.stats(),
+        "odds_store": odds_store.get_odds_store().stats(),
+        "storage": storage_codec.report(),
+        "gcs_disk": disk_cache.stats() if disk_cache is not None else None,
+    }
+
+@app.get("/debug/http", tags=["Debug"])
+async def debug_http(request: Request):
+    _require_api_key(request)
+    return {
+        "ok": True,
+        **http_client.get_http_pool().stats(),
+        "scheduler": fetch_scheduler.get_fetch_scheduler().stats(),
+        "providers": hedging.latency_stats(),
+    }
+
 # Legacy stubs (for compatibility)
 @app.post("/schedule", include_in_schema=False)
 async def legacy_schedule_stub(request: Request, body: BootstrapDayRequest):
@@ -1,15 +1,19 @@
 """Simple simulation wrapper applying calibrated probabilities.
 
 The module reads calibration data produced by ``calibration/calibrate_simulator.py``
-from ``calibration/probabilities.yaml``.  For each call, the calibration file
-is reloaded if modified so that simulations use the latest probabilities.
+from ``calibration/probabilities.yaml``.  The file is parsed once into an
+immutable snapshot by :mod:`hippique_orchestrator.calibration_store`, which
+picks up modifications on its background refresh or on
+:func:`reload_calibration` rather than checking the file on every call.
 
 If a combination of legs is not present in the calibration data, an estimate is
 derived using a simple Beta-Binomial model with a uniform prior
 (:math:`\alpha = \beta = 1`).  Each leg is treated as an independent
 Bernoulli event and the posterior means are multiplied to obtain the final
-probability.  Results are cached in a least-recently-used queue capped at
-``MAX_CACHE_SIZE`` entries to avoid unbounded growth.
+probability.  Results are memoised in a thread-safe least-recently-used cache
+capped at ``MAX_CACHE_SIZE`` entries (optionally expiring after
+``SIMULATE_MEMO_TTL_SECONDS``), kept apart from the calibration entries so
+that memoised results never evict them.
 """
 
 from __future__ import annotations
@@ -18,15 +22,22 @@ import logging
 import math
 import os
 import re
+import statistics
 import sys
 from collections import OrderedDict
 from collections.abc import Iterable, Mapping, Sequence
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from hippique_orchestrator.calibration_store import (
+    CalibrationSnapshot,
+    CalibrationStore,
+    refresh_all,
+    thaw,
+)
 from hippique_orchestrator.ev_calculator import compute_ev_roi
+from hippique_orchestrator.memo_cache import MemoCache
 
 # Explicitly configure logging for this module for debugging purposes
 logger = logging.getLogger(__name__)
@@ -43,6 +54,15 @@ try:  # pragma: no cover - numpy is optional at runtime
 except Exception:  # pragma: no cover - handled gracefully
     np = None  # type: ignore
 
+try:  # pragma: no cover - SciPy is optional at runtime
+    from scipy.special import erfc, ndtr, ndtri
+    from scipy.stats import qmc
+except Exception:  # pragma: no cover - handled gracefully
+    erfc = None  # type: ignore
+    ndtr = None  # type: ignore
+    ndtri = None  # type: ignore
+    qmc = None  # type: ignore
+
 
 CALIBRATION_PATH = Path("config/probabilities.yaml")
 
@@ -59,20 +79,51 @@ def _default_payout_calibration_path() -> Path:
     return Path("calibration/payout_calibration.yaml")
 
 
-# Maximum number of entries to keep in the calibration cache.  When the limit
-# is exceeded, least recently used keys are discarded.  This prevents
-# unbounded growth when many unique combinations are requested.
-MAX_CACHE_SIZE = 500
+# Maximum number of memoised results.  When the limit is exceeded, least
+# recently used keys are discarded.  This prevents unbounded growth when many
+# unique combinations are requested.
+MAX_CACHE_SIZE = int(os.getenv("SIMULATE_MEMO_SIZE", "500"))
+# Lifetime of a memoised result in seconds (0 keeps results until evicted).
+SIMULATE_MEMO_TTL_SECONDS = float(os.getenv("SIMULATE_MEMO_TTL_SECONDS", "0"))
 
-_calibration_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+# Results computed by :func:`simulate_wrapper`, keyed by :func:`_combo_key`.
+# Cleared whenever the calibration or correlation settings change.
+_memo_cache = MemoCache(MAX_CACHE_SIZE, SIMULATE_MEMO_TTL_SECONDS)
+
+# Read-only view of the calibration snapshot.  The files are parsed once by
+# the calibration stores; ``_calibration_mtime`` and ``_correlation_mtime``
+# mirror the published snapshot, ``0.0`` meaning "not loaded" (resetting them
+# requests a reload) and ``_ABSENT_MTIME`` a missing file.
+_calibration_cache: Mapping[str, Mapping[str, Any]] = OrderedDict()
 _calibration_mtime: float = 0.0
 _calibration_metadata: dict[str, Any] = {}
+_calibration_snapshot: CalibrationSnapshot | None = None
 
 _correlation_settings: dict[str, dict[str, Any]] = {}
 _correlation_mtime: float = 0.0
+_correlation_snapshot: CalibrationSnapshot | None = None
+_correlation_store: CalibrationStore | None = None
+
+_ABSENT_MTIME = -1.0
 
 _EPSILON = 1e-6
 
+# Size (log2) of the shared quasi-random sample bank used by the Gaussian
+# copula.  Scrambled Sobol points converge close to O(1/N) instead of the
+# O(1/sqrt(N)) of pseudo-random draws, so 2048 points keep joint probabilities
+# within ``MONTE_CARLO_TOLERANCE`` (absolute) of the exact copula value for
+# groups of 2 to 5 legs, where the previous fresh draws of
+# ``max(2000, 500 * n)`` normals carried a standard error of about 0.01.
+SOBOL_BANK_LOG2 = 11
+MONTE_CARLO_TOLERANCE = 0.01
+# Upper bound on the number of boolean cells materialised per batch chunk.
+_MONTE_CARLO_CHUNK_CELLS = 1 << 20
+
+# Joint probability estimators selectable through ``correlations.<kind>.method``.
+COPULA_METHODS = ("monte_carlo", "quadrature")
+# Gauss-Hermite nodes used by the quadrature estimator.
+QUADRATURE_NODES = 64
+
 # Default penalty applied when correlated legs are detected.  The value can be
 # configured via :func:`set_correlation_penalty` and overridden by historical
 # correlation data loaded from :data:`PAYOUT_CALIBRATION_PATH`.
@@ -167,10 +218,10 @@ def set_correlation_penalty(value: Any) -> None:
         penalty = float(value)
     except (TypeError, ValueError):  # pragma: no cover - defensive
         return
-    if penalty <= 0:
-        CORRELATION_PENALTY = 0.0
-    else:
-        CORRELATION_PENALTY = min(penalty, 1.0)
+    penalty = 0.0 if penalty <= 0 else min(penalty, 1.0)
+    if penalty != CORRELATION_PENALTY:
+        CORRELATION_PENALTY = penalty
+        _memo_cache.clear()
 
 
 def _coerce_str(value: Any) -> str | None:
@@ -321,24 +372,8 @@ def _find_correlation_groups(legs: Sequence[Any]) -> list[dict[str, Any]]:
     return groups
 
 
-def _load_correlation_settings() -> None:
-    """Reload correlation settings from the payout calibration file."""
-
-    global _correlation_settings, _correlation_mtime
-
-    payout_calib_path = _default_payout_calibration_path()
-
-    try:
-        mtime = payout_calib_path.stat().st_mtime
-    except FileNotFoundError:
-        _correlation_settings = {}
-        _correlation_mtime = 0.0
-        return
-    if mtime <= _correlation_mtime:
-        return
-
-    with payout_calib_path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
+def _parse_correlation_settings(data: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Parse the ``correlations`` section of a payout calibration document."""
 
     section = data.get("correlations") if isinstance(data, Mapping) else None
     parsed: dict[str, dict[str, Any]] = {}
@@ -367,11 +402,55 @@ def _load_correlation_settings() -> None:
                     entry["samples"] = max(int(samples), 1)
                 except (TypeError, ValueError):  # pragma: no cover - defensive
                     pass
+            method = payload.get("method")
+            if method is not None:
+                method_name = str(method).strip().lower()
+                if method_name in COPULA_METHODS:
+                    entry["method"] = method_name
+                else:
+                    logger.warning("Ignoring unknown correlation method %r for %s", method, name)
             if entry:
                 parsed[str(name)] = entry
+    return parsed, {}
+
+
+_payout_calibration_stores: dict[Path, CalibrationStore] = {}
+
 
-    _correlation_settings = parsed
-    _correlation_mtime = mtime
+def _payout_calibration_store(path: Path) -> CalibrationStore:
+    """Return the shared store watching the payout calibration at ``path``."""
+
+    path = Path(path)
+    store = _payout_calibration_stores.get(path)
+    if store is None:
+        store = CalibrationStore(path, _parse_correlation_settings, name=f"payout:{path}")
+        _payout_calibration_stores[path] = store
+    return store
+
+
+def _load_correlation_settings() -> None:
+    """Publish correlation settings from the payout calibration store."""
+
+    global _correlation_settings, _correlation_mtime, _correlation_snapshot, _correlation_store
+
+    # The store resolves the path when it refreshes (config/payout_calibration.yaml
+    # may appear or go away), so warm calls only read the in-memory snapshot.
+    if _correlation_store is None:
+        _correlation_store = CalibrationStore(
+            lambda: _default_payout_calibration_path(),
+            _parse_correlation_settings,
+            name="payout:correlations",
+        )
+    if _correlation_mtime == 0.0:
+        _correlation_store.invalidate()
+    snapshot = _correlation_store.get()
+    if snapshot is _correlation_snapshot and _correlation_mtime != 0.0:
+        return
+
+    _correlation_settings = thaw(snapshot.entries)
+    _correlation_mtime = snapshot.mtime if snapshot.exists else _ABSENT_MTIME
+    _correlation_snapshot = snapshot
+    _memo_cache.clear()
 
 
 def _resolve_correlation_settings(kind: str) -> dict[str, Any]:
@@ -388,6 +467,121 @@ def _resolve_correlation_settings(kind: str) -> dict[str, Any]:
     return {}
 
 
+def _bank_size(samples: int | None) -> int:
+    """Return the power-of-two bank size covering ``samples`` draws."""
+
+    size = 1 << SOBOL_BANK_LOG2
+    if samples is not None and samples > size:
+        size = 1 << math.ceil(math.log2(samples))
+    return size
+
+
+def _clamp_rho(rho: float, n: int) -> float:
+    min_rho = -1.0 / (n - 1)
+    return max(min(float(rho), 0.999), min_rho + 1e-6)
+
+
+def _normal_quantile(values: Any) -> Any:
+    if ndtri is not None:
+        return ndtri(values)
+    inv_cdf = np.vectorize(statistics.NormalDist().inv_cdf, otypes=[float])
+    return inv_cdf(values)
+
+
+@lru_cache(maxsize=16)
+def _sample_bank(n: int, size: int) -> Any:
+    """Return a read-only ``(size, n)`` bank of standard normal draws.
+
+    Points come from a scrambled Sobol sequence when SciPy is available and
+    from a seeded pseudo-random generator otherwise; both are deterministic.
+    """
+
+    if qmc is not None:
+        uniforms = qmc.Sobol(d=n, scramble=True, seed=12345).random_base2(int(math.log2(size)))
+        uniforms = np.clip(uniforms, _EPSILON / 10, 1 - _EPSILON / 10)
+        bank = _normal_quantile(uniforms)
+    else:  # pragma: no cover - SciPy missing
+        bank = np.random.default_rng(12345).standard_normal((size, n))
+    bank.setflags(write=False)
+    return bank
+
+
+@lru_cache(maxsize=128)
+def _cholesky_factor(n: int, rho: float) -> Any:
+    """Return the Cholesky factor of the ``n``-dimensional equicorrelation matrix."""
+
+    cov = np.full((n, n), rho, dtype=float)
+    np.fill_diagonal(cov, 1.0)
+    try:
+        transform = np.linalg.cholesky(cov)
+    except np.linalg.LinAlgError:  # pragma: no cover - defensive
+        return None
+    transform.setflags(write=False)
+    return transform
+
+
+@lru_cache(maxsize=128)
+def _correlated_bank(n: int, rho: float, size: int) -> Any:
+    """Return the correlated bank as a contiguous ``(n, size)`` array."""
+
+    transform = _cholesky_factor(n, rho)
+    if transform is None:  # pragma: no cover - defensive
+        return None
+    correlated = np.ascontiguousarray(transform @ _sample_bank(n, size).T)
+    correlated.setflags(write=False)
+    return correlated
+
+
+def monte_carlo_joint_probabilities(
+    groups: Sequence[tuple[Sequence[float], float]],
+    samples: int | None = None,
+) -> list[float | None]:
+    """Estimate Gaussian-copula joint probabilities for many groups at once.
+
+    Each group is a ``(probabilities, rho)`` pair describing equicorrelated
+    legs.  Groups sharing the same size and correlation reuse one cached
+    Cholesky factor and one correlated view of the shared Sobol bank, and
+    their success counts are evaluated together.  Estimates stay within
+    :data:`MONTE_CARLO_TOLERANCE` of the exact copula probability.
+    """
+
+    results: list[float | None] = [None] * len(groups)
+    if np is None:  # pragma: no cover - optional dependency missing
+        return results
+
+    buckets: dict[tuple[int, float], list[int]] = {}
+    for idx, (probabilities, rho) in enumerate(groups):
+        n = len(probabilities)
+        if n == 0:
+            results[idx] = 0.0
+        elif n == 1:
+            results[idx] = float(probabilities[0])
+        else:
+            buckets.setdefault((n, _clamp_rho(rho, n)), []).append(idx)
+
+    size = _bank_size(samples)
+    for (n, rho), members in buckets.items():
+        correlated = _correlated_bank(n, rho, size)
+        if correlated is None:  # pragma: no cover - defensive
+            continue
+        thresholds = np.clip(
+            np.asarray([groups[i][0] for i in members], dtype=float), _EPSILON, 1 - _EPSILON
+        )
+        # ``U < p`` is equivalent to ``Z < Phi^-1(p)``: compare in normal space
+        # so the bank never needs to be mapped back to uniforms.
+        limits = _normal_quantile(thresholds)
+        chunk = max(1, _MONTE_CARLO_CHUNK_CELLS // size)
+        for start in range(0, len(members), chunk):
+            block = limits[start : start + chunk]
+            inside = correlated[0][None, :] < block[:, 0, None]
+            for k in range(1, n):
+                inside &= correlated[k][None, :] < block[:, k, None]
+            hits = np.count_nonzero(inside, axis=1) / size
+            for offset, value in enumerate(hits.tolist()):
+                results[members[start + offset]] = float(value)
+    return results
+
+
 def _monte_carlo_joint_probability(
     probabilities: Sequence[float],
     rho: float,
@@ -395,43 +589,133 @@ def _monte_carlo_joint_probability(
 ) -> float | None:
     """Estimate joint probability using a Gaussian copula approximation."""
 
+    return monte_carlo_joint_probabilities([(probabilities, rho)], samples)[0]
+
+
+def _normal_cdf(values: Any) -> Any:
+    if ndtr is not None:
+        return ndtr(values)
+    erf = np.vectorize(math.erf, otypes=[float])
+    return 0.5 * (1.0 + erf(np.asarray(values) / math.sqrt(2.0)))
+
+
+@lru_cache(maxsize=8)
+def _hermite_rule(nodes: int) -> tuple[Any, Any]:
+    """Return probabilists' Gauss-Hermite nodes and weights normalised to 1."""
+
+    points, weights = np.polynomial.hermite_e.hermegauss(nodes)
+    weights = weights / math.sqrt(2.0 * math.pi)
+    points.setflags(write=False)
+    weights.setflags(write=False)
+    return points, weights
+
+
+def quadrature_joint_probabilities(
+    probabilities: Any,
+    rho: Any,
+    nodes: int = QUADRATURE_NODES,
+) -> Any:
+    """Deterministic joint probabilities for equicorrelated Gaussian copulas.
+
+    With ``Z_k = sqrt(rho) * W + sqrt(1 - rho) * E_k`` the joint probability
+    conditioned on the common factor ``W`` factorises, leaving the 1-D integral
+    ``E_W[prod_k Phi((z_k - sqrt(rho) * W) / sqrt(1 - rho))]`` which is
+    evaluated with Gauss-Hermite quadrature.  For ``rho < 0`` the same
+    integral is the analytic continuation with an imaginary loading
+    ``sqrt(rho)``; it converges on the whole positive-definite range and is
+    evaluated with the complex ``erfc`` from SciPy (those groups yield ``NaN``
+    without SciPy so that callers fall back to the Monte Carlo estimator).
+
+    ``probabilities`` has shape ``(groups, n)`` and ``rho`` one value per
+    group.  With the default 64 nodes the absolute error is below ``1e-4`` for
+    ``rho <= 0.9``; the integrand sharpens as ``rho`` approaches 1 (about
+    ``1e-3`` at 0.95).
+    """
+
+    probs = np.clip(np.atleast_2d(np.asarray(probabilities, dtype=float)), _EPSILON, 1 - _EPSILON)
+    rho_arr = np.broadcast_to(np.asarray(rho, dtype=float), probs.shape[:1])
+    n = probs.shape[1]
+    if n == 1:
+        return probs[:, 0].copy()
+    rho_arr = np.array([_clamp_rho(value, n) for value in rho_arr.tolist()])
+    negative = rho_arr < 0.0
+
+    points, weights = _hermite_rule(nodes)
+    limits = _normal_quantile(probs)[:, None, :]
+    spread = np.sqrt(1.0 - rho_arr)[:, None, None]
+    if negative.any() and erfc is not None:
+        loading = np.sqrt(rho_arr.astype(complex))[:, None, None]
+        scaled = (limits - loading * points[None, :, None]) / spread
+        conditional = 0.5 * erfc(-scaled / math.sqrt(2.0))
+        result = (np.prod(conditional, axis=2) @ weights).real
+        supported = np.ones_like(negative)
+    else:
+        loading = np.sqrt(np.maximum(rho_arr, 0.0))[:, None, None]
+        conditional = _normal_cdf((limits - loading * points[None, :, None]) / spread)
+        result = np.prod(conditional, axis=2) @ weights
+        supported = ~negative
+    return np.where(supported, np.clip(result, 0.0, 1.0), np.nan)
+
+
+def _quadrature_joint_probability(probabilities: Sequence[float], rho: float) -> float | None:
+    """Return the quadrature estimate for one group, ``None`` when unsupported."""
+
     if np is None:  # pragma: no cover - optional dependency missing
         return None
-    n = len(probabilities)
-    if n == 0:
+    if len(probabilities) == 0:
         return 0.0
-    if n == 1:
-        return float(probabilities[0])
+    value = float(quadrature_joint_probabilities([list(probabilities)], float(rho))[0])
+    return None if math.isnan(value) else value
 
-    samples = int(samples or max(2000, 500 * n))
-    if samples <= 0:
-        samples = 2000
-
-    min_rho = -1.0 / (n - 1)
-    rho = max(min(rho, 0.999), min_rho + 1e-6)
 
-    cov = np.full((n, n), rho, dtype=float)
-    np.fill_diagonal(cov, 1.0)
+def _estimate_group_probabilities(
+    groups: Sequence[tuple[Sequence[float], tuple[str, str]]],
+) -> list[tuple[float, str, float]]:
+    """Return adjusted probabilities for several correlated groups of legs.
 
-    try:
-        transform = np.linalg.cholesky(cov)
-    except np.linalg.LinAlgError:  # pragma: no cover - defensive
-        return None
+    Groups resolving to a copula ``rho`` are either integrated by quadrature
+    (``method: quadrature``) or simulated in a single batched call per sample
+    budget.  Quadrature groups that cannot be integrated (negative ``rho``
+    without SciPy) fall back to the simulation.
+    """
 
-    rng = np.random.default_rng(12345)
-    normals = rng.standard_normal((samples, n))
-    correlated = normals @ transform.T
-    scaled = correlated / math.sqrt(2.0)
-    if hasattr(np, "erf"):
-        erf_vals = np.erf(scaled)
-    else:  # pragma: no cover - compatibility when numpy.erf is unavailable
-        erf_func = np.vectorize(math.erf, otypes=[float])
-        erf_vals = erf_func(scaled)
-    uniforms = 0.5 * (1.0 + erf_vals)
+    prepared: list[tuple[float, float, dict[str, Any]]] = []
+    pending: dict[int | None, list[int]] = {}
+    simulated: dict[int, float | None] = {}
+    methods: dict[int, str] = {}
+    for idx, (probabilities, identifier) in enumerate(groups):
+        settings = _resolve_correlation_settings(identifier[0])
+        penalty = settings.get("penalty")
+        if penalty is None:
+            penalty = CORRELATION_PENALTY
+        prepared.append((math.prod(probabilities), float(penalty), settings))
+        if settings.get("rho") is not None and len(probabilities) > 1:
+            if settings.get("method") == "quadrature":
+                value = _quadrature_joint_probability(probabilities, float(settings["rho"]))
+                if value is not None:
+                    simulated[idx] = value
+                    methods[idx] = "quadrature"
+                    continue
+            samples = int(settings.get("samples", 0)) or None
+            pending.setdefault(samples, []).append(idx)
+
+    for samples, members in pending.items():
+        estimates = monte_carlo_joint_probabilities(
+            [(groups[i][0], float(prepared[i][2]["rho"])) for i in members], samples
+        )
+        simulated.update(zip(members, estimates, strict=True))
 
-    thresholds = np.clip(np.asarray(probabilities, dtype=float), _EPSILON, 1 - _EPSILON)
-    successes = (uniforms < thresholds).all(axis=1)
-    return float(successes.mean())
+    results: list[tuple[float, str, float]] = []
+    for idx, (base, penalty, _settings) in enumerate(prepared):
+        adjusted = base * penalty
+        method = "penalty"
+        mc = simulated.get(idx)
+        if mc is not None and mc < adjusted:
+            adjusted = mc
+            method = methods.get(idx, "monte_carlo")
+        adjusted = max(min(adjusted, base), _EPSILON)
+        results.append((adjusted, method, penalty))
+    return results
 
 
 def _estimate_group_probability(
@@ -440,27 +724,7 @@ def _estimate_group_probability(
 ) -> tuple[float, str, float]:
     """Return adjusted probability for a correlated group of legs."""
 
-    settings = _resolve_correlation_settings(identifier[0])
-    penalty = settings.get("penalty")
-    if penalty is None:
-        penalty = CORRELATION_PENALTY
-    base = math.prod(probabilities)
-    adjusted = base * penalty
-    method = "penalty"
-
-    rho = settings.get("rho")
-    if rho is not None and len(probabilities) > 1:
-        mc = _monte_carlo_joint_probability(
-            probabilities,
-            float(rho),
-            int(settings.get("samples", 0)) or None,
-        )
-        if mc is not None and mc < adjusted:
-            adjusted = mc
-            method = "monte_carlo"
-
-    adjusted = max(min(adjusted, base), _EPSILON)
-    return adjusted, method, float(penalty)
+    return _estimate_group_probabilities([(probabilities, identifier)])[0]
 
 
 def _extract_leg_probability(leg: Any) -> tuple[float, str, str, dict[str, Any]]:
@@ -518,64 +782,130 @@ def _extract_leg_probability(leg: Any) -> tuple[float, str, str, dict[str, Any]]
     return 0.5, "default", identifier, {}
 
 
+def _parse_probability_calibration(data: Any) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Validate a probability calibration document into ``(entries, metadata)``."""
+
+    metadata = data.get("__meta__") if isinstance(data, Mapping) else {}
+    if not isinstance(metadata, Mapping):
+        metadata = {}
+    parsed: dict[str, dict[str, Any]] = {}
+    for k, v in data.items():
+        if k.startswith("__"):
+            continue
+        if not isinstance(v, Mapping):
+            continue
+        key = "|".join(sorted(k.split("|")))
+        alpha = float(v.get("alpha", 1.0))
+        beta = float(v.get("beta", 1.0))
+        p = float(v.get("p", alpha / (alpha + beta)))
+        if alpha <= 0 or beta <= 0 or not (0.0 < p < 1.0):
+            raise ValueError(f"Invalid calibration for {k}: alpha={alpha}, beta={beta}, p={p}")
+        source = "calibration_combo" if "|" in key else "calibration_leg"
+        weight = float(v.get("weight", alpha + beta))
+        updated_at = v.get("updated_at")
+        details_entry: dict[str, Any] = {"weight": weight}
+        if updated_at:
+            details_entry["updated_at"] = updated_at
+        decay_val = metadata.get("decay")
+        if decay_val is not None:
+            details_entry["decay"] = decay_val
+        half_life = metadata.get("half_life")
+        if half_life is not None:
+            details_entry["half_life"] = half_life
+        parsed[key] = {
+            "alpha": alpha,
+            "beta": beta,
+            "p": p,
+            "sources": [source],
+            "weight": weight,
+            "details": {"__calibration__": details_entry},
+        }
+        if updated_at:
+            parsed[key]["updated_at"] = updated_at
+    return parsed, dict(metadata)
+
+
+_calibration_store = CalibrationStore(
+    lambda: CALIBRATION_PATH, _parse_probability_calibration, name="probabilities"
+)
+
+
 def _load_calibration() -> None:
-    """Reload calibration file if it has changed on disk."""
-    global _calibration_cache, _calibration_mtime, _calibration_metadata
-    try:
-        mtime = CALIBRATION_PATH.stat().st_mtime
-    except FileNotFoundError:
-        _calibration_cache = OrderedDict()
-        _calibration_mtime = 0.0
-        _calibration_metadata = {}
-        return
-    if mtime <= _calibration_mtime:
+    """Publish the calibration snapshot when the store holds a newer one.
+
+    The store only checks the file when first used, when :data:`CALIBRATION_PATH`
+    changes, after :func:`reload_calibration` or on its background refresh, so
+    calls on a warm worker do no filesystem access.
+    """
+    global _calibration_cache, _calibration_mtime, _calibration_snapshot
+    if _calibration_mtime == 0.0:
+        _calibration_store.invalidate()
+    snapshot = _calibration_store.get(CALIBRATION_PATH)
+    if snapshot is _calibration_snapshot and _calibration_mtime != 0.0:
         return
-    with CALIBRATION_PATH.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh) or {}
-        metadata = data.get("__meta__") if isinstance(data, Mapping) else {}
-        if isinstance(metadata, Mapping):
-            _calibration_metadata.clear()
-            _calibration_metadata.update(metadata)
-        else:
-            _calibration_metadata.clear()
-        parsed: OrderedDict[str, dict[str, Any]] = OrderedDict()
-        for k, v in data.items():
-            if k.startswith("__"):
-                continue
-            if not isinstance(v, Mapping):
-                continue
-            key = "|".join(sorted(k.split("|")))
-            alpha = float(v.get("alpha", 1.0))
-            beta = float(v.get("beta", 1.0))
-            p = float(v.get("p", alpha / (alpha + beta)))
-            if alpha <= 0 or beta <= 0 or not (0.0 < p < 1.0):
-                raise ValueError(f"Invalid calibration for {k}: alpha={alpha}, beta={beta}, p={p}")
-            source = "calibration_combo" if "|" in key else "calibration_leg"
-            weight = float(v.get("weight", alpha + beta))
-            updated_at = v.get("updated_at")
-            details_entry: dict[str, Any] = {"weight": weight}
-            if updated_at:
-                details_entry["updated_at"] = updated_at
-            decay_val = _calibration_metadata.get("decay")
-            if decay_val is not None:
-                details_entry["decay"] = decay_val
-            half_life = _calibration_metadata.get("half_life")
-            if half_life is not None:
-                details_entry["half_life"] = half_life
-            parsed[key] = {
-                "alpha": alpha,
-                "beta": beta,
-                "p": p,
-                "sources": [source],
-                "weight": weight,
-                "details": {"__calibration__": details_entry},
-            }
-            if updated_at:
-                parsed[key]["updated_at"] = updated_at
-        _calibration_cache = parsed
-        while len(_calibration_cache) > MAX_CACHE_SIZE:
-            _calibration_cache.popitem(last=False)
-    _calibration_mtime = mtime
+
+    _calibration_cache = snapshot.entries
+    _calibration_metadata.clear()
+    _calibration_metadata.update(thaw(snapshot.metadata))
+    _calibration_mtime = snapshot.mtime if snapshot.exists else _ABSENT_MTIME
+    _calibration_snapshot = snapshot
+    _memo_cache.clear()
+
+
+def reload_calibration() -> None:
+    """Check the calibration files now instead of waiting for the refresh timer."""
+
+    _calibration_store.invalidate()
+    if _correlation_store is not None:
+        _correlation_store.invalidate()
+    for store in _payout_calibration_stores.values():
+        store.invalidate()
+    refresh_all()
+
+
+def memo_stats() -> dict[str, Any]:
+    """Return size, TTL and hit/miss/eviction counters of the result memo."""
+
+    return _memo_cache.stats()
+
+
+def calibration_stats() -> dict[str, Any]:
+    """Return load time, entry count and hit-rate counters of the calibration stores."""
+
+    return {
+        "probabilities": _calibration_store.stats(),
+        "payout": [store.stats() for store in _payout_calibration_stores.values()],
+        "correlations": _correlation_store.stats() if _correlation_store is not None else None,
+    }
+
+
+def combo_probability_upper_bounds(combos: Iterable[Iterable[object]]) -> list[float]:
+    """Return an optimistic win probability for each combination in ``combos``.
+
+    The bound is what :func:`simulate_wrapper` would return with every
+    correlation penalty lifted: a cached or calibrated combo probability is
+    returned as is, otherwise the leg probabilities are multiplied.  Since the
+    copula estimates never exceed the independent product, the bound is never
+    below the simulated probability.  The calibration file is checked once for
+    the whole batch and nothing is written to the cache.
+    """
+    _load_calibration()
+    bounds: list[float] = []
+    for legs in combos:
+        legs_list = list(legs)
+        key = _combo_key(legs_list)
+        cached = _calibration_cache.get(key) or _memo_cache.peek(key)
+        if cached is not None:
+            prob = cached.get("p")
+            if prob is None:
+                alpha = float(cached.get("alpha", 1.0))
+                beta = float(cached.get("beta", 1.0))
+                prob = alpha / (alpha + beta) if alpha > 0 and beta > 0 else 1.0
+            bounds.append(float(prob))
+            continue
+        prob = math.prod(_extract_leg_probability(leg)[0] for leg in legs_list)
+        bounds.append(max(min(prob, 1.0 - _EPSILON), _EPSILON))
+    return bounds
 
 
 def simulate_wrapper(legs: Iterable[object]) -> float:
@@ -595,11 +925,12 @@ def simulate_wrapper(legs: Iterable[object]) -> float:
         probabilities are multiplied.
     """
     _load_calibration()
+    _load_correlation_settings()
     legs_list = list(legs)
     key = _combo_key(legs_list)
     cached = _calibration_cache.get(key)
+    _calibration_store.record_lookup(cached is not None)
     if cached is not None:
-        _calibration_cache.move_to_end(key)
         prob = cached.get("p")
         if prob is None:
             alpha = float(cached.get("alpha", 1.0))
@@ -607,8 +938,10 @@ def simulate_wrapper(legs: Iterable[object]) -> float:
             if alpha <= 0 or beta <= 0:
                 raise ValueError(f"Invalid cached calibration for {key}: {cached}")
             prob = alpha / (alpha + beta)
-            cached["p"] = prob
         return float(prob)
+    memoised = _memo_cache.get(key)
+    if memoised is not None:
+        return float(memoised["p"])
 
     prob = 1.0
     sources: list[str] = []
@@ -630,16 +963,23 @@ def simulate_wrapper(legs: Iterable[object]) -> float:
 
     groups = _find_correlation_groups(legs_list)
     correlation_details: list[dict[str, Any]] = []
-    for group in groups:
+    group_probabilities = [[leg_probabilities[i] for i in g["indexes"]] for g in groups]
+    estimates = iter(
+        _estimate_group_probabilities(
+            [
+                (probabilities, group["identifier"])
+                for probabilities, group in zip(group_probabilities, groups, strict=True)
+                if math.prod(probabilities) > 0
+            ]
+        )
+    )
+    for group, probabilities in zip(groups, group_probabilities, strict=True):
         indexes = group["indexes"]
-        base_group_prob = math.prod(leg_probabilities[i] for i in indexes)
+        base_group_prob = math.prod(probabilities)
         if base_group_prob <= 0:
             prob = _EPSILON
             continue
-        adjusted, method, penalty = _estimate_group_probability(
-            [leg_probabilities[i] for i in indexes],
-            group["identifier"],
-        )
+        adjusted, method, penalty = next(estimates)
         prob *= adjusted / base_group_prob
         correlation_details.append(
             {
@@ -665,16 +1005,16 @@ def simulate_wrapper(legs: Iterable[object]) -> float:
 
     prob = max(min(prob, 1.0 - _EPSILON), _EPSILON)
 
-    _calibration_cache[key] = {
-        "alpha": 1.0,
-        "beta": 1.0,
-        "p": prob,
-        "sources": sorted(set(sources)),
-        "details": details,
-    }
-    _calibration_cache.move_to_end(key)
-    while len(_calibration_cache) > MAX_CACHE_SIZE:
-        _calibration_cache.popitem(last=False)
+    _memo_cache.put(
+        key,
+        {
+            "alpha": 1.0,
+            "beta": 1.0,
+            "p": prob,
+            "sources": sorted(set(sources)),
+            "details": details,
+        },
+    )
     return prob
 
 
@@ -685,7 +1025,7 @@ def _combo_sources(legs: Iterable[Any]) -> set[str]:
     if not legs_list:
         return set()
     key = _combo_key(legs_list)
-    entry = _calibration_cache.get(key)
+    entry = _calibration_cache.get(key) or _memo_cache.peek(key)
     if not entry:
         return set()
     sources = entry.get("sources")
@@ -751,13 +1091,13 @@ def evaluate_combo(
     requirements: _RequirementsList = _RequirementsList()
     try:
         logger.debug(f"[evaluate_combo] Resolving calib_path: {calib_path}")
-        calibration_used = calib_path.is_file()
+        calibration_used = _payout_calibration_store(calib_path).get().exists
         logger.debug(
-            f"[evaluate_combo] calibration_used (calib_path.is_file()): {calibration_used}"
+            f"[evaluate_combo] calibration_used (calibration store): {calibration_used}"
         )
     except OSError as e:
         logger.error(
-            f"[evaluate_combo] OSError when checking calib_path.is_file(): {e}", exc_info=True
+            f"[evaluate_combo] OSError when checking calibration {calib_path}: {e}", exc_info=True
         )
         calibration_used = False
 
@@ -795,7 +1135,7 @@ def evaluate_combo(
         [dict(t) for t in tickets],
         budget=bankroll,
         simulate_fn=simulate_wrapper,
-        config={"kelly_cap": 1.0, "round_to": 0.0},
+        config={"kelly_cap": 1.0, "round_to": 0.0, "engine": "numpy"},
     )
 
     combo_notes: list[str] = []
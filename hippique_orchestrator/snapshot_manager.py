@@ -6,7 +6,8 @@ from __future__ import annotations
 
 import asyncio
 
-from hippique_orchestrator import config
+from hippique_orchestrator import config, stats_prefetch
+from hippique_orchestrator.analysis_utils import normalize_phase
 from hippique_orchestrator.logging_utils import get_logger
 from hippique_orchestrator.plan import build_plan_async
 from hippique_orchestrator.runner import run_course
@@ -40,6 +41,11 @@ async def write_snapshot_for_day_async(
     """
     Asynchronously fetches the race plan for a given day and triggers
     the snapshot creation for each race.
+
+    For the H9 phase, the stats of every runner snapshotted are prefetched in the
+    background so that the H-30/H-5 analyses only read prepared data.  The
+    prefetch is detached once the snapshots are saved and the counters queued
+    so far are returned without waiting for it.
     """
     logger.info(
         f"Starting daily snapshot job for {date_str}, phase {phase}",
@@ -47,6 +53,11 @@ async def write_snapshot_for_day_async(
     )
 
     semaphore = asyncio.Semaphore(config.MAX_CONCURRENT_SNAPSHOT_TASKS)
+    prefetcher = None
+    if normalize_phase(phase) == "H9" and config.STATS_PREFETCH_CONCURRENCY > 0:
+        prefetcher = stats_prefetch.DayStatsPrefetcher()
+    # Snapshot tasks inherit the context, hence the prefetcher receiving their runners.
+    token = stats_prefetch.activate(prefetcher)
 
     try:
         plan = await build_plan_async(date_str)
@@ -92,12 +103,20 @@ async def write_snapshot_for_day_async(
             extra={"correlation_id": correlation_id},
         )
 
+        if prefetcher is not None:
+            # The request returns now; the prefetch finishes and flushes on its own.
+            stats_prefetch.detach(prefetcher)
+            return prefetcher.stats()
+
     except Exception as e:
         logger.error(
             f"Failed during daily snapshot job for {date_str}: {e}",
             exc_info=True,
             extra={"correlation_id": correlation_id},
         )
+    finally:
+        stats_prefetch.deactivate(token)
+    return None
 
 
 def write_snapshot_for_day(
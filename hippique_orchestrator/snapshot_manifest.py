@@ -0,0 +1,172 @@
+"""
+Per-race manifest of the latest snapshot saved for each phase.
+
+``data/{race_doc_id}/manifest.json`` maps a normalised phase (H9, H30, H5) to
+the path, size and SHA-256 of its latest snapshot.  It is updated with a
+generation-matched upload, so concurrent writers retry instead of losing each
+other's phases, and lets the H-5 drift lookup replace the listing of
+``data/{race_doc_id}/snapshots/`` with a single manifest read.
+
+Both the manifests this instance wrote or read and the snapshot payloads it
+saved are kept in process: an H-5 run on the instance that saved the race's
+H-30 snapshot touches GCS not at all, and a payload already held (same
+checksum) is never downloaded again.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+from . import config, gcs_client, storage_codec
+from .analysis_utils import normalize_phase
+from .logging_utils import get_logger
+from .memo_cache import MemoCache
+
+logger = get_logger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+# Generation-matched uploads attempted before a manifest update is given up
+MAX_WRITE_ATTEMPTS = 5
+
+# race_doc_id -> (manifest, generation) as last written or read by this instance
+_manifests = MemoCache(maxsize=2000, ttl=config.SNAPSHOT_MANIFEST_TTL_SECONDS)
+# sha256 -> stored snapshot text
+_payloads = MemoCache(maxsize=500, ttl=config.SNAPSHOT_MANIFEST_TTL_SECONDS)
+_counters_lock = threading.Lock()
+_counters = {
+    "manifest_reads": 0,
+    "manifest_writes": 0,
+    "write_conflicts": 0,
+    "payload_reads": 0,
+    "payload_cache_hits": 0,
+    "checksum_mismatches": 0,
+}
+
+
+def _count(name: str) -> None:
+    with _counters_lock:
+        _counters[name] += 1
+
+
+def manifest_path(race_doc_id: str) -> str:
+    return f"data/{race_doc_id}/{MANIFEST_NAME}"
+
+
+def decode_snapshot(content: str | None) -> dict[str, Any]:
+    """Decode a stored snapshot, including those saved as a JSON-encoded string."""
+    if not content:
+        return {}
+    value = storage_codec.loads(content)
+    return value if isinstance(value, dict) else {}
+
+
+def _read_manifest(race_doc_id: str) -> tuple[dict[str, Any] | None, int | None]:
+    content, generation = gcs_client.read_text_with_generation(manifest_path(race_doc_id))
+    _count("manifest_reads")
+    if content is None:
+        return None, generation
+    try:
+        manifest = json.loads(content)
+    except json.JSONDecodeError:
+        logger.warning(f"Ignoring unreadable snapshot manifest for {race_doc_id}.")
+        return None, generation
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("phases"), dict):
+        return None, generation
+    _manifests.put(race_doc_id, (manifest, generation))
+    return manifest, generation
+
+
+def record_snapshot(race_doc_id: str, phase: str, gcs_path: str, data: Any) -> dict[str, Any] | None:
+    """Point the race manifest at the snapshot just saved at ``gcs_path``.
+
+    ``data`` is what was given to ``gcs_client.save_json_to_gcs``; it is
+    serialized the same way to checksum the decoded object.  Returns the
+    manifest entry, or None when the manifest could not be updated (the drift
+    lookup then falls back to listing the snapshots).
+    """
+    encoded = storage_codec.dumps(data)
+    stored = encoded.decode("utf-8")
+    entry = {
+        "path": gcs_path,
+        "size": len(encoded),
+        "sha256": hashlib.sha256(encoded).hexdigest(),
+        "saved_at": datetime.now(timezone.utc).isoformat(),
+    }
+    phase = normalize_phase(phase)
+    _payloads.put(entry["sha256"], stored)
+
+    cached = _manifests.peek(race_doc_id)
+    manifest, generation = cached if cached else _read_manifest(race_doc_id)
+    for _ in range(MAX_WRITE_ATTEMPTS):
+        if generation is None:
+            logger.warning(f"Snapshot manifest for {race_doc_id} unavailable; not updated.")
+            return None
+        current = manifest or {"race_doc_id": race_doc_id, "phases": {}}
+        previous = current["phases"].get(phase)
+        if previous and previous.get("path", "") > gcs_path:
+            return previous  # a newer snapshot of this phase is already recorded
+        updated = {
+            **current,
+            "phases": {**current["phases"], phase: entry},
+            "updated_at": entry["saved_at"],
+        }
+        new_generation = gcs_client.write_text_if_generation_match(
+            manifest_path(race_doc_id), json.dumps(updated), generation
+        )
+        if new_generation is not None:
+            _count("manifest_writes")
+            _manifests.put(race_doc_id, (updated, new_generation))
+            return entry
+        _count("write_conflicts")
+        manifest, generation = _read_manifest(race_doc_id)
+
+    logger.warning(f"Gave up updating the snapshot manifest for {race_doc_id} after conflicts.")
+    return None
+
+
+def load_latest(race_doc_id: str, phase: str) -> dict[str, Any] | None:
+    """Return the latest snapshot of ``phase`` for the race, from the manifest.
+
+    Returns None when the manifest has no usable entry for the phase, so the
+    caller can fall back to listing the snapshot directory.
+    """
+    phase = normalize_phase(phase)
+    cached = _manifests.get(race_doc_id)
+    entry = cached[0]["phases"].get(phase) if cached else None
+    if entry is None:
+        manifest, _ = _read_manifest(race_doc_id)
+        entry = manifest["phases"].get(phase) if manifest else None
+        if entry is None:
+            return None
+
+    content = _payloads.get(entry["sha256"])
+    if content is not None:
+        _count("payload_cache_hits")
+        return decode_snapshot(content)
+
+    content = gcs_client.read_file_from_gcs(entry["path"])
+    _count("payload_reads")
+    if content is None:
+        return None
+    encoded = content.encode("utf-8")
+    if len(encoded) != entry["size"] or hashlib.sha256(encoded).hexdigest() != entry["sha256"]:
+        _count("checksum_mismatches")
+        logger.warning(f"Snapshot {entry['path']} does not match its manifest entry; ignoring it.")
+        return None
+    _payloads.put(entry["sha256"], content)
+    return decode_snapshot(content)
+
+
+def stats() -> dict[str, Any]:
+    with _counters_lock:
+        counters = dict(_counters)
+    return {**counters, "manifests": _manifests.stats(), "payloads": _payloads.stats()}
+
+
+def clear() -> None:
+    """Forget the in-process manifests and payloads (counters are kept)."""
+    _manifests.clear()
+    _payloads.clear()
@@ -10,9 +10,8 @@ from collections.abc import Mapping
 from datetime import datetime, date, time as dt_time
 from typing import Any, Sequence
 
-import requests
-from bs4 import BeautifulSoup
-
+from hippique_orchestrator import html_parser
+from hippique_orchestrator.fetch_scheduler import Priority, get_fetch_scheduler
 from hippique_orchestrator.data_contract import RaceData, RaceSnapshotNormalized, RunnerData, RunnerStats
 from hippique_orchestrator.sources_interfaces import SourceProvider
 from hippique_orchestrator.logging_utils import get_logger
@@ -33,22 +32,29 @@ class ZeturfProvider(SourceProvider):
 
     name = "Zeturf"
 
-    def __init__(self):
-        self._session = requests.Session()
-        self._session.headers.update(DEFAULT_HEADERS)
-
     async def fetch_programme(self, url: str, **kwargs) -> list[dict[str, Any]]:
         logger.warning("ZeturfProvider does not implement programme fetching.")
         return []
 
     async def fetch_snapshot(self, race_url: str, **kwargs) -> RaceSnapshotNormalized:
         logger.info(f"Début du scraping ZEturf: {race_url}")
+        try:
+            html_content = await self._http_get(race_url)
+        except Exception as e:
+            logger.error(f"Failed to fetch ZEturf page {race_url}: {e}")
+            html_content = ""
+        # Parsing is CPU bound; keep it off the event loop.
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self._fetch_race_snapshot_sync, race_url)
+        return await loop.run_in_executor(
+            None, self._fetch_race_snapshot_sync, race_url, html_content
+        )
 
-    def _fetch_race_snapshot_sync(self, race_url: str) -> RaceSnapshotNormalized:
+    def _fetch_race_snapshot_sync(
+        self, race_url: str, html_content: str | None = None
+    ) -> RaceSnapshotNormalized:
         try:
-            html_content = self._http_get_sync(race_url)
+            if html_content is None:
+                html_content = self._http_get_sync(race_url)
             raw_snapshot_dict = self._parse_html(html_content, race_url)
 
             if not raw_snapshot_dict.get("runners"):
@@ -95,8 +101,17 @@ class ZeturfProvider(SourceProvider):
         match = re.search(r"/(R\d+C\d+)(?:-|$)", url, re.IGNORECASE)
         return match.group(1) if match else None
 
+    async def _http_get(self, url: str) -> str:
+        resp = await get_fetch_scheduler().fetch(
+            url, priority=Priority.CRITICAL, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT
+        )
+        return self._check_payload(resp, url)
+
     def _http_get_sync(self, url: str) -> str:
-        resp = self._session.get(url, timeout=DEFAULT_TIMEOUT)
+        resp = get_fetch_scheduler().fetch_sync(url, headers=DEFAULT_HEADERS, timeout=DEFAULT_TIMEOUT)
+        return self._check_payload(resp, url)
+
+    def _check_payload(self, resp: Any, url: str) -> str:
         if resp.status_code >= 400:
             raise RuntimeError(f"HTTP {resp.status_code} for {url}")
         text = resp.text
@@ -105,7 +120,7 @@ class ZeturfProvider(SourceProvider):
         return text
 
     def _parse_html(self, html: str, url: str) -> dict[str, Any]:
-        soup = BeautifulSoup(html, "lxml")
+        document = html_parser.parse_html(html)
 
         def _clean_text(value: str | None, lowercase: bool = False) -> str | None:
             if not value:
@@ -115,52 +130,43 @@ class ZeturfProvider(SourceProvider):
 
         runners = []
         cotes_infos = {}
-        if script_tag := soup.find("script", string=re.compile("cotesInfos")):
-            if cotes_match := re.search(r'cotesInfos:\s*(\{.*\})', script_tag.string):
+        if script := html_parser.script_containing(document, "cotesInfos"):
+            if cotes_match := re.search(r'cotesInfos:\s*(\{.*\})', script):
                 try:
                     cotes_infos = json.loads(cotes_match.group(1))
                 except json.JSONDecodeError:
                     logger.warning(f"Failed to decode cotesInfos JSON for {url}")
 
-        if table := soup.find("table", class_="table-runners"):
-            for row in table.select("tbody tr"):
-                cells = row.find_all("td")
-                if len(cells) < 2:
-                    continue
-
-                runner_data = {}
-                if num_cell := cells[0]:
-                    runner_data["num"] = _clean_text(num_cell.text)
-                if name_cell := cells[1].find("a", class_="horse-name"):
-                    runner_data["name"] = _clean_text(name_cell.get("title"))
-
-                # Get odds from visible table first as a fallback
-                if odds_cell := row.find("td", class_="cotes"):
-                    if odds_span := odds_cell.find("span", class_="cote"):
-                        runner_data["odds_win"] = _clean_text(odds_span.text)
-                    # Fallback for place odds from table
-                    if odds_place_span := odds_cell.find("span", class_="cote_place"):
-                        runner_data["odds_place"] = _clean_text(odds_place_span.text)
-
-                # If cotesInfos script exists, it has priority and more details
-                num_key = str(runner_data.get("num"))
-                if num_key and num_key in cotes_infos:
-                    odds_data = cotes_infos[num_key].get("odds", {})
-                    # Override with SG (Simple Gagnant) from script if available
-                    runner_data["odds_win"] = odds_data.get("SG", runner_data.get("odds_win"))
-                    # Get place odds, prefering script data
-                    if "SPMin" in odds_data and "SPMax" in odds_data:
-                        runner_data["odds_place"] = (odds_data["SPMin"] + odds_data["SPMax"]) / 2
-                    else:
-                        # If place odds are not in the script, ensure we don't carry over table data if script exists
-                        runner_data.setdefault("odds_place", None)
-
-
-                runners.append(runner_data)
-
-        discipline_raw = None
-        if p_infos := soup.find("p", class_="infos"):
-            discipline_raw = _clean_text(p_infos.get_text(), lowercase=True)
+        for row in self._runner_rows(document):
+            runner_data = {}
+            if row["num"] is not None:
+                runner_data["num"] = _clean_text(row["num"])
+            if row["has_name"]:
+                runner_data["name"] = _clean_text(row["name"])
+
+            # Get odds from visible table first as a fallback
+            if row["odds_win"] is not None:
+                runner_data["odds_win"] = _clean_text(row["odds_win"])
+            # Fallback for place odds from table
+            if row["odds_place"] is not None:
+                runner_data["odds_place"] = _clean_text(row["odds_place"])
+
+            # If cotesInfos script exists, it has priority and more details
+            num_key = str(runner_data.get("num"))
+            if num_key and num_key in cotes_infos:
+                odds_data = cotes_infos[num_key].get("odds", {})
+                # Override with SG (Simple Gagnant) from script if available
+                runner_data["odds_win"] = odds_data.get("SG", runner_data.get("odds_win"))
+                # Get place odds, prefering script data
+                if "SPMin" in odds_data and "SPMax" in odds_data:
+                    runner_data["odds_place"] = (odds_data["SPMin"] + odds_data["SPMax"]) / 2
+                else:
+                    # If place odds are not in the script, ensure we don't carry over table data if script exists
+                    runner_data.setdefault("odds_place", None)
+
+            runners.append(runner_data)
+
+        discipline_raw = _clean_text(self._first_text(document, "p", "infos"), lowercase=True)
 
         discipline_mapping = {
             "attelé": "Trot Attelé", "trot": "Trot Attelé", "monté": "Trot Monté",
@@ -172,10 +178,63 @@ class ZeturfProvider(SourceProvider):
         if date_match := re.search(r"/(\d{4}-\d{2}-\d{2})/", url):
             date_str = date_match.group(1)
 
-        start_time_str = _clean_text(soup.find('time', class_='time').text if soup.find('time', class_='time') else None)
+        start_time_str = _clean_text(self._first_text(document, "time", "time"))
 
         return {"date": date_str, "discipline": discipline, "start_time": start_time_str, "runners": runners}
 
+    @staticmethod
+    def _first_text(document: Any, tag: str, class_name: str) -> str | None:
+        """Text of the first ``tag`` element having ``class_name``, or None."""
+        if html_parser.is_soup(document):
+            element = document.find(tag, class_=class_name)
+            return element.get_text() if element else None
+        element = html_parser.first(document, f"//{tag}[{html_parser.has_class(class_name)}]")
+        return html_parser.text(element) if element is not None else None
+
+    @staticmethod
+    def _runner_rows(document: Any) -> list[dict[str, Any]]:
+        """Raw cells of the runners table rows having at least two cells."""
+        rows = []
+        if html_parser.is_soup(document):
+            table = document.find("table", class_="table-runners")
+            for row in table.select("tbody tr") if table else []:
+                cells = row.find_all("td")
+                if len(cells) < 2:
+                    continue
+                name_link = cells[1].find("a", class_="horse-name")
+                odds_cell = row.find("td", class_="cotes")
+                odds_span = odds_cell.find("span", class_="cote") if odds_cell else None
+                place_span = odds_cell.find("span", class_="cote_place") if odds_cell else None
+                rows.append({
+                    "num": cells[0].text,
+                    "has_name": name_link is not None,
+                    "name": name_link.get("title") if name_link else None,
+                    "odds_win": odds_span.text if odds_span else None,
+                    "odds_place": place_span.text if place_span else None,
+                })
+            return rows
+
+        has_class = html_parser.has_class
+        table = html_parser.first(document, f"//table[{has_class('table-runners')}]")
+        for row in table.xpath(".//tbody//tr") if table is not None else []:
+            cells = row.xpath(".//td")
+            if len(cells) < 2:
+                continue
+            name_link = html_parser.first(cells[1], f".//a[{has_class('horse-name')}]")
+            odds_cell = html_parser.first(row, f".//td[{has_class('cotes')}]")
+            odds_span = place_span = None
+            if odds_cell is not None:
+                odds_span = html_parser.first(odds_cell, f".//span[{has_class('cote')}]")
+                place_span = html_parser.first(odds_cell, f".//span[{has_class('cote_place')}]")
+            rows.append({
+                "num": html_parser.text(cells[0]),
+                "has_name": name_link is not None,
+                "name": name_link.get("title") if name_link is not None else None,
+                "odds_win": html_parser.text(odds_span) if odds_span is not None else None,
+                "odds_place": html_parser.text(place_span) if place_span is not None else None,
+            })
+        return rows
+
     def _parse_float_fr(self, value: Any) -> float | None:
         if value is None:
             return None
@@ -0,0 +1,189 @@
+"""
+H9 prefetch of the day's runner statistics.
+
+The H-30 and H-5 analyses are latency sensitive and should only read prepared
+data.  While the 09:00 snapshot job saves each race, :class:`DayStatsPrefetcher`
+receives its runners and, in the background with bounded concurrency, fetches
+every distinct horse chrono and jockey/trainer profile of the day once.  The
+results land in the day-scoped stats cache (see :mod:`je_stats_cache`), which
+the Zone-Turf provider consults before scraping, and resolved IDs in the
+``zoneturf_id_cache``; both are flushed when the prefetch completes.
+
+The snapshot request does not wait for the prefetch: once the snapshots are
+saved, :func:`detach` hands the prefetcher to a task of its own, which
+outlives the request and its context and owns the final flush.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import time
+from collections.abc import Iterable
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+from hippique_orchestrator import config, je_stats_cache
+from hippique_orchestrator.logging_utils import get_logger
+from hippique_orchestrator.stats_provider import ZoneTurfProvider
+from hippique_orchestrator.zoneturf_index import normalize_name
+
+logger = get_logger(__name__)
+
+# Prefetcher of the snapshot job running in the current context, if any.
+_current: contextvars.ContextVar[DayStatsPrefetcher | None] = contextvars.ContextVar(
+    "stats_prefetcher", default=None
+)
+
+_FETCHERS = {
+    "horse": "fetch_horse_chrono",
+    "jockey": "fetch_jockey_stats",
+    "trainer": "fetch_trainer_stats",
+}
+
+
+class DayStatsPrefetcher:
+    """Fetches, once each and in the background, the stats of the runners submitted to it."""
+
+    def __init__(
+        self, provider: ZoneTurfProvider | None = None, *, concurrency: int | None = None
+    ) -> None:
+        self._provider = provider
+        self.concurrency = concurrency or config.STATS_PREFETCH_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._seen: set[tuple[str, str]] = set()
+        self._tasks: list[asyncio.Task] = []
+        self._counters = {"runners": 0, "entities": 0, "fetched": 0, "empty": 0, "failed": 0}
+        self._started = time.perf_counter()
+
+    @property
+    def provider(self) -> ZoneTurfProvider:
+        if self._provider is None:
+            self._provider = ZoneTurfProvider(config={})
+        return self._provider
+
+    def submit(self, runners: Iterable[Any]) -> int:
+        """Queue the entities of ``runners`` not seen yet today; returns how many were queued.
+
+        Must be called from a running event loop; the fetches run as a background task.
+        """
+        runners = list(runners)
+        self._counters["runners"] += len(runners)
+        entities = []
+        for entity_type, name in self.provider.runner_entities(runners):
+            key = (entity_type, normalize_name(name))
+            if key[1] and key not in self._seen:
+                self._seen.add(key)
+                entities.append((entity_type, name))
+        if entities:
+            self._counters["entities"] += len(entities)
+            self._tasks.append(
+                asyncio.create_task(self._prefetch(entities), context=_background_context())
+            )
+        return len(entities)
+
+    async def _prefetch(self, entities: list[tuple[str, str]]) -> None:
+        try:
+            known_ids = await run_in_threadpool(self.provider.prefetch_ids, entities)
+        except Exception as e:
+            logger.warning(f"Batched ID lookup failed, resolving one by one: {e}")
+            known_ids = {}
+        await asyncio.gather(
+            *(
+                self._fetch_one(entity_type, name, known_ids.get((entity_type, name)))
+                for entity_type, name in entities
+            )
+        )
+
+    async def _fetch_one(self, entity_type: str, name: str, known_id: str | None) -> None:
+        fetch = getattr(self.provider, _FETCHERS[entity_type])
+        async with self._semaphore:
+            try:
+                result = await run_in_threadpool(fetch, name, known_id)
+            except Exception as e:
+                logger.warning(f"Prefetch of {entity_type} '{name}' failed: {e}")
+                self._counters["failed"] += 1
+                return
+        self._counters["fetched" if result is not None else "empty"] += 1
+
+    async def wait(self) -> dict[str, Any]:
+        """Wait for every queued fetch, persist the results and return the summary."""
+        try:
+            while self._tasks:
+                tasks, self._tasks = self._tasks, []
+                await asyncio.gather(*tasks)
+        except asyncio.CancelledError:
+            for task in self._tasks:
+                task.cancel()
+            raise
+        await run_in_threadpool(je_stats_cache.get_day_stats_cache().flush)
+        await run_in_threadpool(self.provider.flush_id_cache)
+        summary = self.stats()
+        logger.info(
+            f"Stats prefetch done: {summary['entities']} entities of {summary['runners']} runners "
+            f"in {summary['elapsed_seconds']:.1f}s ({summary['fetched']} with data, "
+            f"{summary['empty']} empty, {summary['failed']} failed).",
+            extra={"stats_prefetch": summary},
+        )
+        return summary
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._counters,
+            "concurrency": self.concurrency,
+            "elapsed_seconds": round(time.perf_counter() - self._started, 3),
+        }
+
+
+def _background_context() -> contextvars.Context:
+    # Copy of the caller's context (log correlation) that no longer routes runners to a prefetcher.
+    context = contextvars.copy_context()
+    context.run(_current.set, None)
+    return context
+
+
+# Detached prefetches still running; the references keep their tasks alive.
+_detached: set[asyncio.Task] = set()
+
+
+def _detached_done(task: asyncio.Task) -> None:
+    _detached.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Stats prefetch failed: {task.exception()}", exc_info=task.exception())
+
+
+def detach(prefetcher: DayStatsPrefetcher) -> asyncio.Task:
+    """Finish ``prefetcher`` (fetches, then flush) in a background task and return it at once."""
+    task = asyncio.create_task(prefetcher.wait(), context=_background_context())
+    _detached.add(task)
+    task.add_done_callback(_detached_done)
+    return task
+
+
+async def cancel_detached() -> None:
+    """Stop the detached prefetches (at shutdown, before the caches are flushed)."""
+    tasks = list(_detached)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def activate(prefetcher: DayStatsPrefetcher | None) -> contextvars.Token:
+    """Make ``prefetcher`` receive the runners of snapshots taken in this context."""
+    return _current.set(prefetcher)
+
+
+def deactivate(token: contextvars.Token) -> None:
+    _current.reset(token)
+
+
+def submit_runners(runners: Iterable[Any]) -> int:
+    """Hand a snapshot's runners to the active prefetcher; a no-op outside the H9 job."""
+    prefetcher = _current.get()
+    if prefetcher is None:
+        return 0
+    try:
+        return prefetcher.submit(runners)
+    except Exception as e:
+        logger.warning(f"Could not queue runners for stats prefetch: {e}")
+        return 0
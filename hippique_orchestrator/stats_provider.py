@@ -9,18 +9,26 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
 from datetime import datetime, timedelta, timezone
 from typing import Protocol, runtime_checkable
 
-import httpx
-from bs4 import BeautifulSoup
 from pydantic import BaseModel, Field
 
-from . import firestore_client
+from . import config, fetch_scheduler, firestore_client, html_parser, je_stats_cache, zoneturf_index
+from .memo_cache import MemoCache
 from .utils.retry import http_retry
 
 logger = logging.getLogger(__name__)
 
+ID_CACHE_COLLECTION = "zoneturf_id_cache"
+
+# zoneturf_id_cache documents already read by this process, keyed by document id;
+# "" records a known miss so repeated unknown names do not go back to Firestore.
+_id_memo = MemoCache(maxsize=20000, ttl=config.ZONETURF_ID_MEMO_TTL_SECONDS)
+# Resolved IDs are written behind, in BulkWriter batches.
+_id_cache_writer = firestore_client.WriteBehindBuffer(ID_CACHE_COLLECTION)
+
 # ============================================
 # Helper Functions
 # ============================================
@@ -102,8 +110,17 @@ class ZoneTurfProvider:
     StatsProvider implementation for scraping data from Zone-Turf.
     """
 
-    CACHE_COLLECTION = "zoneturf_id_cache"
+    CACHE_COLLECTION = ID_CACHE_COLLECTION
     MAX_PAGES_TO_SCRAPE = 10  # Safety limit for pagination
+    MAX_INDEX_PAGES = 500  # Safety limit when indexing a whole letter
+    ENTITY_TYPES = ("horse", "jockey", "trainer")
+    # Runner fields naming each entity, in order of preference
+    RUNNER_FIELDS = {
+        "horse": ("nom", "name", "name_norm"),
+        "jockey": ("jockey", "driver", "driver_jockey"),
+        "trainer": ("entraineur", "trainer"),
+    }
+    INDEX_LETTERS = tuple("abcdefghijklmnopqrstuvwxyz") + ("0-9",)
 
     def __init__(self, config: dict, cache_ttl_days: int = 30):
         self.base_url = config.get("base_url", "https://www.zone-turf.fr")
@@ -122,7 +139,7 @@ class ZoneTurfProvider:
             ),
         }
         self.cache_ttl = timedelta(days=cache_ttl_days)
-        self.client = httpx.Client(base_url=self.base_url, follow_redirects=True)
+        self.client = fetch_scheduler.get_fetch_scheduler().bind(self.base_url)
         # Map entity types to their specific list selectors on index pages
         self.index_selectors = {
             "horse": "ul.list-chevaux > li > a",  # Corrected selector
@@ -145,70 +162,177 @@ class ZoneTurfProvider:
         name = re.sub(r'[^a-z0-9]', '', name)
         return name
 
+    def _cache_doc_id(self, entity_type: str, name: str) -> str | None:
+        normalized_name = self._normalize_name(name)
+        return f"{entity_type}_{normalized_name}" if normalized_name else None
+
+    def _valid_cached_id(self, entity_type: str, name: str, cached_doc: dict | None) -> str | None:
+        """Returns the entity ID of a zoneturf_id_cache document unless it has expired."""
+        if not cached_doc:
+            return None
+
+        cached_at = cached_doc.get("cached_at")
+        if datetime.now(timezone.utc) - cached_at > self.cache_ttl:
+            logger.info(f"Cache expired for {entity_type} '{name}'.")
+            return None
+
+        logger.debug(f"Cache hit for {entity_type} '{name}'.")
+        return cached_doc.get("entity_id")
+
     def _get_id_from_cache(self, entity_type: str, name: str) -> str | None:
         """
         Retrieves a Zone-Turf ID from the Firestore cache if it exists and is not expired.
+        Reads are memoized in-process and see writes still waiting in the write-behind buffer.
         """
-        normalized_name = self._normalize_name(name)
-        if not normalized_name:
+        doc_id = self._cache_doc_id(entity_type, name)
+        if not doc_id:
             return None
 
-        doc_id = f"{entity_type}_{normalized_name}"
+        memoized = _id_memo.get(doc_id)
+        if memoized is not None:
+            return memoized or None
+        pending = _id_cache_writer.get(doc_id)
+        if pending:
+            return pending.get("entity_id")
+
         try:
             cached_doc = firestore_client.get_document(self.CACHE_COLLECTION, doc_id)
-            if not cached_doc:
-                return None
-
-            cached_at = cached_doc.get("cached_at")
-            if datetime.now(timezone.utc) - cached_at > self.cache_ttl:
-                logger.info(f"Cache expired for {entity_type} '{name}'.")
-                return None
-
-            logger.debug(f"Cache hit for {entity_type} '{name}'.")
-            return cached_doc.get("entity_id")
+            entity_id = self._valid_cached_id(entity_type, name, cached_doc)
         except Exception as e:
             logger.error(f"Failed to read from cache for {doc_id}: {e}")
             return None
+        _id_memo.put(doc_id, entity_id or "")
+        return entity_id
+
+    def prefetch_ids(self, entities: Iterable[tuple[str, str]]) -> dict[tuple[str, str], str | None]:
+        """
+        Resolves many ``(entity_type, name)`` pairs from the local index, the in-process
+        memo and, for the rest, a single batched Firestore read. Nothing is scraped.
+        """
+        index = zoneturf_index.get_zoneturf_index()
+        resolved: dict[tuple[str, str], str | None] = {}
+        to_read: dict[str, list[tuple[str, str]]] = {}
+        for entity_type, name in entities:
+            key = (entity_type, name)
+            if not name or key in resolved:
+                continue
+            doc_id = self._cache_doc_id(entity_type, name)
+            entity_id = index.lookup(entity_type, name, fuzzy=False)
+            if entity_id is None and doc_id:
+                memoized = _id_memo.get(doc_id)
+                pending = _id_cache_writer.get(doc_id)
+                if memoized is not None:
+                    entity_id = memoized or None
+                elif pending:
+                    entity_id = pending.get("entity_id")
+                else:
+                    to_read.setdefault(doc_id, []).append(key)
+                    continue
+            resolved[key] = entity_id
+
+        docs = firestore_client.get_documents(self.CACHE_COLLECTION, to_read) if to_read else {}
+        for doc_id, keys in to_read.items():
+            for entity_type, name in keys:
+                try:
+                    entity_id = self._valid_cached_id(entity_type, name, docs.get(doc_id))
+                except Exception as e:
+                    logger.error(f"Invalid cache document {doc_id}: {e}")
+                    entity_id = None
+                _id_memo.put(doc_id, entity_id or "")
+                resolved[(entity_type, name)] = entity_id
+
+        logger.info(
+            f"Prefetched {len(resolved)} Zone-Turf IDs "
+            f"({len(to_read)} read from Firestore in one batch)."
+        )
+        return resolved
+
+    def runner_entities(self, runners: Iterable) -> list[tuple[str, str]]:
+        """Lists the ``(entity_type, name)`` pairs (horse, jockey, trainer) named by runners."""
+        entities = []
+        for runner in runners:
+            fields = runner if isinstance(runner, dict) else getattr(runner, "__dict__", {})
+            extra = getattr(runner, "model_extra", None) or {}
+            fields = {**fields, **extra}
+            for entity_type, keys in self.RUNNER_FIELDS.items():
+                name = next((fields[k] for k in keys if fields.get(k)), None)
+                if isinstance(name, str) and name.strip():
+                    entities.append((entity_type, name.strip()))
+        return entities
+
+    def prefetch_runner_ids(self, runners: Iterable) -> dict[tuple[str, str], str | None]:
+        """Resolves the horse, jockey and trainer of every runner of a snapshot in one call."""
+        return self.prefetch_ids(self.runner_entities(runners))
 
     def _set_id_to_cache(self, entity_type: str, name: str, entity_id: str):
         """
-        Saves a resolved Zone-Turf ID to the Firestore cache.
+        Saves a resolved Zone-Turf ID to the Firestore cache through the write-behind buffer.
         """
-        normalized_name = self._normalize_name(name)
-        if not normalized_name or not entity_id:
+        doc_id = self._cache_doc_id(entity_type, name)
+        if not doc_id or not entity_id:
             return
 
-        doc_id = f"{entity_type}_{normalized_name}"
         doc_data = {
             "entity_type": entity_type,
             "name": name,
-            "normalized_name": normalized_name,
+            "normalized_name": self._normalize_name(name),
             "entity_id": entity_id,
             "cached_at": datetime.now(timezone.utc),
         }
+        _id_memo.put(doc_id, entity_id)
         try:
-            firestore_client.set_document(self.CACHE_COLLECTION, doc_id, doc_data)
+            _id_cache_writer.put(doc_id, doc_data)
             logger.info(f"Cached ID '{entity_id}' for {entity_type} '{name}'.")
         except Exception as e:
             logger.error(f"Failed to write to cache for {doc_id}: {e}")
 
+    def flush_id_cache(self) -> int:
+        """Sends the buffered zoneturf_id_cache writes; returns the number written."""
+        try:
+            return _id_cache_writer.flush()
+        except Exception as e:
+            logger.error(f"Failed to write to cache: {e}")
+            return 0
+
     @http_retry
     def _resolve_entity_id(self, entity_type: str, name: str) -> str | None:
         """
         Resolves an entity's name to its Zone-Turf ID.
-        Uses cache first, then falls back to scraping the letter index pages.
+        Tries exact matches first (local index, cache, letter index pages); a fuzzy
+        match against the local index is only the last resort.
         """
         if not name:
             return None
 
-        # 1. Check cache
+        # 1. Local name index, exact match only (no I/O)
+        index = zoneturf_index.get_zoneturf_index()
+        indexed_id = index.lookup(entity_type, name, fuzzy=False)
+        if indexed_id:
+            return indexed_id
+
+        # 2. Check cache
         cached_id = self._get_id_from_cache(entity_type, name)
         if cached_id:
             return cached_id
 
         logger.info(f"Cache miss for {entity_type} '{name}'. Resolving via scraping.")
 
-        # 2. Scrape letter index
+        # 3. Scrape letter index
+        scraped_id = self._scrape_entity_id(entity_type, name)
+        if scraped_id:
+            return scraped_id
+
+        # 4. Closest indexed name; not cached, so a later exact match still wins
+        fuzzy_id = index.lookup(entity_type, name, fuzzy=True)
+        if fuzzy_id:
+            logger.warning(f"Using fuzzy index match '{fuzzy_id}' for {entity_type} '{name}'.")
+            return fuzzy_id
+
+        logger.warning(f"Could not resolve ID for {entity_type} '{name}' after scraping.")
+        return None
+
+    def _scrape_entity_id(self, entity_type: str, name: str) -> str | None:
+        """Looks ``name`` up on the letter index pages, merging them into the local index."""
         index_path_template = self.paths.get(f"{entity_type}_letter_index")
         list_selector = self.index_selectors.get(entity_type)
 
@@ -221,36 +345,75 @@ class ZoneTurfProvider:
         if not 'a' <= first_letter <= 'z':
             first_letter = '0-9'
 
-        target_name = name.lower()
+        target_name = zoneturf_index.normalize_name(name)
+        index = zoneturf_index.get_zoneturf_index()
 
-        for page_num in range(1, self.MAX_PAGES_TO_SCRAPE + 1):
-            index_path = index_path_template.format(letter=first_letter, page=page_num)
-            try:
-                response = self.client.get(index_path)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, "lxml")
-
-                links = soup.select(list_selector)
-                if not links:
-                    break  # No more links on this page, stop paginating
-
-                for link in links:
-                    if link.get_text(strip=True).lower() == target_name:
-                        href = link.get("href")
-                        match = re.search(r'-(\d+)/?$', href)
-                        if match:
-                            entity_id = match.group(1)
-                            logger.info(f"Resolved ID for '{name}' to '{entity_id}'.")
-                            self._set_id_to_cache(entity_type, name, entity_id)
-                            return entity_id
+        # Once the letter is fully indexed, only the page the name sorts into is fetched.
+        page_hint = index.page_for(entity_type, first_letter, name)
+        pages = [page_hint] if page_hint else range(1, self.MAX_PAGES_TO_SCRAPE + 1)
 
+        for page_num in pages:
+            try:
+                entries = self._fetch_index_page(entity_type, first_letter, page_num)
             except Exception as e:
                 logger.error(f"An error occurred while resolving ID for '{name}': {e}")
                 return None
-
-        logger.warning(f"Could not resolve ID for {entity_type} '{name}' after scraping.")
+            if not entries:
+                break  # No more links on this page, stop paginating
+
+            index.merge_page(entity_type, first_letter, page_num, entries)
+            for link_name, entity_id in entries:
+                if zoneturf_index.normalize_name(link_name) == target_name:
+                    logger.info(f"Resolved ID for '{name}' to '{entity_id}'.")
+                    self._set_id_to_cache(entity_type, name, entity_id)
+                    return entity_id
         return None
 
+    def _fetch_index_page(self, entity_type: str, letter: str, page: int) -> list[tuple[str, str]]:
+        """Returns the ``(name, id)`` pairs listed on one letter index page."""
+        index_path = self.paths[f"{entity_type}_letter_index"].format(letter=letter, page=page)
+        response = self.client.get(index_path)
+        response.raise_for_status()
+        return self._parse_index_page(entity_type, response.text)
+
+    def _parse_index_page(self, entity_type: str, html: str) -> list[tuple[str, str]]:
+        """Returns the ``(name, id)`` pairs listed in a letter index page's HTML."""
+        soup = html_parser.soup(html)
+        entries = []
+        for link in soup.select(self.index_selectors[entity_type]):
+            match = re.search(r'-(\d+)/?$', link.get("href") or "")
+            if match:
+                entries.append((link.get_text(strip=True), match.group(1)))
+        return entries
+
+    def refresh_index_letter(self, entity_type: str, letter: str) -> int:
+        """Walks every index page of one letter into the local index; returns the names found."""
+        pages = []
+        for page_num in range(1, self.MAX_INDEX_PAGES + 1):
+            entries = self._fetch_index_page(entity_type, letter, page_num)
+            if not entries:
+                break
+            pages.append(entries)
+        zoneturf_index.get_zoneturf_index().replace_letter(entity_type, letter, pages)
+        return sum(len(page) for page in pages)
+
+    def refresh_index(self, max_letters: int | None = zoneturf_index.LETTERS_PER_CYCLE) -> int:
+        """Refreshes the stalest letters of the local index and saves it; returns letters refreshed."""
+        index = zoneturf_index.get_zoneturf_index()
+        max_age = config.ZONETURF_INDEX_REFRESH_HOURS * 3600
+        stale = index.stale_letters(self.ENTITY_TYPES, self.INDEX_LETTERS, max_age)[:max_letters]
+        refreshed = 0
+        for entity_type, letter in stale:
+            try:
+                count = self.refresh_index_letter(entity_type, letter)
+            except Exception as e:
+                logger.warning(f"Could not index {entity_type} letter '{letter}': {e}")
+                continue
+            refreshed += 1
+            logger.info(f"Indexed {count} {entity_type} names for letter '{letter}'.")
+        index.save()
+        return refreshed
+
     def _parse_chrono_to_seconds(self, chrono_str: str | None) -> float | None:
         """Parses a chrono string like 1'11"6 or 59"8 into seconds."""
         if not chrono_str:
@@ -281,6 +444,94 @@ class ZoneTurfProvider:
         logger.warning(f"Unhandled chrono format: {chrono_str}")
         return None
 
+    def _parse_horse_chrono(self, html: str) -> dict:
+        """Extracts record and recent chronos (in seconds) from a horse page."""
+        soup = html_parser.soup(html)
+        chrono_data = {}
+
+        # 1. Parse records
+        records_table = soup.find("table", class_="performances-table")
+        if records_table:
+            for row in records_table.find_all("tr"):
+                cells = row.find_all("td")
+                if len(cells) == 2:
+                    label = cells[0].get_text(strip=True)
+                    value = cells[1].get_text(strip=True)
+                    if "Record attelé" in label:
+                        chrono_data["record_attele_sec"] = self._parse_chrono_to_seconds(value)
+                    elif "Record monté" in label:
+                        chrono_data["record_monte_sec"] = self._parse_chrono_to_seconds(value)
+
+        # 2. Parse last 3 chronos from performances
+        last3_rk = []
+        performances_table = soup.find("table", id="horse-performances-table")
+        if performances_table:
+            for row in performances_table.tbody.find_all("tr")[
+                :5
+            ]:  # Check last 5 races for 3 valid chronos
+                if len(last3_rk) >= 3:
+                    break
+                cells = row.find_all("td")
+                # Assuming chrono is in the 7th column (index 6)
+                if len(cells) > 6:
+                    chrono_val = self._parse_chrono_to_seconds(cells[6].get_text(strip=True))
+                    if chrono_val:
+                        last3_rk.append(chrono_val)
+
+        # Add last3_rk_sec if it has data
+        if last3_rk:
+            chrono_data["last3_rk_sec"] = last3_rk
+            chrono_data["rk_best3_sec"] = min(last3_rk)
+
+        return chrono_data
+
+    def _parse_profile_stats(self, html: str, starters_label: str, description: str) -> dict | None:
+        """
+        Extracts the yearly stats table of a jockey or trainer page; ``starters_label``
+        names the row counting starts ("Courses" for jockeys, "Partants" for trainers).
+        Returns None, after logging why, when the page has no stats table.
+        """
+        soup = html_parser.soup(html)
+        stats = {"year": datetime.now().year}
+
+        # Find the stats table/section
+        stats_header = soup.find("h2", string=re.compile(r"Statistiques \d{4} de"))
+        if not stats_header:
+            logger.warning(f"Stats section not found for {description}")
+            return None
+
+        stats_table = stats_header.find_next_sibling("table")
+        if not stats_table:
+            logger.warning(f"Stats table not found for {description}")
+            return None
+
+        # Extract stats from the table
+        # This is highly dependent on the page structure
+        for row in stats_table.find_all("tr"):
+            cells = row.find_all("td")
+            if len(cells) == 2:
+                label = cells[0].get_text(strip=True)
+                value_text = cells[1].get_text(strip=True)
+                try:
+                    value = int(re.sub(r'\D', '', value_text))
+                except (ValueError, TypeError):
+                    continue
+
+                if label == starters_label:
+                    stats["starters"] = value
+                elif label == "Victoires":
+                    stats["wins"] = value
+                elif label == "Placés":
+                    stats["places"] = value
+
+        if stats.get("starters", 0) > 0:
+            stats["win_rate"] = stats.get("wins", 0) / stats["starters"]
+            stats["place_rate"] = stats.get("places", 0) / stats["starters"]
+        else:
+            stats["win_rate"] = 0.0
+            stats["place_rate"] = 0.0
+        return stats
+
     @http_retry
     def fetch_horse_chrono(self, horse_name: str, known_id: str | None = None) -> Chrono | None:
         logger.debug(f"Fetching horse chrono for '{horse_name}' (ID: {known_id})")
@@ -288,56 +539,29 @@ class ZoneTurfProvider:
         if not entity_id:
             return None
 
+        # Chronos are prepared by the H9 prefetch; an empty entry records a horse without any.
+        day_cache = je_stats_cache.get_day_stats_cache()
+        cached_chrono = day_cache.get("chrono", entity_id)
+        if cached_chrono is not None:
+            return Chrono(**cached_chrono) if cached_chrono else None
+
         slug = _slugify(horse_name)
         url_path = self.paths["horse"].format(slug=slug, id=entity_id)
 
         try:
             response = self.client.get(url_path)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-
-            chrono_data = {}
-
-            # 1. Parse records
-            records_table = soup.find("table", class_="performances-table")
-            if records_table:
-                for row in records_table.find_all("tr"):
-                    cells = row.find_all("td")
-                    if len(cells) == 2:
-                        label = cells[0].get_text(strip=True)
-                        value = cells[1].get_text(strip=True)
-                        if "Record attelé" in label:
-                            chrono_data["record_attele_sec"] = self._parse_chrono_to_seconds(value)
-                        elif "Record monté" in label:
-                            chrono_data["record_monte_sec"] = self._parse_chrono_to_seconds(value)
-
-            # 2. Parse last 3 chronos from performances
-            last3_rk = []
-            performances_table = soup.find("table", id="horse-performances-table")
-            if performances_table:
-                for row in performances_table.tbody.find_all("tr")[
-                    :5
-                ]:  # Check last 5 races for 3 valid chronos
-                    if len(last3_rk) >= 3:
-                        break
-                    cells = row.find_all("td")
-                    # Assuming chrono is in the 7th column (index 6)
-                    if len(cells) > 6:
-                        chrono_val = self._parse_chrono_to_seconds(cells[6].get_text(strip=True))
-                        if chrono_val:
-                            last3_rk.append(chrono_val)
-
-            # Add last3_rk_sec if it has data
-            if last3_rk:
-                chrono_data["last3_rk_sec"] = last3_rk
-                chrono_data["rk_best3_sec"] = min(last3_rk)
+            chrono_data = self._parse_horse_chrono(response.text)
 
             # If no records were found and no recent Rks, we have no data.
             if not chrono_data:
                 logger.warning(f"No chrono data found for horse '{horse_name}' at {url_path}")
+                day_cache.put("chrono", entity_id, {})
                 return None
 
-            return Chrono(**chrono_data)
+            chrono = Chrono(**chrono_data)
+            day_cache.put("chrono", entity_id, chrono.model_dump())
+            return chrono
 
         except Exception as e:
             logger.error(
@@ -353,54 +577,27 @@ class ZoneTurfProvider:
         if not entity_id:
             return None
 
+        # Profiles are parsed once per day and shared across races, phases and instances.
+        day_cache = je_stats_cache.get_day_stats_cache()
+        cached_stats = day_cache.get("jockey", entity_id)
+        if cached_stats is not None:
+            return JEStats(**cached_stats)
+
         slug = _slugify(jockey_name)
         url_path = self.paths["jockey"].format(slug=slug, id=entity_id)
 
         try:
             response = self.client.get(url_path)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-
-            stats = {"year": datetime.now().year}
-
-            # Find the stats table/section
-            stats_header = soup.find("h2", string=re.compile(r"Statistiques \d{4} de"))
-            if not stats_header:
-                logger.warning(f"Stats section not found for jockey '{jockey_name}' at {url_path}")
-                return None
-
-            stats_table = stats_header.find_next_sibling("table")
-            if not stats_table:
-                logger.warning(f"Stats table not found for jockey '{jockey_name}' at {url_path}")
+            stats = self._parse_profile_stats(
+                response.text, "Courses", f"jockey '{jockey_name}' at {url_path}"
+            )
+            if stats is None:
                 return None
 
-            # Extract stats from the table
-            # This is highly dependent on the page structure
-            for row in stats_table.find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 2:
-                    label = cells[0].get_text(strip=True)
-                    value_text = cells[1].get_text(strip=True)
-                    try:
-                        value = int(re.sub(r'\D', '', value_text))
-                    except (ValueError, TypeError):
-                        continue
-
-                    if label == "Courses":
-                        stats["starters"] = value
-                    elif label == "Victoires":
-                        stats["wins"] = value
-                    elif label == "Placés":
-                        stats["places"] = value
-
-            if stats.get("starters", 0) > 0:
-                stats["win_rate"] = stats.get("wins", 0) / stats["starters"]
-                stats["place_rate"] = stats.get("places", 0) / stats["starters"]
-            else:
-                stats["win_rate"] = 0.0
-                stats["place_rate"] = 0.0
-
-            return JEStats(**stats)
+            je_stats = JEStats(**stats)
+            day_cache.put("jockey", entity_id, je_stats.model_dump())
+            return je_stats
 
         except Exception as e:
             logger.error(
@@ -416,53 +613,27 @@ class ZoneTurfProvider:
         if not entity_id:
             return None
 
+        # Profiles are parsed once per day and shared across races, phases and instances.
+        day_cache = je_stats_cache.get_day_stats_cache()
+        cached_stats = day_cache.get("trainer", entity_id)
+        if cached_stats is not None:
+            return JEStats(**cached_stats)
+
         slug = _slugify(trainer_name)
         url_path = self.paths["trainer"].format(slug=slug, id=entity_id)
 
         try:
             response = self.client.get(url_path)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "lxml")
-
-            stats = {"year": datetime.now().year}
-
-            stats_header = soup.find("h2", string=re.compile(r"Statistiques \d{4} de"))
-            if not stats_header:
-                logger.warning(
-                    f"Stats section not found for trainer '{trainer_name}' at {url_path}"
-                )
+            stats = self._parse_profile_stats(
+                response.text, "Partants", f"trainer '{trainer_name}' at {url_path}"
+            )
+            if stats is None:
                 return None
 
-            stats_table = stats_header.find_next_sibling("table")
-            if not stats_table:
-                logger.warning(f"Stats table not found for trainer '{trainer_name}' at {url_path}")
-                return None
-
-            for row in stats_table.find_all("tr"):
-                cells = row.find_all("td")
-                if len(cells) == 2:
-                    label = cells[0].get_text(strip=True)
-                    value_text = cells[1].get_text(strip=True)
-                    try:
-                        value = int(re.sub(r'\D', '', value_text))
-                    except (ValueError, TypeError):
-                        continue
-
-                    if label == "Partants":
-                        stats["starters"] = value
-                    elif label == "Victoires":
-                        stats["wins"] = value
-                    elif label == "Placés":
-                        stats["places"] = value
-
-            if stats.get("starters", 0) > 0:
-                stats["win_rate"] = stats.get("wins", 0) / stats["starters"]
-                stats["place_rate"] = stats.get("places", 0) / stats["starters"]
-            else:
-                stats["win_rate"] = 0.0
-                stats["place_rate"] = 0.0
-
-            return JEStats(**stats)
+            je_stats = JEStats(**stats)
+            day_cache.put("trainer", entity_id, je_stats.model_dump())
+            return je_stats
 
         except Exception as e:
             logger.error(
@@ -472,5 +643,17 @@ class ZoneTurfProvider:
             return None
 
 
+def start_index_refresh(provider_config: dict | None = None):
+    """
+    Starts refreshing the local Zone-Turf name index in a background thread.
+    Disabled when ZONETURF_INDEX_REFRESH_HOURS is not positive.
+    """
+    if config.ZONETURF_INDEX_REFRESH_HOURS <= 0:
+        return None
+    provider = ZoneTurfProvider(config=provider_config or {})
+    return zoneturf_index.start_background_refresh(provider.refresh_index)
+
+
 # Verify that the class implements the protocol at runtime (optional but good practice)
 assert issubclass(ZoneTurfProvider, StatsProvider)
+
@@ -0,0 +1,172 @@
+"""
+Encoding of the JSON documents persisted to GCS.
+
+Documents are serialized compactly (orjson when installed) and compressed
+with ``STORAGE_CODEC``: ``zstd`` (needs ``zstandard``), ``gzip`` or
+``identity``.  The codec goes into the object's ``Content-Encoding`` and
+:func:`decode_text` undoes it, sniffing the magic bytes when the metadata is
+missing, so objects written before compression was introduced read back
+unchanged.
+
+Sizes before and after compression are counted per UTC day, for both writes
+(bytes stored) and reads (egress saved), and reported by :func:`report`.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+CODECS = ("zstd", "gzip", "identity")
+GZIP_LEVEL = 6
+ZSTD_LEVEL = 6
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+# Days of per-day counters kept in memory
+REPORT_DAYS = 14
+
+
+@dataclass(frozen=True)
+class Encoded:
+    body: bytes
+    content_encoding: str | None  # None for identity
+    raw_size: int
+
+
+def codec(name: str | None = None) -> str:
+    """The configured codec, downgraded to gzip when zstandard is missing."""
+    name = (name or config.STORAGE_CODEC or "identity").lower()
+    if name not in CODECS:
+        logger.warning(f"Unknown storage codec '{name}', using 'gzip'.")
+        name = "gzip"
+    if name == "zstd" and zstandard is None:
+        name = "gzip"
+    return name
+
+
+def dumps(data: Any) -> bytes:
+    """Compact UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # types orjson refuses; the standard encoder decides
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(text: str | bytes) -> Any:
+    """Parse JSON, unwrapping documents stored as a JSON-encoded string.
+
+    Snapshots used to be saved as ``model_dump_json()`` text passed through
+    ``json.dump``, i.e. a JSON string holding the document.
+    """
+    value = orjson.loads(text) if orjson is not None else json.loads(text)
+    if isinstance(value, str) and value.lstrip()[:1] in ("{", "["):
+        try:
+            value = loads(value)
+        except ValueError:
+            pass
+    return value
+
+
+def compress(raw: bytes, name: str | None = None) -> tuple[bytes, str | None]:
+    name = codec(name)
+    if name == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(raw), "zstd"
+    if name == "gzip":
+        return gzip.compress(raw, compresslevel=GZIP_LEVEL, mtime=0), "gzip"
+    return raw, None
+
+
+def decompress(body: bytes, content_encoding: str | None = None) -> bytes:
+    """Undo ``content_encoding``; objects without metadata are recognized by their magic bytes."""
+    encoding = (content_encoding or "").lower()
+    if encoding == "zstd" or (not encoding and body.startswith(ZSTD_MAGIC)):
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to read zstd-encoded objects.")
+        return zstandard.ZstdDecompressor().decompressobj().decompress(body)
+    if encoding == "gzip" or (not encoding and body.startswith(GZIP_MAGIC)):
+        return gzip.decompress(body)
+    return body
+
+
+def encode(data: Any, name: str | None = None) -> Encoded:
+    """Serialize and compress ``data``; the write is counted in the day's report."""
+    raw = dumps(data)
+    body, content_encoding = compress(raw, name)
+    _record("written", len(raw), len(body))
+    return Encoded(body=body, content_encoding=content_encoding, raw_size=len(raw))
+
+
+def encode_text(text: str, name: str | None = None) -> Encoded:
+    """Compress an already rendered document (HTML); counted like :func:`encode`."""
+    raw = text.encode("utf-8")
+    body, content_encoding = compress(raw, name)
+    _record("written", len(raw), len(body))
+    return Encoded(body=body, content_encoding=content_encoding, raw_size=len(raw))
+
+
+def decode_text(body: bytes, content_encoding: str | None = None) -> str:
+    """Decompress a downloaded object to text; the read is counted in the day's report."""
+    raw = decompress(body, content_encoding)
+    _record("read", len(raw), len(body))
+    return raw.decode("utf-8")
+
+
+_report_lock = threading.Lock()
+_report: dict[str, dict[str, int]] = {}
+
+
+def _record(kind: str, raw_size: int, stored_size: int) -> None:
+    day = datetime.now(timezone.utc).date().isoformat()
+    with _report_lock:
+        counters = _report.setdefault(
+            day,
+            {
+                "objects_written": 0, "bytes_raw_written": 0, "bytes_stored": 0,
+                "objects_read": 0, "bytes_raw_read": 0, "bytes_transferred": 0,
+            },
+        )
+        if kind == "written":
+            counters["objects_written"] += 1
+            counters["bytes_raw_written"] += raw_size
+            counters["bytes_stored"] += stored_size
+        else:
+            counters["objects_read"] += 1
+            counters["bytes_raw_read"] += raw_size
+            counters["bytes_transferred"] += stored_size
+        for old_day in sorted(_report)[:-REPORT_DAYS]:
+            del _report[old_day]
+
+
+def report() -> dict[str, Any]:
+    """Per-day bytes stored and egress saved, newest day first."""
+    with _report_lock:
+        days = {day: dict(counters) for day, counters in _report.items()}
+    for counters in days.values():
+        counters["bytes_saved_stored"] = counters["bytes_raw_written"] - counters["bytes_stored"]
+        counters["egress_saved"] = counters["bytes_raw_read"] - counters["bytes_transferred"]
+    return {"codec": codec(), "days": dict(sorted(days.items(), reverse=True))}
+
+
+def reset_report() -> None:
+    with _report_lock:
+        _report.clear()
@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import datetime
-import json
 import os
 from typing import Any
 
 from google.cloud import storage
 from jinja2 import Template
 
+from hippique_orchestrator import storage_codec
+
 TICKETS_BUCKET = os.environ.get("TICKETS_BUCKET")
 TICKETS_PREFIX = os.environ.get("TICKETS_PREFIX", "tickets")
 
@@ -98,8 +99,8 @@ def render_ticket_html(
         date_str=date_str,
         ev=ev,
         roi=roi,
-        tickets_pre=json.dumps(tickets, ensure_ascii=False, indent=2),
-        payload_pre=json.dumps(payload, ensure_ascii=False, indent=2),
+        tickets_pre=storage_codec.dumps(tickets).decode("utf-8"),
+        payload_pre=storage_codec.dumps(payload).decode("utf-8"),
     )
 
 
@@ -109,7 +110,10 @@ def save_ticket_html(html: str, *, date_str: str, rxcy: str) -> None:
     blob = bkt.blob(_blob_path(date_str, rxcy))
     blob.cache_control = "no-cache"
     blob.content_type = "text/html; charset=utf-8"
-    blob.upload_from_string(html, content_type=blob.content_type)
+    # Toujours gzip : GCS le décompresse à la volée pour les clients qui ne l'acceptent pas.
+    encoded = storage_codec.encode_text(html, "gzip")
+    blob.content_encoding = encoded.content_encoding
+    blob.upload_from_string(encoded.body, content_type=blob.content_type)
 
 
 def build_and_save_ticket(
@@ -49,6 +49,19 @@ class AntiBotError(FetchError):
 
 # --- Retry Decorator ---
 
+def retry_policy(attempts: int = TOTAL_ATTEMPTS, backoff: float = BACKOFF_BASE_S) -> dict:
+    """
+    Keyword arguments for tenacity's ``retry``/``Retrying`` implementing the
+    standard policy: ``attempts`` tries with exponential backoff (2s to 30s).
+    A ``backoff`` of 0 retries immediately.
+    """
+    return {
+        "stop": stop_after_attempt(attempts),
+        "wait": wait_exponential(multiplier=backoff, min=2 if backoff else 0, max=30),
+        "reraise": True,  # Reraise the last exception after all retries fail
+    }
+
+
 def http_retry(func):
     """
     A decorator that provides a standardized retry mechanism for functions
@@ -58,11 +71,7 @@ def http_retry(func):
     and implements an exponential backoff with jitter.
     """
     
-    @retry(
-        stop=stop_after_attempt(TOTAL_ATTEMPTS),
-        wait=wait_exponential(multiplier=BACKOFF_BASE_S, min=2, max=30),
-        reraise=True  # Reraise the last exception after all retries fail
-    )
+    @retry(**retry_policy())
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
@@ -1,112 +1,91 @@
-import bs4
 import json
 import re
 
-def parse_html(html_content: str) -> bs4.BeautifulSoup:
-    """Parses HTML content using BeautifulSoup."""
-    return bs4.BeautifulSoup(html_content, "html5lib")
-
-def parse_race_data(soup: bs4.BeautifulSoup) -> dict:
-
-    """Parses race data from a ZEturf race page."""
-
-    data = {}
-
-    
+from hippique_orchestrator import html_parser
+from hippique_orchestrator.html_parser import first, has_class
+
+
+def parse_html(html_content: str):
+    """Parses HTML content with the configured engine (see :mod:`html_parser`)."""
+    return html_parser.parse_html(html_content)
+
+
+def _parse_cotes_infos(document) -> dict:
+    script = html_parser.script_containing(document, "cotesInfos")
+    if not script:
+        return {}
+    match = re.search(r'cotesInfos: (\{.*\})', script)
+    if not match:
+        return {}
+    # Fix for json loading by removing trailing comma
+    return json.loads(re.sub(r',(\s*})', r'\1', match.group(1)))
+
+
+def _runner_rows(document) -> list[tuple[str, str | None, str | None]]:
+    """``(number, name, record)`` of every runner row of the table-runners table."""
+    rows = []
+    if html_parser.is_soup(document):
+        table = document.find("table", class_="table-runners")
+        if not table:
+            return rows
+        for row in table.find_all("tr"):
+            if not row.has_attr('data-runner'):
+                continue
+            name_element = row.select_one(".cheval a.horse-name")
+            record_element = row.select_one("td.record b")
+            rows.append((
+                row['data-runner'],
+                name_element.text.strip() if name_element else None,
+                record_element.text.strip() if record_element else None,
+            ))
+        return rows
+
+    table = first(document, f"//table[{has_class('table-runners')}]")
+    if table is None:
+        return rows
+    for row in table.xpath(".//tr[@data-runner]"):
+        name_element = first(row, f".//*[{has_class('cheval')}]//a[{has_class('horse-name')}]")
+        record_element = first(row, f".//td[{has_class('record')}]//b")
+        rows.append((
+            row.get('data-runner'),
+            html_parser.text(name_element).strip() if name_element is not None else None,
+            html_parser.text(record_element).strip() if record_element is not None else None,
+        ))
+    return rows
+
+
+def parse_race_data(document) -> dict:
+    """Parses race data from a ZEturf race page (as returned by :func:`parse_html`)."""
+    if isinstance(document, str):
+        document = parse_html(document)
 
     # Extract data from the cotesInfos JSON object
+    cotes_infos = _parse_cotes_infos(document)
 
-    cotes_infos = {}
-
-    script_text = soup.find("script", string=re.compile("cotesInfos"))
-
-    if script_text:
-
-        match = re.search(r'cotesInfos: (\{.*\})', script_text.string)
-
-        if match:
-
-            cotes_json = match.group(1)
-
-            # Fix for json loading by removing trailing comma
-
-            cotes_json = re.sub(r',(\s*})', r'\1', cotes_json)
-
-            cotes_infos = json.loads(cotes_json)
-
-
-
-    runners = []
-
-    table = soup.find("table", class_="table-runners")
-
-    if not table:
-
+    rows = _runner_rows(document)
+    if not rows:
         return {"runners": []}
 
-
-
-    all_rows = table.find_all("tr")
-
-    
-
-    for row in all_rows:
-
-        if not row.has_attr('data-runner'):
-
-            continue
-
-            
-
+    runners = []
+    for runner_number, name, record in rows:
         runner = {}
-
-        
-
-        runner_number = row['data-runner']
-
-
-
-        name_element = row.select_one(".cheval a.horse-name")
-
-        if name_element:
-
-            runner["name"] = name_element.text.strip()
-
-
-
-        record_element = row.select_one("td.record b")
-
-        if record_element:
-
-            runner["record"] = record_element.text.strip()
-
-        
+        if name is not None:
+            runner["name"] = name
+        if record is not None:
+            runner["record"] = record
 
         # Win/place rates are not on this page, will be handled later
-
         runner["win_rate"] = None
-
         runner["place_rate"] = None
 
-
-
         if runner_number in cotes_infos:
-
             odds_data = cotes_infos[runner_number].get("odds", {})
-
             runner["odds"] = odds_data.get("SG")
-
             runner["place_odds"] = odds_data.get("SPMin") # Using SPMin as a proxy for place_odds
 
-
-
         runners.append(runner)
 
-    
-
-    data["runners"] = runners
-
-    return data
+    return {"runners": runners}
 
 def calculate_quality_score(snapshot: dict) -> float:
     """
@@ -0,0 +1,291 @@
+"""
+Local name → Zone-Turf ID index.
+
+Resolving a horse, jockey or trainer used to mean walking up to ten
+``lettre-X.html?p=N`` pages.  :class:`ZoneTurfIndex` keeps every letter page
+already seen, per entity type, as a sorted array of normalised names so that a
+lookup is a binary search (with a fuzzy fallback on the neighbouring names),
+and remembers the first name of each page so that a miss costs a single page
+fetch once the letter has been indexed completely.
+
+The index is persisted as one gzipped JSON file (``ZONETURF_INDEX_PATH``) and
+refreshed letter by letter in a background thread, stalest letters first.
+"""
+from __future__ import annotations
+
+import bisect
+import difflib
+import gzip
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from hippique_orchestrator import config
+from hippique_orchestrator.logging_utils import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+FUZZY_CUTOFF = 0.9
+FUZZY_WINDOW = 25  # Sorted neighbours on each side compared by the fuzzy fallback
+REFRESH_CYCLE_SECONDS = 300.0
+LETTERS_PER_CYCLE = 4
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase ASCII letters and digits only, accents folded."""
+    decomposed = unicodedata.normalize("NFKD", name or "")
+    return "".join(c for c in decomposed if c.isascii() and c.isalnum()).lower()
+
+
+class _EntityIndex:
+    """Letter buckets of one entity type plus the merged sorted arrays."""
+
+    def __init__(self, letters: dict[str, dict[str, Any]] | None = None) -> None:
+        # letter -> {"complete": bool, "refreshed_at": float | None, "pages": [[[key, id], ...], ...]}
+        self.letters: dict[str, dict[str, Any]] = letters or {}
+        self.keys: list[str] = []
+        self.ids: list[str] = []
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        merged = {
+            key: entity_id
+            for bucket in self.letters.values()
+            for page in bucket["pages"]
+            for key, entity_id in page
+        }
+        pairs = sorted(merged.items())
+        self.keys = [key for key, _ in pairs]
+        self.ids = [entity_id for _, entity_id in pairs]
+
+    def lookup(self, key: str, fuzzy: bool) -> tuple[str | None, bool]:
+        i = bisect.bisect_left(self.keys, key)
+        if i < len(self.keys) and self.keys[i] == key:
+            return self.ids[i], False
+        if not fuzzy:
+            return None, False
+        lo = max(i - FUZZY_WINDOW, 0)
+        window = [k for k in self.keys[lo : i + FUZZY_WINDOW] if k[:1] == key[:1]]
+        match = difflib.get_close_matches(key, window, n=1, cutoff=FUZZY_CUTOFF)
+        if not match:
+            return None, False
+        return self.ids[bisect.bisect_left(self.keys, match[0])], True
+
+    def page_for(self, letter: str, key: str) -> int | None:
+        bucket = self.letters.get(letter)
+        if not bucket or not bucket["complete"] or not bucket["pages"]:
+            return None
+        starts = [page[0][0] if page else "" for page in bucket["pages"]]
+        return max(bisect.bisect_right(starts, key), 1)
+
+
+class ZoneTurfIndex:
+    """Thread-safe, file-backed name → ID index for each Zone-Turf entity type."""
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._entities: dict[str, _EntityIndex] = {}
+        self._dirty = False
+        self._counters = {"lookups": 0, "hits": 0, "fuzzy_hits": 0, "page_hints": 0}
+        self.load_ms = 0.0
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> ZoneTurfIndex:
+        """Load the index from ``path``; a missing or unreadable file gives an empty index."""
+        index = cls(path)
+        start = time.perf_counter()
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("version") == FORMAT_VERSION:
+                index._entities = {
+                    entity_type: _EntityIndex(letters)
+                    for entity_type, letters in payload.get("entities", {}).items()
+                }
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable Zone-Turf index {path}: {e}")
+        index.load_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Zone-Turf index loaded in {index.load_ms:.1f}ms ({index.size()} names).")
+        return index
+
+    def save(self, path: str | os.PathLike[str] | None = None) -> bool:
+        """Write the index atomically; returns False when there is nothing new to write."""
+        target = Path(path) if path else self.path
+        if target is None:
+            return False
+        with self._lock:
+            if not self._dirty and path is None:
+                return False
+            data = json.dumps(
+                {
+                    "version": FORMAT_VERSION,
+                    "entities": {
+                        entity_type: entity.letters
+                        for entity_type, entity in self._entities.items()
+                    },
+                },
+                separators=(",", ":"),
+            )
+            self._dirty = False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp, target)
+        return True
+
+    def _entity(self, entity_type: str) -> _EntityIndex:
+        # Caller holds the lock.
+        entity = self._entities.get(entity_type)
+        if entity is None:
+            entity = self._entities[entity_type] = _EntityIndex()
+        return entity
+
+    # --- Queries ---
+
+    def lookup(self, entity_type: str, name: str, *, fuzzy: bool = True) -> str | None:
+        """Return the ID indexed for ``name`` (exact, then fuzzy), or None."""
+        key = normalize_name(name)
+        if not key:
+            return None
+        with self._lock:
+            self._counters["lookups"] += 1
+            entity_id, fuzzy_hit = self._entity(entity_type).lookup(key, fuzzy)
+            if entity_id is not None:
+                self._counters["hits"] += 1
+                self._counters["fuzzy_hits"] += int(fuzzy_hit)
+        return entity_id
+
+    def page_for(self, entity_type: str, letter: str, name: str) -> int | None:
+        """Return the letter page ``name`` would be listed on, if the letter is fully indexed."""
+        with self._lock:
+            page = self._entity(entity_type).page_for(letter, normalize_name(name))
+            self._counters["page_hints"] += int(page is not None)
+        return page
+
+    def size(self) -> int:
+        with self._lock:
+            return sum(len(entity.keys) for entity in self._entities.values())
+
+    def stale_letters(
+        self, entity_types: Iterable[str], letters: Iterable[str], max_age: float
+    ) -> list[tuple[str, str]]:
+        """Return ``(entity_type, letter)`` pairs older than ``max_age`` seconds, stalest first."""
+        now = time.time()
+        letters = list(letters)
+        candidates = []
+        with self._lock:
+            for entity_type in entity_types:
+                buckets = self._entity(entity_type).letters
+                for letter in letters:
+                    refreshed_at = (buckets.get(letter) or {}).get("refreshed_at") or 0.0
+                    if now - refreshed_at >= max_age:
+                        candidates.append((refreshed_at, entity_type, letter))
+        return [(entity_type, letter) for _, entity_type, letter in sorted(candidates)]
+
+    # --- Updates ---
+
+    def merge_page(
+        self, entity_type: str, letter: str, page: int, entries: Iterable[tuple[str, str]]
+    ) -> None:
+        """Record the ``(name, id)`` pairs listed on one letter page."""
+        rows = sorted({normalize_name(name): entity_id for name, entity_id in entries}.items())
+        rows = [[key, entity_id] for key, entity_id in rows if key]
+        with self._lock:
+            entity = self._entity(entity_type)
+            bucket = entity.letters.setdefault(
+                letter, {"complete": False, "refreshed_at": None, "pages": []}
+            )
+            pages = bucket["pages"]
+            while len(pages) < page:
+                pages.append([])
+            if pages[page - 1] == rows:
+                return
+            pages[page - 1] = rows
+            entity.rebuild()
+            self._dirty = True
+
+    def replace_letter(
+        self, entity_type: str, letter: str, pages: list[list[tuple[str, str]]]
+    ) -> None:
+        """Replace a letter with a complete walk of its pages."""
+        rows = [
+            sorted([key, entity_id] for name, entity_id in page if (key := normalize_name(name)))
+            for page in pages
+        ]
+        with self._lock:
+            entity = self._entity(entity_type)
+            entity.letters[letter] = {"complete": True, "refreshed_at": time.time(), "pages": rows}
+            entity.rebuild()
+            self._dirty = True
+
+    # --- Monitoring ---
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entities = {
+                entity_type: {
+                    "names": len(entity.keys),
+                    "complete_letters": sum(1 for b in entity.letters.values() if b["complete"]),
+                }
+                for entity_type, entity in self._entities.items()
+            }
+            counters = dict(self._counters)
+        return {
+            **counters,
+            "hit_rate": counters["hits"] / counters["lookups"] if counters["lookups"] else 0.0,
+            "load_ms": self.load_ms,
+            "entities": entities,
+        }
+
+
+_index: ZoneTurfIndex | None = None
+_index_lock = threading.Lock()
+_refresh_thread: threading.Thread | None = None
+
+
+def get_zoneturf_index() -> ZoneTurfIndex:
+    """Return the process-wide index, loading ``ZONETURF_INDEX_PATH`` on first use."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ZoneTurfIndex.load(config.ZONETURF_INDEX_PATH)
+        return _index
+
+
+def reset_zoneturf_index() -> None:
+    """Forget the process-wide index (mainly for tests)."""
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def start_background_refresh(
+    refresh: Callable[[], Any], interval: float = REFRESH_CYCLE_SECONDS
+) -> threading.Thread | None:
+    """Run ``refresh`` every ``interval`` seconds in a daemon thread (once per process)."""
+    global _refresh_thread
+
+    def _loop() -> None:
+        while True:
+            try:
+                refresh()
+            except Exception as e:
+                logger.warning(f"Zone-Turf index refresh failed: {e}")
+            time.sleep(interval)
+
+    with _index_lock:
+        if _refresh_thread is not None and _refresh_thread.is_alive():
+            return _refresh_thread
+        _refresh_thread = threading.Thread(target=_loop, name="zoneturf-index", daemon=True)
+        _refresh_thread.start()
+        return _refresh_thread
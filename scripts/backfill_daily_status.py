@@ -0,0 +1,43 @@
+"""Build the daily status aggregate of past days from their race documents.
+
+``update_race_document`` maintains one aggregate per race date in
+``FIRESTORE_DAILY_STATUS_COLLECTION``; days written before it existed have
+none, so /ops/status reports them as empty.  This replays every race
+document of each ``--date`` (in ``last_modified_at`` order) through the same
+merge and overwrites the day's aggregate, as /ops/status does for a day
+marked dirty.
+
+Usage::
+
+    python scripts/backfill_daily_status.py --date 2025-12-30 --date 2025-12-31 [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from hippique_orchestrator import config, firestore_client  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--date", action="append", required=True, help="YYYY-MM-DD, repeatable")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    db_client = firestore_client._get_firestore_client()
+    if db_client is None:
+        sys.exit("Firestore is not available (PROJECT_ID not set?).")
+    for date_str in args.date:
+        status = firestore_client.rebuild_daily_status(db_client, date_str)
+        print(f"{date_str}: {status.get('counts') or 'no races'}")
+        if status and not args.dry_run:
+            db_client.collection(config.FIRESTORE_DAILY_STATUS_COLLECTION).document(date_str).set(status)
+
+
+if __name__ == "__main__":
+    main()
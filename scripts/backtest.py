@@ -1,55 +1,76 @@
 import argparse
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any
-from unittest.mock import patch
 
 import yaml
 
-from hippique_orchestrator.pipeline_run import generate_tickets
+from hippique_orchestrator import pipeline_run
+from hippique_orchestrator.pipeline_run import generate_tickets_batch
 
 logging.basicConfig(level=logging.INFO)
 
-def run_backtest_on_race(race_dir: Path, gpi_config: dict[str, Any]) -> dict[str, Any]:
+
+def _passthrough_probabilities(runners, config):
+    # Directly use p_finale from snapshot, bypassing complex adjustments
+    return runners, ["Probabilities patched for backtest"]
+
+
+def bypass_probability_adjustments() -> None:
     """
-    Exécute le backtest pour une seule course.
+    Initialise chaque worker: les p_finale des snapshots sont utilisées telles quelles.
     """
-    print(f"Backtesting race in {race_dir}")
+    pipeline_run._calculate_adjusted_probabilities = _passthrough_probabilities
 
+
+def load_race(race_dir: Path) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """
+    Charge les snapshots H-5/H-30 et l'arrivée d'une course.
+    """
     with open(race_dir / "snapshot_H-5.json") as f:
         snapshot_data = json.load(f)
     with open(race_dir / "snapshot_H-30.json") as f:
         h30_snapshot_data = json.load(f)
     with open(race_dir / "results.json") as f:
         results = json.load(f)
+    return snapshot_data, h30_snapshot_data, results
 
-    gpi_config["h30_snapshot_data"] = h30_snapshot_data
-    gpi_config["je_stats"] = {}
-    gpi_config["calibration_data"] = {}
-
-    def mock_calculate_adjusted_probabilities(runners, config):
-        # Directly use p_finale from snapshot, bypassing complex adjustments
-        return runners, ["Probabilities patched for backtest"]
-
-    with patch(
-        "hippique_orchestrator.pipeline_run._calculate_adjusted_probabilities",
-        mock_calculate_adjusted_probabilities,
-    ):
-        try:
-            pipeline_results = generate_tickets(snapshot_data, gpi_config)
-            tickets = pipeline_results.get("tickets", [])
-        except Exception as e:
-            print(f"[ERREUR] Le pipeline a échoué pour {race_dir}: {e}")
-            return {"race": race_dir.name, "error": str(e), "profit": 0, "tickets": []}
 
+def score_race(
+    race_name: str,
+    snapshot_data: dict[str, Any],
+    results: dict[str, Any],
+    batch_result: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Calcule le résultat du backtest pour une course à partir de la sortie du pipeline.
+    """
+    wall_time_s = batch_result["wall_time_s"]
+    if batch_result["error"] is not None:
+        print(f"[ERREUR] Le pipeline a échoué pour {race_name}: {batch_result['error']}")
+        return {
+            "race": race_name,
+            "error": batch_result["error"],
+            "profit": 0,
+            "tickets": [],
+            "wall_time_s": wall_time_s,
+        }
+
+    tickets = batch_result["result"].get("tickets", [])
     total_profit = 0
     for ticket in tickets:
         if ticket["type"] == "SP_DUTCHING":
             total_profit += calculate_sp_profit(ticket, results, snapshot_data['runners'])
         # TODO: Add other ticket types
 
-    return {"race": race_dir.name, "tickets": tickets, "profit": total_profit}
+    return {
+        "race": race_name,
+        "tickets": tickets,
+        "profit": total_profit,
+        "wall_time_s": wall_time_s,
+    }
 
 
 def calculate_sp_profit(ticket: dict[str, Any], results: dict[str, Any], runners: list) -> float:
@@ -77,6 +98,12 @@ def main() -> None:
     parser.add_argument(
         "--config", default="config/gpi_v52.yml", help="Fichier de configuration YAML à utiliser."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="Nombre de processus (1 = exécution séquentielle dans le processus courant).",
+    )
     args = parser.parse_args()
 
     # Charger la configuration
@@ -92,24 +119,48 @@ def main() -> None:
         print(f"[ERREUR] Le dossier de données n'existe pas: {data_dir}")
         return
 
+    snapshots = {}
+    race_data = {}
+    config_overrides = {}
+    for race_dir in sorted(data_dir.iterdir()):
+        if race_dir.is_dir():
+            snapshot_data, h30_snapshot_data, race_results = load_race(race_dir)
+            snapshots[race_dir.name] = snapshot_data
+            race_data[race_dir.name] = (snapshot_data, race_results)
+            config_overrides[race_dir.name] = {
+                "h30_snapshot_data": h30_snapshot_data,
+                "je_stats": {},
+                "calibration_data": {},
+            }
+
     results = []
     total_profit = 0
     total_stake = 0
     num_bets = 0
 
-    for race_dir in data_dir.iterdir():
-        if race_dir.is_dir():
-            race_results = run_backtest_on_race(race_dir, gpi_config)
-            results.append(race_results)
+    for batch_result in generate_tickets_batch(
+        snapshots,
+        gpi_config,
+        workers=args.workers,
+        config_overrides=config_overrides,
+        initializer=bypass_probability_adjustments,
+    ):
+        race_name = batch_result["race"]
+        print(f"Backtested race {race_name} in {batch_result['wall_time_s']:.3f}s")
+        snapshot_data, race_results_data = race_data[race_name]
+        race_results = score_race(race_name, snapshot_data, race_results_data, batch_result)
+        results.append(race_results)
+
+        profit = race_results.get("profit", 0)
+        total_profit += profit
 
-            profit = race_results.get("profit", 0)
-            total_profit += profit
+        for ticket in race_results.get("tickets", []):
+            total_stake += ticket.get("stake", 0)
 
-            for ticket in race_results.get("tickets", []):
-                total_stake += ticket.get("stake", 0)
+        if race_results.get("tickets"):
+            num_bets += 1
 
-            if race_results.get("tickets"):
-                num_bets += 1
+    results.sort(key=lambda race: race["race"])
 
     roi = (total_profit / total_stake) * 100 if total_stake > 0 else 0
 
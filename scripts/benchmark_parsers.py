@@ -0,0 +1,67 @@
+"""Benchmark the HTML parsing engines on the saved page corpus.
+
+Runs every extractor of ``tests/parser_corpus.py`` on its pages with each
+engine of :mod:`hippique_orchestrator.html_parser`, prints the mean time per
+page and checks that every engine extracts the same output.
+
+Usage::
+
+    python scripts/benchmark_parsers.py --repeat 20
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from hippique_orchestrator import html_parser  # noqa: E402
+from tests import parser_corpus  # noqa: E402
+
+
+def _timed(extract, html: str, repeat: int):
+    output = extract(html)  # warm-up, also the output compared across engines
+    start = time.perf_counter()
+    for _ in range(repeat):
+        extract(html)
+    return output, (time.perf_counter() - start) / repeat
+
+
+def run(repeat: int, engines: list[str]) -> int:
+    print(f"{'page':<48} {'extractor':<22}" + "".join(f"{e:>13}" for e in engines))
+    totals = dict.fromkeys(engines, 0.0)
+    mismatches = 0
+    for page, name in parser_corpus.cases():
+        html = parser_corpus.load(page)
+        outputs, timings = {}, []
+        for engine in engines:
+            with html_parser.use_engine(engine):
+                outputs[engine], elapsed = _timed(parser_corpus.EXTRACTORS[name], html, repeat)
+            totals[engine] += elapsed
+            timings.append(f"{elapsed * 1e3:10.2f} ms")
+        same = all(output == outputs[engines[0]] for output in outputs.values())
+        mismatches += not same
+        print(f"{page[-48:]:<48} {name:<22}" + "".join(timings) + ("" if same else "  MISMATCH"))
+
+    print(f"{'total':<71}" + "".join(f"{totals[e] * 1e3:10.2f} ms" for e in engines))
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument(
+        "--engines", nargs="+", default=list(html_parser.available_engines()),
+        choices=html_parser.ENGINES,
+    )
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # extractors log skipped rows on every run
+    sys.exit(1 if run(args.repeat, args.engines) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Load saved JSON snapshots into the columnar odds store.
+
+Walks ``data/{race_doc_id}/snapshots/{YYYYmmdd_HHMMSS}_{phase}.json`` and the
+backtest layout ``data/backtest_history/{race}_{YYYY-mm-dd}/snapshot_{phase}.json``
+under ``--data-dir`` and appends each snapshot's odds to the per-day datasets of
+:mod:`hippique_orchestrator.odds_store`, then compacts every day touched, so
+backtests and replays scan one file per day instead of parsing every snapshot.
+
+Usage::
+
+    python scripts/build_odds_store.py --data-dir data --store-dir /tmp/hippique-odds
+"""
+
+import argparse
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from hippique_orchestrator import odds_store  # noqa: E402
+from hippique_orchestrator.snapshot_manifest import decode_snapshot  # noqa: E402
+
+SNAPSHOT_NAME = re.compile(r"^(\d{8}_\d{6})_(H-?\d+)\.json$")
+RACE_DAY = re.compile(r"^(\d{4}-\d{2}-\d{2})_")
+BACKTEST_SNAPSHOT_NAME = re.compile(r"^snapshot_(H-?\d+)\.json$")
+BACKTEST_RACE_DAY = re.compile(r"_(\d{4}-\d{2}-\d{2})$")
+
+
+def _snapshot_files(data_dir: Path):
+    """Yield ``(path, day, race, phase, saved_at)`` for every snapshot found."""
+    for path in sorted(data_dir.glob("*/snapshots/*.json")):
+        match = SNAPSHOT_NAME.match(path.name)
+        if not match:
+            continue  # *_stats.json and other side files
+        race = path.parent.parent.name
+        saved_at = datetime.strptime(match.group(1), "%Y%m%d_%H%M%S").replace(tzinfo=timezone.utc)
+        day_match = RACE_DAY.match(race)
+        day = day_match.group(1) if day_match else saved_at.date().isoformat()
+        yield path, day, race, match.group(2), saved_at
+
+    for path in sorted(data_dir.glob("backtest_history/*/snapshot_*.json")):
+        match, day_match = BACKTEST_SNAPSHOT_NAME.match(path.name), BACKTEST_RACE_DAY.search(path.parent.name)
+        if match and day_match:
+            saved_at = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+            yield path, day_match.group(1), path.parent.name, match.group(1), saved_at
+
+
+def build(data_dir: Path, store: odds_store.OddsStore) -> dict[str, int]:
+    rows_per_day: dict[str, int] = {}
+    for path, day, race, phase, saved_at in _snapshot_files(data_dir):
+        try:
+            snapshot = decode_snapshot(path.read_text(encoding="utf-8"))
+        except ValueError as e:
+            print(f"skipped {path}: {e}", file=sys.stderr)
+            continue
+        added = store.append_snapshot(day, race, phase, snapshot, ts=saved_at)
+        rows_per_day[day] = rows_per_day.get(day, 0) + added
+
+    for day in rows_per_day:
+        store.compact(day)
+    return rows_per_day
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--data-dir", type=Path, default=project_root / "data")
+    parser.add_argument("--store-dir", default=None, help="defaults to ODDS_STORE_DIR")
+    args = parser.parse_args()
+
+    if not odds_store.available():
+        sys.exit("pyarrow is required to build the odds store.")
+    rows_per_day = build(args.data_dir, odds_store.OddsStore(args.store_dir))
+    for day, rows in sorted(rows_per_day.items()):
+        print(f"{day}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
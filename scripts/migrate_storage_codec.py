@@ -0,0 +1,64 @@
+"""Re-encode JSON objects saved before the storage codec was introduced.
+
+Lists the objects under ``--prefix`` in the configured bucket and rewrites
+every one without a Content-Encoding through
+:mod:`hippique_orchestrator.storage_codec`: compact JSON (documents stored as a
+JSON-encoded string are unwrapped) compressed with ``STORAGE_CODEC``.
+Readers decode both forms, so the migration can run at any time.
+
+Usage::
+
+    python scripts/migrate_storage_codec.py --prefix data/ --dry-run
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root))
+
+from hippique_orchestrator import gcs_client, storage_codec  # noqa: E402
+
+
+def migrate(prefix: str, dry_run: bool) -> tuple[int, int, int]:
+    manager = gcs_client.get_gcs_manager()
+    if manager is None:
+        sys.exit("GCS is disabled or GCS_BUCKET is not set.")
+    bucket = manager.client.bucket(manager.bucket_name)
+    migrated = before = after = 0
+    for blob in manager.client.list_blobs(bucket, prefix=prefix):
+        if not blob.name.endswith(".json") or blob.content_encoding:
+            continue
+        body = blob.download_as_bytes(raw_download=True)
+        try:
+            document = storage_codec.loads(storage_codec.decompress(body))
+        except ValueError as e:
+            print(f"skipped {blob.name}: {e}", file=sys.stderr)
+            continue
+        encoded = storage_codec.encode(document)
+        before += len(body)
+        after += len(encoded.body)
+        migrated += 1
+        if not dry_run:
+            blob.content_encoding = encoded.content_encoding
+            blob.upload_from_string(
+                encoded.body, content_type="application/json", if_generation_match=blob.generation
+            )
+    return migrated, before, after
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefix", default="data/")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    migrated, before, after = migrate(args.prefix, args.dry_run)
+    verb = "would re-encode" if args.dry_run else "re-encoded"
+    print(f"{verb} {migrated} objects: {before} -> {after} bytes ({before - after} saved)")
+
+
+if __name__ == "__main__":
+    main()
@@ -54,6 +54,66 @@ def mock_network_calls(session_mocker):
   )
 
 
+@pytest.fixture(autouse=True)
+def reset_pronostics_cache():
+  """Drops memoized /api/pronostics payloads so tests do not see each other's data."""
+  from hippique_orchestrator import service  # noqa: PLC0415
+
+  service._pronostics_cache.clear()
+  yield
+  service._pronostics_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolated_http_cache(tmp_path, monkeypatch):
+  """Points the on-disk HTTP cache at a per-test directory."""
+  from hippique_orchestrator import http_cache  # noqa: PLC0415
+
+  monkeypatch.setattr("hippique_orchestrator.config.HTTP_CACHE_DIR", str(tmp_path / "http-cache"))
+  http_cache.reset_http_cache()
+  yield
+  http_cache.reset_http_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_gcs_disk_cache(tmp_path, monkeypatch):
+  """Points the local-disk GCS read tier at a per-test directory."""
+  from hippique_orchestrator import gcs_disk_cache  # noqa: PLC0415
+
+  monkeypatch.setattr("hippique_orchestrator.config.GCS_DISK_CACHE_DIR", str(tmp_path / "gcs-cache"))
+  gcs_disk_cache.reset_gcs_disk_cache()
+  yield
+  gcs_disk_cache.reset_gcs_disk_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_zoneturf_index(tmp_path, monkeypatch):
+  """Gives each test an empty Zone-Turf name index and no background refresh."""
+  from hippique_orchestrator import zoneturf_index  # noqa: PLC0415
+
+  monkeypatch.setattr(
+      "hippique_orchestrator.config.ZONETURF_INDEX_PATH", str(tmp_path / "zoneturf-index.json.gz")
+  )
+  monkeypatch.setattr("hippique_orchestrator.config.ZONETURF_INDEX_REFRESH_HOURS", 0)
+  zoneturf_index.reset_zoneturf_index()
+  yield
+  zoneturf_index.reset_zoneturf_index()
+
+
+@pytest.fixture(autouse=True)
+def reset_zoneturf_caches():
+  """Forgets memoized and buffered Zone-Turf IDs and day stats between tests."""
+  from hippique_orchestrator import je_stats_cache, stats_provider  # noqa: PLC0415
+
+  stats_provider._id_memo.clear()
+  stats_provider._id_cache_writer.clear()
+  je_stats_cache.get_day_stats_cache().clear()
+  yield
+  stats_provider._id_memo.clear()
+  stats_provider._id_cache_writer.clear()
+  je_stats_cache.get_day_stats_cache().clear()
+
+
 @pytest.fixture
 def mock_boto3_client():
   """Mocks the boto3 client to avoid actual AWS calls."""
@@ -80,6 +140,27 @@ def mock_subprocess_run(session_mocker):
   session_mocker.patch("subprocess.run", return_value=mock_process)
 
 
+@pytest.fixture(autouse=True)
+def isolated_odds_store(tmp_path, monkeypatch):
+  """Points the columnar odds store at a per-test directory."""
+  from hippique_orchestrator import odds_store  # noqa: PLC0415
+
+  monkeypatch.setattr("hippique_orchestrator.config.ODDS_STORE_DIR", str(tmp_path / "odds-store"))
+  odds_store.reset_odds_store()
+  yield
+  odds_store.reset_odds_store()
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot_manifests():
+  """Forgets snapshot manifests and payloads held in process between tests."""
+  from hippique_orchestrator import snapshot_manifest  # noqa: PLC0415
+
+  snapshot_manifest.clear()
+  yield
+  snapshot_manifest.clear()
+
+
 @pytest.fixture(autouse=True)
 def mock_config_values(mocker):
   """
@@ -0,0 +1,65 @@
+"""
+Corpus of saved programme, race and profile pages for the HTML extractors.
+
+Shared by the output-equivalence tests (tests/test_html_parser.py) and the
+parser benchmark (scripts/benchmark_parsers.py).
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from hippique_orchestrator import fetch_je_stats, zoneturf_client
+from hippique_orchestrator.providers.boturfers_provider import parse_programme
+from hippique_orchestrator.stats_provider import ZoneTurfProvider
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+_zoneturf = ZoneTurfProvider(config={})
+
+# Extractor name -> callable taking the page HTML
+EXTRACTORS: dict[str, Callable[[str], Any]] = {
+    "zeturf.race": lambda html: zoneturf_client.parse_race_data(zoneturf_client.parse_html(html)),
+    "boturfers.programme": lambda html: parse_programme(
+        html, "https://www.boturfers.fr", "Boturfers-Live"
+    ),
+    "zoneturf.index_page": lambda html: _zoneturf._parse_index_page("horse", html),
+    "zoneturf.horse_chrono": _zoneturf._parse_horse_chrono,
+    "zoneturf.jockey_stats": lambda html: _zoneturf._parse_profile_stats(html, "Courses", "jockey"),
+    "geny.search": lambda html: fetch_je_stats._best_horse_link(html, "Jullou"),
+    "geny.horse_links": fetch_je_stats.extract_links_from_horse_page,
+    "geny.profile_rate": fetch_je_stats.extract_rate_from_profile,
+}
+
+# Page (relative to tests/fixtures) -> extractors run on it
+PAGES: dict[str, tuple[str, ...]] = {
+    "zeturf_race.html": ("zeturf.race",),
+    "zeturf_race_script_only.html": ("zeturf.race",),
+    "zeturf_race_no_script_no_table.html": ("zeturf.race",),
+    "zeturf/2024-01-11_R1C1.html": ("zeturf.race",),
+    "parser_corpus/boturfers_programme.html": ("boturfers.programme",),
+    "zoneturf_index_page.html": ("zoneturf.index_page", "geny.search"),
+    "zoneturf_horse_alpha_z.html": ("zoneturf.index_page", "geny.search"),
+    "parser_corpus/zoneturf_horse_chronos.html": ("zoneturf.horse_chrono", "geny.horse_links"),
+    "zoneturf_zade.html": ("zoneturf.horse_chrono", "geny.horse_links"),
+    "parser_corpus/zoneturf_jockey_stats.html": ("zoneturf.jockey_stats", "geny.profile_rate"),
+    "parser_corpus/zoneturf_jockey_stats_xhtml.html": ("zoneturf.jockey_stats", "geny.profile_rate"),
+    # Bodies lxml refuses to parse as such; every engine must still give the empty output.
+    "parser_corpus/whitespace_only.html": ("zeturf.race", "boturfers.programme", "zoneturf.index_page"),
+    "parser_corpus/comment_only.html": ("zeturf.race", "boturfers.programme", "zoneturf.jockey_stats"),
+    "zoneturf_person_page_stephane_pasquier.html": (
+        "zoneturf.jockey_stats",
+        "geny.horse_links",
+        "geny.profile_rate",
+    ),
+}
+
+
+def cases() -> list[tuple[str, str]]:
+    """Every ``(page, extractor)`` pair of the corpus."""
+    return [(page, name) for page, names in PAGES.items() for name in names]
+
+
+def load(page: str) -> str:
+    return (FIXTURES_DIR / page).read_text(encoding="utf-8")
@@ -0,0 +1,146 @@
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+import yaml
+
+from hippique_orchestrator import simulate_wrapper as sw
+from hippique_orchestrator.calibration_store import CalibrationStore
+
+
+def _parse(data):
+    return {str(k): v for k, v in data.items() if k != "meta"}, data.get("meta", {})
+
+
+@pytest.fixture
+def calib(tmp_path):
+    path = tmp_path / "calibration.yaml"
+    path.write_text("meta: {version: 1}\na|b: {p: 0.4, sources: [x]}\n", encoding="utf-8")
+    return path
+
+
+def _bump(path: Path, text: str) -> None:
+    mtime = path.stat().st_mtime
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (mtime + 10, mtime + 10))
+
+
+def test_store_parses_once_into_frozen_snapshot(calib):
+    store = CalibrationStore(calib, _parse)
+
+    first = store.get()
+    second = store.get()
+
+    assert first is second
+    assert first.entries["a|b"]["p"] == 0.4
+    assert first.entries["a|b"]["sources"] == ("x",)
+    assert first.metadata["version"] == 1
+    with pytest.raises(TypeError):
+        first.entries["a|b"]["p"] = 0.9  # type: ignore[index]
+    stats = store.stats()
+    assert stats["loads"] == 1
+    assert stats["checks"] == 1
+    assert stats["entries"] == 1
+    assert stats["load_seconds"] >= 0.0
+
+
+def test_store_reloads_only_when_invalidated(calib):
+    store = CalibrationStore(calib, _parse)
+    store.get()
+    _bump(calib, "a|b: {p: 0.7}\n")
+
+    assert store.get().entries["a|b"]["p"] == 0.4
+    store.invalidate()
+    assert store.get().entries["a|b"]["p"] == 0.7
+    assert store.stats()["loads"] == 2
+
+
+def test_store_follows_path_changes_and_missing_files(calib, tmp_path):
+    store = CalibrationStore(calib, _parse)
+    store.get()
+
+    missing = store.get(tmp_path / "missing.yaml")
+
+    assert not missing.exists
+    assert dict(missing.entries) == {}
+    assert store.get(calib).entries["a|b"]["p"] == 0.4
+
+
+def test_background_refresh_keeps_snapshot_on_parse_error(calib):
+    store = CalibrationStore(calib, _parse)
+    snapshot = store.get()
+    _bump(calib, "a|b: [unbalanced\n")
+
+    assert store.refresh() is snapshot
+    store.invalidate()
+    with pytest.raises(yaml.YAMLError):
+        store.get()
+
+
+def test_store_hit_rate_counters(calib):
+    store = CalibrationStore(calib, _parse)
+    store.record_lookup(True)
+    store.record_lookup(True)
+    store.record_lookup(False)
+
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_simulate_wrapper_warm_calls_skip_filesystem(monkeypatch, tmp_path):
+    cal = tmp_path / "probabilities.yaml"
+    cal.write_text("a|b:\n  alpha: 1\n  beta: 1\n  p: 0.3\n", encoding="utf-8")
+    monkeypatch.setattr(sw, "CALIBRATION_PATH", cal)
+    monkeypatch.setattr(sw, "_calibration_cache", OrderedDict())
+    monkeypatch.setattr(sw, "_calibration_mtime", 0.0)
+    monkeypatch.setattr(sw, "_calibration_metadata", {})
+    assert sw.simulate_wrapper(["a", "b"]) == pytest.approx(0.3)
+
+    stat_calls = []
+    original_stat = Path.stat
+
+    def counting_stat(self, *args, **kwargs):
+        stat_calls.append(self)
+        return original_stat(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", counting_stat)
+    before = sw.calibration_stats()["probabilities"]
+    for _ in range(5):
+        sw.simulate_wrapper(["a", "b"])
+    after = sw.calibration_stats()["probabilities"]
+
+    assert stat_calls == []
+    assert after["hits"] - before["hits"] == 5
+    assert after["loads"] == before["loads"]
+
+    _bump(cal, "a|b:\n  alpha: 1\n  beta: 1\n  p: 0.6\n")
+    assert sw.simulate_wrapper(["a", "b"]) == pytest.approx(0.3)
+    sw.reload_calibration()
+    assert sw.simulate_wrapper(["a", "b"]) == pytest.approx(0.6)
+
+
+def test_correlation_settings_follow_the_resolved_calibration_path(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sw, "_correlation_store", None)
+    monkeypatch.setattr(sw, "_correlation_mtime", 0.0)
+    monkeypatch.setattr(sw, "_correlation_settings", {})
+    monkeypatch.setattr(sw, "_correlation_snapshot", None)
+    monkeypatch.setattr(sw, "_payout_calibration_stores", {})
+    (tmp_path / "calibration").mkdir()
+    (tmp_path / "calibration" / "payout_calibration.yaml").write_text(
+        "correlations:\n  legacy:\n    rho: 0.1\n", encoding="utf-8"
+    )
+    sw._load_correlation_settings()
+    assert set(sw._correlation_settings) == {"legacy"}
+
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "payout_calibration.yaml").write_text(
+        "correlations:\n  current:\n    rho: 0.2\n", encoding="utf-8"
+    )
+    sw._load_correlation_settings()
+    assert set(sw._correlation_settings) == {"legacy"}  # until the store refreshes
+    sw.reload_calibration()
+    sw._load_correlation_settings()
+    assert set(sw._correlation_settings) == {"current"}
@@ -0,0 +1,90 @@
+import pytest
+
+from hippique_orchestrator.config_cache import ConfigCache
+
+
+class FakeReader:
+    def __init__(self):
+        self.objects = {"config/gpi.yml": ("a: 1\nb: [1, 2]\n", 1)}
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, path, generation):
+        self.calls.append((path, generation))
+        if self.fail or path not in self.objects:
+            return True, None, None
+        content, current = self.objects[path]
+        if generation == current:
+            return False, None, generation
+        return True, content, current
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def cache():
+    reader = FakeReader()
+    clock = Clock()
+    return ConfigCache(60, reader=reader, clock=clock), reader, clock
+
+
+def test_hits_within_interval_skip_reader_and_return_copies(cache):
+    cache, reader, clock = cache
+
+    first = cache.get("config/gpi.yml")
+    first["b"].append(3)
+    clock.now = 30
+    second = cache.get("config/gpi.yml")
+
+    assert second == {"a": 1, "b": [1, 2]}
+    assert reader.calls == [("config/gpi.yml", None)]
+    stats = cache.stats()
+    assert (stats["fetches"], stats["hits"], stats["revalidations"]) == (1, 1, 0)
+    assert stats["hit_ratio"] == pytest.approx(0.5)
+    assert stats["time_saved_seconds"] >= 0.0
+
+
+def test_revalidates_by_generation_after_interval(cache):
+    cache, reader, clock = cache
+    cache.get("config/gpi.yml")
+
+    clock.now = 61
+    assert cache.get("config/gpi.yml")["a"] == 1
+    assert reader.calls[-1] == ("config/gpi.yml", 1)
+    assert cache.stats()["revalidations"] == 1
+
+    reader.objects["config/gpi.yml"] = ("a: 2\n", 2)
+    clock.now = 200
+    assert cache.get("config/gpi.yml") == {"a": 2}
+    assert cache.stats()["fetches"] == 2
+
+
+def test_serves_stale_copy_when_refresh_fails(cache):
+    cache, reader, clock = cache
+    cache.get("config/gpi.yml")
+    reader.fail = True
+    clock.now = 100
+
+    assert cache.get("config/gpi.yml")["a"] == 1
+    assert cache.get("config/missing.yml") == {}
+
+
+def test_preload_warms_cache_and_swallows_errors(cache):
+    cache, reader, clock = cache
+
+    def broken(path, generation):
+        raise RuntimeError("offline")
+
+    cache.preload(["config/gpi.yml"])
+    assert cache.stats()["entries"] == 1
+
+    cache._reader = broken
+    cache.clear()
+    cache.preload(["config/gpi.yml"])
+    assert cache.stats()["entries"] == 0
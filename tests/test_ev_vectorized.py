@@ -0,0 +1,277 @@
+"""Equivalence suite: the NumPy engine must reproduce the scalar reference."""
+
+from __future__ import annotations
+
+import copy
+import random
+
+import numpy as np
+import pytest
+
+from hippique_orchestrator.ev_calculator import compute_ev_roi, compute_joint_moments
+from hippique_orchestrator.ev_vectorized import (
+    TicketArrays,
+    compute_ev_roi_vectorized,
+    compute_joint_moments_sparse,
+    evaluate_arrays,
+    kelly_fractions,
+)
+from hippique_orchestrator.kelly import calculate_kelly_fraction
+
+_SCALAR_KEYS = (
+    "ev",
+    "roi",
+    "ev_ratio",
+    "total_stake_normalized",
+    "risk_of_ruin",
+    "clv",
+    "std_dev",
+    "ev_over_std",
+    "variance",
+    "variance_naive",
+    "covariance_adjustment",
+    "combined_expected_payout",
+    "calibrated_expected_payout",
+    "sharpe",
+)
+
+
+def _simulate(legs):
+    prob = 1.0
+    for leg in legs:
+        prob *= leg["p"] if isinstance(leg, dict) else 0.4
+    return prob
+
+
+def _assert_equivalent(tickets, budget, config=None, simulate_fn=_simulate):
+    scalar_tickets = copy.deepcopy(tickets)
+    vector_tickets = copy.deepcopy(tickets)
+
+    expected = compute_ev_roi(scalar_tickets, budget, simulate_fn, config=config)
+    actual = compute_ev_roi_vectorized(vector_tickets, budget, simulate_fn, config=config)
+
+    assert actual["green"] == expected["green"]
+    assert actual.get("failure_reasons") == expected.get("failure_reasons")
+    for key in _SCALAR_KEYS:
+        assert actual[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-9), key
+
+    assert len(actual["ticket_metrics"]) == len(expected["ticket_metrics"])
+    for got, want in zip(actual["ticket_metrics"], expected["ticket_metrics"], strict=True):
+        assert got.keys() == want.keys()
+        for key in want:
+            assert got[key] == pytest.approx(want[key], rel=1e-9, abs=1e-9), key
+
+    assert len(actual["covariance_pairs"]) == len(expected["covariance_pairs"])
+    for got, want in zip(actual["covariance_pairs"], expected["covariance_pairs"], strict=True):
+        assert got["tickets"] == want["tickets"]
+        assert got["shared"] == want["shared"]
+        assert got["covariance"] == pytest.approx(want["covariance"], rel=1e-9, abs=1e-9)
+
+    for got, want in zip(vector_tickets, scalar_tickets, strict=True):
+        assert got.keys() == want.keys()
+        for key, value in want.items():
+            if isinstance(value, float):
+                assert got[key] == pytest.approx(value, rel=1e-9, abs=1e-9), key
+            else:
+                assert got[key] == value
+    return actual, expected
+
+
+def test_kelly_fractions_matches_scalar_kelly():
+    rng = random.Random(7)
+    p = [rng.uniform(0.01, 0.99) for _ in range(200)] + [0.0, 1.0, 0.5]
+    odds = [rng.uniform(1.01, 30.0) for _ in range(200)] + [2.0, 2.0, 1.0]
+    for lam, cap in ((1.0, 1.0), (0.6, 1.0), (0.25, 0.05), (0.0, 2.0)):
+        expected = [calculate_kelly_fraction(pi, oi, lam=lam, cap=cap) for pi, oi in zip(p, odds, strict=True)]
+        got = kelly_fractions(np.array(p), np.array(odds), lam=lam, cap=cap)
+        assert got.tolist() == pytest.approx(expected, rel=1e-12, abs=1e-15)
+
+
+def test_simple_tickets_with_explicit_stakes():
+    tickets = [
+        {"id": "1", "p": 0.5, "odds": 2.5, "stake": 10.0},
+        {"id": "2", "p": 0.3, "odds": 4.0, "stake": 5.0},
+    ]
+    _assert_equivalent(tickets, 100.0)
+
+
+def test_kelly_sized_tickets_with_stake_redistribution():
+    tickets = [
+        {"p": 0.55, "odds": 2.2},
+        {"p": 0.35, "odds": 3.5},
+        {"p": 0.2, "odds": 6.0},
+    ]
+    _assert_equivalent(tickets, 50.0, config={"kelly_cap": 0.5})
+
+
+def test_dutching_and_closing_odds():
+    tickets = [
+        {"p": 0.5, "odds": 2.5, "stake": 10.0, "dutching": "g1", "closing_odds": 2.2},
+        {"p": 0.4, "odds": 3.0, "stake": 10.0, "dutching": "g1", "closing_odds": 3.3},
+        {"p": 0.7, "odds": 1.5, "stake": 5.0},
+    ]
+    _assert_equivalent(tickets, 100.0)
+
+
+def test_budget_overflow_is_normalised():
+    tickets = [{"p": 0.9, "odds": 2.5, "stake": 80.0}, {"p": 0.85, "odds": 3.0, "stake": 70.0}]
+    actual, _ = _assert_equivalent(tickets, 100.0, config={"kelly_cap": 1.0, "round_to": 0.0})
+    assert actual["total_stake_normalized"] == pytest.approx(100.0)
+
+
+def test_variance_cap_rescales_stakes():
+    tickets = [{"p": 0.4, "odds": 3.5, "stake": 20.0}, {"p": 0.3, "odds": 5.0, "stake": 15.0}]
+    actual, _ = _assert_equivalent(tickets, 100.0, config={"variance_cap": 0.01})
+    assert "variance above 0.01 * bankroll^2" in actual["failure_reasons"]
+
+
+def test_combined_tickets_with_shared_legs_and_covariance():
+    tickets = [
+        {"id": "a", "legs": [{"id": "7", "p": 0.4}, {"id": "3", "p": 0.5}], "odds": 8.0},
+        {"id": "b", "legs": [{"id": "7", "p": 0.4}, {"id": "9", "p": 0.3}], "odds": 12.0},
+        {"id": "c", "legs": [{"id": "1", "p": 0.6}, {"id": "2", "p": 0.6}], "odds": 4.0},
+    ]
+    actual, expected = _assert_equivalent(tickets, 100.0, config={"round_to": 0.5})
+    assert expected["covariance_pairs"], "fixture should exercise the covariance path"
+    assert actual["combined_expected_payout"] > 0
+
+
+def test_optimize_path_is_equivalent():
+    tickets = [
+        {"p": 0.45, "odds": 3.0, "stake": 10.0},
+        {"p": 0.3, "odds": 5.0, "stake": 10.0},
+    ]
+    actual, expected = _assert_equivalent(tickets, 100.0, config={"optimize": True})
+    assert actual["optimized_stakes"] == pytest.approx(expected["optimized_stakes"], rel=1e-6)
+    assert actual["ev_individual"] == pytest.approx(expected["ev_individual"], rel=1e-9)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_randomised_ticket_sets(seed):
+    rng = random.Random(seed)
+    tickets = []
+    for idx in range(rng.randint(1, 30)):
+        ticket = {
+            "id": f"t{idx % 7}",
+            "p": rng.uniform(0.02, 0.9),
+            "odds": rng.uniform(1.1, 25.0),
+        }
+        if rng.random() < 0.7:
+            ticket["stake"] = round(rng.uniform(0.5, 20.0), 2)
+        if rng.random() < 0.5:
+            ticket["closing_odds"] = ticket["odds"] * rng.uniform(0.8, 1.2)
+        tickets.append(ticket)
+    config = {
+        "kelly_cap": rng.choice([0.25, 0.6, 1.0]),
+        "round_to": rng.choice([0.0, 0.1, 0.5]),
+        "variance_cap": rng.choice([None, 0.05]),
+    }
+    _assert_equivalent(tickets, rng.choice([20.0, 100.0, 500.0]), config=config)
+
+
+def test_invalid_inputs_raise_same_errors():
+    with pytest.raises(ValueError, match="budget must be > 0"):
+        compute_ev_roi_vectorized([{"p": 0.5, "odds": 2.0}], 0)
+    with pytest.raises(ValueError, match=r"probability must be in \(0,1\)"):
+        compute_ev_roi_vectorized([{"p": 1.2, "odds": 2.0}], 10)
+    with pytest.raises(ValueError, match="odds must be > 1"):
+        compute_ev_roi_vectorized([{"p": 0.5, "odds": 1.0}], 10)
+    with pytest.raises(ValueError, match="Ticket must include probability 'p'"):
+        compute_ev_roi_vectorized([{"odds": 2.0}], 10)
+
+
+def test_compute_ev_roi_numpy_engine_delegates():
+    tickets = [{"p": 0.5, "odds": 2.5, "stake": 10.0}, {"p": 0.3, "odds": 4.0}]
+    expected = compute_ev_roi(copy.deepcopy(tickets), 100.0, _simulate)
+    actual = compute_ev_roi(copy.deepcopy(tickets), 100.0, _simulate, config={"engine": "numpy"})
+    assert actual["ev"] == pytest.approx(expected["ev"], rel=1e-12)
+    for got, want in zip(actual["ticket_metrics"], expected["ticket_metrics"], strict=True):
+        assert got == pytest.approx(want)
+
+
+def test_evaluate_arrays_on_columns():
+    arrays = TicketArrays.from_columns(
+        p=[0.5, 0.3, 0.2],
+        odds=[2.5, 4.0, 7.0],
+        stake=[10.0, np.nan, 4.0],
+        closing_odds=[2.4, np.nan, np.nan],
+    )
+    tickets = [
+        {"p": 0.5, "odds": 2.5, "stake": 10.0, "closing_odds": 2.4},
+        {"p": 0.3, "odds": 4.0},
+        {"p": 0.2, "odds": 7.0, "stake": 4.0},
+    ]
+    expected = compute_ev_roi(tickets, 100.0, _simulate)
+    result, metrics = evaluate_arrays(arrays, 100.0)
+    assert result["ev"] == pytest.approx(expected["ev"], rel=1e-12)
+    assert result["clv"] == pytest.approx(expected["clv"], rel=1e-12)
+    assert [m["stake"] for m in metrics] == pytest.approx(
+        [m["stake"] for m in expected["ticket_metrics"]]
+    )
+
+
+def _trio_infos(seed, count, favourite="7"):
+    rng = random.Random(seed)
+    infos = []
+    for idx in range(count):
+        others = rng.sample([str(n) for n in range(1, 17) if str(n) != favourite], 2)
+        stake = rng.uniform(0.5, 5.0)
+        p = rng.uniform(0.01, 0.2)
+        odds = rng.uniform(5.0, 80.0)
+        exposures = {f"leg:{favourite}"} | {f"leg:{n}" for n in others}
+        if rng.random() < 0.2:
+            exposures.add(f"id:race{idx % 3}")
+        if rng.random() < 0.2:
+            exposures.add("meeting:R1")
+        infos.append(
+            {
+                "p": p,
+                "ev": stake * (p * (odds - 1) - (1 - p)),
+                "win_value": stake * (odds - 1),
+                "loss_value": -stake,
+                "exposures": frozenset(exposures),
+                "legs_for_sim": tuple({"id": n} for n in [favourite, *others]),
+                "label": f"trio_{idx}",
+            }
+        )
+    return infos
+
+
+def _assert_same_moments(infos, **kwargs):
+    expected_adj, expected_pairs = compute_joint_moments(infos, **kwargs)
+    actual_adj, actual_pairs = compute_joint_moments_sparse(infos, **kwargs)
+    assert actual_adj == pytest.approx(expected_adj, rel=1e-9, abs=1e-12)
+    assert len(actual_pairs) == len(expected_pairs)
+    for got, want in zip(actual_pairs, expected_pairs, strict=True):
+        assert got["tickets"] == want["tickets"]
+        assert got["shared"] == want["shared"]
+        assert got["joint_probability"] == pytest.approx(want["joint_probability"], rel=1e-12)
+        assert got["covariance"] == pytest.approx(want["covariance"], rel=1e-9, abs=1e-12)
+    return actual_adj, actual_pairs
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_sparse_joint_moments_match_pairwise_reference(seed):
+    adjustment, pairs = _assert_same_moments(_trio_infos(seed, 40))
+    assert len(pairs) > 0
+    assert adjustment != 0.0
+
+
+def test_sparse_joint_moments_with_simulation_and_cache():
+    infos = _trio_infos(11, 25)
+    expected_cache: dict = {}
+    actual_cache: dict = {}
+    expected = compute_joint_moments(infos, simulate_fn=_simulate, cache=expected_cache)
+    actual = compute_joint_moments_sparse(infos, simulate_fn=_simulate, cache=actual_cache)
+    assert actual[0] == pytest.approx(expected[0], rel=1e-9)
+    assert [p["tickets"] for p in actual[1]] == [p["tickets"] for p in expected[1]]
+    assert actual_cache.keys() == expected_cache.keys()
+
+
+def test_sparse_joint_moments_without_shared_exposures():
+    infos = _trio_infos(3, 2)
+    infos[0]["exposures"] = frozenset({"leg:1"})
+    infos[1]["exposures"] = frozenset({"leg:2"})
+    assert compute_joint_moments_sparse(infos) == (0.0, [])
+    assert compute_joint_moments_sparse(infos[:1]) == (0.0, [])
+    assert compute_joint_moments_sparse([]) == (0.0, [])
@@ -0,0 +1,70 @@
+import csv
+import json
+
+from hippique_orchestrator import fetch_je_stats
+
+SEARCH = {
+    "ALPHA": '<a href="/cheval/alpha_1">ALPHA</a>',
+    "BRAVO": '<a href="/cheval/bravo_2">BRAVO</a>',
+    "CHARLIE": '<a href="/cheval/charlie_3">CHARLIE</a>',
+}
+HORSES = {
+    "alpha_1": '<a href="/jockey/shared_j">J</a><a href="/entraineur/t1">T</a>',
+    "bravo_2": '<a href="/jockey/shared_j">J</a><a href="/entraineur/t1">T</a>',
+    "charlie_3": '<a href="/jockey/j3">J</a>',
+}
+PROFILES = {
+    "shared_j": "<p>Victoires : 12%</p>",
+    "t1": "<p>Victoires : 8.5%</p>",
+    "j3": "<p>Victoires : 20%</p>",
+}
+
+
+def _fake_site(calls):
+    async def fake_get(url, *, timeout=None, headers=None):
+        calls.append(url)
+        if "/recherche?query=" in url:
+            return SEARCH[url.rsplit("=", 1)[1]]
+        key = url.rstrip("/").rsplit("/", 1)[1]
+        if "/cheval/" in url:
+            return HORSES[key]
+        return PROFILES[key]
+
+    return fake_get
+
+
+def test_collect_stats_fetches_shared_profiles_once(tmp_path, monkeypatch, caplog):
+    calls = []
+    monkeypatch.setattr(fetch_je_stats, "get_gcs_manager", lambda: None)
+    monkeypatch.setattr(fetch_je_stats, "async_http_get", _fake_site(calls))
+    h5 = tmp_path / "h5.json"
+    h5.write_text(
+        json.dumps(
+            {
+                "runners": [
+                    {"num": 1, "name": "ALPHA"},
+                    {"num": 2, "name": "BRAVO"},
+                    {"num": 3, "name": "CHARLIE"},
+                    {"num": 4, "name": ""},
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    with caplog.at_level("INFO", logger=fetch_je_stats.__name__):
+        json_path = fetch_je_stats.collect_stats(str(h5), concurrency=2)
+
+    assert len(calls) == len(set(calls)) == 9
+    assert "9 fetches, 2 saved by deduplication" in caplog.text
+    payload = json.loads((tmp_path / "stats_je.json").read_text(encoding="utf-8"))
+    assert json_path == str(tmp_path / "stats_je.json")
+    assert payload["coverage"] == 75.0
+    assert [(r["num"], r["j_rate"], r["e_rate"]) for r in payload["rows"]] == [
+        ("1", "12.00", "8.50"),
+        ("2", "12.00", "8.50"),
+        ("3", "20.00", ""),
+        ("4", "", ""),
+    ]
+    with (tmp_path / "h5_je.csv").open(encoding="utf-8", newline="") as f:
+        assert [row["num"] for row in csv.DictReader(f)] == ["1", "2", "3", "4"]
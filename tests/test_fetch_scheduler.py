@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from hippique_orchestrator.fetch_scheduler import (
+    FetchScheduler,
+    Priority,
+    TokenBucket,
+    parse_host_rates,
+)
+from hippique_orchestrator.http_client import HttpClientPool
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _scheduler(handler, **kwargs):
+    transport = httpx.MockTransport(handler)
+    pool = HttpClientPool(transport=transport, async_transport=transport, backoff=0)
+    return FetchScheduler(pool=pool, host_rates={}, **kwargs)
+
+
+def test_token_bucket_spaces_reservations():
+    clock = Clock()
+    bucket = TokenBucket(rate=2.0, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+
+
+def test_parse_host_rates_skips_invalid_entries():
+    assert parse_host_rates("www.geny.com=0.5, WWW.Zone-Turf.fr=2,bad,x=abc,y=0") == {
+        "www.geny.com": 0.5,
+        "www.zone-turf.fr": 2.0,
+    }
+    assert parse_host_rates(None) == {}
+
+
+@pytest.mark.asyncio
+async def test_hosts_keep_their_budget_but_run_in_parallel():
+    scheduler = _scheduler(lambda request: httpx.Response(200), rate=10.0, max_concurrency=8)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(scheduler.fetch(f"https://host{i}.test/") for i in range(4)))
+    parallel = time.perf_counter() - start
+
+    start = time.perf_counter()
+    await asyncio.gather(*(scheduler.fetch("https://same.test/") for _ in range(4)))
+    serial = time.perf_counter() - start
+
+    assert parallel < 0.2
+    assert serial >= 0.29  # three refills at 10 requests per second
+    assert scheduler.stats()["hosts"]["same.test"]["requests"] == 4
+
+
+@pytest.mark.asyncio
+async def test_critical_requests_overtake_queued_backfill():
+    order = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.url.path == "/blocker":
+            await release.wait()
+        order.append(request.url.path)
+        return httpx.Response(200)
+
+    scheduler = _scheduler(handler, rate=1000.0, max_concurrency=1)
+    blocker = asyncio.create_task(scheduler.fetch("https://a.test/blocker"))
+    await asyncio.sleep(0.01)
+    backfill = [
+        asyncio.create_task(scheduler.fetch(f"https://b.test/stats{i}", priority=Priority.BACKFILL))
+        for i in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    critical = asyncio.create_task(scheduler.fetch("https://c.test/odds", priority=Priority.CRITICAL))
+    await asyncio.sleep(0.01)
+    release.set()
+    await asyncio.gather(blocker, critical, *backfill)
+
+    assert order[:2] == ["/blocker", "/odds"]
+    assert scheduler.stats()["hosts"]["c.test"]["by_priority"] == {"CRITICAL": 1}
+
+
+def test_fetch_sync_uses_host_bucket_and_bound_views():
+    seen = []
+
+    def handler(request):
+        seen.append(str(request.url))
+        return httpx.Response(200)
+
+    scheduler = _scheduler(handler)
+    scheduler.configure_host("www.geny.com", rate=50.0)
+
+    bound = scheduler.bind("https://www.geny.com")
+    bound.get("/cheval/a")
+    bound.get("/cheval/b")
+
+    assert seen == ["https://www.geny.com/cheval/a", "https://www.geny.com/cheval/b"]
+    stats = scheduler.stats()
+    assert stats["host_rates"]["www.geny.com"] == 50.0
+    assert stats["hosts"]["www.geny.com"]["requests"] == 2
@@ -1,4 +1,6 @@
+import asyncio
 import logging
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -37,9 +39,23 @@ def test_update_race_document_success(mock_db):
     data = {"status": "processed"}
     firestore_client.update_race_document(document_id, data)
 
-    mock_db.collection.assert_called_once_with("races-test")
-    mock_db.collection.return_value.document.assert_called_once_with(document_id)
-    doc_ref_mock.set.assert_called_once_with(data, merge=True)
+    mock_db.collection.assert_any_call("races-test")
+    mock_db.collection.return_value.document.assert_any_call(document_id)
+    doc_ref_mock.set.assert_any_call(data, merge=True)
+
+
+def test_update_race_document_bumps_races_version(mock_db):
+    """Writes change the version token of their race date (or of every date)."""
+    before = firestore_client.races_version("2025-12-30")
+    other = firestore_client.races_version("2025-12-31")
+
+    firestore_client.update_race_document("2025-12-30_R1C1", {"status": "processed"})
+
+    assert firestore_client.races_version("2025-12-30") != before
+    assert firestore_client.races_version("2025-12-31") == other
+
+    firestore_client.update_race_document("R1C1", {"status": "processed"})
+    assert firestore_client.races_version("2025-12-31") != other
 
 
 def test_update_race_document_handles_exception(mock_db, caplog):
@@ -65,6 +81,141 @@ def test_update_race_document_skips_if_db_not_available(mock_warning, mock_get_f
     mock_warning.assert_called_once_with("Firestore is not available, skipping update.")
 
 
+def _status_collections(mock_db, status=None):
+    """Separate race and daily-status collections; the day's aggregate starts as ``status``."""
+    races, daily, refs = MagicMock(), MagicMock(), {}
+
+    def document(doc_id):
+        if doc_id not in refs:
+            data = status
+            snapshot = MagicMock(exists=data is not None)
+            snapshot.to_dict.return_value = data
+            refs[doc_id] = MagicMock(**{"get.return_value": snapshot})
+        return refs[doc_id]
+
+    daily.document.side_effect = document
+    mock_db.collection.side_effect = {"races-test": races, "daily_status": daily}.get
+    return daily
+
+
+def test_update_race_document_maintains_the_daily_status(mock_db):
+    daily = _status_collections(
+        mock_db,
+        {
+            "races": {"R1C1": "play"},
+            "latest_doc_id": "2025-12-30_R1C1",
+            "latest_processed_timestamp": "2025-12-30T10:05:00+00:00",
+            "last_error": None,
+        },
+    )
+
+    firestore_client.update_race_document(
+        "2025-12-30_R1C2", {"tickets_analysis": {"gpi_decision": "Abstain"}}
+    )
+    transaction_set = mock_db.transaction.return_value.set
+    transaction_set.assert_called_once()
+    assert transaction_set.call_args.args[0] is daily.document("2025-12-30")
+    status = transaction_set.call_args.args[1]
+    assert status["races"] == {"R1C1": "play", "R1C2": "abstain"}
+    assert status["counts"] == {
+        "total_processed": 2, "total_playable": 1, "total_abstain": 1, "total_error": 0,
+    }
+    assert status["latest_doc_id"] == "2025-12-30_R1C2"
+
+    # A failed H-5 run keeps the race's H-30 decision (the race document is merged)
+    # and becomes the day's last error.
+    error = firestore_client._merge_daily_status(
+        status, "2025-12-30", "2025-12-30_R1C1",
+        {"ok": False, "error_message": "ValueError: boom", "last_modified_at": "2025-12-30T11:00:00+00:00"},
+    )
+    assert error["races"]["R1C1"] == "play"
+    assert error["last_error"] == {
+        "doc_id": "2025-12-30_R1C1", "at": "2025-12-30T11:00:00+00:00", "message": "ValueError: boom",
+    }
+
+
+def test_processing_status_of_an_empty_day_reads_the_newest_day(mock_db):
+    daily = _status_collections(mock_db)
+    newest = daily.order_by.return_value.limit.return_value
+    newest.stream.return_value = [
+        MagicMock(
+            **{
+                "to_dict.return_value": {
+                    "latest_doc_id": "2025-12-30_R1C2",
+                    "latest_processed_timestamp": "2025-12-30T10:35:00+00:00",
+                }
+            }
+        )
+    ]
+
+    with patch.object(firestore_client, "get_document", return_value=None):
+        status = asyncio.run(firestore_client.get_processing_status_for_date("2025-12-31", []))
+
+    daily.order_by.assert_called_once_with(
+        "latest_processed_timestamp", direction=firestore_client.firestore.Query.DESCENDING
+    )
+    assert status["firestore_metadata"]["latest_global_doc_id"] == "2025-12-30_R1C2"
+    mock_db.collection("races-test").order_by.assert_not_called()
+
+
+def test_failed_daily_status_update_marks_the_day_dirty(mock_db):
+    daily = _status_collections(mock_db, {})
+    daily.document("2025-12-30").get.side_effect = RuntimeError("deadline exceeded")
+
+    firestore_client.update_race_document("2025-12-30_R1C1", {"tickets_analysis": {}})
+
+    daily.document("2025-12-30").set.assert_called_once_with({"dirty": True}, merge=True)
+
+
+def test_processing_status_rebuilds_a_dirty_day(mock_db):
+    _status_collections(mock_db)
+    races = [
+        MagicMock(id=f"2025-12-30_R1C{i}", **{"to_dict.return_value": data})
+        for i, data in enumerate(
+            (
+                {"tickets_analysis": {"gpi_decision": "Play"}, "last_modified_at": "2025-12-30T10:00:00+00:00"},
+                {"tickets_analysis": {"gpi_decision": "Abstain"}, "last_modified_at": "2025-12-30T10:30:00+00:00"},
+            ),
+            start=1,
+        )
+    ]
+    query = mock_db.collection("races-test").order_by.return_value.start_at.return_value.end_at.return_value
+    query.stream.return_value = races
+    stale = {"races": {"R1C1": "play"}, "dirty": True}
+
+    with patch.object(firestore_client, "get_document", return_value=stale), patch.object(
+        firestore_client, "set_document"
+    ) as set_document:
+        status = asyncio.run(firestore_client.get_processing_status_for_date("2025-12-30", []))
+
+    rebuilt = set_document.call_args.args[2]
+    set_document.assert_called_once_with("daily_status", "2025-12-30", rebuilt)
+    assert rebuilt["races"] == {"R1C1": "play", "R1C2": "abstain"} and "dirty" not in rebuilt
+    assert status["last_task_attempt"] == "2025-12-30T10:30:00+00:00"
+
+
+def test_processing_status_reads_one_aggregate_document(mock_db):
+    _status_collections(mock_db)
+    status_doc = {
+        "races": {"R1C1": "play", "R1C2": "error_pipeline_failure"},
+        "latest_processed_timestamp": "2025-12-30T10:35:00+00:00",
+        "last_error": {"doc_id": "2025-12-30_R1C2", "message": "boom"},
+    }
+    daily_plan = [{"r_label": "R1", "c_label": f"C{i}"} for i in (1, 2, 3)]
+
+    with patch.object(firestore_client, "get_document", return_value=status_doc) as get_document:
+        status = asyncio.run(firestore_client.get_processing_status_for_date("2025-12-30", daily_plan))
+
+    get_document.assert_called_once_with("daily_status", "2025-12-30")
+    assert status["counts"] == {
+        "total_in_plan": 3, "total_processed": 2, "total_playable": 1, "total_abstain": 0,
+        "total_error": 1, "total_pending": 1, "total_analyzed": 2,
+    }
+    assert status["last_task_attempt"] == "2025-12-30T10:35:00+00:00"
+    assert status["last_error"]["doc_id"] == "2025-12-30_R1C2"
+    assert status["reason_if_empty"] is None
+
+
 async def test_get_races_for_date_success(mock_db):
     """Test `get_races_for_date` returns a list of document snapshots."""
 
@@ -398,3 +549,58 @@ def test_set_document_skips_if_db_not_available(mock_warning, mock_get_firestore
     firestore_client.set_document("test_collection", "test_doc", {"key": "value"})
     # No return value to assert, just check logs
     mock_warning.assert_called_once_with("Firestore is not available, cannot set document.")
+
+
+def test_get_documents_batches_reads_with_get_all(mock_db, monkeypatch):
+    """Test get_documents issues one get_all per chunk and skips missing documents."""
+    monkeypatch.setattr(firestore_client, "GET_ALL_CHUNK_SIZE", 2)
+
+    def get_all(refs):
+        for ref in refs:
+            doc = MagicMock()
+            doc.id = ref.id
+            doc.exists = ref.id != "missing"
+            doc.to_dict.return_value = {"id": ref.id}
+            yield doc
+
+    mock_db.collection.return_value.document.side_effect = lambda doc_id: MagicMock(id=doc_id)
+    mock_db.get_all.side_effect = get_all
+
+    result = firestore_client.get_documents("coll", ["a", "b", "missing", "a"])
+
+    assert result == {"a": {"id": "a"}, "b": {"id": "b"}}
+    assert mock_db.get_all.call_count == 2
+
+
+def test_write_behind_buffer_flushes_through_bulk_writer(mock_db):
+    """Test buffered writes are coalesced and sent with a single BulkWriter."""
+    writer = mock_db.bulk_writer.return_value
+    buffer = firestore_client.WriteBehindBuffer("coll", max_pending=3)
+
+    buffer.put("a", {"v": 1})
+    buffer.put("a", {"v": 2})
+    buffer.put("b", {"v": 1})
+    assert buffer.get("a") == {"v": 2}
+    writer.set.assert_not_called()
+
+    buffer.put("c", {"v": 1})  # third distinct document triggers the flush
+
+    assert writer.set.call_count == 3
+    writer.close.assert_called_once()
+    assert buffer.stats() == {"collection": "coll", "pending": 0, "flushes": 1, "written": 3}
+    assert buffer.flush() == 0
+
+
+def test_write_behind_buffer_flushes_a_quiet_batch_after_max_delay(mock_db):
+    """A pending write is sent once it is max_delay old, without waiting for another put()."""
+    writer = mock_db.bulk_writer.return_value
+    buffer = firestore_client.WriteBehindBuffer("coll", max_delay=0.05)
+
+    buffer.put("a", {"v": 1})
+    writer.set.assert_not_called()
+    deadline = time.monotonic() + 2
+    while buffer.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    writer.set.assert_called_once()
+    assert buffer.stats()["flushes"] == 1
@@ -1,3 +1,4 @@
+import gzip
 import logging
 from unittest.mock import MagicMock
 
@@ -102,12 +103,17 @@ def test_build_gcs_path_no_manager(monkeypatch, caplog):
     assert "GCSManager is not initialized. Cannot build GCS path." in caplog.text
 
 
-def test_gcs_manager_save_json_to_gcs_exception(gcs_manager, mocker):
-    mocker.patch(
-        "hippique_orchestrator.gcs_client.json.dump", side_effect=Exception("Mock GCS write error")
-    )
-    # Patch self.fs.open directly, not gcs_client.fs.open
-    mock_fs_open = mocker.patch.object(gcs_manager.fs, "open")
+def _mock_blob(gcs_manager):
+    blob = MagicMock()
+    blob.content_encoding = None
+    gcs_manager._client = MagicMock()
+    gcs_manager._client.bucket.return_value.blob.return_value = blob
+    return blob
+
+
+def test_gcs_manager_save_json_to_gcs_exception(gcs_manager):
+    blob = _mock_blob(gcs_manager)
+    blob.upload_from_string.side_effect = Exception("Mock GCS write error")
 
     gcs_path = "gs://test-bucket/error.json"
     data = {"key": "value"}
@@ -115,12 +121,12 @@ def test_gcs_manager_save_json_to_gcs_exception(gcs_manager, mocker):
     with pytest.raises(Exception, match="Mock GCS write error"):
         gcs_manager.save_json_to_gcs(gcs_path, data)
 
-    mock_fs_open.assert_called_once_with(gcs_path, 'w')
+    gcs_manager._client.bucket.return_value.blob.assert_called_once_with("error.json")
 
 
-def test_gcs_manager_save_json_to_gcs_success(gcs_manager, mocker, caplog):
-    mock_fs_open = mocker.patch.object(gcs_manager.fs, "open")
-    mocker.patch("hippique_orchestrator.gcs_client.json.dump")
+def test_gcs_manager_save_json_to_gcs_success(gcs_manager, monkeypatch, caplog):
+    monkeypatch.setattr(config, "STORAGE_CODEC", "gzip")
+    blob = _mock_blob(gcs_manager)
 
     gcs_path = "gs://test-bucket/test.json"
     data = {"key": "value"}
@@ -128,7 +134,10 @@ def test_gcs_manager_save_json_to_gcs_success(gcs_manager, mocker, caplog):
     with caplog.at_level(logging.INFO):
         gcs_manager.save_json_to_gcs(gcs_path, data)
 
-    mock_fs_open.assert_called_once_with(gcs_path, 'w')
+    body = blob.upload_from_string.call_args.args[0]
+    assert blob.upload_from_string.call_args.kwargs == {"content_type": "application/json"}
+    assert blob.content_encoding == "gzip"
+    assert gzip.decompress(body) == b'{"key":"value"}'
     assert f"Successfully saved JSON to {gcs_path}" in caplog.text
 
 
@@ -187,25 +196,29 @@ def test_gcs_manager_list_files_exception(gcs_manager, mocker):
     mock_fs_ls.assert_called_once_with("gs://test-bucket/dir/", detail=True)
 
 
-def test_gcs_manager_read_file_from_gcs_success(gcs_manager, mocker):
-    mock_fs_open = mocker.patch.object(gcs_manager.fs, "open")
-    mock_file_handle = MagicMock()
-    mock_file_handle.__enter__.return_value.read.return_value = "file content"
-    mock_fs_open.return_value = mock_file_handle
+def test_gcs_manager_read_file_from_gcs_success(gcs_manager):
+    blob = _mock_blob(gcs_manager)
+    blob.download_as_bytes.return_value = b"file content"
 
     gcs_path = "path/to/file.json"
     content = gcs_manager.read_file_from_gcs(gcs_path)
     assert content == "file content"
-    mock_fs_open.assert_called_once_with("gs://test-bucket/path/to/file.json", 'r')
+    gcs_manager._client.bucket.return_value.blob.assert_called_once_with("path/to/file.json")
+    blob.download_as_bytes.assert_called_once_with(raw_download=True)
 
+    blob.download_as_bytes.return_value = gzip.compress(b'{"a": 1}')
+    blob.content_encoding = "gzip"
+    assert gcs_manager.read_file_from_gcs(gcs_path) == '{"a": 1}'
 
-def test_gcs_manager_read_file_from_gcs_exception(gcs_manager, mocker):
-    mock_fs_open = mocker.patch.object(gcs_manager.fs, "open", side_effect=Exception("Mock GCS read error"))
+
+def test_gcs_manager_read_file_from_gcs_exception(gcs_manager):
+    blob = _mock_blob(gcs_manager)
+    blob.download_as_bytes.side_effect = Exception("Mock GCS read error")
     gcs_path = "path/to/file.json"
 
     content = gcs_manager.read_file_from_gcs(gcs_path)
     assert content is None
-    mock_fs_open.assert_called_once_with("gs://test-bucket/path/to/file.json", 'r')
+    gcs_manager._client.bucket.return_value.blob.assert_called_once_with("path/to/file.json")
 
 
 def test_global_list_files_gcs_enabled_success(monkeypatch, mocker):
@@ -290,3 +303,64 @@ def test_global_read_file_from_gcs_gcs_disabled_local_file_not_found(monkeypatch
     assert content is None
     # No direct log assertion, as warning is already checked in the original test suite
     # assert "Local file not found" in caplog.text
+
+
+def test_gcs_manager_read_file_if_modified(gcs_manager):
+    from google.api_core import exceptions as gcs_exceptions
+
+    blob = MagicMock()
+    blob.generation = 7
+    blob.content_encoding = None
+    blob.download_as_bytes.return_value = b"a: 1"  # first read goes through the disk tier
+    gcs_manager._client = MagicMock()
+    gcs_manager._client.bucket.return_value.blob.return_value = blob
+
+    assert gcs_manager.read_file_if_modified("config/gpi.yml") == (True, "a: 1", 7)
+    gcs_manager._client.bucket.assert_called_with("test-bucket")
+    gcs_manager._client.bucket.return_value.blob.assert_called_with("config/gpi.yml")
+
+    blob.download_as_text.side_effect = gcs_exceptions.NotModified("unchanged")
+    assert gcs_manager.read_file_if_modified("config/gpi.yml", 7) == (False, None, 7)
+    blob.download_as_text.assert_called_with(if_generation_not_match=7)
+
+    blob.download_as_text.side_effect = Exception("boom")
+    assert gcs_manager.read_file_if_modified("config/gpi.yml", 7) == (True, None, None)
+
+
+def test_global_read_file_if_modified_local_fallback(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "BUCKET_NAME", "test-bucket")
+    monkeypatch.setattr(config, "GCS_ENABLED", False)
+    gcs_client.reset_gcs_manager()
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config").mkdir()
+    (tmp_path / "config" / "gpi.yml").write_text("a: 1")
+
+    modified, content, generation = gcs_client.read_file_if_modified("config/gpi.yml")
+    assert (modified, content) == (True, "a: 1")
+    assert gcs_client.read_file_if_modified("config/gpi.yml", generation) == (
+        False,
+        None,
+        generation,
+    )
+    assert gcs_client.read_file_if_modified("config/missing.yml") == (True, None, None)
+
+
+def test_gcs_manager_generation_matched_manifest_io(gcs_manager):
+    from google.api_core import exceptions as gcs_exceptions
+
+    blob = MagicMock()
+    blob.generation = 3
+    blob.download_as_text.return_value = '{"phases": {}}'
+    gcs_manager._client = MagicMock()
+    gcs_manager._client.bucket.return_value.blob.return_value = blob
+
+    assert gcs_manager.read_text_with_generation("data/R1C1/manifest.json") == ('{"phases": {}}', 3)
+    blob.download_as_text.side_effect = gcs_exceptions.NotFound("missing")
+    assert gcs_manager.read_text_with_generation("data/R1C1/manifest.json") == (None, 0)
+
+    assert gcs_manager.write_text_if_generation_match("data/R1C1/manifest.json", "{}", 3) == 3
+    blob.upload_from_string.assert_called_with(
+        "{}", content_type="application/json", if_generation_match=3
+    )
+    blob.upload_from_string.side_effect = gcs_exceptions.PreconditionFailed("raced")
+    assert gcs_manager.write_text_if_generation_match("data/R1C1/manifest.json", "{}", 3) is None
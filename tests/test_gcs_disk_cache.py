@@ -0,0 +1,87 @@
+import threading
+import time
+
+import pytest
+from google.api_core import exceptions as gcs_exceptions
+
+from hippique_orchestrator import gcs_client, gcs_disk_cache
+
+
+class FakeObject:
+    """One GCS object whose download honours ifGenerationNotMatch."""
+
+    def __init__(self, body=b'{"a": 1}', generation=1, delay=0.0):
+        self.body = body
+        self.generation = generation
+        self.delay = delay
+        self.downloads = []
+
+    def __call__(self, generation):
+        self.downloads.append(generation)
+        time.sleep(self.delay)
+        if generation == self.generation:
+            raise gcs_exceptions.NotModified("unchanged")
+        return self.body, None, self.generation
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return gcs_disk_cache.GcsDiskCache(tmp_path, max_bytes=1024)
+
+
+def test_unchanged_object_is_served_from_disk_after_conditional_check(cache, tmp_path):
+    obj = FakeObject()
+    name = "data/R1C1/snapshots/20250101_120000_H30.json"
+
+    assert cache.fetch("bucket", name, obj) == (b'{"a": 1}', None, 1)
+    assert cache.fetch("bucket", name, obj) == (b'{"a": 1}', None, 1)
+    obj.body, obj.generation = b'{"a": 2}', 2
+    assert cache.fetch("bucket", name, obj)[0] == b'{"a": 2}'
+
+    assert obj.downloads == [None, 1, 1]
+    counters = cache.stats()["prefixes"]["data/*/snapshots"]
+    assert (counters["hits"], counters["misses"]) == (1, 2)
+
+    # A new worker process sharing the directory starts with the latest generation.
+    other = gcs_disk_cache.GcsDiskCache(tmp_path, max_bytes=1024)
+    assert other.fetch("bucket", name, obj)[0] == b'{"a": 2}'
+    assert other.stats()["entries"] == 1 and obj.downloads[-1] == 2
+
+
+def test_concurrent_reads_share_one_download(cache):
+    obj = FakeObject(delay=0.1)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.fetch("bucket", "config/gpi.yml", obj)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert obj.downloads == [None]
+    assert len(results) == 5 and cache.stats()["coalesced"] == 4
+
+
+def test_least_recently_used_objects_are_evicted(cache):
+    for i in range(3):
+        cache.fetch("bucket", f"programmes/2025-01-0{i}.json", FakeObject(body=b"x" * 400))
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] == 800 and stats["evictions"] == 1
+
+
+def test_gcs_reads_go_through_the_disk_tier(mock_config_values, mocker):
+    mocker.patch("hippique_orchestrator.config.GCS_ENABLED", True)
+    gcs_client.reset_gcs_manager()
+    blob = mocker.MagicMock(content_encoding=None, generation=7)
+    blob.download_as_bytes.side_effect = [b'{"ok": true}', gcs_exceptions.NotModified("unchanged")]
+    mocker.patch("hippique_orchestrator.gcs_client.storage.Client").return_value.bucket.return_value.blob.return_value = blob
+
+    assert gcs_client.read_file_from_gcs("data/R1C1/analysis_H5.json") == '{"ok": true}'
+    assert gcs_client.read_file_from_gcs("data/R1C1/analysis_H5.json") == '{"ok": true}'
+
+    blob.download_as_bytes.assert_called_with(raw_download=True, if_generation_not_match=7)
+    assert gcs_disk_cache.get_gcs_disk_cache().stats()["prefixes"]["data/*"]["hits"] == 1
+    gcs_client.reset_gcs_manager()
@@ -0,0 +1,56 @@
+import pytest
+
+from hippique_orchestrator import config, html_parser
+from tests import parser_corpus
+
+ENGINES = html_parser.available_engines()
+
+
+@pytest.mark.parametrize("page, extractor", parser_corpus.cases())
+def test_extractors_give_the_same_output_with_every_engine(page, extractor):
+    html = parser_corpus.load(page)
+    outputs = {}
+    for engine in ENGINES:
+        with html_parser.use_engine(engine):
+            outputs[engine] = parser_corpus.EXTRACTORS[extractor](html)
+
+    reference = outputs["lxml"]
+    assert all(output == reference for output in outputs.values()), outputs
+
+
+def test_programme_corpus_page_is_fully_extracted():
+    races = parser_corpus.EXTRACTORS["boturfers.programme"](
+        parser_corpus.load("parser_corpus/boturfers_programme.html")
+    )
+
+    assert len(races) == 22  # R1C7 has no known discipline, R3C5 no start time
+    r2c3 = next(r for r in races if (r["reunion_id"], r["race_id"]) == (2, 3))  # R/C from the URL
+    assert r2c3["name"] == "Prix Ténébreuse - Chantilly"  # whitespace and comment dropped
+    assert r2c3["discipline"] == "Plate"
+
+
+def test_engine_resolution(monkeypatch):
+    monkeypatch.setattr(config, "HTML_PARSER", "lxml")
+    assert html_parser.engine() == "lxml"
+    assert not html_parser.is_soup(html_parser.parse_html("<p>x</p>"))
+    with html_parser.use_engine("html5lib"):
+        assert html_parser.is_soup(html_parser.parse_html("<p>x</p>"))
+        assert html_parser.soup("<p>x</p>").builder.NAME == "html5lib"
+    assert html_parser.engine("bs4") == "bs4"
+
+    monkeypatch.setattr(config, "HTML_PARSER", "nope")
+    assert html_parser.engine() == "html.parser"
+
+    monkeypatch.setattr(config, "HTML_PARSER", "lxml")
+    monkeypatch.setattr(html_parser, "lxml_html", None)
+    assert html_parser.engine() == "html.parser"
+    assert "lxml" not in html_parser.available_engines()
+
+
+def test_native_text_matches_get_text():
+    html = "<div><a> Prix <!-- c --><b>X</b>\n</a><script>var a = 1</script></div>"
+    node = html_parser.parse_html(html, "lxml").xpath("//div")[0]
+    tag = html_parser.soup(html).div
+
+    assert html_parser.text(node) == tag.get_text()
+    assert html_parser.text(node, strip=True) == tag.get_text(strip=True) == "PrixX"
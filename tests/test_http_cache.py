@@ -0,0 +1,135 @@
+import random
+
+import httpx
+import pytest
+
+from hippique_orchestrator.fetch_scheduler import FetchScheduler
+from hippique_orchestrator.http_cache import HttpCache, parse_ttl_rules
+from hippique_orchestrator.http_client import HttpClientPool
+
+PROFILE = "https://www.zone-turf.fr/jockey/jean-dupont-12/"
+RACE = "https://www.zeturf.fr/fr/course/2026-01-16/R1C1-prix"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _setup(tmp_path, handler):
+    clock = Clock()
+    cache = HttpCache(tmp_path, max_bytes=10**6, clock=clock)
+    transport = httpx.MockTransport(handler)
+    pool = HttpClientPool(transport=transport, async_transport=transport, backoff=0)
+    scheduler = FetchScheduler(pool=pool, host_rates={}, rate=1000.0, cache=cache)
+    return scheduler, cache, clock
+
+
+def test_fresh_entries_skip_the_network(tmp_path):
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, text="<html>profile</html>")
+
+    scheduler, cache, clock = _setup(tmp_path, handler)
+
+    assert scheduler.fetch_sync(PROFILE).text == "<html>profile</html>"
+    second = scheduler.fetch_sync(PROFILE)
+    clock.now += 2 * 86400  # profiles stay fresh for days
+    scheduler.fetch_sync(PROFILE)
+
+    assert calls == [PROFILE]
+    assert second.headers["X-Cache"] == "HIT"
+    second.raise_for_status()
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (2, 1, 1)
+    assert stats["bytes_saved"] == 2 * len("<html>profile</html>")
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+    assert 0 < stats["disk_bytes"]
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_revalidated_with_conditional_get(tmp_path):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="odds v1", headers={"ETag": '"v1"'})
+
+    scheduler, cache, clock = _setup(tmp_path, handler)
+
+    await scheduler.fetch(RACE)
+    clock.now += 60  # odds pages expire after seconds
+    response = await scheduler.fetch(RACE)
+
+    assert seen == [None, '"v1"']
+    assert (response.status_code, response.text) == (200, "odds v1")
+    assert response.headers["X-Cache"] == "REVALIDATED"
+    assert cache.stats()["revalidated"] == 1
+    assert cache.lookup(RACE).fresh  # the 304 restarted the TTL
+
+
+def test_uncacheable_responses_are_not_stored(tmp_path):
+    def handler(request):
+        if request.url.path == "/api":
+            return httpx.Response(200, text="no validators, no ttl")
+        if request.url.path == "/jockey/private-1/":
+            return httpx.Response(200, text="x", headers={"Cache-Control": "no-store"})
+        return httpx.Response(404)
+
+    scheduler, cache, _ = _setup(tmp_path, handler)
+
+    scheduler.fetch_sync("https://example.test/api")
+    scheduler.fetch_sync("https://example.test/jockey/private-1/")
+    scheduler.fetch_sync("https://example.test/jockey/missing-2/")
+
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_bounds_disk_usage_and_shares_blobs(tmp_path):
+    bodies = {f"/cheval/h-{i}/": random.Random(i).randbytes(1024 * (i + 1)) for i in range(4)}
+    bodies["/cheval/copy-9/"] = bodies["/cheval/h-0/"]
+
+    scheduler, cache, clock = _setup(
+        tmp_path, lambda request: httpx.Response(200, content=bodies[request.url.path])
+    )
+    cache.max_bytes = sum(len(body) for body in bodies.values()) // 2  # random bytes do not compress
+
+    for path in bodies:
+        clock.now += 1
+        scheduler.fetch_sync(f"https://example.test{path}")
+
+    stats = cache.stats()
+    assert stats["disk_bytes"] <= cache.max_bytes
+    assert stats["evictions"] >= 1
+    assert cache.lookup("https://example.test/cheval/copy-9/") is not None
+    assert cache.lookup("https://example.test/cheval/h-0/") is None
+
+
+def test_rewritten_url_releases_its_previous_body(tmp_path):
+    scheduler, cache, clock = _setup(
+        tmp_path, lambda request: httpx.Response(200, content=random.Random(-1).randbytes(1024))
+    )
+    cache.max_bytes = 20 * 1024
+    scheduler.fetch_sync(PROFILE)
+    for i in range(50):  # the odds page changes on every fetch
+        clock.now += 60
+        cache.store(RACE, httpx.Response(200, content=random.Random(i).randbytes(1024)))
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["evictions"]) == (2, 0)
+    assert stats["disk_bytes"] < 3 * 1024
+    assert len(list((tmp_path / "blobs").rglob("*.z"))) == 2
+
+
+def test_parse_ttl_rules_overrides_and_skips_invalid():
+    assert parse_ttl_rules(r"/odds/=5;bad;/x[=3;/jockey/\d+=86400") == [
+        ("/odds/", 5.0),
+        (r"/jockey/\d+", 86400.0),
+    ]
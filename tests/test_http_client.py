@@ -0,0 +1,152 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from hippique_orchestrator import http_client
+from hippique_orchestrator.http_client import HttpClientPool
+
+
+def _pool(handler, **kwargs):
+    transport = httpx.MockTransport(handler)
+    return HttpClientPool(
+        transport=transport, async_transport=transport, backoff=0, attempts=3, **kwargs
+    )
+
+
+def test_retries_retryable_status_then_succeeds():
+    statuses = iter([503, 200])
+    pool = _pool(lambda request: httpx.Response(next(statuses), text="ok"))
+
+    response = pool.get("https://example.test/page")
+
+    assert response.status_code == 200
+    host = pool.stats()["hosts"]["example.test"]
+    assert (host["requests"], host["retries"], host["errors"]) == (2, 1, 0)
+
+
+def test_returns_last_response_when_attempts_run_out():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(429)
+
+    response = _pool(handler).get("https://example.test/page")
+
+    assert response.status_code == 429
+    assert len(calls) == 3
+
+
+def test_transport_errors_are_retried_and_reraised():
+    def handler(request):
+        raise httpx.ConnectError("down", request=request)
+
+    pool = _pool(handler)
+    with pytest.raises(httpx.ConnectError):
+        pool.get("https://example.test/page")
+    assert pool.stats()["hosts"]["example.test"]["errors"] == 3
+
+
+def test_client_errors_are_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(404)
+
+    assert _pool(handler).get("https://example.test/missing").status_code == 404
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_requests_share_one_client_per_loop():
+    pool = _pool(lambda request: httpx.Response(200, text=request.url.path))
+
+    first = await pool.aget("https://example.test/a")
+    second = await pool.bind("https://example.test/base").aget("/b")
+
+    assert (first.text, second.text) == ("/a", "/base/b")
+    assert pool.async_client() is pool.async_client()
+    assert pool.stats()["hosts"]["example.test"]["requests"] == 2
+    await pool.aclose()
+
+
+def test_bound_client_sends_default_headers_and_resolves_paths():
+    seen = []
+
+    def handler(request):
+        seen.append((str(request.url), request.headers["user-agent"]))
+        return httpx.Response(200)
+
+    bound = _pool(handler).bind("https://www.zone-turf.fr")
+    bound.get("/cheval/lettre-a.html?p=1")
+
+    assert seen == [
+        ("https://www.zone-turf.fr/cheval/lettre-a.html?p=1", http_client.DEFAULT_HEADERS["User-Agent"])
+    ]
+
+
+def test_per_host_limit_caps_concurrent_requests():
+    lock = threading.Lock()
+    active = {"now": 0, "max": 0}
+
+    def handler(request):
+        with lock:
+            active["now"] += 1
+            active["max"] = max(active["max"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return httpx.Response(200)
+
+    pool = _pool(handler, per_host_limit=2)
+    threads = [
+        threading.Thread(target=pool.get, args=("https://example.test/page",)) for _ in range(6)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert active["max"] <= 2
+
+
+def test_keep_alive_connections_are_reused():
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    pool = HttpClientPool(backoff=0)
+    try:
+        url = f"http://127.0.0.1:{server.server_port}/"
+        for _ in range(3):
+            assert pool.get(url).text == "ok"
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+
+    host = pool.stats()["hosts"][f"127.0.0.1:{server.server_port}"]
+    assert host["new_connections"] == 1
+    assert host["reused_connections"] == 2
+
+
+def test_process_pool_is_shared_and_resettable():
+    first = http_client.get_http_pool()
+    assert http_client.get_http_pool() is first
+    http_client.reset_http_pool()
+    assert http_client.get_http_pool() is not first
+    http_client.reset_http_pool()
@@ -0,0 +1,53 @@
+from hippique_orchestrator import firestore_client
+from hippique_orchestrator.je_stats_cache import DayStatsCache
+from hippique_orchestrator.stats_provider import ZoneTurfProvider
+
+JOCKEY_PAGE = """
+<html><body>
+  <h2>Statistiques 2025 de E. Raffin</h2>
+  <table>
+    <tr><td>Courses</td><td>100</td></tr>
+    <tr><td>Victoires</td><td>20</td></tr>
+    <tr><td>Placés</td><td>50</td></tr>
+  </table>
+</body></html>
+"""
+
+
+def test_day_cache_serves_local_then_shared_entries(mocker):
+    get_document = mocker.patch.object(firestore_client, "get_document", return_value=None)
+    get_documents = mocker.patch.object(
+        firestore_client,
+        "get_documents",
+        return_value={"2026-03-01_trainer_9": {"stats": {"year": 2026, "wins": 3}}},
+    )
+    cache = DayStatsCache("je-test")
+
+    assert cache.get("jockey", "7", day="2026-03-01") is None
+    cache.put("jockey", "7", {"year": 2026, "wins": 1}, day="2026-03-01")
+    assert cache.get("jockey", "7", day="2026-03-01") == {"year": 2026, "wins": 1}
+    assert cache.get("jockey", "7", day="2026-03-02") is None  # scoped to its day
+
+    assert cache.prefetch([("trainer", "9"), ("jockey", "7")], day="2026-03-01") == 1
+    assert get_documents.call_args.args == ("je-test", ["2026-03-01_trainer_9"])
+    assert cache.get("trainer", "9", day="2026-03-01") == {"year": 2026, "wins": 3}
+    assert get_document.call_count == 2  # only the two misses
+
+    day = cache.stats()["days"]["2026-03-01"]
+    assert (day["local_hits"], day["misses"], day["stored"], day["fetches_avoided"]) == (2, 1, 1, 2)
+    assert cache.stats()["write_behind"]["pending"] == 1
+    cache.clear()
+
+
+def test_jockey_profile_is_parsed_once_per_day(mocker):
+    mocker.patch.object(firestore_client, "get_document", return_value=None)
+    provider = ZoneTurfProvider(config={})
+    response = mocker.Mock(text=JOCKEY_PAGE)
+    get = mocker.patch.object(provider.client, "get", return_value=response)
+
+    first = provider.fetch_jockey_stats("E. Raffin", known_id="2957")
+    second = provider.fetch_jockey_stats("E. Raffin", known_id="2957")
+
+    assert first == second
+    assert first.win_rate == 0.2
+    get.assert_called_once()
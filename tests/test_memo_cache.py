@@ -0,0 +1,81 @@
+import threading
+
+import pytest
+
+from hippique_orchestrator.memo_cache import MemoCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction_and_counters():
+    cache = MemoCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "a" becomes most recent
+    cache.put("c", 3)  # evicts "b"
+
+    assert cache.keys() == ["a", "c"]
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (1, 1, 1)
+    assert stats["hit_rate"] == pytest.approx(0.5)
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = MemoCache(maxsize=4, ttl=10.0, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 9.0
+    assert cache.get("a") == 1
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_peek_does_not_touch_recency_or_counters():
+    cache = MemoCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.peek("a") == 1
+    cache.put("c", 3)
+
+    assert "a" not in cache
+    assert cache.stats()["hits"] == 0
+
+
+def test_rejects_non_positive_size():
+    with pytest.raises(ValueError):
+        MemoCache(maxsize=0)
+
+
+def test_concurrent_access_stays_bounded():
+    cache = MemoCache(maxsize=64)
+    errors = []
+
+    def worker(offset):
+        try:
+            for i in range(2000):
+                key = (offset + i) % 200
+                if cache.get(key) is None:
+                    cache.put(key, key)
+        except Exception as exc:  # pragma: no cover - reported below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(n * 37,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = cache.stats()
+    assert not errors
+    assert stats["size"] <= 64
+    assert stats["hits"] + stats["misses"] == 8 * 2000
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from hippique_orchestrator import analysis_pipeline, odds_store  # noqa: E402
+
+T0 = datetime(2025, 1, 1, 13, 20, tzinfo=timezone.utc)
+
+
+def _snapshot(odds, source="boturfers"):
+    return {
+        "source_snapshot": source,
+        "runners": [
+            {"num": num, "odds_win": win, "odds_place": place} for num, (win, place) in odds.items()
+        ] + [{"num": 9, "odds_win": None, "odds_place": None}],  # no odds: not stored
+    }
+
+
+def test_buffered_parts_are_compacted_and_sorted(tmp_path):
+    store = odds_store.OddsStore(tmp_path, flush_rows=3, max_parts=3)
+    for i in range(7):
+        store.append_snapshot(
+            "2025-01-01", f"R1C{2 - i % 2}", "H-30", _snapshot({1: (3.0 + i, 1.5), 2: (8.0, 2.5)}),
+            ts=T0 + timedelta(minutes=i),
+        )
+
+    day_dir = tmp_path / "2025-01-01"
+    assert (day_dir / odds_store.COMPACT_NAME).exists()
+    assert store.stats()["compactions"] == 1 and store.stats()["rows_buffered"] == 2
+
+    table = store.scan("2025-01-01")  # includes the buffered rows
+    assert table.num_rows == 14
+    compacted = odds_store.ds.dataset(str(day_dir / odds_store.COMPACT_NAME), format="ipc").to_table()
+    assert compacted.column("race").to_pylist() == sorted(compacted.column("race").to_pylist())
+
+
+def test_scan_filters_are_pushed_down(tmp_path):
+    store = odds_store.OddsStore(tmp_path)
+    store.append_snapshot("2025-01-01", "R1C1", "H30", _snapshot({1: (3.0, 1.5), 2: (8.0, 2.5)}), ts=T0)
+    store.append_snapshot(
+        "2025-01-01", "R1C1", "H5", _snapshot({1: (2.5, 1.3), 2: (9.0, 2.8)}),
+        ts=T0 + timedelta(minutes=25),
+    )
+    store.append_snapshot("2025-01-01", "R1C2", "H5", _snapshot({1: (4.0, 1.9)}), ts=T0)
+
+    table = store.scan(
+        "2025-01-01", races=["R1C1"], runners=[2], start=T0 + timedelta(minutes=1),
+        columns=["phase", "odds_place"],
+    )
+    assert table.to_pylist() == [{"phase": "H5", "odds_place": 2.8}]
+    assert store.scan("2025-01-02").num_rows == 0
+
+
+def test_reads_serve_buffered_rows_without_writing_parts(tmp_path):
+    store = odds_store.OddsStore(tmp_path, flush_rows=100)
+    store.append_snapshot("2025-01-01", "R1C1", "H-30", _snapshot({1: (4.0, 1.8)}), ts=T0)
+    store.flush()
+    for i in range(10):
+        store.append_snapshot(
+            "2025-01-01", "R1C1", "H-5", _snapshot({1: (5.0 + i, 2.0)}), ts=T0 + timedelta(minutes=i)
+        )
+        assert store.phase_snapshot("2025-01-01", "R1C1", "H5")["runners"][0]["odds_win"] == 5.0 + i
+
+    assert store.scan("2025-01-01", phases=["H30"]).num_rows == 1
+    stats = store.stats()
+    assert (stats["parts_written"], stats["rows_buffered"]) == (1, 10)
+
+
+def test_latest_phase_snapshot_serves_the_drift_lookup(mocker):
+    store = odds_store.get_odds_store()
+    store.append_snapshot("2025-01-01", "R1C1", "H30", _snapshot({1: (3.0, 1.5)}), ts=T0)
+    store.append_snapshot(
+        "2025-01-01", "R1C1", "H30", _snapshot({1: (3.2, 1.6), 2: (8.0, 2.5)}),
+        ts=T0 + timedelta(minutes=2),
+    )
+    manifest = mocker.patch("hippique_orchestrator.snapshot_manifest.load_latest")
+
+    h30 = analysis_pipeline._find_and_load_h30_snapshot("R1C1", {"date": "2025-01-01"})
+
+    assert h30["runners"] == [
+        {"num": 1, "odds_win": 3.2, "odds_place": 1.6},
+        {"num": 2, "odds_win": 8.0, "odds_place": 2.5},
+    ]
+    manifest.assert_not_called()
+
+
+def test_store_is_a_no_op_without_pyarrow(tmp_path, monkeypatch):
+    monkeypatch.setattr(odds_store, "pa", None)
+    store = odds_store.OddsStore(tmp_path)
+
+    assert store.append_snapshot("2025-01-01", "R1C1", "H30", _snapshot({1: (3.0, 1.5)})) == 0
+    assert store.scan("2025-01-01") is None
+    assert store.phase_snapshot("2025-01-01", "R1C1", "H30") == {}
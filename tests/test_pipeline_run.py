@@ -156,6 +156,11 @@ def test_generate_tickets_creates_trio_ticket_with_best_roi(
         "hippique_orchestrator.pipeline_run.evaluate_combo",
         side_effect=evaluate_combo_side_effect,
     )
+    # The mocked ROIs are not derived from the legs, so lift the pruning bound.
+    mocker.patch(
+        "hippique_orchestrator.pipeline_run.combo_probability_upper_bounds",
+        side_effect=lambda combos: [1.0 for _ in combos],
+    )
 
     result = generate_tickets(
         snapshot_data=snapshot_data,
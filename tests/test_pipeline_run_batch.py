@@ -0,0 +1,100 @@
+import copy
+
+import pytest
+
+from hippique_orchestrator import pipeline_run
+from hippique_orchestrator.pipeline_run import generate_tickets, generate_tickets_batch
+
+GPI_CONFIG = {
+    "budget": 5.0,
+    "je_stats": {},
+    "h30_snapshot_data": None,
+    "roi_min_sp": 0.20,
+    "roi_min_global": 0.25,
+    "overround_max_exotics": 1.30,
+    "ev_min_combo": 0.40,
+    "payout_min_combo": 10.0,
+    "weights": {"base": {}, "horse_stats": {}},
+    "adjustments": {"chrono": {"k_c": 0.18}, "drift": {"k_d": 0.70}},
+    "tickets": {
+        "sp_dutching": {
+            "budget_ratio": 0.6,
+            "legs_min": 2,
+            "legs_max": 3,
+            "odds_range": [1.1, 999],
+            "kelly_frac": 0.25,
+        },
+        "exotics": {"allowed": ["TRIO"]},
+    },
+}
+
+
+def _snapshot(race_id: str, shift: float) -> dict:
+    return {
+        "race_id": race_id,
+        "runners": [
+            {"num": 1, "nom": "Cheval1", "p_no_vig": 0.4, "odds_place": 4.0 + shift},
+            {"num": 2, "nom": "Cheval2", "p_no_vig": 0.3, "odds_place": 5.0},
+            {"num": 3, "nom": "Cheval3", "p_no_vig": 0.1, "odds_place": 10.0 - shift},
+        ],
+        "market": {"overround_place": 1.10},
+    }
+
+
+@pytest.fixture(autouse=True)
+def isolated_status_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(pipeline_run, "STATUS_FILE_PATH", tmp_path / "live_quality_status.json")
+
+
+def _mark_initialized():
+    pipeline_run._BATCH_TEST_INITIALIZED = True
+
+
+def test_generate_tickets_batch_matches_sequential_runs():
+    snapshots = {f"R1C{i}": _snapshot(f"R1C{i}", i * 0.5) for i in range(1, 5)}
+    expected = {
+        race: generate_tickets(copy.deepcopy(snapshot), GPI_CONFIG)
+        for race, snapshot in snapshots.items()
+    }
+
+    results = list(generate_tickets_batch(snapshots, GPI_CONFIG, workers=2))
+
+    assert sorted(r["race"] for r in results) == sorted(snapshots)
+    for batch_result in results:
+        assert batch_result["error"] is None
+        assert batch_result["wall_time_s"] >= 0
+        assert batch_result["result"] == expected[batch_result["race"]]
+
+
+def test_generate_tickets_batch_applies_per_race_overrides():
+    snapshots = [("R1C1", _snapshot("R1C1", 0.0)), ("R1C2", _snapshot("R1C2", 0.0))]
+
+    results = {
+        r["race"]: r["result"]
+        for r in generate_tickets_batch(
+            snapshots,
+            GPI_CONFIG,
+            workers=2,
+            config_overrides={"R1C2": {"roi_min_global": 0.99}},
+        )
+    }
+
+    assert results["R1C1"]["gpi_decision"] == "Play"
+    assert results["R1C2"]["gpi_decision"].startswith("Abstain")
+
+
+def test_generate_tickets_batch_in_process_isolates_failures(monkeypatch):
+    monkeypatch.setattr(pipeline_run, "_BATCH_TEST_INITIALIZED", False, raising=False)
+    broken = _snapshot("R1C2", 0.0)
+    del broken["runners"][0]["num"]
+    snapshots = {"R1C1": _snapshot("R1C1", 0.0), "R1C2": broken}
+
+    results = list(
+        generate_tickets_batch(snapshots, GPI_CONFIG, workers=1, initializer=_mark_initialized)
+    )
+
+    assert pipeline_run._BATCH_TEST_INITIALIZED is True
+    assert [r["race"] for r in results] == ["R1C1", "R1C2"]
+    assert results[0]["error"] is None
+    assert results[1]["result"] is None
+    assert results[1]["error"].startswith("KeyError")
@@ -1,6 +1,7 @@
 # Re-use the mock_gpi_config from test_pipeline_run.py or define a more comprehensive one
 import copy
 import math
+from itertools import combinations
 
 import pytest
 from pytest_mock import MockerFixture
@@ -695,6 +696,11 @@ def test_generate_exotic_tickets_multiple_profitable_combos_updates_best(
             {"status": "ok", "roi": 0.7, "payout_expected": 25.0},  # Fourth combo (best)
         ],
     )
+    # The mocked ROIs are not derived from the legs, so lift the pruning bound.
+    mocker.patch(
+        "hippique_orchestrator.pipeline_run.combo_probability_upper_bounds",
+        side_effect=lambda combos: [1.0 for _ in combos],
+    )
     # Ensure sp_candidates have the 'odds' key expected by math.prod
     sp_candidates = [
         {"num": 1, "nom": "Horse A", "odds": 5.0},
@@ -717,6 +723,111 @@ def test_generate_exotic_tickets_multiple_profitable_combos_updates_best(
     assert "Profitable TRIO combo found" in analysis_messages[0]
 
 
+def _priced_legs():
+    # Legs carry explicit probabilities so the pruning bound is informative.
+    specs = [(0.45, 3.0), (0.35, 4.5), (0.30, 5.0), (0.20, 6.0), (0.10, 9.0), (0.05, 15.0)]
+    return [
+        {"num": 900 + i, "nom": f"Horse {i}", "p": prob, "odds": odds}
+        for i, (prob, odds) in enumerate(specs)
+    ]
+
+
+def test_generate_exotic_tickets_prunes_unreachable_combos(
+    mocker: MockerFixture, mock_snapshot_data, mock_gpi_config, caplog
+):
+    def roi_from_legs(tickets, bankroll, calibration):
+        legs = tickets[0]["legs"]
+        gross = math.prod(leg["p"] * leg["odds"] for leg in legs)
+        return {"status": "ok", "roi": gross - 1.0, "payout_expected": gross * bankroll}
+
+    evaluate = mocker.patch(
+        "hippique_orchestrator.pipeline_run.evaluate_combo", side_effect=roi_from_legs
+    )
+    sp_candidates = _priced_legs()
+    mock_gpi_config["exotics_config"]["allowed"] = ["COUPLE", "TRIO"]
+    mock_gpi_config["market"] = {"overround_place": 1.10}
+    mock_gpi_config["overround_max"] = mock_gpi_config["overround_max_exotics"]
+
+    with caplog.at_level("INFO", logger="hippique_orchestrator.pipeline_run"):
+        final_tickets, _ = pipeline_run._generate_exotic_tickets(
+            sp_candidates, mock_snapshot_data, mock_gpi_config, [], []
+        )
+
+    best = max(
+        (
+            combo
+            for legs in (2, 3)
+            for combo in combinations(sp_candidates, legs)
+            if math.prod(leg["p"] * leg["odds"] for leg in combo) - 1.0
+            >= mock_gpi_config["ev_min_combo"]
+        ),
+        key=lambda combo: math.prod(leg["p"] * leg["odds"] for leg in combo),
+    )
+    assert final_tickets[0]["horses"] == [leg["num"] for leg in best]
+    total = math.comb(6, 2) + math.comb(6, 3)
+    assert 0 < evaluate.call_count < total
+    assert f"EXOTIC_COMBO_SEARCH combos={total} evaluated={evaluate.call_count}" in caplog.text
+
+
+def test_generate_exotic_tickets_skips_evaluation_when_bound_below_threshold(
+    mocker: MockerFixture, mock_snapshot_data, mock_gpi_config
+):
+    evaluate = mocker.patch("hippique_orchestrator.pipeline_run.evaluate_combo")
+    # Without probabilities each leg falls back to 1 / odds, so no combo has an edge.
+    sp_candidates = [{"num": 910 + i, "odds": odds} for i, odds in enumerate((3.0, 4.0, 6.0))]
+    mock_gpi_config["exotics_config"]["allowed"] = ["TRIO"]
+    mock_gpi_config["market"] = {"overround_place": 1.10}
+    mock_gpi_config["overround_max"] = mock_gpi_config["overround_max_exotics"]
+
+    final_tickets, analysis_messages = pipeline_run._generate_exotic_tickets(
+        sp_candidates, mock_snapshot_data, mock_gpi_config, [], []
+    )
+
+    evaluate.assert_not_called()
+    assert not final_tickets
+    assert not analysis_messages
+
+
+def test_generate_exotic_tickets_matches_exhaustive_search(mock_snapshot_data, mock_gpi_config):
+    sp_candidates = _priced_legs()
+    mock_gpi_config["exotics_config"]["allowed"] = ["COUPLE", "TRIO"]
+    mock_gpi_config["market"] = {"overround_place": 1.10}
+    mock_gpi_config["overround_max"] = mock_gpi_config["overround_max_exotics"]
+    mock_gpi_config["payout_min_combo"] = 2.0
+    combo_budget = mock_gpi_config["budget"] * (1 - mock_gpi_config["sp_config"]["budget_ratio"])
+
+    best = None
+    for exotic_type, legs in (("COUPLE", 2), ("TRIO", 3)):
+        for combo in combinations(sp_candidates, legs):
+            result = pipeline_run.evaluate_combo(
+                tickets=[
+                    {
+                        "type": exotic_type,
+                        "odds": math.prod(leg["odds"] for leg in combo),
+                        "legs": list(combo),
+                    }
+                ],
+                bankroll=combo_budget,
+                calibration=pipeline_run.CALIB_PATH,
+            )
+            if (
+                result["status"] == "ok"
+                and result["roi"] >= mock_gpi_config["ev_min_combo"]
+                and result["payout_expected"] >= mock_gpi_config["payout_min_combo"]
+                and (best is None or result["roi"] > best[1]["roi"])
+            ):
+                best = (combo, result)
+
+    final_tickets, _ = pipeline_run._generate_exotic_tickets(
+        sp_candidates, mock_snapshot_data, mock_gpi_config, [], []
+    )
+
+    assert best is not None
+    assert final_tickets[0]["horses"] == [leg["num"] for leg in best[0]]
+    assert final_tickets[0]["roi_est"] == best[1]["roi"]
+    assert final_tickets[0]["payout_est"] == best[1]["payout_expected"]
+
+
 # --- Tests for _finalize_and_decide ---
 
 
@@ -0,0 +1,200 @@
+import threading
+import time
+from datetime import date, datetime
+
+import pytest
+
+from hippique_orchestrator import config, programme_provider
+from hippique_orchestrator.contracts.models import OddsSnapshot, Race, Runner
+from hippique_orchestrator.providers import hedging
+from hippique_orchestrator.providers.aggregate import AggregateProvider
+from hippique_orchestrator.providers.base import Provider
+
+
+@pytest.fixture(autouse=True)
+def _fresh_histograms():
+    hedging.reset_latency_histograms()
+    yield
+    hedging.reset_latency_histograms()
+
+
+def _race(uid="r1", **fields):
+    data = dict(
+        race_uid=uid, meeting_ref="M1", race_number=1,
+        scheduled_time_local=datetime(2025, 1, 1, 13, 50), discipline="PLAT",
+        distance_m=2000, runners_count=2,
+    )
+    return Race(**{**data, **fields})
+
+
+class FakeProvider(Provider):
+    def __init__(self, name, programme=None, details=None, delay=0.0, error=None):
+        self._name = name
+        self.programme = programme or []
+        self.details = details
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.release = threading.Event()
+
+    @property
+    def name(self):
+        return self._name
+
+    def _run(self, result):
+        self.calls += 1
+        self.release.wait(self.delay)
+        if self.error:
+            raise self.error
+        return result
+
+    def fetch_programme(self, for_date):
+        return self._run(self.programme)
+
+    def fetch_race_details(self, race, phase):
+        return self._run(self.details)
+
+
+def test_histogram_quantiles_and_stats():
+    hist = hedging.LatencyHistogram()
+    for seconds in [0.04] * 18 + [0.7, 42.0]:
+        hist.record(seconds)
+    hist.record(0.2, ok=False)
+
+    assert hist.quantile(0.5) == 0.05
+    assert hist.quantile(0.95) == 1.0
+    assert hist.quantile(1.0) == 42.0  # "+Inf" bucket reports the maximum seen
+    stats = hist.stats()
+    assert stats["count"] == 21 and stats["failures"] == 1
+    assert stats["buckets"]["<=0.05s"] == 18 and stats["buckets"]["+Inf"] == 1
+
+
+def test_hedge_delay_uses_recorded_quantile_once_enough_samples(monkeypatch):
+    monkeypatch.setattr(config, "PROVIDER_HEDGE_DELAY_SECONDS", 3.0)
+    monkeypatch.setattr(config, "PROVIDER_HEDGE_MIN_SAMPLES", 5)
+    assert hedging.hedge_delay("slow") == 3.0
+    for _ in range(5):
+        hedging.histogram("slow").record(0.3)
+    assert hedging.hedge_delay("slow") == 0.5
+
+
+def test_hedged_starts_fallback_after_delay_and_abandons_slow_primary(monkeypatch):
+    monkeypatch.setattr(config, "PROVIDER_HEDGE_DELAY_SECONDS", 0.05)
+    primary = FakeProvider("slow-primary", programme=[_race()], delay=5)
+    fallback = FakeProvider("fallback", programme=[_race("fb")])
+
+    started = time.monotonic()
+    try:
+        races = AggregateProvider([primary, fallback], mode="hedged").fetch_programme(date.today())
+    finally:
+        primary.release.set()
+
+    assert [r.race_uid for r in races] == ["fb"]
+    assert time.monotonic() - started < 2
+
+
+def test_hedge_launches_do_not_queue_behind_abandoned_calls(monkeypatch):
+    monkeypatch.setattr(config, "PROVIDER_HEDGE_DELAY_SECONDS", 0.05)
+    busy = hedging.ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(hedging, "_executor", busy)
+    blocker = threading.Event()
+    busy.submit(blocker.wait, 5)  # a losing call of an earlier race, still running
+    fallback = FakeProvider("fallback", programme=[_race("fb")])
+
+    started = time.monotonic()
+    try:
+        winner = hedging.hedged_first(
+            [("primary", lambda: None), ("fallback", lambda: fallback.fetch_programme(None))]
+        )
+    finally:
+        blocker.set()
+        busy.shutdown()
+
+    assert winner[0] == "fallback"
+    assert time.monotonic() - started < 2
+
+
+def test_hedged_prefers_primary_and_never_starts_fallback_when_fast():
+    primary = FakeProvider("primary", programme=[_race()])
+    fallback = FakeProvider("fallback", programme=[_race("fb")])
+
+    races = AggregateProvider([primary, fallback], mode="hedged").fetch_programme(date.today())
+
+    assert [r.race_uid for r in races] == ["r1"]
+    assert fallback.calls == 0
+    assert hedging.latency_stats()["primary"]["count"] == 1
+
+
+def test_hedged_moves_on_immediately_when_primary_fails(monkeypatch):
+    monkeypatch.setattr(config, "PROVIDER_HEDGE_DELAY_SECONDS", 30.0)
+    primary = FakeProvider("primary", error=RuntimeError("boom"))
+    empty = FakeProvider("empty")
+    fallback = FakeProvider("fallback", programme=[_race("fb")])
+
+    races = AggregateProvider([primary, empty, fallback], mode="hedged").fetch_programme(date.today())
+
+    assert [r.race_uid for r in races] == ["fb"]
+    assert hedging.latency_stats()["primary"]["failures"] == 1
+
+
+def test_parallel_merges_runner_and_odds_fields():
+    race = _race()
+    primary = FakeProvider("primary", details=(
+        [Runner(runner_uid="a", race_uid="r1", program_number=1, name_norm="ALPHA", trainer="T1"),
+         Runner(runner_uid="b", race_uid="r1", program_number=2, name_norm="BRAVO")],
+        OddsSnapshot(race_uid="r1", phase="H30", source="primary", odds_place={"1": 2.0}),
+    ))
+    secondary = FakeProvider("secondary", details=(
+        [Runner(runner_uid="b2", race_uid="r1", program_number=2, name_norm="BRAVO", trainer="T2",
+                music_recent="1p2p"),
+         Runner(runner_uid="c", race_uid="r1", program_number=3, name_norm="CHARLIE")],
+        OddsSnapshot(race_uid="r1", phase="H30", source="secondary",
+                     odds_place={"1": 9.0, "2": 3.5}, odds_win={"1": 4.0}),
+    ))
+
+    runners, snapshot = AggregateProvider(
+        [primary, secondary], mode="parallel"
+    ).fetch_race_details(race, "H30")
+
+    by_number = {r.program_number: r for r in runners}
+    assert sorted(by_number) == [1, 2, 3]
+    assert by_number[2].runner_uid == "b" and by_number[2].music_recent == "1p2p"
+    assert by_number[2].trainer == "T2"  # filled: primary had none
+    assert by_number[1].trainer == "T1"
+    assert snapshot.odds_place == {"1": 2.0, "2": 3.5}
+    assert snapshot.odds_win == {"1": 4.0}
+    assert snapshot.source == "primary+secondary"
+
+
+def test_parallel_ignores_providers_past_the_timeout(monkeypatch):
+    monkeypatch.setattr(config, "PROVIDER_PARALLEL_TIMEOUT_SECONDS", 0.05)
+    slow = FakeProvider("slow", programme=[_race("slow")], delay=5)
+    fast = FakeProvider("fast", programme=[_race(runners_count=9)])
+    try:
+        races = AggregateProvider([slow, fast], mode="parallel").fetch_programme(date.today())
+    finally:
+        slow.release.set()
+
+    assert [(r.race_uid, r.runners_count) for r in races] == [("r1", 9)]
+
+
+def test_programme_provider_parallel_merges_races(mocker, monkeypatch):
+    monkeypatch.setattr(config, "PROVIDER_FETCH_MODE", "parallel")
+
+    def race(course_id, **extra):
+        return {"race_id": f"C{course_id}", "reunion_id": 1, "course_id": course_id,
+                "name": f"Prix {course_id}", "date": "2025-01-01", **extra}
+
+    primary = mocker.MagicMock()
+    primary.get_programme.return_value = {"date": "2025-01-01", "races": [race(1), race(2)]}
+    secondary = mocker.MagicMock()
+    secondary.get_programme.return_value = {
+        "date": "2025-01-01", "races": [race(2, distance_m=2100), race(3)]
+    }
+    registry = mocker.patch("hippique_orchestrator.programme_provider.source_registry")
+    registry.get_providers_by_capability.return_value = [primary, secondary]
+
+    programme = programme_provider.get_programme_for_date(date(2025, 1, 1))
+
+    assert [r.course_id for r in programme.races] == [1, 2, 3]
+    assert programme.races[1].distance_m == 2100
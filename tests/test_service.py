@@ -652,6 +652,17 @@ def test_debug_config_endpoint(client):
     assert "require_auth" in data
 
 
+def test_debug_caches_endpoint(client):
+    """Test that /debug/caches exposes the simulate_wrapper memo and calibration counters."""
+    response = client.get("/debug/caches")
+    assert response.status_code == 200
+    data = response.json()
+    memo = data["simulate_wrapper_memo"]
+    for key in ("size", "maxsize", "hits", "misses", "evictions", "hit_rate"):
+        assert key in memo
+    assert "entries" in data["calibration"]["probabilities"]
+
+
 def test_get_pronostics_data_defaults_to_today(client, mock_build_plan, mock_firestore):
     """Test /api/pronostics defaults to the current date when none is provided."""
     mock_get_races, _ = mock_firestore
@@ -699,3 +710,58 @@ def test_get_ops_status_invalid_date_format(client):
     response = client.get("/ops/status?date=not-a-date")
     assert response.status_code == 422
     assert "Invalid date format. Use YYYY-MM-DD." in response.json()["detail"]
+
+
+def test_get_pronostics_data_memoizes_until_race_update(client, mock_race_doc, mocker):
+    """The merged day payload is reused until a race of that day is written."""
+    day = date(2025, 3, 1)
+    programme = Programme.model_validate(
+        {
+            "date": day,
+            "races": [
+                {
+                    "race_id": f"C{i}",
+                    "reunion_id": 1,
+                    "course_id": i,
+                    "hippodrome": "VINCENNES",
+                    "date": day,
+                    "start_time": time(13, i),
+                    "name": f"Prix {i}",
+                    "discipline": "Plat",
+                    "country_code": "FR",
+                    "url": f"http://example.com/r1c{i}",
+                    "rc": f"R1C{i}",
+                }
+                for i in (1, 2)
+            ],
+        }
+    )
+    mock_programme = mocker.patch(
+        "hippique_orchestrator.service.get_programme_for_date", return_value=programme
+    )
+    docs = [
+        mock_race_doc("2025-03-01_R1C2", {"gpi_decision": "play"}),
+        mock_race_doc("2025-03-01_R1C9", {"gpi_decision": "abstain"}),
+    ]
+    mock_get_races = mocker.patch(
+        "hippique_orchestrator.service.get_races_for_date", new=AsyncMock(return_value=docs)
+    )
+
+    first = client.get("/api/pronostics?date=2025-03-01").json()
+    second = client.get("/api/pronostics?date=2025-03-01").json()
+
+    assert first == second
+    assert [r.get("gpi_decision") for r in first["races"]] == [None, "play"]
+    assert mock_programme.call_count == 1
+    assert mock_get_races.await_count == 1
+    docs[1].to_dict.assert_not_called()
+
+    client.get("/api/pronostics?date=2025-03-01&phase=H5")
+    assert mock_get_races.await_count == 2
+
+    from hippique_orchestrator import firestore_client
+
+    mocker.patch("hippique_orchestrator.firestore_client._get_firestore_client")
+    firestore_client.update_race_document("2025-03-01_R1C1", {"gpi_decision": "play"})
+    client.get("/api/pronostics?date=2025-03-01")
+    assert mock_get_races.await_count == 3
@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from hippique_orchestrator import simulate_wrapper as sw
 from hippique_orchestrator.ev_calculator import compute_ev_roi
+from hippique_orchestrator.memo_cache import MemoCache
 
 TICKETS = [{"legs": ["a", "b"], "odds": 10.0, "stake": 1.0}]
 
@@ -111,20 +112,39 @@ def test_cache_prevents_recomputation(monkeypatch: pytest.MonkeyPatch, tmp_path)
 
 
 def test_cache_eviction(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
-    """Oldest entries are evicted when cache exceeds ``MAX_CACHE_SIZE``."""
+    """Oldest memoised results are evicted when the memo exceeds its size."""
     cal = tmp_path / "probabilities.yaml"
     cal.write_text("")
     monkeypatch.setattr(sw, "CALIBRATION_PATH", cal)
     monkeypatch.setattr(sw, "_calibration_cache", OrderedDict())
     monkeypatch.setattr(sw, "_calibration_mtime", 0.0)
-    monkeypatch.setattr(sw, "MAX_CACHE_SIZE", 2)
+    monkeypatch.setattr(sw, "_memo_cache", MemoCache(maxsize=2))
 
     sw.simulate_wrapper(["a"])  # cache: a
     sw.simulate_wrapper(["b"])  # cache: a, b
-    assert list(sw._calibration_cache.keys()) == ["a", "b"]
+    assert sw._memo_cache.keys() == ["a", "b"]
 
     sw.simulate_wrapper(["c"])  # should evict "a"
-    assert list(sw._calibration_cache.keys()) == ["b", "c"]
+    assert sw._memo_cache.keys() == ["b", "c"]
+    assert sw.memo_stats()["evictions"] == 1
+
+
+def test_memoised_results_never_evict_calibration(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    """Calibration entries stay available however many results are memoised."""
+    cal = tmp_path / "probabilities.yaml"
+    cal.write_text("a|b:\n  alpha: 1\n  beta: 1\n  p: 0.3\n")
+    monkeypatch.setattr(sw, "CALIBRATION_PATH", cal)
+    monkeypatch.setattr(sw, "_calibration_cache", OrderedDict())
+    monkeypatch.setattr(sw, "_calibration_mtime", 0.0)
+    monkeypatch.setattr(sw, "_memo_cache", MemoCache(maxsize=2))
+
+    for leg in ("c", "d", "e", "f"):
+        sw.simulate_wrapper([leg])
+
+    assert sw.simulate_wrapper(["a", "b"]) == pytest.approx(0.3)
+    assert "a|b" not in sw._memo_cache
 
 
 def test_fallback_uses_leg_probabilities(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
@@ -139,7 +159,7 @@ def test_fallback_uses_leg_probabilities(monkeypatch: pytest.MonkeyPatch, tmp_pa
     prob = sw.simulate_wrapper(legs)
     assert math.isclose(prob, 0.2 * 0.3)
     key = sw._combo_key(legs)
-    assert set(sw._calibration_cache[key]["sources"]) == {"leg_p", "leg_p_true"}
+    assert set(sw._memo_cache.peek(key)["sources"]) == {"leg_p", "leg_p_true"}
 
 
 def test_fallback_uses_implied_odds(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
@@ -155,7 +175,7 @@ def test_fallback_uses_implied_odds(monkeypatch: pytest.MonkeyPatch, tmp_path) -
     expected = (1 / 5.0) * (1 / 4.0)
     assert math.isclose(prob, expected)
     key = sw._combo_key(legs)
-    assert sw._calibration_cache[key]["sources"] == ["implied_odds"]
+    assert sw._memo_cache.peek(key)["sources"] == ["implied_odds"]
 
 
 def test_correlation_penalty_reduces_probability_and_ev(
@@ -196,7 +216,7 @@ def test_correlation_penalty_reduces_probability_and_ev(
         monkeypatch.setattr(sw, "_calibration_cache", OrderedDict())
         sw.set_correlation_penalty(penalty)
         prob = sw.simulate_wrapper(legs)
-        entry = sw._calibration_cache[sw._combo_key(legs)]
+        entry = sw._memo_cache.peek(sw._combo_key(legs))
         detail = entry.get("details") or {}
         corr_info = detail.get("__correlation__", [])
 
@@ -221,3 +241,142 @@ def test_correlation_penalty_reduces_probability_and_ev(
     assert corr_penalized and corr_penalized[0]["method"] in {"penalty", "monte_carlo"}
     assert prob_penalized < prob_neutral
     assert ev_penalized < ev_neutral
+
+
+def _exact_copula_probability(probabilities: list[float], rho: float) -> float:
+    stats = pytest.importorskip("scipy.stats")
+    special = pytest.importorskip("scipy.special")
+    n = len(probabilities)
+    cov = [[1.0 if i == j else rho for j in range(n)] for i in range(n)]
+    limits = special.ndtri(probabilities)
+    return float(stats.multivariate_normal(mean=[0.0] * n, cov=cov).cdf(limits))
+
+
+@pytest.mark.parametrize(
+    "probabilities,rho",
+    [
+        ([0.6, 0.55], -0.45),
+        ([0.3, 0.2], 0.45),
+        ([0.4, 0.25, 0.6], 0.2),
+        ([0.15, 0.5, 0.35, 0.7], 0.8),
+    ],
+)
+def test_monte_carlo_stays_within_documented_tolerance(probabilities, rho) -> None:
+    estimate = sw._monte_carlo_joint_probability(probabilities, rho)
+    exact = _exact_copula_probability(probabilities, rho)
+    assert estimate == pytest.approx(exact, abs=sw.MONTE_CARLO_TOLERANCE)
+
+
+def test_batched_monte_carlo_matches_single_calls_and_reuses_factors() -> None:
+    groups = [
+        ([0.4, 0.3], 0.45),
+        ([0.2, 0.6, 0.5], 0.45),
+        ([0.7, 0.1], 0.45),
+        ([0.5], 0.3),
+        ([], 0.3),
+    ]
+    sw._cholesky_factor.cache_clear()
+    sw._correlated_bank.cache_clear()
+
+    batched = sw.monte_carlo_joint_probabilities(groups)
+
+    assert batched[3] == pytest.approx(0.5)
+    assert batched[4] == 0.0
+    # Two distinct (n, rho) buckets -> two factorisations for five groups.
+    assert sw._cholesky_factor.cache_info().misses == 2
+    for (probabilities, rho), value in zip(groups[:3], batched[:3], strict=True):
+        assert sw._monte_carlo_joint_probability(probabilities, rho) == value
+    assert sw._correlated_bank.cache_info().hits >= 3
+
+
+def test_estimate_group_probabilities_batches_copula_groups(monkeypatch) -> None:
+    settings = {"meeting_course": {"penalty": 0.9, "rho": 0.6}}
+    monkeypatch.setattr(sw, "_load_correlation_settings", lambda: None)
+    monkeypatch.setattr(sw, "_correlation_settings", settings)
+    calls: list[int] = []
+    original = sw.monte_carlo_joint_probabilities
+
+    def _spy(groups, samples=None):
+        calls.append(len(groups))
+        return original(groups, samples)
+
+    monkeypatch.setattr(sw, "monte_carlo_joint_probabilities", _spy)
+    groups = [([0.5, 0.4], ("rc", "R1C1")), ([0.3, 0.3, 0.3], ("rc", "R1C2"))]
+
+    results = sw._estimate_group_probabilities(groups)
+
+    assert calls == [2]
+    assert len(results) == 2
+    for (probabilities, _), (adjusted, method, penalty) in zip(groups, results, strict=True):
+        assert penalty == pytest.approx(0.9)
+        assert method in {"penalty", "monte_carlo"}
+        assert adjusted <= math.prod(probabilities)
+
+
+@pytest.mark.parametrize(
+    "probabilities,rho",
+    [
+        ([0.6, 0.55], 0.0),
+        ([0.6, 0.55], -0.45),
+        ([0.3, 0.2], 0.45),
+        ([0.4, 0.25, 0.6], -0.3),
+        ([0.4, 0.25, 0.6], 0.2),
+        ([0.15, 0.5, 0.35, 0.7], 0.85),
+    ],
+)
+def test_quadrature_matches_exact_copula(probabilities, rho) -> None:
+    value = sw._quadrature_joint_probability(probabilities, rho)
+    assert value == pytest.approx(_exact_copula_probability(probabilities, rho), abs=1e-4)
+
+
+def test_quadrature_without_scipy_defers_negative_correlation(monkeypatch) -> None:
+    monkeypatch.setattr(sw, "erfc", None)
+    assert sw._quadrature_joint_probability([0.5, 0.4], -0.3) is None
+    assert sw._quadrature_joint_probability([0.5, 0.4], 0.3) is not None
+    assert sw._quadrature_joint_probability([0.5], 0.3) == pytest.approx(0.5)
+
+
+def test_correlation_settings_parse_quadrature_method(mocker, monkeypatch, tmp_path) -> None:
+    payout = tmp_path / "payout_calibration.yaml"
+    payout.write_text(
+        yaml.safe_dump(
+            {
+                "correlations": {
+                    "meeting_course": {"penalty": 0.9, "rho": -0.5, "method": "Quadrature"},
+                    "default": {"rho": 0.3, "method": "bogus"},
+                }
+            }
+        ),
+        encoding="utf-8",
+    )
+    mocker.patch(
+        "hippique_orchestrator.simulate_wrapper._default_payout_calibration_path",
+        return_value=payout,
+    )
+    monkeypatch.setattr(sw, "_correlation_settings", {})
+    monkeypatch.setattr(sw, "_correlation_mtime", 0.0)
+
+    sw._load_correlation_settings()
+
+    assert sw._correlation_settings["meeting_course"]["method"] == "quadrature"
+    assert "method" not in sw._correlation_settings["default"]
+
+    adjusted, method, penalty = sw._estimate_group_probability([0.6, 0.55], ("rc", "R1C1"))
+    expected = sw._quadrature_joint_probability([0.6, 0.55], -0.5)
+    assert method == "quadrature"
+    assert penalty == pytest.approx(0.9)
+    assert adjusted == pytest.approx(expected)
+    assert adjusted < 0.6 * 0.55 * 0.9
+
+
+def test_ev_calculator_copula_fallback_uses_quadrature(monkeypatch) -> None:
+    from hippique_orchestrator import ev_calculator
+
+    monkeypatch.setattr(ev_calculator, "_copula_method", lambda: "quadrature")
+    info_i = {"p": 0.5, "exposures": frozenset({"leg:7"})}
+    info_j = {"p": 0.4, "exposures": frozenset({"leg:7"})}
+
+    joint = ev_calculator._estimate_joint_probability(info_i, info_j, None, None)
+
+    assert joint == pytest.approx(sw._quadrature_joint_probability([0.5, 0.4], 0.60))
+    assert joint != pytest.approx(ev_calculator._approx_joint_probability(0.5, 0.4, 0.60))
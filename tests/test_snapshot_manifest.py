@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+from hippique_orchestrator import analysis_pipeline, snapshot_manifest, storage_codec
+
+
+class FakeBucket:
+    """In-memory objects with generations, standing in for the gcs_client functions."""
+
+    def __init__(self):
+        self.objects = {}  # path -> (content, generation)
+        self.reads = []
+        self.lists = 0
+        self.conflict_next_write = False
+
+    def read_text_with_generation(self, path):
+        self.reads.append(path)
+        return self.objects.get(path, (None, 0))
+
+    def write_text_if_generation_match(self, path, content, generation):
+        current = self.objects.get(path, (None, 0))[1]
+        if self.conflict_next_write:
+            self.conflict_next_write = False
+            current += 1  # another instance updated the manifest meanwhile
+            self.objects[path] = (json.dumps({"phases": {"H9": {"path": "h9"}}}), current)
+        if current != generation:
+            return None
+        self.objects[path] = (content, current + 1)
+        return current + 1
+
+    def read_file_from_gcs(self, path):
+        self.reads.append(path)
+        return self.objects.get(path, (None, 0))[0]
+
+    def save_json_to_gcs(self, path, data):
+        self.objects[path] = (storage_codec.dumps(data).decode("utf-8"), 1)
+
+    def list_files(self, path):
+        self.lists += 1
+        return [p for p in self.objects if p.startswith(path)]
+
+
+@pytest.fixture
+def bucket(mocker):
+    fake = FakeBucket()
+    for name in (
+        "read_text_with_generation", "write_text_if_generation_match",
+        "read_file_from_gcs", "save_json_to_gcs", "list_files",
+    ):
+        mocker.patch(f"hippique_orchestrator.gcs_client.{name}", side_effect=getattr(fake, name))
+    return fake
+
+
+def _save(bucket, race, name, phase, payload):
+    path = f"data/{race}/snapshots/{name}_{phase}.json"
+    bucket.save_json_to_gcs(path, payload)
+    return snapshot_manifest.record_snapshot(race, phase, path, payload)
+
+
+def test_h5_lookup_on_the_writing_instance_touches_no_object(bucket):
+    _save(bucket, "R1C1", "20250101_120000", "H30", {"runners": [{"num": 1}]})
+    _save(bucket, "R1C1", "20250101_122500", "H-30", {"runners": [{"num": 2}]})
+    bucket.reads.clear()
+
+    assert analysis_pipeline._find_and_load_h30_snapshot("R1C1", {}) == {"runners": [{"num": 2}]}
+    assert bucket.reads == [] and bucket.lists == 0
+
+
+def test_other_instance_reads_manifest_then_verified_payload(bucket):
+    entry = _save(bucket, "R1C1", "20250101_120000", "H30", {"runners": [{"num": 1}]})
+    snapshot_manifest.clear()  # a fresh instance
+    bucket.reads.clear()
+
+    assert snapshot_manifest.load_latest("R1C1", "H30") == {"runners": [{"num": 1}]}
+    assert bucket.reads == ["data/R1C1/manifest.json", entry["path"]]
+    assert bucket.lists == 0
+
+    bucket.objects[entry["path"]] = (json.dumps(json.dumps({"runners": []})), 2)
+    snapshot_manifest.clear()
+    assert snapshot_manifest.load_latest("R1C1", "H30") is None  # checksum mismatch
+    assert snapshot_manifest.stats()["checksum_mismatches"] == 1
+
+
+def test_concurrent_manifest_update_is_retried_without_losing_phases(bucket):
+    _save(bucket, "R1C1", "20250101_120000", "H30", {"a": 1})
+    bucket.conflict_next_write = True
+    _save(bucket, "R1C1", "20250101_122500", "H5", {"b": 2})
+
+    manifest = json.loads(bucket.objects["data/R1C1/manifest.json"][0])
+    assert set(manifest["phases"]) == {"H9", "H5"}  # re-read after the conflict, then merged
+    assert snapshot_manifest.stats()["write_conflicts"] >= 1
+
+
+def test_races_without_manifest_fall_back_to_listing(bucket):
+    path = "data/R2C3/snapshots/20250101_120000_H30.json"
+    # Snapshots used to be saved as a JSON-encoded string of the document
+    bucket.save_json_to_gcs(path, json.dumps({"runners": [{"num": 7}]}))
+
+    assert analysis_pipeline._find_and_load_h30_snapshot("R2C3", {}) == {"runners": [{"num": 7}]}
+    assert bucket.lists == 1
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from hippique_orchestrator import firestore_client, snapshot_manager, stats_prefetch
+from hippique_orchestrator.stats_prefetch import DayStatsPrefetcher
+from hippique_orchestrator.stats_provider import Chrono, JEStats, ZoneTurfProvider
+
+RACE_1 = [
+    {"nom": "Alpha", "jockey": "E. Raffin", "entraineur": "S. Guarato"},
+    {"nom": "Bravo", "jockey": "J.-M. Bazire", "entraineur": "S. Guarato"},
+]
+RACE_2 = [
+    {"nom": "Charlie", "jockey": "E. Raffin", "entraineur": "P. Vercruysse"},
+]
+
+
+def _mock_fetches(mocker, target, delay=0.0):
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow(result):
+        def fetch(name, known_id=None):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(delay)
+            with lock:
+                state["active"] -= 1
+            return result
+
+        return fetch
+
+    mocks = {
+        "horse": mocker.patch.object(target, "fetch_horse_chrono", side_effect=slow(None)),
+        "jockey": mocker.patch.object(
+            target, "fetch_jockey_stats", side_effect=slow(JEStats(year=2026))
+        ),
+        "trainer": mocker.patch.object(
+            target, "fetch_trainer_stats", side_effect=slow(JEStats(year=2026))
+        ),
+    }
+    return mocks, state
+
+
+@pytest.mark.asyncio
+async def test_prefetcher_fetches_each_entity_once_with_bounded_concurrency(mocker):
+    provider = ZoneTurfProvider(config={})
+    prefetch_ids = mocker.patch.object(
+        provider, "prefetch_ids", return_value={("jockey", "E. Raffin"): "2957"}
+    )
+    mocker.patch.object(provider, "flush_id_cache", return_value=0)
+    mocks, state = _mock_fetches(mocker, provider, delay=0.02)
+    prefetcher = DayStatsPrefetcher(provider, concurrency=2)
+
+    assert prefetcher.submit(RACE_1) == 5
+    assert prefetcher.submit(RACE_2) == 2  # E. Raffin was already queued
+    summary = await prefetcher.wait()
+
+    assert prefetch_ids.call_count == 2
+    assert state["peak"] <= 2
+    mocks["jockey"].assert_any_call("E. Raffin", "2957")
+    assert mocks["jockey"].call_count == 2
+    assert mocks["trainer"].call_count == 2
+    assert (summary["runners"], summary["entities"]) == (3, 7)
+    assert (summary["fetched"], summary["empty"], summary["failed"]) == (4, 3, 0)
+
+
+def test_h9_snapshot_job_returns_before_the_detached_prefetch(mocker):
+    mocker.patch.object(
+        snapshot_manager,
+        "build_plan_async",
+        return_value=[
+            {"course_url": "url1", "date": "2026-03-01"},
+            {"course_url": "url2", "date": "2026-03-01"},
+        ],
+    )
+    races = {"url1": RACE_1, "url2": RACE_2}
+
+    async def run_course(course_url, phase, date, correlation_id):
+        await asyncio.sleep(0)
+        stats_prefetch.submit_runners(races[course_url])
+
+    mocker.patch.object(snapshot_manager, "run_course", side_effect=run_course)
+    mocker.patch.object(ZoneTurfProvider, "prefetch_ids", return_value={})
+    flush = mocker.patch.object(ZoneTurfProvider, "flush_id_cache", return_value=0)
+    mocks, _ = _mock_fetches(mocker, ZoneTurfProvider, delay=0.05)
+
+    async def job():
+        queued = await snapshot_manager.write_snapshot_for_day_async("2026-03-01", phase="H9")
+        assert queued["entities"] == 7 and queued["fetched"] == 0  # not waited for
+        assert stats_prefetch.submit_runners(RACE_1) == 0  # inactive once the job is over
+        assert len(stats_prefetch._detached) == 1 and not flush.called
+
+        (summary,) = await asyncio.gather(*stats_prefetch._detached)
+        assert summary["fetched"] + summary["empty"] == 7
+        assert mocks["horse"].call_count == 3 and flush.call_count == 1
+
+        # Other phases do not prefetch.
+        assert await snapshot_manager.write_snapshot_for_day_async("2026-03-01", phase="H30") is None
+        assert not stats_prefetch._detached
+
+    asyncio.run(job())
+
+
+def test_detached_prefetches_are_cancelled_at_shutdown(mocker):
+    provider = ZoneTurfProvider(config={})
+    mocker.patch.object(provider, "prefetch_ids", return_value={})
+    mocker.patch.object(provider, "flush_id_cache", return_value=0)
+    _mock_fetches(mocker, provider, delay=0.05)
+
+    async def job():
+        prefetcher = DayStatsPrefetcher(provider, concurrency=1)
+        prefetcher.submit(RACE_1)
+        task = stats_prefetch.detach(prefetcher)
+        await asyncio.sleep(0)
+        await stats_prefetch.cancel_detached()
+        assert task.cancelled() and not stats_prefetch._detached
+
+    asyncio.run(job())
+
+
+def test_horse_chrono_is_read_from_the_day_cache(mocker):
+    mocker.patch.object(firestore_client, "get_document", return_value=None)
+    provider = ZoneTurfProvider(config={})
+    page = """
+    <html><body><table class="performances-table">
+      <tr><td>Record attelé</td><td>1'12"5</td></tr>
+    </table></body></html>
+    """
+    get = mocker.patch.object(provider.client, "get", return_value=mocker.Mock(text=page))
+
+    first = provider.fetch_horse_chrono("Alpha", known_id="11")
+    assert provider.fetch_horse_chrono("Alpha", known_id="11") == first
+    assert isinstance(first, Chrono) and first.record_attele_sec == 72.5
+
+    get.return_value = mocker.Mock(text="<html><body></body></html>")
+    assert provider.fetch_horse_chrono("Bravo", known_id="12") is None
+    assert provider.fetch_horse_chrono("Bravo", known_id="12") is None
+    assert get.call_count == 2
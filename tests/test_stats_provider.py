@@ -380,14 +380,51 @@ class TestZoneTurfIdResolution:
     def test_set_id_to_cache_handles_exception(self, zt_provider: ZoneTurfProvider, mocker, caplog):
         """Ensures that exceptions during cache write are handled gracefully."""
         mocker.patch.object(
-            firestore_client, 'set_document', side_effect=Exception("Firestore unavailable")
+            firestore_client, 'set_documents', side_effect=Exception("Firestore unavailable")
         )
 
-        # This function should not raise an exception
+        # Writes are buffered; neither call should raise an exception
         zt_provider._set_id_to_cache("horse", "My Horse", "12345")
+        assert zt_provider.flush_id_cache() == 0
 
         assert "Failed to write to cache" in caplog.text
 
+    def test_prefetch_runner_ids_reads_firestore_once(self, zt_provider: ZoneTurfProvider, mocker):
+        """Ensures a snapshot's entities are resolved in one batch and then memoized."""
+        now = datetime.now(timezone.utc)
+        mock_get_documents = mocker.patch.object(
+            firestore_client,
+            'get_documents',
+            return_value={
+                "horse_alpha": {"entity_id": "1", "cached_at": now},
+                "jockey_jdupont": {"entity_id": "7", "cached_at": now},
+            },
+        )
+        mock_get_document = mocker.patch.object(firestore_client, 'get_document')
+        runners = [
+            {"nom": "Alpha", "jockey": "J. Dupont", "entraineur": "X. Martin"},
+            {"nom": "Bravo", "jockey": "J. Dupont"},
+        ]
+
+        ids = zt_provider.prefetch_runner_ids(runners)
+
+        assert ids == {
+            ("horse", "Alpha"): "1",
+            ("jockey", "J. Dupont"): "7",
+            ("trainer", "X. Martin"): None,
+            ("horse", "Bravo"): None,
+        }
+        mock_get_documents.assert_called_once()
+        assert sorted(mock_get_documents.call_args.args[1]) == [
+            "horse_alpha", "horse_bravo", "jockey_jdupont", "trainer_xmartin"
+        ]
+        # Later races of the day reuse the memo instead of Firestore.
+        assert zt_provider._get_id_from_cache("jockey", "J. Dupont") == "7"
+        assert zt_provider._get_id_from_cache("horse", "Bravo") is None
+        zt_provider.prefetch_runner_ids(runners)
+        mock_get_documents.assert_called_once()
+        mock_get_document.assert_not_called()
+
     def test_get_id_from_cache_expired(self, zt_provider: ZoneTurfProvider, mocker):
         """Ensures that an expired cache entry is ignored."""
         expired_time = datetime.now(timezone.utc) - timedelta(days=90)
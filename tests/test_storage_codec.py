@@ -0,0 +1,54 @@
+import gzip
+import json
+
+import pytest
+
+from hippique_orchestrator import config, storage_codec
+
+DOC = {"race": {"nom": "Prix d'Amérique"}, "runners": [{"num": 1, "odds_place": 2.5}] * 50}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_report():
+    storage_codec.reset_report()
+    yield
+    storage_codec.reset_report()
+
+
+@pytest.mark.parametrize("codec", ["zstd", "gzip", "identity"])
+def test_round_trip_and_content_encoding(codec):
+    if codec == "zstd":
+        pytest.importorskip("zstandard")
+    encoded = storage_codec.encode(DOC, codec)
+
+    assert encoded.content_encoding == (None if codec == "identity" else codec)
+    assert json.loads(storage_codec.decode_text(encoded.body, encoded.content_encoding)) == DOC
+    if codec != "identity":
+        assert len(encoded.body) < encoded.raw_size / 5
+
+
+def test_legacy_objects_decode_without_metadata():
+    legacy = json.dumps(json.dumps(DOC))  # model_dump_json() text passed through json.dump
+    assert storage_codec.loads(storage_codec.decode_text(legacy.encode())) == DOC
+
+    gzipped_without_header = gzip.compress(b'{"a": 1}')
+    assert storage_codec.decode_text(gzipped_without_header) == '{"a": 1}'
+    assert storage_codec.loads('"plain string"') == "plain string"
+
+
+def test_zstd_falls_back_to_gzip_when_unavailable(monkeypatch):
+    monkeypatch.setattr(storage_codec, "zstandard", None)
+    monkeypatch.setattr(config, "STORAGE_CODEC", "zstd")
+
+    assert storage_codec.encode(DOC).content_encoding == "gzip"
+
+
+def test_report_counts_bytes_stored_and_egress_saved():
+    encoded = storage_codec.encode(DOC, "gzip")
+    storage_codec.decode_text(encoded.body, "gzip")
+    storage_codec.decode_text(b"{}")
+
+    (day,) = storage_codec.report()["days"].values()
+    assert day["objects_written"] == 1 and day["objects_read"] == 2
+    assert day["bytes_saved_stored"] == encoded.raw_size - len(encoded.body)
+    assert day["egress_saved"] == encoded.raw_size - len(encoded.body)
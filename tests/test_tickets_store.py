@@ -1,4 +1,5 @@
 import datetime
+import gzip
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -69,9 +70,9 @@ def test_render_ticket_html_full_payload():
     assert "<div><b>Budget:</b> 100.0 €</div>" in html
     assert "<div><b>EV estimée:</b> 1.2</div>" in html
     assert "<div><b>ROI estimé:</b> 0.15</div>" in html
-    assert '"runner": "Horse A"' in html
-    assert '"odds": 5.0' in html
-    assert '"some_other_data": "value"' in html
+    assert '"runner":"Horse A"' in html
+    assert '"odds":5.0' in html
+    assert '"some_other_data":"value"' in html
 
 
 def test_render_ticket_html_minimal_payload():
@@ -113,8 +114,8 @@ def test_render_ticket_html_different_keys_for_ev_roi_tickets():
     assert "<div><b>EV estimée:</b> 1.3</div>" in html
     # Adjusted assertion for float representation
     assert "<div><b>ROI estimé:</b> 0.2</div>" in html
-    assert '"runner": "Horse B"' in html
-    assert '"odds": 3.0' in html
+    assert '"runner":"Horse B"' in html
+    assert '"odds":3.0' in html
 
 
 def test_save_ticket_html_success(mock_gcs_client):
@@ -130,9 +131,13 @@ def test_save_ticket_html_success(mock_gcs_client):
     )
     assert mock_blob.cache_control == "no-cache"
     assert mock_blob.content_type == "text/html; charset=utf-8"
-    mock_blob.upload_from_string.assert_called_once_with(
-        html_content, content_type="text/html; charset=utf-8"
-    )
+    assert mock_blob.content_encoding == "gzip"
+    mock_blob.upload_from_string.assert_called_once()
+    body = mock_blob.upload_from_string.call_args.args[0]
+    assert gzip.decompress(body).decode("utf-8") == html_content
+    assert mock_blob.upload_from_string.call_args.kwargs == {
+        "content_type": "text/html; charset=utf-8"
+    }
 
 
 def test_save_ticket_html_no_bucket_env_var_raises_error():
@@ -0,0 +1,99 @@
+from hippique_orchestrator import zoneturf_index
+from hippique_orchestrator.stats_provider import ZoneTurfProvider
+from hippique_orchestrator.zoneturf_index import ZoneTurfIndex, normalize_name
+
+PAGES = {
+    1: [("ABRICOT", "11"), ("ALPHA DU BOIS", "12")],
+    2: [("AMIRAL", "21"), ("ATHOS", "22")],
+    3: [("AZUR", "31")],
+}
+
+
+def _page_html(entries):
+    items = "".join(
+        f'<li><a href="/cheval/{name.lower().replace(" ", "-")}-{entity_id}/">{name}</a></li>'
+        for name, entity_id in entries
+    )
+    return f'<html><body><ul class="list-chevaux">{items}</ul></body></html>'
+
+
+def _mock_site(mocker, provider, pages):
+    def get(path):
+        page = int(path.rsplit("=", 1)[1])
+        response = mocker.Mock()
+        response.text = _page_html(pages.get(page, []))
+        response.raise_for_status = mocker.Mock()
+        return response
+
+    return mocker.patch.object(provider.client, "get", side_effect=get)
+
+
+def test_lookup_exact_fuzzy_and_round_trip(tmp_path):
+    index = ZoneTurfIndex(tmp_path / "index.json.gz")
+    index.replace_letter("horse", "a", [PAGES[1], PAGES[2]])
+
+    assert normalize_name("Alpha du Bois") == "alphadubois"
+    assert index.lookup("horse", "Alpha du Bois") == "12"
+    assert index.lookup("horse", "ATHOSS") == "22"  # fuzzy fallback
+    assert index.lookup("horse", "ATHOSS", fuzzy=False) is None
+    assert index.lookup("jockey", "ATHOS") is None
+    assert index.page_for("horse", "a", "ANTARES") == 2
+    assert index.page_for("horse", "a", "AARDVARK") == 1
+    assert index.page_for("horse", "b", "BRAVO") is None
+
+    assert index.save()
+    assert not index.save()  # nothing changed since
+    reloaded = ZoneTurfIndex.load(tmp_path / "index.json.gz")
+    assert reloaded.lookup("horse", "amiral") == "21"
+    assert reloaded.stats()["entities"]["horse"] == {"names": 4, "complete_letters": 1}
+    assert reloaded.stale_letters(["horse"], ["a", "b"], max_age=3600) == [("horse", "b")]
+
+
+def test_indexed_letter_resolves_misses_with_one_page(mocker):
+    provider = ZoneTurfProvider(config={})
+    mocker.patch.object(provider, "_get_id_from_cache", return_value=None)
+    mocker.patch.object(provider, "_set_id_to_cache")
+    get = _mock_site(mocker, provider, PAGES)
+
+    assert provider.refresh_index_letter("horse", "a") == 5
+    assert get.call_count == 4  # three pages plus the empty one ending the walk
+
+    get.reset_mock()
+    assert provider._resolve_entity_id("horse", "Athos") == "22"
+    get.assert_not_called()
+
+    # A horse added to page 2 since the last refresh costs exactly one fetch.
+    _mock_site(mocker, provider, {**PAGES, 2: [*PAGES[2], ("ARTEMIS", "23")]})
+    assert provider._resolve_entity_id("horse", "Artemis") == "23"
+    provider.client.get.assert_called_once_with("/cheval/lettre-a.html?p=2")
+    assert zoneturf_index.get_zoneturf_index().lookup("horse", "Artemis") == "23"
+
+
+def test_fuzzy_index_match_is_the_last_resort(mocker):
+    provider = ZoneTurfProvider(config={})
+    cache = mocker.patch.object(provider, "_get_id_from_cache", return_value=None)
+    mocker.patch.object(provider, "_set_id_to_cache")
+    _mock_site(mocker, provider, PAGES)
+    provider.refresh_index_letter("horse", "a")
+
+    # "ATHOSS" is close to the indexed "ATHOS" but is another horse.
+    cache.return_value = "99"
+    assert provider._resolve_entity_id("horse", "Athoss") == "99"
+
+    cache.return_value = None
+    _mock_site(mocker, provider, {**PAGES, 2: [*PAGES[2], ("ATHOSS", "24")]})
+    assert provider._resolve_entity_id("horse", "Athoss") == "24"
+
+    _mock_site(mocker, provider, PAGES)
+    assert provider._resolve_entity_id("horse", "Amirall") == "21"  # nothing exact anywhere
+
+
+def test_refresh_index_walks_stalest_letters_and_saves(mocker, tmp_path):
+    provider = ZoneTurfProvider(config={})
+    _mock_site(mocker, provider, PAGES)
+    mocker.patch.object(provider, "INDEX_LETTERS", ("a", "b"))
+
+    assert provider.refresh_index(max_letters=2) == 2
+
+    saved = ZoneTurfIndex.load(zoneturf_index.get_zoneturf_index().path)
+    assert saved.stats()["entities"]["horse"]["complete_letters"] == 2